@@ -1,7 +1,12 @@
 import time
 import os
+import sys
 import requests
 import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from datetime import datetime
 from selenium import webdriver
@@ -22,9 +27,13 @@ def _get_config():
     - OUTLET_INDEX_TEMPLATE_PATH
     - OUTLET_PAGES_DIR
     - OUTLET_MAPPING_PATH
+    - OUTLET_MAPPING_SHARDS_DIR
     - OUTLET_SITE_BASE_URL
     - OUTLET_SITEMAP_PATH
     - OUTLET_INDEX_OUTPUT_PATH
+    - OUTLET_CACHE_DIR
+    - OUTLET_MANIFEST_PATH
+    - OUTLET_EVENTS_FEED_PATH
     """
     base_dir = os.path.dirname(os.path.abspath(__file__))
     return {
@@ -44,6 +53,10 @@ def _get_config():
             "OUTLET_MAPPING_PATH",
             os.path.join(base_dir, "../web/public/url-mapping.json"),
         ),
+        "MAPPING_SHARDS_DIR": os.environ.get(
+            "OUTLET_MAPPING_SHARDS_DIR",
+            os.path.join(base_dir, "../web/public/url-mapping"),
+        ),
         "SITE_BASE_URL": os.environ.get(
             "OUTLET_SITE_BASE_URL",
             "https://discounts.deluxo.co.kr",
@@ -56,10 +69,99 @@ def _get_config():
             "OUTLET_INDEX_OUTPUT_PATH",
             os.path.join(base_dir, "../web/public/index.html"),
         ),
+        "CACHE_DIR": os.environ.get(
+            "OUTLET_CACHE_DIR",
+            os.path.join(base_dir, ".cache"),
+        ),
+        "MANIFEST_PATH": os.environ.get(
+            "OUTLET_MANIFEST_PATH",
+            os.path.join(base_dir, "pages-manifest.jsonl"),
+        ),
+        "EVENTS_FEED_PATH": os.environ.get(
+            "OUTLET_EVENTS_FEED_PATH",
+            os.path.join(base_dir, "../web/public/events.json"),
+        ),
     }
 
 # --- 전역 변수 (main에서 초기화)
 url_mapping = {}
+# 지점 병렬 크롤링 시 스레드별 컨텍스트 (mapping_log: 지연 반영할 URL 매핑 목록)
+_BRANCH_CTX = threading.local()
+
+# --- 유틸: 숫자형 환경변수 (파싱 실패 시 기본값)
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, str(default)))
+    except Exception:
+        return default
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, str(default)))
+    except Exception:
+        return default
+
+# --- HTTP 클라이언트 (크롤러 전체가 공유하는 keep-alive 세션)
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+_HTTP_STATS = {"requests": 0}
+_HTTP_STATS_LOCK = threading.Lock()
+
+DEFAULT_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; DeluxoOutletCrawler/1.0; +https://discounts.deluxo.co.kr)",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+def _get_http_session():
+    """커넥션 풀을 가진 requests.Session을 한 번만 만들어 재사용합니다.
+
+    - OUTLET_HTTP_POOL_SIZE: 호스트당 유지할 커넥션 수 (기본 16, 상세 동시 수집 스레드 수 이상 권장)
+    - OUTLET_HTTP_USER_AGENT: User-Agent 재정의
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is not None:
+        return _HTTP_SESSION
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            from requests.adapters import HTTPAdapter
+            pool_size = max(1, _env_int("OUTLET_HTTP_POOL_SIZE", 16))
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(DEFAULT_HTTP_HEADERS)
+            ua = os.environ.get("OUTLET_HTTP_USER_AGENT")
+            if ua:
+                session.headers["User-Agent"] = ua
+            _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+def http_get(url, **kwargs):
+    """공유 세션으로 GET 요청. timeout 기본값은 OUTLET_HTTP_TIMEOUT(초, 기본 15)."""
+    kwargs.setdefault("timeout", _env_float("OUTLET_HTTP_TIMEOUT", 15.0))
+    resp = _get_http_session().get(url, **kwargs)
+    with _HTTP_STATS_LOCK:
+        _HTTP_STATS["requests"] += 1
+    return resp
+
+def http_stats():
+    """요청 수/신규 커넥션 수/재사용 횟수 집계 (urllib3 풀 카운터 기반)."""
+    connections = 0
+    session = _HTTP_SESSION
+    if session is not None:
+        adapters = {id(a): a for a in session.adapters.values()}
+        for adapter in adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+    requests_count = _HTTP_STATS["requests"]
+    return {
+        "requests": requests_count,
+        "connections": connections,
+        "reused": max(0, requests_count - connections),
+    }
 
 # --- 유틸: 날짜 포맷 변환(YYYYMMDDHHMMSS -> M.D)
 def _fmt_md(yyyymmddhhmmss: str) -> str:
@@ -241,6 +343,200 @@ def process_price_text(price_text):
     else:
         return price_text
 
+# --- 목록 API 토큰(curtMblDmCd) 캐시 (지점별)
+_MBL_TOKENS = {}
+_MBL_TOKENS_LOCK = threading.Lock()
+LISTING_API_URL = "https://www.ehyundai.com/newPortal/SN/GetCmsContentsAJX.do"
+
+def _listing_landing_url(branchCd):
+    return f"https://www.ehyundai.com/newPortal/SN/SN_0101000.do?branchCd={branchCd}&SN=1"
+
+def _cache_dir():
+    return (CFG or _get_config())["CACHE_DIR"]
+
+def _token_cache_path():
+    return os.path.join(_cache_dir(), "mbl_tokens.json")
+
+def _read_persisted_token(branchCd, ttl):
+    import json as _json
+    try:
+        with open(_token_cache_path(), "r", encoding="utf-8") as f:
+            entry = _json.load(f).get(branchCd) or {}
+    except Exception:
+        return None
+    if entry.get("token") and time.time() - float(entry.get("fetched_at", 0)) < ttl:
+        return entry["token"]
+    return None
+
+def _write_persisted_token(branchCd, token):
+    import json as _json
+    path = _token_cache_path()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = _json.load(f)
+    except Exception:
+        data = {}
+    data[branchCd] = {"token": token, "fetched_at": time.time()}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            _json.dump(data, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"⚠️ 토큰 캐시 저장 실패: {e}")
+
+def get_mbl_token(branchCd, refresh=False):
+    """지점 랜딩 페이지의 curtMblDmCd 값을 지점별로 한 번만 가져옵니다.
+
+    - 실행 중에는 메모리에 캐시하므로 페이지마다 랜딩 페이지를 다시 받지 않습니다.
+    - OUTLET_TOKEN_TTL(초, 기본 0)이 0보다 크면 캐시 디렉터리에 저장해 다음 실행에서도 재사용합니다.
+    - refresh=True면 캐시를 무시하고 다시 가져옵니다.
+    """
+    ttl = _env_int("OUTLET_TOKEN_TTL", 0)
+    with _MBL_TOKENS_LOCK:
+        if not refresh:
+            token = _MBL_TOKENS.get(branchCd)
+            if token:
+                return token
+            if ttl > 0:
+                token = _read_persisted_token(branchCd, ttl)
+                if token:
+                    _MBL_TOKENS[branchCd] = token
+                    return token
+        html = http_get(_listing_landing_url(branchCd)).text
+        m = re.search(r"var\s+curtMblDmCd\s*=\s*'([^']+)'", html)
+        if not m:
+            raise RuntimeError("mblDmCd 파싱 실패")
+        token = m.group(1)
+        _MBL_TOKENS[branchCd] = token
+        if ttl > 0:
+            _write_persisted_token(branchCd, token)
+        return token
+
+def _fetch_listing_result(branchCd, page, page_size=9):
+    """목록 AJAX(ifAppHdcms012) 호출. 토큰이 거부되면 캐시를 무효화하고 한 번 재시도합니다."""
+    for attempt in range(2):
+        mbl = get_mbl_token(branchCd, refresh=attempt > 0)
+        # typeCd '01' = 이벤트
+        params = {
+            'apiID': 'ifAppHdcms012',
+            'param': f"mblDmCd={mbl}&evntCrdTypeCd=01&pageSize={page_size}&page={page}",
+        }
+        try:
+            result = http_get(LISTING_API_URL, params=params).json().get('result')
+        except ValueError:
+            result = None
+        if isinstance(result, dict) and 'items' in result:
+            return result
+        if attempt == 0:
+            print(f"⚠️ [{branchCd}] 목록 API가 토큰을 거부했습니다. 토큰을 갱신해 재시도합니다.")
+    raise RuntimeError("목록 API 응답 오류 (토큰 갱신 후에도 실패)")
+
+# 상세 링크의 page 파라미터는 시트 중복 판정 키(상세 링크)에 포함되므로,
+# 큰 페이지 크기로 요청하더라도 기존 9개 단위 페이지 번호를 유지합니다.
+LEGACY_PAGE_SIZE = 9
+AUTO_PAGINATION_MAX_REQUESTS = 50
+
+def _listing_item_to_event(it, branchCd, page):
+    """목록 API 항목 하나를 {title, period, image, link} dict로 변환합니다."""
+    # 카테고리 판단
+    t = (it.get('evntCrdTypeCd') or {}).get('value') or '01'
+    if t == '02':
+        category = 'gift'
+    elif t == '03':
+        category = 'culture'
+    elif t == '04':
+        category = 'special'
+    else:
+        category = 'event'
+    img = it.get('imgPath2') or ''
+    if img:
+        img = ("https://imgprism.ehyundai.com/" + img).replace("https://apiprism.ehyundai.com/", "")
+    # 기간 문자열 구성
+    stCd = (it.get('expsEvntStartGbcd') or {}).get('value')
+    enCd = (it.get('expsEvntEndGbcd') or {}).get('value')
+    st = it.get('expsEvntStartTxt') if stCd == '02' else _fmt_md(it.get('expsEvntStartDt') or '')
+    en = it.get('expsEvntEndTxt') if enCd == '02' else _fmt_md(it.get('expsEvntEndDt') or '')
+    period = (st or '') + (" ~ " if (st or en) and en else "") + (en or '')
+    link = f"https://www.ehyundai.com/newPortal/SN/SN_0201000.do?evntCrdCd={it.get('evntCrdCd')}&category={category}&page={page}&branchCd={branchCd}"
+    return {
+        'title': it.get('evntCrdNm') or '',
+        'period': period,
+        'image': img,
+        'link': link,
+    }
+
+def _listing_total_count(result):
+    """목록 API 응답에 전체 건수가 노출되어 있으면 정수로 반환 (없으면 None)."""
+    sources = [result]
+    for key in ('paging', 'page', 'pageInfo'):
+        if isinstance(result.get(key), dict):
+            sources.append(result[key])
+    for src in sources:
+        for key in ('totalCount', 'totalCnt', 'totCnt', 'totalElements', 'total'):
+            try:
+                if src.get(key) not in (None, ''):
+                    return int(src[key])
+            except (TypeError, ValueError):
+                continue
+    return None
+
+def fetch_event_list_auto(branchCd):
+    """HTTP 목록을 큰 페이지 단위로 끝까지 수집합니다 (요청 1회당 dict 리스트 1개 yield).
+
+    - OUTLET_PAGE_SIZE: 요청당 항목 수 (기본 50)
+    - 서버가 페이지 크기를 더 작게 제한하면(첫 응답이 요청보다 짧으면) 첫 응답 길이를
+      페이지 크기로 사용합니다.
+    - 전체 건수가 노출되면 그 건수에 도달하거나 빈 페이지가 올 때까지 수집하고,
+      없으면 빈 페이지나 (맞춘) 페이지 크기보다 짧은 페이지가 오면 중단합니다.
+    """
+    page_size = max(1, _env_int("OUTLET_PAGE_SIZE", 50))
+    seen = 0
+    for page in range(1, AUTO_PAGINATION_MAX_REQUESTS + 1):
+        result = _fetch_listing_result(branchCd, page, page_size)
+        items = result.get('items', []) or []
+        total = _listing_total_count(result)
+        events = []
+        for i, it in enumerate(items):
+            legacy_page = (seen + i) // LEGACY_PAGE_SIZE + 1
+            events.append(_listing_item_to_event(it, branchCd, legacy_page))
+        seen += len(items)
+        if events:
+            yield events
+        if not items or (total is not None and seen >= total):
+            return
+        if page == 1 and len(items) < page_size:
+            # 서버 페이지 크기 상한일 수 있음: 다음 요청부터 실제 크기로 요청해 페이지 경계를 맞춤
+            # (마지막 페이지였다면 다음 요청이 빈 페이지로 끝남)
+            print(f"ℹ️ [{branchCd}] 첫 응답 {len(items)}개 (요청 {page_size}개): 페이지 크기를 {len(items)}개로 맞춥니다")
+            page_size = len(items)
+            continue
+        if total is None and len(items) < page_size:
+            return
+    print(f"⚠️ [{branchCd}] 자동 페이징 요청 상한({AUTO_PAGINATION_MAX_REQUESTS}회)에 도달했습니다.")
+
+def _iter_listing_batches(driver, branchCd, sheet_name, max_pages):
+    """crawl_outlet이 처리할 목록 묶음을 순서대로 yield 합니다.
+    OUTLET_PAGINATION=auto(HTTP 목록 모드 전용)면 자동 페이징, 아니면 고정 페이지 수만큼 수집합니다.
+    """
+    listing_mode = os.environ.get("OUTLET_LISTING_MODE", "http").lower()
+    pagination = os.environ.get("OUTLET_PAGINATION", "fixed").lower()
+    if listing_mode == "http" and pagination == "auto":
+        fetched = 0
+        try:
+            for n, events in enumerate(fetch_event_list_auto(branchCd), 1):
+                print(f"[{sheet_name}] 자동 페이징 {n}번째 요청: {len(events)}개 항목")
+                fetched += 1
+                yield events
+            return
+        except Exception as e:
+            if fetched:
+                print(f"⚠️ 자동 페이징 중단: {e}")
+                return
+            print(f"⚠️ 자동 페이징 실패: {e}. 고정 페이지 수집으로 전환합니다.")
+    for page in range(1, max_pages + 1):
+        print(f"[{sheet_name}] 페이지 {page} 크롤링 중...")
+        yield fetch_event_list(driver, branchCd, page)
+
 # --- 행사 리스트 페이지 크롤링
 def fetch_event_list(driver, branchCd, page):
     """행사 목록 페이징 수집.
@@ -250,55 +546,15 @@ def fetch_event_list(driver, branchCd, page):
       - HTTP 모드: dict 리스트 [{title, period, image, link}]
       - 클릭/폴백: BeautifulSoup li 요소 리스트
     """
-    import os as _os, re, requests
+    import os as _os
     mode = _os.environ.get("OUTLET_LISTING_MODE", "http").lower()
 
-    list_url = f"https://www.ehyundai.com/newPortal/SN/SN_0101000.do?branchCd={branchCd}&SN=1"
+    list_url = _listing_landing_url(branchCd)
 
     if mode == "http":
         try:
-            html = requests.get(list_url, timeout=15).text
-            m = re.search(r"var\s+curtMblDmCd\s*=\s*'([^']+)'", html)
-            if not m:
-                raise RuntimeError("mblDmCd 파싱 실패")
-            mbl = m.group(1)
-            # typeCd '01' = 이벤트
-            api = "https://www.ehyundai.com/newPortal/SN/GetCmsContentsAJX.do"
-            params = {
-                'apiID': 'ifAppHdcms012',
-                'param': f"mblDmCd={mbl}&evntCrdTypeCd=01&pageSize=9&page={page}",
-            }
-            js = requests.get(api, params=params, timeout=15).json()
-            items = js.get('result', {}).get('items', [])
-            evts = []
-            for it in items:
-                # 카테고리 판단
-                t = (it.get('evntCrdTypeCd') or {}).get('value') or '01'
-                if t == '02':
-                    category = 'gift'
-                elif t == '03':
-                    category = 'culture'
-                elif t == '04':
-                    category = 'special'
-                else:
-                    category = 'event'
-                img = it.get('imgPath2') or ''
-                if img:
-                    img = ("https://imgprism.ehyundai.com/" + img).replace("https://apiprism.ehyundai.com/", "")
-                # 기간 문자열 구성
-                stCd = (it.get('expsEvntStartGbcd') or {}).get('value')
-                enCd = (it.get('expsEvntEndGbcd') or {}).get('value')
-                st = it.get('expsEvntStartTxt') if stCd == '02' else _fmt_md(it.get('expsEvntStartDt') or '')
-                en = it.get('expsEvntEndTxt') if enCd == '02' else _fmt_md(it.get('expsEvntEndDt') or '')
-                period = (st or '') + (" ~ " if (st or en) and en else "") + (en or '')
-                link = f"https://www.ehyundai.com/newPortal/SN/SN_0201000.do?evntCrdCd={it.get('evntCrdCd')}&category={category}&page={page}&branchCd={branchCd}"
-                evts.append({
-                    'title': it.get('evntCrdNm') or '',
-                    'period': period,
-                    'image': img,
-                    'link': link,
-                })
-            return evts
+            items = _fetch_listing_result(branchCd, page).get('items', [])
+            return [_listing_item_to_event(it, branchCd, page) for it in items]
         except Exception as e:
             print(f"⚠️ HTTP 목록 수집 실패: {e}. 클릭 모드로 폴백합니다.")
             # 폴백으로 계속 진행
@@ -329,6 +585,7 @@ def fetch_event_list(driver, branchCd, page):
 
 # --- 행사 상세페이지 크롤링
 def fetch_event_detail(driver, url):
+    """Selenium으로 상세 페이지를 파싱합니다. 실패하면 None (다음 실행에서 다시 수집)."""
     try:
         driver.get(url)
         WebDriverWait(driver, 5).until(
@@ -429,104 +686,281 @@ def fetch_event_detail(driver, url):
 
     except Exception as e:
         print(f"❌ 상세페이지 크롤링 실패: {e}")
-        return {"상세 제목": "", "상세 기간": "", "시작일":"", "종료일":"", "텍스트 설명": [], "상품 리스트": []}
+        return None
 
-def fetch_event_detail_http(url):
-    """Selenium 없이 HTTP로 상세 페이지를 파싱합니다."""
+def _parse_event_detail_html(html):
+    """상세 페이지 HTML을 파싱해 상세 dict를 반환합니다."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    title_el = soup.select_one("section.fixArea h2")
+    title_text = title_el.text.strip() if title_el else ""
+
+    period_el = soup.select_one("table.info td")
+    period_text = period_el.text.strip() if period_el else ""
+    start_iso, end_iso = parse_period(period_text)
+
+    noimg_list = [
+        f"{r.find('th').text.strip()}: {r.find('td').text.strip()}"
+        for r in soup.select("article.noImgProduct tr")
+        if r.find('th') and r.find('td')
+    ]
+
+    products = []
+    for p in soup.select("article.twoProduct figure"):
+        brand_text = (
+            p.select_one(".p_brandNm").get_text(" ", strip=True)
+            if p.select_one(".p_brandNm")
+            else ""
+        )
+        name_text = (
+            p.select_one(".p_productNm").get_text(" ", strip=True)
+            if p.select_one(".p_productNm")
+            else ""
+        )
+        brand_text = " ".join(w for w in brand_text.split() if not w.startswith("#"))
+        if brand_text.upper() in ("MEN", "WOMEN", "MEN/WOMEN"):
+            brand_text = ""
+        if not name_text and brand_text:
+            name_text, brand_text = brand_text, ""
+        if re.fullmatch(r"\[[^\]]+\]", brand_text):
+            brand_text = brand_text[1:-1].strip()
+        if not brand_text:
+            m = re.match(r"^\[([^\]]+)\]\s*(.+)$", name_text)
+            if m:
+                brand_text = m.group(1).strip()
+                name_text = m.group(2).strip()
+        if brand_text and "/" in name_text:
+            name_text = f"{brand_text} {name_text}"
+            brand_text = ""
+        if "증정" in brand_text or "구매시" in name_text or name_text.startswith("「"):
+            continue
+        if re.fullmatch(r"[A-Z0-9]+", name_text):
+            continue
+        price_tag = p.select_one(".p_productPrc")
+        price_txt = price_tag.get_text(" ", strip=True) if price_tag else ""
+        img_tag = p.select_one(".p_productImg")
+        img_url = img_tag["src"] if img_tag else ""
+        name_text = " ".join(name_text.split())
+        products.append({
+            "브랜드": brand_text,
+            "제품명": name_text,
+            "가격": process_price_text(price_txt),
+            "이미지": img_url
+        })
+
+    return {
+        "상세 제목": title_text,
+        "상세 기간": period_text,
+        "시작일": start_iso,
+        "종료일": end_iso,
+        "텍스트 설명": noimg_list,
+        "상품 리스트": products
+    }
+
+# --- 상세 페이지 조건부 GET 캐시 (ETag/Last-Modified/본문 해시)
+_HTTP_CACHE_STATS = {"hit_304": 0, "hit_hash": 0, "miss": 0}
+_HTTP_CACHE_STATS_LOCK = threading.Lock()
+
+def _http_cache_enabled():
+    return os.environ.get("OUTLET_HTTP_CACHE", "1").lower() not in ("0", "false", "no")
+
+def _http_cache_path(url):
+    import hashlib
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(_cache_dir(), "http", key[:2], f"{key}.json")
+
+def _http_cache_load(url):
+    import json as _json
     try:
-        import requests as _req
-        html = _req.get(url, timeout=15).text
-        soup = BeautifulSoup(html, "html.parser")
+        with open(_http_cache_path(url), "r", encoding="utf-8") as f:
+            entry = _json.load(f)
+        return entry if entry.get("url") == url else None
+    except Exception:
+        return None
 
-        title_el = soup.select_one("section.fixArea h2")
-        title_text = title_el.text.strip() if title_el else ""
+def _http_cache_store(url, entry):
+    import json as _json
+    path = _http_cache_path(url)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            _json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"⚠️ HTTP 캐시 저장 실패: {e}")
 
-        period_el = soup.select_one("table.info td")
-        period_text = period_el.text.strip() if period_el else ""
-        start_iso, end_iso = parse_period(period_text)
+def _http_cache_count(key):
+    with _HTTP_CACHE_STATS_LOCK:
+        _HTTP_CACHE_STATS[key] += 1
 
-        noimg_list = [
-            f"{r.find('th').text.strip()}: {r.find('td').text.strip()}"
-            for r in soup.select("article.noImgProduct tr")
-            if r.find('th') and r.find('td')
-        ]
+def http_cache_stats():
+    return dict(_HTTP_CACHE_STATS)
 
-        products = []
-        for p in soup.select("article.twoProduct figure"):
-            brand_text = (
-                p.select_one(".p_brandNm").get_text(" ", strip=True)
-                if p.select_one(".p_brandNm")
-                else ""
-            )
-            name_text = (
-                p.select_one(".p_productNm").get_text(" ", strip=True)
-                if p.select_one(".p_productNm")
-                else ""
-            )
-            brand_text = " ".join(w for w in brand_text.split() if not w.startswith("#"))
-            if brand_text.upper() in ("MEN", "WOMEN", "MEN/WOMEN"):
-                brand_text = ""
-            if not name_text and brand_text:
-                name_text, brand_text = brand_text, ""
-            if re.fullmatch(r"\[[^\]]+\]", brand_text):
-                brand_text = brand_text[1:-1].strip()
-            if not brand_text:
-                m = re.match(r"^\[([^\]]+)\]\s*(.+)$", name_text)
-                if m:
-                    brand_text = m.group(1).strip()
-                    name_text = m.group(2).strip()
-            if brand_text and "/" in name_text:
-                name_text = f"{brand_text} {name_text}"
-                brand_text = ""
-            if "증정" in brand_text or "구매시" in name_text or name_text.startswith("「"):
-                continue
-            if re.fullmatch(r"[A-Z0-9]+", name_text):
-                continue
-            price_tag = p.select_one(".p_productPrc")
-            price_txt = price_tag.get_text(" ", strip=True) if price_tag else ""
-            img_tag = p.select_one(".p_productImg")
-            img_url = img_tag["src"] if img_tag else ""
-            name_text = " ".join(name_text.split())
-            products.append({
-                "브랜드": brand_text,
-                "제품명": name_text,
-                "가격": process_price_text(price_txt),
-                "이미지": img_url
-            })
+def fetch_event_detail_http(url):
+    """Selenium 없이 HTTP로 상세 페이지를 파싱합니다.
 
-        return {
-            "상세 제목": title_text,
-            "상세 기간": period_text,
-            "시작일": start_iso,
-            "종료일": end_iso,
-            "텍스트 설명": noimg_list,
-            "상품 리스트": products
-        }
+    OUTLET_HTTP_CACHE(기본 1)가 켜져 있으면 캐시 디렉터리의 URL별 항목으로
+    If-None-Match/If-Modified-Since 조건부 요청을 보내고, 304 응답이거나
+    본문 해시가 같으면 파싱 없이 저장된 결과를 반환합니다.
+    요청이 실패하거나 200/304가 아니면 None (다음 실행에서 다시 수집)."""
+    try:
+        import hashlib
+        use_cache = _http_cache_enabled()
+        entry = _http_cache_load(url) if use_cache else None
+        headers = {}
+        if entry and entry.get("detail"):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        else:
+            entry = None
+        resp = http_get(url, headers=headers)
+        if entry and resp.status_code == 304:
+            _http_cache_count("hit_304")
+            return entry["detail"]
+        if resp.status_code != 200:
+            print(f"❌ 상세페이지(HTTP) 응답 {resp.status_code}: {url}")
+            return None
+        body_hash = hashlib.sha256(resp.content).hexdigest()
+        if entry and entry.get("body_hash") == body_hash:
+            _http_cache_count("hit_hash")
+            detail = entry["detail"]
+        else:
+            if use_cache:
+                _http_cache_count("miss")
+            detail = _parse_event_detail_html(resp.text)
+        if use_cache:
+            _http_cache_store(url, {
+                "url": url,
+                "etag": resp.headers.get("ETag", ""),
+                "last_modified": resp.headers.get("Last-Modified", ""),
+                "body_hash": body_hash,
+                "detail": detail,
+            })
+        return detail
     except Exception as e:
         print(f"❌ 상세페이지(HTTP) 크롤링 실패: {e}")
-        return {"상세 제목": "", "상세 기간": "", "시작일":"", "종료일":"", "텍스트 설명": [], "상품 리스트": []}
-        
-# --- HTML 페이지 생성
-def generate_html(detail_data, event_id):
-    global CFG
+        return None
+
+# --- 상세 페이지 동시 수집 (HTTP 모드 전용)
+_HOST_SEMAPHORES = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+def _host_semaphore(url):
+    """호스트별 동시 요청 상한(OUTLET_DETAIL_PER_HOST)을 지키기 위한 세마포어."""
+    host = urlparse(url).netloc
+    with _HOST_SEMAPHORES_LOCK:
+        sem = _HOST_SEMAPHORES.get(host)
+        if sem is None:
+            sem = threading.BoundedSemaphore(max(1, _env_int("OUTLET_DETAIL_PER_HOST", 4)))
+            _HOST_SEMAPHORES[host] = sem
+    return sem
+
+def _fetch_detail_http_limited(url):
+    with _host_semaphore(url):
+        return fetch_event_detail_http(url)
+
+def fetch_event_details_http(urls):
+    """여러 상세 페이지를 스레드 풀로 동시에 수집합니다.
+    결과는 입력 순서와 동일하게 반환하므로 페이지 생성/시트 행 순서가 그대로 유지됩니다.
+    실패한 항목은 None입니다.
+
+    - OUTLET_DETAIL_WORKERS: 스레드 수 (기본 8, 1이면 순차 수집)
+    - OUTLET_DETAIL_PER_HOST: 호스트당 동시 요청 상한 (기본 4)
+    """
+    workers = max(1, _env_int("OUTLET_DETAIL_WORKERS", 8))
+    if workers == 1 or len(urls) <= 1:
+        return [fetch_event_detail_http(u) for u in urls]
+    with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as ex:
+        return list(ex.map(_fetch_detail_http_limited, urls))
+
+# --- 템플릿 (프로세스당 한 번 로드/컴파일)
+_TEMPLATE_CACHE = {}
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+def compile_template(text):
+    """템플릿 문자열을 [리터럴, 자리표시자, 리터럴, ...] 세그먼트 튜플로 분해합니다.
+    짝수 인덱스는 리터럴, 홀수 인덱스는 자리표시자 이름입니다."""
+    return tuple(_PLACEHOLDER_RE.split(text))
+
+def render_template(segments, values):
+    """컴파일된 템플릿을 한 번의 join으로 렌더링합니다.
+    values에 없는 자리표시자는 원문({{이름}}) 그대로 남깁니다."""
+    out = []
+    for i, seg in enumerate(segments):
+        if i % 2 == 0:
+            out.append(seg)
+        else:
+            value = values.get(seg)
+            out.append("{{" + seg + "}}" if value is None else value)
+    return "".join(out)
+
+def load_template(template_path):
+    segments = _TEMPLATE_CACHE.get(template_path)
+    if segments is None:
+        with _TEMPLATE_CACHE_LOCK:
+            segments = _TEMPLATE_CACHE.get(template_path)
+            if segments is None:
+                with open(template_path, "r", encoding="utf-8") as f:
+                    segments = compile_template(f.read())
+                _TEMPLATE_CACHE[template_path] = segments
+    return segments
+
+def _template_path():
     # 템플릿 경로: 환경설정 우선, 없으면 기존 기본값
-    template_path = None
     if CFG and CFG.get("TEMPLATE_PATH"):
-        template_path = CFG["TEMPLATE_PATH"]
-    else:
-        template_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "template.html")
+        return CFG["TEMPLATE_PATH"]
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "template.html")
 
-    with open(template_path, "r", encoding="utf-8") as f:
-        template = f.read()
+def _pages_dir():
+    # 출력 디렉토리: 환경설정 우선, 없으면 기존 기본값
+    if CFG and CFG.get("PAGES_DIR"):
+        return CFG["PAGES_DIR"]
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "../web/public/pages")
+
+# 지점명을 영문으로 변환
+BRANCH_EN = {
+    "송도": "songdo",
+    "김포": "gimpo",
+    "스페이스원": "spaceone",
+}
+
+def _norm_spaces(s: str) -> str:
+    return re.sub(r"\s+", " ", (s or "")).strip()
+
+def slugify(text):
+    """제목을 URL 친화적으로 변환 (한글 유지, 특수문자 제거)"""
+    text = re.sub(r'[^\w\s가-힣]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    text = text.replace(' ', '-')
+    text = re.sub(r'-+', '-', text)
+    text = text.strip('-')
+    return text.lower()
+
+def _render_product(p):
+    return f"""
+        <div class='product'>
+          <img
+            src="{p['이미지']}"
+            alt="{p['제품명']} 행사 이미지"
+            loading="lazy" decoding="async" width="800" height="800"
+          />
+          <h3 class='name'>{p['제품명']}</h3>
+          <p class='price'>{p['가격']}</p>
+        </div>
+        """
 
-    # 템플릿 변수 치환
-    html = template
-    # 제목/설명 정리: 개행 제거 및 JSON-LD용 이스케이프 값 추가
+def build_page_values(detail_data, update_date=None):
+    """상세 페이지 템플릿 자리표시자 값 dict와 (url_path, filename, branch_en)을 반환합니다.
+    관련 행사({{관련 행사}}, {{RELATED_PREFETCH}})는 호출자가 채웁니다."""
     import json as _json
-    def _norm_spaces(s: str) -> str:
-        import re as _re
-        return _re.sub(r"\s+", " ", (s or "")).strip()
+    update_date = update_date or datetime.today().strftime('%Y-%m-%d')
 
+    # 제목/설명 정리: 개행 제거 및 JSON-LD용 이스케이프 값 추가
     title_clean = _norm_spaces(detail_data["제목"])  # 개행/연속 공백 정규화
     desc_clean = _norm_spaces(detail_data.get("혜택 설명", ""))
 
@@ -535,22 +969,6 @@ def generate_html(detail_data, event_id):
     end_iso = detail_data.get("종료일", "")
     event_status = get_event_status(start_iso, end_iso)
 
-    # 종료된 이벤트는 noindex 처리
-    if event_status == "expired":
-        noindex_tag = '<meta name="robots" content="noindex, follow">'
-    else:
-        noindex_tag = ""
-    html = html.replace("{{NOINDEX_TAG}}", noindex_tag)
-
-    # 이벤트 상태에 따른 스키마 타입 결정
-    html = html.replace("{{EVENT_STATUS}}", event_status)
-
-    html = html.replace("{{제목}}", title_clean)
-    html = html.replace("{{기간}}", detail_data["기간"])
-    html = html.replace("{{상세 제목}}", detail_data["상세 제목"])
-    html = html.replace("{{상세 기간}}", detail_data["상세 기간"])
-    html = html.replace("{{썸네일}}", detail_data.get("썸네일", ""))
-    html = html.replace("{{혜택 설명}}", desc_clean.replace("\n", "<br>"))
     # 메타/OG/JSON-LD 설명: 혜택 설명이 없으면 기간/지점 기반으로 대체
     branch_label = detail_data.get("지점명", "")
     period_label = _norm_spaces(detail_data.get("기간", "")) or _norm_spaces(detail_data.get("상세 기간", ""))
@@ -559,17 +977,6 @@ def generate_html(detail_data, event_id):
     else:
         fallback = f"{period_label}" if period_label else f"현대 프리미엄 아울렛 {branch_label} 행사"
         meta_desc = f"{title_clean} | {fallback}"
-    html = html.replace("{{META_DESC}}", meta_desc)
-    html = html.replace("{{OG_DESC}}", meta_desc)
-    # JSON-LD에 안전하게 삽입할 수 있도록 JSON 문자열로 이스케이프된 값 주입
-    html = html.replace("{{제목_JSON}}", _json.dumps(title_clean, ensure_ascii=False))
-    html = html.replace("{{DESC_JSON}}", _json.dumps(desc_clean or meta_desc, ensure_ascii=False))
-    html = html.replace("{{업데이트 날짜}}", datetime.today().strftime('%Y-%m-%d'))
-    html = html.replace("{{시작일}}", start_iso)
-    html = html.replace("{{종료일}}", end_iso)
-    html = html.replace("{{지점명}}", detail_data.get("지점명", ""))
-    html = html.replace("{{event_id}}", detail_data.get("id", ""))
-    html = html.replace("{{상세 링크}}", detail_data.get("상세 링크", "#"))
 
     # JSON-LD 스키마 생성 (조건부: 진행 중이고 날짜가 유효하면 Event, 그 외 Article)
     jsonld_schema = _generate_jsonld_schema(
@@ -580,131 +987,247 @@ def generate_html(detail_data, event_id):
         event_status=event_status,
         branch=detail_data.get("지점명", ""),
         thumbnail=detail_data.get("썸네일", ""),
-        update_date=datetime.today().strftime('%Y-%m-%d')
+        update_date=update_date
     )
-    html = html.replace("{{JSONLD_SCHEMA}}", jsonld_schema)
-
-    # 상품 리스트 HTML 생성 (이미지 저장 없이 URL만 사용)
-    product_html = ""
-    for p in detail_data["상품 리스트"]:
-        product_html += f"""
-        <div class='product'>
-          <img
-            src="{p['이미지']}"
-            alt="{p['제품명']} 행사 이미지"
-            loading="lazy" decoding="async" width="800" height="800"
-          />
-          <h3 class='name'>{p['제품명']}</h3>
-          <p class='price'>{p['가격']}</p>
-        </div>
-        """
 
-    html = html.replace("{{상품 목록}}", product_html)
-
-    # pages 폴더에 SEO 친화적인 파일명으로 저장
-    # 출력 디렉토리: 환경설정 우선, 없으면 기존 기본값
-    output_dir = None
-    if CFG and CFG.get("PAGES_DIR"):
-        output_dir = CFG["PAGES_DIR"]
-    else:
-        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../web/public/pages")
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # 지점명을 영문으로 변환
-    branch_mapping = {
-        "송도": "songdo",
-        "김포": "gimpo", 
-        "스페이스원": "spaceone"
-    }
-    
-    branch = detail_data.get("지점명", "송도")
-    branch_en = branch_mapping.get(branch, "songdo")
-    
-    # 제목을 URL 친화적으로 변환
-    def slugify(text):
-        import re
-        # 한글을 유지하면서 특수문자 제거
-        text = re.sub(r'[^\w\s가-힣]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        text = text.replace(' ', '-')
-        text = re.sub(r'-+', '-', text)
-        text = text.strip('-')
-        return text.lower()
-    
+    branch_en = BRANCH_EN.get(detail_data.get("지점명", "송도"), "songdo")
     title_slug = slugify(detail_data["제목"])
-    
-    # 새 URL 경로 생성
     url_path = f"{branch_en}/{title_slug}"
     filename = f"{branch_en}-{title_slug}.html"
-    
-    # 템플릿에 경로 변수 주입
-    html = html.replace("{{filename}}", filename)
     # 사이트 기본 URL: 환경설정 사용
-    site_base = (CFG or {}).get("SITE_BASE_URL", "https://discounts.deluxo.co.kr")
-    pretty_path = f"{site_base.rstrip('/')}/{url_path}"
-    html = html.replace("{{pretty_path}}", pretty_path)
-    html = html.replace("{{site_base}}", site_base.rstrip('/'))
-    html = html.replace("{{branch_en}}", branch_en)
-
-    # 관련 행사(같은 지점) 3~5개 생성
-    # 기준: 동일 브랜치 파일들 중 최근 수정 순 (현재 파일 제외)
+    site_base = (CFG or {}).get("SITE_BASE_URL", "https://discounts.deluxo.co.kr").rstrip('/')
+
+    values = {
+        # 종료된 이벤트는 noindex 처리
+        "NOINDEX_TAG": '<meta name="robots" content="noindex, follow">' if event_status == "expired" else "",
+        "EVENT_STATUS": event_status,
+        "제목": title_clean,
+        "기간": detail_data["기간"],
+        "상세 제목": detail_data["상세 제목"],
+        "상세 기간": detail_data["상세 기간"],
+        "썸네일": detail_data.get("썸네일", ""),
+        "혜택 설명": desc_clean.replace("\n", "<br>"),
+        "META_DESC": meta_desc,
+        "OG_DESC": meta_desc,
+        # JSON-LD에 안전하게 삽입할 수 있도록 JSON 문자열로 이스케이프된 값 주입
+        "제목_JSON": _json.dumps(title_clean, ensure_ascii=False),
+        "DESC_JSON": _json.dumps(desc_clean or meta_desc, ensure_ascii=False),
+        "업데이트 날짜": update_date,
+        "시작일": start_iso,
+        "종료일": end_iso,
+        "지점명": detail_data.get("지점명", ""),
+        "event_id": detail_data.get("id", ""),
+        "상세 링크": detail_data.get("상세 링크", "#"),
+        "JSONLD_SCHEMA": jsonld_schema,
+        # 상품 리스트 HTML 생성 (이미지 저장 없이 URL만 사용)
+        "상품 목록": "".join(_render_product(p) for p in detail_data["상품 리스트"]),
+        "filename": filename,
+        "pretty_path": f"{site_base}/{url_path}",
+        "site_base": site_base,
+        "branch_en": branch_en,
+    }
+    return values, url_path, filename, branch_en
+
+# --- 페이지 매니페스트 (pages 디렉터리의 구조화된 메타데이터)
+# 실행당 한 번 구축하고 페이지를 쓸 때마다 갱신한 뒤, main 종료 시 JSON Lines로 저장합니다.
+# 레코드 형식, 파일명 분리, HTML 추출, 상태 판정은 apps/web/tools/page_manifest.py와 공유합니다
+# (도구들이 같은 파일을 읽으므로 구현은 한 곳). mtime은 내용이 마지막으로 바뀐 시각입니다
+# (checkout 등으로 파일 시각만 바뀌고 내용 해시가 같으면 기존 값을 유지).
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "web", "tools"))
+import page_manifest
+
+_PAGE_INDEX = {}  # pages_dir -> {filename: record}
+_PAGE_INDEX_LOCK = threading.Lock()
+
+def _manifest_path():
+    return (CFG or _get_config())["MANIFEST_PATH"]
+
+def _h1_text(fragment):
+    """BeautifulSoup의 h1.get_text(strip=True)와 같은 결과 (마크업이 없으면 파싱 생략)."""
+    if '<' not in fragment and '&' not in fragment:
+        return fragment.strip()
+    soup = BeautifulSoup(f"<h1>{fragment}</h1>", "html.parser")
+    h1 = soup.find('h1')
+    return h1.get_text(strip=True) if h1 else ""
+
+def _file_content_hash(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as rf:
+            return page_manifest.content_hash(rf.read())
+    except Exception:
+        return ""
+
+def get_page_index(pages_dir):
+    """pages 디렉터리의 매니페스트 레코드를 반환합니다 (실행당 한 번 구축).
+
+    저장된 매니페스트를 읽고, 파일 시각과 내용 해시가 모두 달라진 파일이나
+    매니페스트에 없는 파일만 HTML을 파싱해 보충합니다.
+    """
+    index = _PAGE_INDEX.get(pages_dir)
+    if index is not None:
+        return index
+    with _PAGE_INDEX_LOCK:
+        index = _PAGE_INDEX.get(pages_dir)
+        if index is None:
+            known = page_manifest.load_manifest(_manifest_path())
+            index = {}
+            scanned = 0
+            if os.path.isdir(pages_dir):
+                for fn in os.listdir(pages_dir):
+                    if not page_manifest.split_filename(fn)[0]:
+                        continue
+                    path = os.path.join(pages_dir, fn)
+                    mtime = os.path.getmtime(path)
+                    record = known.get(fn)
+                    if record and record.get("mtime") != mtime \
+                            and record.get("content_hash") != _file_content_hash(path):
+                        record = None
+                    if record is None:
+                        record = page_manifest.scrape_page(path, fn)
+                        scanned += 1
+                    index[fn] = record
+            if known or scanned:
+                print(f"🗂️ 페이지 매니페스트: {len(index)}개 (HTML 파싱 {scanned}개)")
+            _PAGE_INDEX[pages_dir] = index
+    return index
+
+def page_index_update(pages_dir, filename, values, content_hash, written=True):
+    """생성(또는 변경 없음으로 유지)한 페이지를 매니페스트에 반영합니다."""
+    branch_en, slug = page_manifest.split_filename(filename)
+    if not branch_en:
+        return
+    index = get_page_index(pages_dir)
+    previous = index.get(filename)
+    if written or not previous:
+        mtime = os.path.getmtime(os.path.join(pages_dir, filename))
+    else:
+        mtime = previous.get("mtime", 0)
+    record = {
+        "id": values["event_id"],
+        "branch": branch_en,
+        "slug": slug,
+        "filename": filename,
+        "title": _h1_text(values["제목"]),
+        "start": values["시작일"],
+        "end": values["종료일"],
+        "status": values["EVENT_STATUS"],
+        "noindex": bool(values["NOINDEX_TAG"]),
+        "content_hash": content_hash,
+        "mtime": mtime,
+    }
+    with _PAGE_INDEX_LOCK:
+        index[filename] = record
+
+def write_page_manifest(pages_dir, path=None):
+    """매니페스트를 파일명 순 JSON Lines로 저장합니다 (원자적 교체)."""
+    path = path or _manifest_path()
+    index = get_page_index(pages_dir)
+    with _PAGE_INDEX_LOCK:
+        records = list(index.values())
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    page_manifest.save_manifest(records, path)
+    print(f"✔ 페이지 매니페스트 저장: {len(records)}개 → {path}")
+
+def _collect_related(output_dir, branch_en, filename):
+    """관련 행사(같은 지점) 3~5개: 동일 브랜치 페이지 중 최근 수정 순 (현재 파일 제외)"""
+    index = get_page_index(output_dir)
+    with _PAGE_INDEX_LOCK:
+        candidates = [
+            (rec["mtime"], fn, rec["title"], rec["slug"])
+            for fn, rec in index.items()
+            if rec["branch"] == branch_en and fn != filename
+        ]
+    # 최신순 정렬 후 상위 5개
+    candidates.sort(key=lambda x: (-x[0], x[1]))
     related_html = []
     related_prefetch = []
+    for i, (_, _, title_text, slug) in enumerate(candidates[:5]):
+        pretty = f"/{branch_en}/{slug}"
+        title_display = title_text or slug
+        related_html.append(f"<li><a href=\"{pretty}\">{title_display}</a></li>")
+        if i < 2:
+            related_prefetch.append(f"<link rel=\"prefetch\" href=\"{pretty}\" as=\"document\">")
+    return "\n".join(related_html), "\n  ".join(related_prefetch)
+
+# --- 변경 없는 페이지 쓰기 생략
+# 업데이트 날짜(JSON-LD dateModified 등)만 다른 경우는 내용 변경으로 보지 않습니다.
+_PAGE_WRITE_STATS = {"written": 0, "skipped": 0}
+_PAGE_WRITE_STATS_LOCK = threading.Lock()
+_DATE_MODIFIED_RE = re.compile(r'"dateModified":\s*"(\d{4}-\d{2}-\d{2})"')
+
+def _content_hash(text):
+    import hashlib
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def _page_write_count(key):
+    with _PAGE_WRITE_STATS_LOCK:
+        _PAGE_WRITE_STATS[key] += 1
+
+def page_write_stats():
+    return dict(_PAGE_WRITE_STATS)
+
+def _read_existing_page(path):
     try:
-        import os as _os
-        from bs4 import BeautifulSoup as _BS
-        candidates = []
-        for fn in _os.listdir(output_dir):
-            if not fn.endswith('.html'):
-                continue
-            if not fn.startswith(f"{branch_en}-"):
-                continue
-            if fn == filename:
-                continue
-            path = _os.path.join(output_dir, fn)
-            mtime = _os.path.getmtime(path)
-            # 타이틀 추출
-            title_text = None
-            try:
-                with open(path, 'r', encoding='utf-8') as rf:
-                    soup = _BS(rf, 'html.parser')
-                    h1 = soup.find('h1')
-                    if h1 and h1.get_text(strip=True):
-                        title_text = h1.get_text(strip=True)
-            except Exception:
-                title_text = None
-            candidates.append((mtime, fn, title_text))
-        # 최신순 정렬 후 상위 5개
-        candidates.sort(key=lambda x: -x[0])
-        top_related = candidates[:5]
-        for i, (_, fn, title_text) in enumerate(top_related):
-            slug = fn[len(branch_en)+1:-5]
-            pretty = f"/{branch_en}/{slug}"
-            title_display = title_text or slug
-            related_html.append(f"<li><a href=\"{pretty}\">{title_display}</a></li>")
-            if i < 2:
-                related_prefetch.append(f"<link rel=\"prefetch\" href=\"{pretty}\" as=\"document\">")
-    except Exception:
-        pass
-    html = html.replace("{{관련 행사}}", "\n".join(related_html))
-    html = html.replace("{{RELATED_PREFETCH}}", "\n  ".join(related_prefetch))
-    
-    # 파일명 생성 (pages 폴더 안에 저장)
+        with open(path, 'r', encoding='utf-8') as rf:
+            return rf.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def _is_unchanged_page(existing, detail_data, values, html):
+    """기존 파일이 새 내용과 업데이트 날짜를 빼고 같은지 확인합니다.
+
+    기존 파일의 dateModified 날짜로 다시 렌더링해 해시를 비교하므로,
+    날짜 외의 내용이 하나라도 바뀌면 변경으로 판단합니다.
+    """
+    if existing is None:
+        return False
+    existing_hash = _content_hash(existing)
+    if existing_hash == _content_hash(html):
+        return True
+    m = _DATE_MODIFIED_RE.search(existing)
+    if not m or m.group(1) == values["업데이트 날짜"]:
+        return False
+    prev_values = build_page_values(detail_data, update_date=m.group(1))[0]
+    prev_values["관련 행사"] = values["관련 행사"]
+    prev_values["RELATED_PREFETCH"] = values["RELATED_PREFETCH"]
+    prev_html = render_template(load_template(_template_path()), prev_values)
+    return existing_hash == _content_hash(prev_html)
+
+# --- HTML 페이지 생성
+def generate_html(detail_data, event_id):
+    values, url_path, filename, branch_en = build_page_values(detail_data)
+
+    # pages 폴더에 SEO 친화적인 파일명으로 저장
+    output_dir = _pages_dir()
+    os.makedirs(output_dir, exist_ok=True)
+
+    values["관련 행사"], values["RELATED_PREFETCH"] = _collect_related(output_dir, branch_en, filename)
+    html = render_template(load_template(_template_path()), values)
+
+    # HTML 파일 저장 (pages 폴더 안에 저장) — 업데이트 날짜 외에 바뀐 내용이 없으면 기존 파일 유지
     filename_html = os.path.join(output_dir, filename)
-    
-    # HTML 파일 저장
-    with open(filename_html, "w", encoding="utf-8") as f:
-        f.write(html)
-    
+    existing = _read_existing_page(filename_html)
+    if _is_unchanged_page(existing, detail_data, values, html):
+        _page_write_count("skipped")
+        page_index_update(output_dir, filename, values, _content_hash(existing), written=False)
+    else:
+        with open(filename_html, "w", encoding="utf-8") as f:
+            f.write(html)
+        _page_write_count("written")
+        page_index_update(output_dir, filename, values, _content_hash(html))
+
     # URL 매핑에 추가 (개선된 포괄적 방식)
     event_id = detail_data.get("id", "")
-    if event_id and 'url_mapping' in globals():
+    mapping_log = getattr(_BRANCH_CTX, "mapping_log", None)
+    if event_id and mapping_log is not None:
+        # 지점 병렬 크롤링 중에는 기록만 해 두고 main에서 지점 순서대로 반영
+        mapping_log.append((event_id, filename))
+    elif event_id and 'url_mapping' in globals():
         mappings_count = add_comprehensive_mapping(event_id, filename)
         print(f"  📌 {mappings_count}개 변형 매핑 추가: {event_id} → {filename}")
-    
+
     print(f"✔ SEO 친화적인 HTML 생성 완료: {url_path}")
-    
+
     return url_path
 
 def add_comprehensive_mapping(event_id, filename):
@@ -754,29 +1277,50 @@ def add_comprehensive_mapping(event_id, filename):
     
     return mappings_added
 
+def _event_dates_from_content(content):
+    """HTML 문자열에서 (startDate, endDate, noindex 여부) 추출 (JSON-LD 파싱)"""
+    # startDate와 endDate 추출 (JSON-LD에서)
+    start_match = re.search(r'"startDate"\s*:\s*"([^"]+)"', content)
+    end_match = re.search(r'"endDate"\s*:\s*"([^"]+)"', content)
+
+    start_date = start_match.group(1) if start_match else ""
+    end_date = end_match.group(1) if end_match else ""
+
+    # noindex 태그 확인
+    has_noindex = 'name="robots" content="noindex' in content
+
+    return start_date, end_date, has_noindex
+
+def _read_html_head(filepath, chunk_size=4096):
+    """파일을 조금씩 읽다가 </head>를 만나면 멈추고 (head 문자열, 읽은 바이트 수)를 반환합니다.
+    </head>가 없으면 파일 전체를 반환합니다."""
+    buf = bytearray()
+    with open(filepath, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            # 청크 경계에 걸친 태그도 찾도록 직전 6바이트부터 검색
+            start = max(0, len(buf) - 6)
+            buf += chunk
+            pos = bytes(buf[start:]).lower().find(b'</head>')
+            if pos != -1:
+                return bytes(buf[:start + pos + 7]).decode('utf-8', errors='replace'), len(buf)
+    return bytes(buf).decode('utf-8', errors='replace'), len(buf)
+
 def _extract_event_dates_from_html(filepath):
-    """HTML 파일에서 이벤트 날짜 추출 (JSON-LD 파싱)"""
+    """HTML 파일에서 이벤트 날짜 추출 (JSON-LD 파싱)
+    startDate/endDate/robots 메타는 모두 <head>에 있으므로 </head>까지만 읽습니다."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # startDate와 endDate 추출 (JSON-LD에서)
-        start_match = re.search(r'"startDate"\s*:\s*"([^"]+)"', content)
-        end_match = re.search(r'"endDate"\s*:\s*"([^"]+)"', content)
-
-        start_date = start_match.group(1) if start_match else ""
-        end_date = end_match.group(1) if end_match else ""
-
-        # noindex 태그 확인
-        has_noindex = 'name="robots" content="noindex' in content
-
-        return start_date, end_date, has_noindex
+        head, _ = _read_html_head(filepath)
+        return _event_dates_from_content(head)
     except Exception:
         return "", "", False
 
-def generate_sitemap(pages_dir, base_url, output_path, split_threshold: int = 5000):
+def generate_sitemap(pages_dir, base_url, output_path, split_threshold: int = 5000, manifest=None):
     """Generate sitemap.
     - 진행 중/예정된 이벤트만 포함 (종료된 이벤트는 제외)
+    - manifest(get_page_index 결과)가 주어지면 HTML 파일 대신 매니페스트 레코드를 사용
     - If URL count <= split_threshold: write a single urlset to output_path.
     - Else: write multiple part files (sitemap-1.xml, sitemap-2.xml, ...), and
       make output_path a sitemap index that points to those part files.
@@ -791,20 +1335,27 @@ def generate_sitemap(pages_dir, base_url, output_path, split_threshold: int = 50
     urls.append((site_root + "privacy.html", today, "0.5"))
 
     # ── ② 상세 페이지(프리티 URL) - 진행 중인 이벤트만 포함
-    for filename in os.listdir(pages_dir):
+    for filename in (sorted(manifest) if manifest is not None else os.listdir(pages_dir)):
         if filename.endswith(".html") and '-' in filename and not filename.startswith('index'):
-            filepath = os.path.join(pages_dir, filename)
+            if manifest is not None:
+                record = manifest[filename]
+                event_status = page_manifest.record_status(record)
+                has_noindex = record.get("noindex", False)
+                mtime = record.get("mtime", 0)
+            else:
+                filepath = os.path.join(pages_dir, filename)
 
-            # 이벤트 날짜 확인
-            start_date, end_date, has_noindex = _extract_event_dates_from_html(filepath)
-            event_status = get_event_status(start_date, end_date)
+                # 이벤트 날짜 확인
+                start_date, end_date, has_noindex = _extract_event_dates_from_html(filepath)
+                event_status = get_event_status(start_date, end_date)
+                mtime = os.path.getmtime(filepath)
 
             # 종료된 이벤트 또는 noindex 페이지는 sitemap에서 제외
             if event_status == "expired" or has_noindex:
                 excluded_count += 1
                 continue
 
-            lastmod = datetime.fromtimestamp(os.path.getmtime(filepath)).strftime('%Y-%m-%d')
+            lastmod = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
             name_without_ext = filename[:-5]
             if name_without_ext.startswith('songdo-'):
                 url_path = name_without_ext.replace('songdo-', 'songdo/')
@@ -860,7 +1411,7 @@ def generate_sitemap(pages_dir, base_url, output_path, split_threshold: int = 50
         print(f"✔ sitemap.xml 생성 완료(단일 파일, {len(urls)} urls): {output_path}")
         # Clean up old parts if any
         for fn in os.listdir(output_dir):
-            if fn.startswith('sitemap-') and fn.endswith('.xml'):
+            if fn.startswith('sitemap-') and (fn.endswith('.xml') or fn.endswith('.xml.gz')):
                 try:
                     os.remove(os.path.join(output_dir, fn))
                 except Exception:
@@ -870,7 +1421,7 @@ def generate_sitemap(pages_dir, base_url, output_path, split_threshold: int = 50
     # Split into multiple parts and build index
     # Clean old parts first
     for fn in os.listdir(output_dir):
-        if fn.startswith('sitemap-') and fn.endswith('.xml'):
+        if fn.startswith('sitemap-') and (fn.endswith('.xml') or fn.endswith('.xml.gz')):
             try:
                 os.remove(os.path.join(output_dir, fn))
             except Exception:
@@ -900,15 +1451,178 @@ def generate_sitemap(pages_dir, base_url, output_path, split_threshold: int = 50
         f.write("\n".join(index_xml))
     print(f"✔ sitemap index 생성 완료({len(parts)} parts, 총 {len(urls)} urls): {output_path}")
 
-def generate_index(pages_dir, index_path):
+# --- 지점별 스트리밍 sitemap (OUTLET_SITEMAP_SPLIT=branch)
+# songdo/gimpo/spaceone/events 파트를 URL 하나씩 바로 파일에 쓰고, 파트 끝에 URL/lastmod
+# 다이제스트를 주석으로 남겨 내용이 같은 파트는 다시 쓰지 않습니다.
+SITEMAP_BRANCH_PARTS = ("songdo", "gimpo", "spaceone", "events")
+_SITEMAP_DIGEST_RE = re.compile(r"<!-- digest: ([0-9a-f]{64}) -->")
+
+def _sitemap_page_entries(pages_dir, branch_en, manifest, counts):
+    """지점 하나의 상세 페이지 (filename, 상태, lastmod) — 종료/noindex 페이지 제외, 파일명 순."""
+    if manifest is not None:
+        filenames = sorted(fn for fn, rec in manifest.items() if rec.get("branch") == branch_en)
+    else:
+        filenames = sorted(fn for fn in os.listdir(pages_dir)
+                           if page_manifest.split_filename(fn)[0] == branch_en)
+    for fn in filenames:
+        if manifest is not None:
+            record = manifest[fn]
+            event_status = page_manifest.record_status(record)
+            has_noindex = record.get("noindex", False)
+            mtime = record.get("mtime", 0)
+        else:
+            filepath = os.path.join(pages_dir, fn)
+            start_date, end_date, has_noindex = _extract_event_dates_from_html(filepath)
+            event_status = get_event_status(start_date, end_date)
+            mtime = os.path.getmtime(filepath)
+        if event_status == "expired" or has_noindex:
+            counts["excluded"] += 1
+            continue
+        counts["included"] += 1
+        yield fn, event_status, datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
+
+def _sitemap_part_urls(part, pages_dir, base_url, manifest, counts, newest):
+    """파트별 (url, lastmod, priority)를 하나씩 생성합니다."""
+    base = base_url.rstrip('/')
+    if part in BRANCH_EN.values():
+        for fn, event_status, lastmod in _sitemap_page_entries(pages_dir, part, manifest, counts):
+            newest[part] = max(newest.get(part, ""), lastmod)
+            # 진행 중인 이벤트는 높은 priority
+            yield f"{base}/{part}/{fn[len(part)+1:-5]}", lastmod, "0.8" if event_status == "active" else "0.6"
+        return
+    # events 파트: 루트/정적 페이지 + /events 허브. lastmod는 실행 날짜 대신
+    # 해당 허브가 모으는 상세 페이지의 최신 lastmod를 사용 (지점 파트를 먼저 생성)
+    site_newest = max(newest.values(), default=datetime.today().strftime('%Y-%m-%d'))
+    yield base + '/', site_newest, "1.0"
+    yield base + '/privacy.html', site_newest, "0.5"
+    events_dir = os.path.abspath(os.path.join(pages_dir, '..', 'events'))
+    if os.path.isdir(events_dir):
+        for fn in sorted(os.listdir(events_dir)):
+            if not fn.endswith('.html'):
+                continue
+            name = fn[:-5]
+            if fn == 'index.html':
+                url, lastmod = f"{base}/events/", site_newest
+            elif name in newest:
+                url, lastmod = f"{base}/events/{fn}", newest[name]
+            else:
+                fp = os.path.join(events_dir, fn)
+                url = f"{base}/events/{fn}"
+                lastmod = datetime.fromtimestamp(os.path.getmtime(fp)).strftime('%Y-%m-%d')
+            yield url, lastmod, "0.9"  # 허브 페이지는 높은 priority
+
+def _sitemap_file_digest(path):
+    import gzip
+    try:
+        with (gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')) as f:
+            data = f.read()
+    except Exception:
+        return None
+    m = _SITEMAP_DIGEST_RE.search(data.decode('utf-8', errors='replace'))
+    return m.group(1) if m else None
+
+def _write_sitemap_part(path, urls):
+    """urlset을 임시 파일에 스트리밍으로 쓰고, 다이제스트가 기존 파일과 같으면 버립니다.
+    반환: (변경 여부, URL 수, 최신 lastmod)"""
+    import gzip
+    import hashlib
+    digest = hashlib.sha256()
+    count = 0
+    part_lastmod = ""
+    tmp = path + ".tmp"
+    raw = open(tmp, 'wb')
+    # mtime=0: 내용이 같으면 압축 파일 바이트도 같도록
+    f = gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) if path.endswith('.gz') else raw
+    try:
+        f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write(b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for url, lastmod, prio in urls:
+            digest.update(f"{url}\t{lastmod}\t{prio}\n".encode('utf-8'))
+            count += 1
+            part_lastmod = max(part_lastmod, lastmod)
+            f.write((
+                "  <url>\n"
+                f"    <loc>{url}</loc>\n"
+                f"    <lastmod>{lastmod}</lastmod>\n"
+                "    <changefreq>daily</changefreq>\n"
+                f"    <priority>{prio}</priority>\n"
+                "  </url>\n"
+            ).encode('utf-8'))
+        f.write(b'</urlset>\n')
+        f.write(f"<!-- digest: {digest.hexdigest()} -->\n".encode('utf-8'))
+    finally:
+        f.close()
+        raw.close()
+    if _sitemap_file_digest(path) == digest.hexdigest():
+        os.remove(tmp)
+        return False, count, part_lastmod
+    os.replace(tmp, path)
+    return True, count, part_lastmod
+
+def generate_branch_sitemaps(pages_dir, base_url, output_path, manifest=None, gzip_parts=False):
+    """지점별 sitemap 파트(sitemap-{part}.xml[.gz]) + output_path의 sitemap index를 생성합니다.
+    - 진행 중/예정된 이벤트만 포함 (종료/noindex 제외), URL 목록을 메모리에 모으지 않음
+    - URL/lastmod가 바뀐 파트만 다시 씀 (파트 끝 다이제스트 주석 비교)
+    """
+    output_dir = os.path.dirname(output_path)
+    ext = ".xml.gz" if gzip_parts else ".xml"
+    counts = {"included": 0, "excluded": 0}
+    newest = {}
+    parts = []
+    rewritten = 0
+    for part in SITEMAP_BRANCH_PARTS:
+        name = f"sitemap-{part}{ext}"
+        urls = _sitemap_part_urls(part, pages_dir, base_url, manifest, counts, newest)
+        changed, count, lastmod = _write_sitemap_part(os.path.join(output_dir, name), urls)
+        rewritten += changed
+        parts.append((name, lastmod or datetime.today().strftime('%Y-%m-%d'), count))
+
+    # 다른 형식/이전 방식(sitemap-1.xml 등)의 파트 정리
+    keep = {name for name, _, _ in parts}
+    for fn in os.listdir(output_dir):
+        if fn.startswith('sitemap-') and (fn.endswith('.xml') or fn.endswith('.xml.gz')) and fn not in keep:
+            try:
+                os.remove(os.path.join(output_dir, fn))
+            except Exception:
+                pass
+
+    index_xml = ['<?xml version="1.0" encoding="UTF-8"?>']
+    index_xml.append('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">')
+    for name, lm, _ in parts:
+        index_xml.append("  <sitemap>")
+        index_xml.append(f"    <loc>{base_url.rstrip('/')}/{name}</loc>")
+        index_xml.append(f"    <lastmod>{lm}</lastmod>")
+        index_xml.append("  </sitemap>")
+    index_xml.append('</sitemapindex>')
+    index_text = "\n".join(index_xml)
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            index_changed = f.read() != index_text
+    except OSError:
+        index_changed = True
+    if index_changed:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(index_text)
+
+    print(f"📊 sitemap: {counts['included']}개 이벤트 포함, {counts['excluded']}개 종료된 이벤트 제외")
+    summary = ", ".join(f"{name} {count}" for name, _, count in parts)
+    print(f"✔ 지점별 sitemap 생성 완료({summary}; 변경 파트 {rewritten}개, index {'갱신' if index_changed else '유지'}): {output_path}")
+
+def generate_index(pages_dir, index_path, manifest=None):
     import os
     from datetime import datetime
     from bs4 import BeautifulSoup
 
+    manifest = manifest or {}
     links = []
     for fn in sorted(os.listdir(pages_dir)):
         if not (fn.startswith("event-") and fn.endswith(".html")):
             continue
+        url = f"pages/{fn}"
+        # 매니페스트에 제목이 있으면 HTML 파싱 생략
+        if manifest.get(fn, {}).get("title"):
+            links.append((manifest[fn]["title"], url))
+            continue
         filepath = os.path.join(pages_dir, fn)
         # ① 파일 열어서 제목(<h1> 또는 템플릿 구조에 맞는 요소) 파싱
         with open(filepath, "r", encoding="utf-8") as f:
@@ -947,11 +1661,152 @@ def generate_index(pages_dir, index_path):
     print(f"✔ index.html 생성 완료: {index_path}")
 
 
+# --- 정적 이벤트 피드 (events.json)
+# 홈 캘린더가 Sheets API 대신 읽는 파일. 행사 하나당 레코드 하나, 캘린더가 쓰는 값만 담고
+# 상품은 [브랜드, 제품명, 가격] 배열로 중첩합니다. 기존 파일을 저장소로 삼아 이번 실행에서
+# 수집한 행사만 id 기준으로 갱신하므로, 증분 모드로 건너뛴 행사도 그대로 유지됩니다.
+EVENTS_FEED_VERSION = 1
+_FEED_OUTLETS = ("송도", "김포", "스페이스원")
+_FEED_UPDATES = {}
+_FEED_LOCK = threading.Lock()
+
+def _events_feed_enabled():
+    return os.environ.get("OUTLET_EVENTS_FEED", "1").lower() not in ("0", "false", "no")
+
+def _wrap_year_end(start, end):
+    """연말-연초 행사 (예: 12.20 ~ 01.05): parse_period는 두 날짜에 같은 연도를 붙이므로
+    시작일이 종료일보다 늦으면 종료일 연도를 1 올림 (script.js parseSheetData와 같은 처리)"""
+    if start > end:
+        y, m, d = end.split("-")
+        end = f"{int(y) + 1}-{m}-{d}"
+    return start, end
+
+def events_feed_record(detail_data):
+    """상세 수집 결과 → 피드 레코드 (날짜를 알 수 없으면 None: 캘린더에 표시할 수 없음)"""
+    start = detail_data.get("시작일", "")
+    end = detail_data.get("종료일", "")
+    if not start or not end:
+        p_start, p_end = parse_period(detail_data.get("기간", ""))
+        start, end = start or p_start, end or p_end
+    if not start or not end:
+        return None
+    start, end = _wrap_year_end(start, end)
+    return {
+        "id": detail_data.get("id", ""),
+        "outlet": detail_data.get("지점명", ""),
+        "title": detail_data.get("제목", ""),
+        "start": start,
+        "end": end,
+        "thumbnail": detail_data.get("썸네일", ""),
+        "desc": detail_data.get("혜택 설명", ""),
+        "items": [[p["브랜드"], p["제품명"], p["가격"]] for p in detail_data.get("상품 리스트", [])],
+    }
+
+def events_feed_add(detail_data):
+    record = events_feed_record(detail_data)
+    if record is not None and record["id"]:
+        with _FEED_LOCK:
+            _FEED_UPDATES[record["id"]] = record
+
+def _load_events_feed(path):
+    import json
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {e["id"]: e for e in data.get("events", []) if e.get("id")}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+def _write_if_changed(path, data):
+    """바이트가 같으면 쓰지 않음 (원자적 교체). 반환: 변경 여부"""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+def write_events_feed(path=None, updates=None, compress=True):
+    """기존 피드에 갱신분을 합쳐 events.json(+ .gz, brotli 모듈이 있으면 .br)을 저장합니다.
+    반환: (전체 행사 수, 변경 여부)"""
+    import gzip
+    import json
+    path = path or (CFG or _get_config())["EVENTS_FEED_PATH"]
+    if updates is None:
+        with _FEED_LOCK:
+            updates = dict(_FEED_UPDATES)
+    events = _load_events_feed(path)
+    events.update(updates)
+    # 지점 → 시작일 → id 순으로 고정 (실행 순서/병렬 여부와 무관하게 같은 바이트)
+    order = {name: i for i, name in enumerate(_FEED_OUTLETS)}
+    records = sorted(events.values(), key=lambda e: (order.get(e.get("outlet"), len(order)), e.get("start", ""), e["id"]))
+    body = json.dumps({"version": EVENTS_FEED_VERSION, "events": records},
+                      ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    changed = _write_if_changed(path, body)
+    if compress:
+        # mtime=0: 내용이 같으면 압축 파일 바이트도 같도록
+        _write_if_changed(path + ".gz", gzip.compress(body, compresslevel=9, mtime=0))
+        try:
+            import brotli
+        except ImportError:
+            brotli = None
+        if brotli is not None:
+            _write_if_changed(path + ".br", brotli.compress(body, quality=11))
+    return len(records), changed
+
 # --- Google Sheets 업로드
-def upload_to_google_sheet(sheet_title, sheet_name, new_rows):
+SHEET_HEADERS = ["제목", "기간", "상세 제목", "상세 기간", "썸네일", "상세 링크", "혜택 설명",
+                 "브랜드", "제품명", "가격", "이미지", "업데이트 날짜", "event_id"]
+
+# 시트 클라이언트 주입 지점: (client, WorksheetNotFound 예외 클래스)를 반환하는 함수.
+# OUTLET_SHEETS_FAKE=<상태 JSON 경로>이면 tools/fake_sheets.py의 로컬 가짜 백엔드를 사용합니다.
+SHEETS_CLIENT_FACTORY = None
+_FAKE_SHEETS = None
+_FAKE_SHEETS_LOCK = threading.Lock()
+
+def _fake_sheets_client():
+    global _FAKE_SHEETS
+    with _FAKE_SHEETS_LOCK:
+        if _FAKE_SHEETS is None:
+            sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools"))
+            from fake_sheets import FakeSheetsClient
+            _FAKE_SHEETS = FakeSheetsClient.load(
+                os.environ["OUTLET_SHEETS_FAKE"],
+                latency=_env_float("OUTLET_SHEETS_FAKE_LATENCY", 0.0),
+            )
+            print(f"🧪 가짜 시트 백엔드 사용: {_FAKE_SHEETS.path}")
+    return _FAKE_SHEETS, _FAKE_SHEETS.WorksheetNotFound
+
+def finish_fake_sheets():
+    """가짜 시트 백엔드를 썼다면 상태를 저장하고 API 호출/전송량을 출력합니다."""
+    if _FAKE_SHEETS is None:
+        return
+    from fake_sheets import format_stats
+    _FAKE_SHEETS.save()
+    print("🧪 가짜 시트 API 사용량: " + format_stats(_FAKE_SHEETS.stats()))
+
+def _open_worksheet(sheet_title, sheet_name):
+    """서비스 계정으로 스프레드시트/워크시트를 엽니다 (없으면 워크시트 생성)."""
+    factory = SHEETS_CLIENT_FACTORY
+    if factory is None and os.environ.get("OUTLET_SHEETS_FAKE"):
+        factory = _fake_sheets_client
+    if factory is not None:
+        client, not_found = factory()
+        spreadsheet = client.open(sheet_title)
+        try:
+            worksheet = spreadsheet.worksheet(sheet_name)
+        except not_found:
+            worksheet = spreadsheet.add_worksheet(title=sheet_name, rows="1000", cols="20")
+        return spreadsheet, worksheet
+
     import gspread
     from oauth2client.service_account import ServiceAccountCredentials
-    today_str = datetime.today().strftime('%Y-%m-%d')
     scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     # 자격증명 경로: ENV 우선 → 신규 기본경로(apps/crawler/credentials.json) → 레거시(outlet-crawler/credentials.json)
@@ -975,9 +1830,19 @@ def upload_to_google_sheet(sheet_title, sheet_name, new_rows):
         worksheet = spreadsheet.worksheet(sheet_name)
     except gspread.exceptions.WorksheetNotFound:
         worksheet = spreadsheet.add_worksheet(title=sheet_name, rows="1000", cols="20")
+    return spreadsheet, worksheet
+
+def _sheets_mode():
+    """OUTLET_SHEETS_MODE: rewrite(기본, 전체 읽기/지우기/다시 쓰기) | insert(새 행만 2행에 삽입)"""
+    mode = os.environ.get("OUTLET_SHEETS_MODE", "rewrite").lower()
+    return mode if mode in ("rewrite", "insert") else "rewrite"
 
-    headers = ["제목", "기간", "상세 제목", "상세 기간", "썸네일", "상세 링크", "혜택 설명",
-               "브랜드", "제품명", "가격", "이미지", "업데이트 날짜", "event_id"]
+def upload_to_google_sheet(sheet_title, sheet_name, new_rows):
+    if _sheets_mode() == "insert":
+        return insert_rows_to_google_sheet(sheet_title, sheet_name, new_rows)
+    spreadsheet, worksheet = _open_worksheet(sheet_title, sheet_name)
+
+    headers = SHEET_HEADERS
     try:
         existing_data = worksheet.get_all_values()
         if existing_data and existing_data[0] == headers:
@@ -999,8 +1864,167 @@ def upload_to_google_sheet(sheet_title, sheet_name, new_rows):
     print(f"✅ [{sheet_name}] 총 {len(all_data)-1}개 데이터 저장 완료.")
     print(f"🔗 시트 링크: https://docs.google.com/spreadsheets/d/{spreadsheet.id}/edit")
 
+# --- 시트 삽입 모드: 로컬 캐시의 상세 링크 집합으로 중복 판정, 새 행만 한 번의 batchUpdate로 삽입
+def _sheet_links_path(sheet_title, sheet_name):
+    safe = re.sub(r"[^0-9A-Za-z가-힣_-]+", "_", f"{sheet_title}-{sheet_name}")
+    return os.path.join(_cache_dir(), "sheets", f"{safe}.links.json")
+
+def _load_sheet_links(sheet_title, sheet_name):
+    import json
+    try:
+        with open(_sheet_links_path(sheet_title, sheet_name), "r", encoding="utf-8") as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return None
+
+def _save_sheet_links(sheet_title, sheet_name, links):
+    import json
+    path = _sheet_links_path(sheet_title, sheet_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(sorted(links), f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+def _sheet_cells(row):
+    # worksheet.update(기본 RAW 입력)와 같게 문자열 그대로 저장
+    return {"values": [{"userEnteredValue": {"stringValue": "" if v is None else str(v)}} for v in row]}
+
+def insert_rows_to_google_sheet(sheet_title, sheet_name, new_rows, offset=0):
+    """새 행만 헤더 아래(2행 + offset)에 삽입하고 삽입한 행 수를 반환합니다
+    (기존 행은 읽거나 다시 쓰지 않음).
+
+    중복 판정은 캐시 디렉터리의 상세 링크 목록으로 하며, 캐시가 없을 때만
+    시트의 상세 링크 열(F) 하나를 내려받아 초기화합니다. offset은 같은 실행에서
+    앞서 삽입한 행 수로, 나눠 올린 배치가 목록 순서대로 쌓이게 합니다.
+    """
+    spreadsheet, worksheet = _open_worksheet(sheet_title, sheet_name)
+    known = _load_sheet_links(sheet_title, sheet_name)
+    requests_body = []
+    if known is None:
+        column = worksheet.col_values(6)
+        has_header = bool(column) and column[0] == SHEET_HEADERS[5]
+        if not has_header:
+            # 빈 시트: 헤더 행부터 작성
+            requests_body.append({
+                "insertDimension": {
+                    "range": {"sheetId": worksheet.id, "dimension": "ROWS", "startIndex": 0, "endIndex": 1},
+                    "inheritFromBefore": False,
+                }
+            })
+            requests_body.append({
+                "updateCells": {
+                    "rows": [_sheet_cells(SHEET_HEADERS)],
+                    "fields": "userEnteredValue",
+                    "start": {"sheetId": worksheet.id, "rowIndex": 0, "columnIndex": 0},
+                }
+            })
+        known = {v for v in (column[1:] if has_header else column) if v}
+        print(f"🗂️ [{sheet_name}] 시트 상세 링크 {len(known)}개로 로컬 캐시 초기화")
+
+    filtered_new_rows = [row for row in new_rows if len(row) >= 6 and row[5] not in known]
+    print(f"✨ [{sheet_name}] 새로 추가할 항목 수: {len(filtered_new_rows)}개")
+
+    if filtered_new_rows:
+        requests_body.append({
+            "insertDimension": {
+                "range": {"sheetId": worksheet.id, "dimension": "ROWS",
+                          "startIndex": 1 + offset, "endIndex": 1 + offset + len(filtered_new_rows)},
+                "inheritFromBefore": False,
+            }
+        })
+        requests_body.append({
+            "updateCells": {
+                "rows": [_sheet_cells(row) for row in filtered_new_rows],
+                "fields": "userEnteredValue",
+                "start": {"sheetId": worksheet.id, "rowIndex": 1 + offset, "columnIndex": 0},
+            }
+        })
+    if requests_body:
+        spreadsheet.batch_update({"requests": requests_body})
+    known.update(row[5] for row in filtered_new_rows)
+    _save_sheet_links(sheet_title, sheet_name, known)
+
+    if not filtered_new_rows:
+        print(f"✅ [{sheet_name}] 추가할 데이터 없음.")
+        return 0
+    print(f"✅ [{sheet_name}] {len(filtered_new_rows)}개 행 삽입 완료 (batchUpdate 1회).")
+    print(f"🔗 시트 링크: https://docs.google.com/spreadsheets/d/{spreadsheet.id}/edit")
+    return len(filtered_new_rows)
+
+# --- 증분 크롤링 상태 저장소 (SQLite, evntCrdCd 기준)
+def _incremental_enabled():
+    return os.environ.get("OUTLET_INCREMENTAL", "").lower() in ("1", "true", "yes")
+
+def open_crawl_state():
+    """크롤 상태 DB를 엽니다. 경로: OUTLET_STATE_DB (기본: 캐시 디렉터리/crawl_state.sqlite3)"""
+    import sqlite3
+    path = os.environ.get("OUTLET_STATE_DB") or os.path.join(_cache_dir(), "crawl_state.sqlite3")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS events (
+            evnt_crd_cd  TEXT PRIMARY KEY,
+            branch_cd    TEXT NOT NULL,
+            fingerprint  TEXT NOT NULL,
+            filename     TEXT NOT NULL,
+            start_date   TEXT NOT NULL DEFAULT '',
+            end_date     TEXT NOT NULL DEFAULT '',
+            status       TEXT NOT NULL DEFAULT '',
+            last_fetched REAL NOT NULL
+        )"""
+    )
+    conn.commit()
+    return conn
+
+def _event_code(detail_url):
+    """상세 링크에서 evntCrdCd 값을 추출합니다 (없으면 빈 문자열)."""
+    m = re.search(r"[?&]evntCrdCd=([^&#]+)", detail_url or "")
+    return m.group(1) if m else ""
+
+def _listing_fingerprint(title, period, image_url):
+    import hashlib
+    raw = "\x1f".join([title or "", period or "", image_url or ""])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def crawl_state_is_unchanged(conn, code, fingerprint):
+    """목록 지문이 같고, 페이지 파일이 남아 있고, 진행 상태(active/upcoming/expired)가
+    바뀌지 않았다면 True (상세 수집/페이지 재생성 생략 가능)."""
+    if not code:
+        return False
+    row = conn.execute(
+        "SELECT fingerprint, filename, start_date, end_date, status FROM events WHERE evnt_crd_cd = ?",
+        (code,),
+    ).fetchone()
+    if not row or row[0] != fingerprint:
+        return False
+    if not os.path.exists(os.path.join(_pages_dir(), row[1])):
+        return False
+    if not row[2] and not row[3]:
+        # 날짜가 없는 기록 (상세 수집 실패로 빈 결과가 기록된 이전 상태 포함)은 다시 수집
+        return False
+    return get_event_status(row[2], row[3]) == row[4]
+
+def crawl_state_record(conn, code, branchCd, fingerprint, filename, start_iso, end_iso):
+    if not code:
+        return
+    conn.execute(
+        """INSERT INTO events (evnt_crd_cd, branch_cd, fingerprint, filename, start_date, end_date, status, last_fetched)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+           ON CONFLICT(evnt_crd_cd) DO UPDATE SET
+             branch_cd = excluded.branch_cd, fingerprint = excluded.fingerprint,
+             filename = excluded.filename, start_date = excluded.start_date,
+             end_date = excluded.end_date, status = excluded.status,
+             last_fetched = excluded.last_fetched""",
+        (code, branchCd, fingerprint, filename, start_iso or "", end_iso or "",
+         get_event_status(start_iso, end_iso), time.time()),
+    )
+
 # --- 아울렛 크롤링
-def crawl_outlet(branchCd, outletName, sheet_name):
+def crawl_outlet(branchCd, outletName, sheet_name, upload=True):
+    """지점 하나를 크롤링해 페이지를 생성하고 시트 행 리스트를 반환합니다.
+    upload=False면 시트 업로드를 호출자에게 맡깁니다 (지점 병렬 크롤링)."""
     import os as _os
     listing_mode = _os.environ.get("OUTLET_LISTING_MODE", "http").lower()
     detail_mode = _os.environ.get("OUTLET_DETAIL_MODE", "selenium").lower()
@@ -1015,9 +2039,14 @@ def crawl_outlet(branchCd, outletName, sheet_name):
         max_pages = int(_os.environ.get("OUTLET_MAX_PAGES", "4"))
     except Exception:
         max_pages = 4
-    for page in range(1, max_pages + 1):
-        print(f"[{sheet_name}] 페이지 {page} 크롤링 중...")
-        events = fetch_event_list(driver, branchCd, page)
+    state = open_crawl_state() if _incremental_enabled() else None
+    skipped = 0
+    failed = 0
+    # 백그라운드 시트 업로드 중이면 목록 페이지마다 새 행을 바로 넘겨 크롤링과 겹치게 처리
+    stream_rows = upload and _SHEETS_QUEUE is not None
+    for events in _iter_listing_batches(driver, branchCd, sheet_name, max_pages):
+        batch_start = len(new_rows)
+        listing = []
         for event in events:
             # HTTP 모드(dict)와 클릭/폴백 모드(li)를 모두 지원
             if isinstance(event, dict):
@@ -1034,10 +2063,24 @@ def crawl_outlet(branchCd, outletName, sheet_name):
                 period = period_tag.get_text(strip=True) if period_tag else ""
                 image_url = img_tag["src"] if img_tag else ""
                 detail_url = "https://www.ehyundai.com" + link_tag["href"] if link_tag else ""
-            if detail_mode == "http":
-                detail = fetch_event_detail_http(detail_url)
-            else:
-                detail = fetch_event_detail(driver, detail_url)
+            if state is not None:
+                code = _event_code(detail_url)
+                fingerprint = _listing_fingerprint(title, period, image_url)
+                # 증분 모드: 변경 없는 행사는 상세 수집/페이지 재생성을 생략
+                if crawl_state_is_unchanged(state, code, fingerprint):
+                    skipped += 1
+                    continue
+            listing.append((title, period, image_url, detail_url))
+        # 상세 수집: HTTP 모드는 페이지 단위로 동시 수집(순서 유지), Selenium은 순차
+        if detail_mode == "http":
+            details = fetch_event_details_http([item[3] for item in listing])
+        else:
+            details = [fetch_event_detail(driver, item[3]) for item in listing]
+        for (title, period, image_url, detail_url), detail in zip(listing, details):
+            if detail is None:
+                # 상세 수집 실패: 빈 페이지/상태 기록을 남기지 않아야 다음 실행에서 다시 수집됨
+                failed += 1
+                continue
             thumbnail_id = image_url.split("/")[-1].split(".")[0][-12:]
             event_id = thumbnail_id
             detail_data = {
@@ -1055,6 +2098,12 @@ def crawl_outlet(branchCd, outletName, sheet_name):
                 "상품 리스트": detail["상품 리스트"]
             }
             url_path = generate_html(detail_data, event_id)
+            events_feed_add(detail_data)
+            if state is not None:
+                crawl_state_record(state, _event_code(detail_url), branchCd,
+                                   _listing_fingerprint(title, period, image_url),
+                                   url_path.replace("/", "-") + ".html",
+                                   detail["시작일"], detail["종료일"])
             base_info = [title, period, detail["상세 제목"], detail["상세 기간"],
                          image_url, detail_url, detail_data["혜택 설명"]]
             if detail["상품 리스트"]:
@@ -1066,28 +2115,139 @@ def crawl_outlet(branchCd, outletName, sheet_name):
             else:
                 new_rows.append(base_info + ["", "", "", "",
                                  datetime.today().strftime('%Y-%m-%d'), event_id])
+        if state is not None:
+            state.commit()
+        if stream_rows and len(new_rows) > batch_start:
+            sheets_enqueue(sheet_name, new_rows[batch_start:])
     if driver:
         driver.quit()
+    if failed:
+        print(f"⚠️ [{sheet_name}] 상세 수집 실패 {failed}개: 페이지/시트 행/상태를 기록하지 않고 다음 실행에서 다시 수집합니다")
+    if state is not None:
+        state.close()
+        print(f"♻️ [{sheet_name}] 증분 모드: 변경 없는 행사 {skipped}개 건너뜀")
+    if upload:
+        # 스트리밍한 경우 남은 행이 없으므로 시트 완료 표시만 보냄
+        _upload_rows(sheet_name, [] if stream_rows else new_rows)
+    return new_rows
+
+def _skip_sheets():
+    return os.environ.get("OUTLET_SKIP_SHEETS", "").lower() in ("1", "true", "yes")
+
+def _upload_rows(sheet_name, new_rows):
+    """지점 하나의 행을 업로드합니다. 백그라운드 업로더가 켜져 있으면 큐에 넣고(시트 완료 표시) 바로 반환합니다."""
     # Allow skipping Google Sheets upload for dry-run via OUTLET_SKIP_SHEETS
-    import os as _os
-    if _os.environ.get("OUTLET_SKIP_SHEETS", "").lower() in ("1", "true", "yes"):
-        print("⚠️ OUTLET_SKIP_SHEETS=1: Google Sheets 업로드를 생략합니다.")
+    if _skip_sheets():
+        print(f"⚠️ OUTLET_SKIP_SHEETS=1: [{sheet_name}] Google Sheets 업로드를 생략합니다.")
+    elif _SHEETS_QUEUE is not None:
+        sheets_enqueue(sheet_name, new_rows, final=True)
     else:
         upload_to_google_sheet("outlet-data", sheet_name, new_rows)
 
+# --- 백그라운드 시트 업로드 (OUTLET_SHEETS_BACKGROUND, 기본 켜짐)
+# 크롤링 스레드는 행을 큐에 넣기만 하고, 업로드 스레드가 시트별로 모아 한꺼번에 반영합니다.
+# - rewrite 모드: 시트(지점)가 끝났을 때 한 번 업로드 (기존과 같은 결과)
+# - insert 모드: OUTLET_SHEETS_BATCH_ROWS(기본 500)행이 모이면 중간에도 삽입하며,
+#   같은 시트의 다음 배치는 앞서 넣은 행 아래에 넣어 순서를 유지
+_SHEETS_QUEUE = None
+_SHEETS_THREAD = None
+_SHEETS_FAILURES = []
+
+def _sheets_background_enabled():
+    return os.environ.get("OUTLET_SHEETS_BACKGROUND", "1").lower() not in ("0", "false", "no")
+
+def start_sheets_writer():
+    """업로드 스레드를 시작합니다 (시트 업로드 생략/비활성 시 아무것도 하지 않음)."""
+    global _SHEETS_QUEUE, _SHEETS_THREAD
+    if _skip_sheets() or not _sheets_background_enabled() or _SHEETS_QUEUE is not None:
+        return
+    _SHEETS_FAILURES.clear()
+    _SHEETS_QUEUE = queue.Queue()
+    _SHEETS_THREAD = threading.Thread(target=_sheets_writer_loop, args=(_SHEETS_QUEUE,),
+                                      name="sheets-writer", daemon=True)
+    _SHEETS_THREAD.start()
+    print("📤 시트 업로드를 백그라운드에서 진행합니다.")
+
+def sheets_enqueue(sheet_name, rows, final=False):
+    _SHEETS_QUEUE.put((sheet_name, list(rows), final))
+
+def _sheets_writer_loop(q):
+    insert = _sheets_mode() == "insert"
+    batch_rows = max(1, _env_int("OUTLET_SHEETS_BATCH_ROWS", 500))
+    pending = {}   # sheet_name -> 아직 업로드하지 않은 행
+    offsets = {}   # sheet_name -> 이번 실행에서 삽입한 행 수 (insert 모드)
+    while True:
+        item = q.get()
+        if item is None:
+            break
+        sheet_name, rows, final = item
+        pending.setdefault(sheet_name, []).extend(rows)
+        if final or (insert and len(pending[sheet_name]) >= batch_rows):
+            rows = pending.pop(sheet_name)
+            if rows or sheet_name not in offsets:
+                _flush_sheet_rows(sheet_name, rows, insert, offsets)
+    # 완료 표시 없이 남은 행 (예: 크롤링 중 예외)도 업로드
+    for sheet_name, rows in pending.items():
+        if rows:
+            _flush_sheet_rows(sheet_name, rows, insert, offsets)
+
+def _flush_sheet_rows(sheet_name, rows, insert, offsets):
+    try:
+        if insert:
+            offset = offsets.get(sheet_name, 0)
+            offsets[sheet_name] = offset + insert_rows_to_google_sheet("outlet-data", sheet_name, rows, offset=offset)
+        else:
+            upload_to_google_sheet("outlet-data", sheet_name, rows)
+            offsets[sheet_name] = offsets.get(sheet_name, 0) + len(rows)
+    except Exception as e:
+        _SHEETS_FAILURES.append((sheet_name, len(rows), f"{type(e).__name__}: {e}"))
+        print(f"❌ [{sheet_name}] 시트 업로드 실패 ({len(rows)}행): {e}")
+
+def finish_sheets_writer():
+    """남은 행을 모두 업로드할 때까지 기다리고 실패 목록 [(시트, 행 수, 오류)]을 반환합니다."""
+    global _SHEETS_QUEUE, _SHEETS_THREAD
+    if _SHEETS_QUEUE is None:
+        return []
+    started = time.time()
+    _SHEETS_QUEUE.put(None)
+    _SHEETS_THREAD.join()
+    _SHEETS_QUEUE = _SHEETS_THREAD = None
+    print(f"📤 시트 업로드 마무리 대기: {time.time() - started:.1f}초")
+    return list(_SHEETS_FAILURES)
+
+def _crawl_outlet_isolated(branchCd, outletName, sheet_name):
+    """병렬 모드용: URL 매핑 추가를 스레드 로컬 로그로 모으고 업로드 없이 크롤링합니다."""
+    _BRANCH_CTX.mapping_log = []
+    try:
+        rows = crawl_outlet(branchCd, outletName, sheet_name, upload=False)
+        return rows, _BRANCH_CTX.mapping_log
+    finally:
+        _BRANCH_CTX.mapping_log = None
+
+def crawl_outlets_parallel(targets, workers):
+    """여러 지점을 스레드로 동시에 크롤링한 뒤, 지점 순서대로 URL 매핑과 시트 행을 합칩니다.
+    매핑은 순차 실행과 같은 순서로 add_comprehensive_mapping을 재생하므로 결과가 동일합니다."""
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [ex.submit(_crawl_outlet_isolated, *t) for t in targets]
+        results = [f.result() for f in futures]
+    for (branchCd, outletName, sheet_name), (rows, mapping_log) in zip(targets, results):
+        added = sum(add_comprehensive_mapping(event_id, filename) for event_id, filename in mapping_log)
+        print(f"📌 [{sheet_name}] URL 매핑 병합: 이벤트 {len(mapping_log)}개, 항목 {added}개 추가")
+        _upload_rows(sheet_name, rows)
+
 # --- 메인 실행
 def main():
     # 기존 URL 매핑 파일 읽기 (누적 방식으로 변경)
-    import json
     global CFG
     if CFG is None:
         CFG = _get_config()
 
     mapping_path = CFG.get("MAPPING_PATH")
     global url_mapping
+    # url-mapping.json은 v2(변형 없는 정규 ID)로 저장되며, 메모리에는 변형 키까지 펼쳐서 사용 (v1 파일도 읽음)
+    from url_mapping import load_mapping, compact, make_table, write_table, write_shards
     try:
-        with open(mapping_path, "r", encoding="utf-8") as f:
-            url_mapping = json.load(f)
+        url_mapping = load_mapping(mapping_path)
         print(f"📋 기존 URL 매핑 로드: {len(url_mapping)}개 항목")
     except:
         url_mapping = {}
@@ -1102,28 +2262,89 @@ def main():
     # 크롤링 시작 전 매핑 개수
     initial_count = len(url_mapping)
 
-    for branchCd, outletName, sheet_name in OUTLET_TARGETS:
-        crawl_outlet(branchCd, outletName, sheet_name)
-    
-    # URL 매핑 JSON 파일 저장 (기존 + 새로운 매핑)
-    with open(mapping_path, "w", encoding="utf-8") as f:
-        json.dump(url_mapping, f, ensure_ascii=False, indent=2)
-    
-    new_count = len(url_mapping) - initial_count
-    print(f"📋 URL 매핑 파일 업데이트: 기존 {initial_count}개 + 신규 {new_count}개 = 총 {len(url_mapping)}개 항목")
-
-    # ✅ 새로운 URL 구조의 sitemap.xml 생성
-    generate_sitemap(
-        pages_dir=CFG.get("PAGES_DIR"),
-        base_url=CFG.get("SITE_BASE_URL"),
-        output_path=CFG.get("SITEMAP_PATH"),
-    )
+    # 시트 업로드는 백그라운드 스레드에서 크롤링과 겹쳐 진행 (OUTLET_SHEETS_BACKGROUND=0이면 동기)
+    start_sheets_writer()
 
-    # ✅ index.html (정적 이벤트 링크 목록) 생성
-    generate_index(
-        pages_dir=CFG.get("PAGES_DIR"),
-        index_path=CFG.get("INDEX_OUTPUT_PATH"),
-    )
+    # 이후 단계 어디서 예외가 나도 큐에 넣은 행은 업로드하고 실패를 보고
+    # (업로드 스레드는 daemon이라 기다리지 않으면 종료 시 행이 사라짐)
+    completed = False
+    try:
+        # OUTLET_PARALLEL_BRANCHES: 동시에 크롤링할 지점 수 (기본 1 = 순차)
+        parallel = min(len(OUTLET_TARGETS), max(1, _env_int("OUTLET_PARALLEL_BRANCHES", 1)))
+        if parallel > 1:
+            print(f"🚀 지점 병렬 크롤링: {parallel}개 동시 실행")
+            crawl_outlets_parallel(OUTLET_TARGETS, parallel)
+        else:
+            for branchCd, outletName, sheet_name in OUTLET_TARGETS:
+                crawl_outlet(branchCd, outletName, sheet_name)
+
+        # URL 매핑 JSON 파일 저장 (기존 + 새로운 매핑, 규칙으로 해석되는 변형은 빼고 v2로 압축)
+        mapping_table = make_table(compact(url_mapping))
+        stored_count, mapping_bytes, mapping_changed = write_table(mapping_path, mapping_table)
+
+        new_count = len(url_mapping) - initial_count
+        print(f"📋 URL 매핑 파일 {'업데이트' if mapping_changed else '변경 없음'}: 기존 {initial_count}개 + 신규 {new_count}개 = 총 {len(url_mapping)}개 항목 "
+              f"(저장 ID {stored_count}개, {mapping_bytes:,} B)")
+
+        # ✅ 홈 캘린더용 매핑 샤드 (클릭한 이벤트의 샤드만 받음, OUTLET_MAPPING_SHARDS=0이면 생략)
+        if os.environ.get("OUTLET_MAPPING_SHARDS", "1").lower() not in ("0", "false", "no"):
+            shards_manifest, shards_written, shards_removed = write_shards(mapping_table, CFG.get("MAPPING_SHARDS_DIR"))
+            print(f"🧩 URL 매핑 샤드 {len(shards_manifest['shards'])}개 (새로 씀 {shards_written}, 삭제 {shards_removed}) → {CFG.get('MAPPING_SHARDS_DIR')}")
+
+        # ✅ 홈 캘린더용 정적 이벤트 피드 (OUTLET_EVENTS_FEED=0이면 생략)
+        if _events_feed_enabled():
+            compress = os.environ.get("OUTLET_EVENTS_FEED_COMPRESS", "1").lower() not in ("0", "false", "no")
+            total, changed = write_events_feed(compress=compress)
+            print(f"🗓️ 이벤트 피드 {'갱신' if changed else '변경 없음'}: 이번 실행 {len(_FEED_UPDATES)}개 반영, 총 {total}개 → {CFG.get('EVENTS_FEED_PATH')}")
+
+        # ✅ 페이지 매니페스트 저장 (sitemap/index 및 apps/web/tools가 HTML 대신 사용)
+        manifest = get_page_index(CFG.get("PAGES_DIR"))
+        write_page_manifest(CFG.get("PAGES_DIR"))
+
+        # ✅ 새로운 URL 구조의 sitemap.xml 생성
+        # OUTLET_SITEMAP_SPLIT=branch: 지점별 파트 + sitemap index (OUTLET_SITEMAP_GZIP=1이면 .xml.gz)
+        if os.environ.get("OUTLET_SITEMAP_SPLIT", "").lower() == "branch":
+            generate_branch_sitemaps(
+                pages_dir=CFG.get("PAGES_DIR"),
+                base_url=CFG.get("SITE_BASE_URL"),
+                output_path=CFG.get("SITEMAP_PATH"),
+                manifest=manifest,
+                gzip_parts=os.environ.get("OUTLET_SITEMAP_GZIP", "").lower() in ("1", "true", "yes"),
+            )
+        else:
+            generate_sitemap(
+                pages_dir=CFG.get("PAGES_DIR"),
+                base_url=CFG.get("SITE_BASE_URL"),
+                output_path=CFG.get("SITEMAP_PATH"),
+                manifest=manifest,
+            )
+
+        # ✅ index.html (정적 이벤트 링크 목록) 생성
+        generate_index(
+            pages_dir=CFG.get("PAGES_DIR"),
+            index_path=CFG.get("INDEX_OUTPUT_PATH"),
+            manifest=manifest,
+        )
+
+        ws = page_write_stats()
+        print(f"📝 상세 페이지: 작성 {ws['written']}개, 변경 없음(생략) {ws['skipped']}개")
+
+        cs = http_cache_stats()
+        if _http_cache_enabled():
+            print(f"🗄️ 상세 HTTP 캐시: 304 적중 {cs['hit_304']}건, 본문 해시 적중 {cs['hit_hash']}건, 미적중 {cs['miss']}건")
+        hs = http_stats()
+        print(f"🌐 HTTP: 요청 {hs['requests']}회, 신규 커넥션 {hs['connections']}개, 재사용 {hs['reused']}회")
+        completed = True
+    finally:
+        sheet_failures = finish_sheets_writer()
+        finish_fake_sheets()
+        if sheet_failures:
+            print(f"❌ 시트 업로드 실패 {len(sheet_failures)}건:")
+            for sheet_name, row_count, error in sheet_failures:
+                print(f"   - [{sheet_name}] {row_count}행: {error}")
+            # 다른 예외로 중단된 경우에는 그 예외(종료 코드 1)를 그대로 전파
+            if completed:
+                raise SystemExit(1)
 
     print("\n🎉 전체 아울렛 크롤링 및 저장 + 새로운 URL 구조의 sitemap 생성 완료!")
     print("🔗 새로운 URL 구조: discounts.deluxo.co.kr/pages/{지점명}-{제목}.html")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark sitemap date extraction: full-file read (previous approach) versus
+head-only streaming read that stops at </head> (_extract_event_dates_from_html).
+
+Both methods must return the same (startDate, endDate, noindex) for every page;
+the script asserts that, then reports bytes read and time per pass.
+
+With --synthetic N, N product-heavy pages (--products each) are rendered from the
+detail template into a temporary directory instead of using --pages.
+
+Usage:
+  python3 apps/crawler/tools/bench_head_read.py
+  python3 apps/crawler/tools/bench_head_read.py --pages apps/web/public/pages --repeat 5
+  python3 apps/crawler/tools/bench_head_read.py --synthetic 1000 --products 200
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, os.path.join(REPO, 'apps', 'crawler'))
+
+import crawler_organized as co  # type: ignore
+
+
+def full_read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return co._event_dates_from_content(content), os.path.getsize(path)
+
+
+def head_read(path):
+    head, nbytes = co._read_html_head(path)
+    return co._event_dates_from_content(head), nbytes
+
+
+def run(paths, fn, repeat):
+    best = None
+    total_bytes = 0
+    results = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = [fn(p) for p in paths]
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+        results = [r for r, _ in out]
+        total_bytes = sum(n for _, n in out)
+    return results, total_bytes, best
+
+
+def make_synthetic(out_dir, n, products):
+    template = co.load_template(co._template_path())
+    for i in range(n):
+        detail = {
+            "id": f"synthetic{i:04d}", "제목": f"합성 행사 {i}", "기간": "10.01 ~ 12.31",
+            "상세 제목": f"합성 행사 {i}", "상세 기간": "10.01 ~ 12.31",
+            "시작일": "2026-10-01", "종료일": "2026-12-31" if i % 2 else "2025-12-31",
+            "지점명": "송도", "썸네일": "https://example.com/t.jpg",
+            "상세 링크": "https://example.com/e", "혜택 설명": "설명",
+            "상품 리스트": [{"브랜드": "B", "제품명": f"상품 {j}", "가격": "10,000원",
+                         "이미지": f"https://example.com/{j}.jpg"} for j in range(products)],
+        }
+        values = co.build_page_values(detail)[0]
+        values["관련 행사"] = values["RELATED_PREFETCH"] = ""
+        with open(os.path.join(out_dir, f"songdo-synthetic-{i}.html"), "w", encoding="utf-8") as f:
+            f.write(co.render_template(template, values))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--pages', default=os.path.join(REPO, 'apps', 'web', 'public', 'pages'))
+    ap.add_argument('--repeat', type=int, default=3, help='Passes per method (best time is reported)')
+    ap.add_argument('--synthetic', type=int, default=0, help='Render N synthetic pages instead of --pages')
+    ap.add_argument('--products', type=int, default=200, help='Products per synthetic page')
+    args = ap.parse_args()
+
+    tmp = None
+    pages_dir = args.pages
+    if args.synthetic:
+        tmp = pages_dir = tempfile.mkdtemp(prefix='bench_head_')
+        make_synthetic(tmp, args.synthetic, args.products)
+    try:
+        paths = sorted(os.path.join(pages_dir, fn) for fn in os.listdir(pages_dir) if fn.endswith('.html'))
+        full, full_bytes, full_s = run(paths, full_read, args.repeat)
+        head, head_bytes, head_s = run(paths, head_read, args.repeat)
+        assert full == head, "head-only read returned different dates/noindex"
+    finally:
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"pages: {len(paths)}")
+    print(f"full read : {full_bytes / 1024:10.1f} KiB  {full_s * 1000:8.1f} ms")
+    print(f"head only : {head_bytes / 1024:10.1f} KiB  {head_s * 1000:8.1f} ms")
+    print(f"bytes read -{(1 - head_bytes / full_bytes) * 100:.1f}%, time x{full_s / head_s:.2f} faster")
+
+
+if __name__ == '__main__':
+    main()
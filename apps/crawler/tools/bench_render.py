@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark for detail page rendering: the previous approach (re-read
+template + ~30 sequential str.replace + product string +=) versus the
+compiled single-pass renderer used by generate_html.
+
+Only the render step is measured (no related-events scan, no file write).
+Both renderers must produce identical HTML; the script asserts that first.
+
+Usage:
+  python3 apps/crawler/tools/bench_render.py
+  python3 apps/crawler/tools/bench_render.py --pages 2000 --products 40
+"""
+
+import os
+import sys
+import time
+import argparse
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, os.path.join(REPO, 'apps', 'crawler'))
+
+import crawler_organized as co  # type: ignore
+
+# Order of str.replace calls in the previous generate_html
+LEGACY_ORDER = [
+    "NOINDEX_TAG", "EVENT_STATUS", "제목", "기간", "상세 제목", "상세 기간", "썸네일",
+    "혜택 설명", "META_DESC", "OG_DESC", "제목_JSON", "DESC_JSON", "업데이트 날짜",
+    "시작일", "종료일", "지점명", "event_id", "상세 링크", "JSONLD_SCHEMA",
+    "상품 목록", "filename", "pretty_path", "site_base", "branch_en",
+    "관련 행사", "RELATED_PREFETCH",
+]
+
+
+def legacy_render(template_path, values, products):
+    with open(template_path, "r", encoding="utf-8") as f:
+        html = f.read()
+    product_html = ""
+    for p in products:
+        product_html += co._render_product(p)
+    for key in LEGACY_ORDER:
+        value = product_html if key == "상품 목록" else values[key]
+        html = html.replace("{{" + key + "}}", value)
+    return html
+
+
+def compiled_render(template_path, values, products):
+    values = dict(values)
+    values["상품 목록"] = "".join(co._render_product(p) for p in products)
+    return co.render_template(co.load_template(template_path), values)
+
+
+def sample_detail(i, n_products):
+    return {
+        'id': f'bench{i:07d}',
+        '제목': f'[송도] 벤치마크 행사 {i} 시즌오프 특가',
+        '기간': '10.01 ~ 10.31',
+        '상세 제목': '벤치마크 상세 제목',
+        '상세 기간': '10.01 ~ 10.31',
+        '시작일': '2025-10-01',
+        '종료일': '2099-10-31',
+        '지점명': '송도',
+        '썸네일': 'https://via.placeholder.com/800',
+        '상세 링크': 'https://example.com',
+        '혜택 설명': '벤치마크용 더미 혜택 설명입니다. ' * 3,
+        '상품 리스트': [
+            {'브랜드': '브랜드', '제품명': f'상품 {j}', '가격': '<s>₩99,000</s> 판매가 ₩49,000',
+             '이미지': f'https://via.placeholder.com/400?{j}'}
+            for j in range(n_products)
+        ],
+    }
+
+
+def bench(fn, template_path, items):
+    t0 = time.perf_counter()
+    for values, products in items:
+        fn(template_path, values, products)
+    return (time.perf_counter() - t0) / len(items)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--pages', type=int, default=1000)
+    ap.add_argument('--products', type=int, default=20)
+    args = ap.parse_args()
+
+    template_path = co._template_path()
+    items = []
+    for i in range(args.pages):
+        detail = sample_detail(i, args.products)
+        values, _, _, _ = co.build_page_values(detail)
+        values["관련 행사"] = "<li><a href=\"/songdo/a\">A</a></li>"
+        values["RELATED_PREFETCH"] = "<link rel=\"prefetch\" href=\"/songdo/a\" as=\"document\">"
+        items.append((values, detail['상품 리스트']))
+
+    v, p = items[0]
+    assert legacy_render(template_path, v, p) == compiled_render(template_path, v, p), 'render mismatch'
+
+    before = bench(legacy_render, template_path, items)
+    after = bench(compiled_render, template_path, items)
+    print(f"pages={args.pages} products/page={args.products}")
+    print(f"  before (re-read + str.replace): {before * 1e6:8.1f} µs/page")
+    print(f"  after  (compiled single-pass):  {after * 1e6:8.1f} µs/page")
+    print(f"  speedup: {before / after:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark Google Sheets upload strategies against the local fake backend (fake_sheets.py).
+
+- rewrite: get_all_values + clear + update('A1', everything)  (OUTLET_SHEETS_MODE=rewrite)
+- insert:  new rows only, one batchUpdate at row 2             (OUTLET_SHEETS_MODE=insert)
+
+Each sheet starts with --existing rows. Every simulated crawl run uploads a listing of
+--listing rows per sheet, of which --new are not yet in the sheet. The script reports
+API calls, bytes sent/received and wall time per mode (--latency adds a simulated
+round trip per call, --bandwidth a per-byte cost), and asserts both modes end with
+identical sheet contents.
+
+Usage:
+  python3 apps/crawler/tools/bench_sheets_upload.py
+  python3 apps/crawler/tools/bench_sheets_upload.py --existing 20000 --new 50 --runs 3 --latency 0.2
+"""
+
+import io
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, os.path.join(REPO, 'apps', 'crawler'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import crawler_organized as co  # type: ignore
+from fake_sheets import FakeSheetsClient, format_stats
+
+SHEET_TITLE = 'outlet-data'
+SHEETS = ('송도', '김포', '스페이스원')
+
+
+def make_row(sheet, i):
+    link = f'https://www.ehyundai.com/newPortal/SN/SN_0101000.do?branchCd=B00{SHEETS.index(sheet)}&evntId={i:08d}'
+    return [f'행사 {i}', '2025.01.01 ~ 2025.01.31', f'상세 제목 {i}', '2025.01.01 ~ 2025.01.31',
+            f'https://image.ehyundai.com/thumb/{i}.jpg', link, '혜택 설명 ' * 5,
+            '브랜드', f'제품 {i}', '39,000원', f'https://image.ehyundai.com/img/{i}.jpg', '2025-01-01', f'{i:08d}']
+
+
+def initial_sheets(existing):
+    # 최신 행이 위쪽: 번호가 큰 행부터
+    return {SHEET_TITLE: {s: [list(co.SHEET_HEADERS)] + [make_row(s, i) for i in range(existing, 0, -1)]
+                          for s in SHEETS}}
+
+
+def run_mode(mode, args):
+    cache_dir = tempfile.mkdtemp(prefix='bench_sheets_')
+    client = FakeSheetsClient(sheets=initial_sheets(args.existing),
+                              latency=args.latency, bytes_per_sec=args.bandwidth)
+    saved = {k: os.environ.get(k) for k in ('OUTLET_SHEETS_MODE', 'OUTLET_CACHE_DIR')}
+    os.environ['OUTLET_SHEETS_MODE'] = mode
+    os.environ['OUTLET_CACHE_DIR'] = cache_dir
+    co.SHEETS_CLIENT_FACTORY = lambda: (client, client.WorksheetNotFound)
+    try:
+        started = time.perf_counter()
+        top = args.existing
+        for _ in range(args.runs):
+            for sheet in SHEETS:
+                # 목록 = 새 행 --new개 + 이미 있는 최신 행들 (목록 순서 = 최신순)
+                ids = list(range(top + args.new, max(top + args.new - args.listing, 0), -1))
+                rows = [make_row(sheet, i) for i in ids]
+                with contextlib.redirect_stdout(io.StringIO()):
+                    co.upload_to_google_sheet(SHEET_TITLE, sheet, rows)
+            top += args.new
+        elapsed = time.perf_counter() - started
+    finally:
+        co.SHEETS_CLIENT_FACTORY = None
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return client, elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--existing', type=int, default=5000, help='Rows already in each sheet')
+    ap.add_argument('--listing', type=int, default=200, help='Rows uploaded per sheet per run')
+    ap.add_argument('--new', type=int, default=20, help='Rows per sheet per run not yet in the sheet')
+    ap.add_argument('--runs', type=int, default=3, help='Simulated crawl runs')
+    ap.add_argument('--latency', type=float, default=0.0, help='Simulated seconds per API call')
+    ap.add_argument('--bandwidth', type=float, default=0.0, help='Simulated bytes/sec (0 = unlimited)')
+    args = ap.parse_args()
+
+    results = {}
+    for mode in ('rewrite', 'insert'):
+        client, elapsed = run_mode(mode, args)
+        results[mode] = (client, elapsed)
+        print(f"== {mode}: {elapsed:.2f}s")
+        print(format_stats(client.stats()))
+
+    assert results['rewrite'][0].sheets == results['insert'][0].sheets, 'final sheet contents differ'
+    r, i = results['rewrite'][0].stats(), results['insert'][0].stats()
+    ratio = (r['sent'] + r['received']) / max(1, i['sent'] + i['received'])
+    print(f"\n✅ identical sheet contents; insert moves {ratio:.0f}x fewer bytes "
+          f"({r['calls']} → {i['calls']} API calls)")
+
+
+if __name__ == '__main__':
+    main()
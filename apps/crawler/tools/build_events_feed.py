@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Build (or rebuild) apps/web/public/events.json from the current Google Sheets contents.
+
+The crawler keeps events.json up to date by merging the events it crawls on each run,
+so this is only needed once to seed the feed with events crawled before the feed
+existed (or to resync it after editing the sheets by hand). Rows are grouped into one
+record per event_id, products nested as [brand, product, price], the same way the
+home page script used to group the live Sheets rows.
+
+Sheets are opened the same way the crawler does (credentials.json, or OUTLET_SHEETS_FAKE
+for the local fake backend).
+
+Usage:
+  python3 apps/crawler/tools/build_events_feed.py
+  python3 apps/crawler/tools/build_events_feed.py --out /tmp/events.json --no-compress
+"""
+
+import os
+import re
+import sys
+import argparse
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+sys.path.insert(0, os.path.join(REPO, 'apps', 'crawler'))
+
+import crawler_organized as co  # type: ignore
+
+SHEETS = (('Sheet1', '송도'), ('Sheet2', '김포'), ('Sheet3', '스페이스원'))
+
+
+def period_dates(period, updated):
+    """'09.19(금) ~ 09.21(일)' → ISO (시작, 종료). 연도가 없는 기간은 행의 업데이트 날짜 연도 기준
+    (parse_period는 오늘 연도를 쓰므로 지난 해 행사가 잘못된 해로 옮겨지지 않도록)"""
+    start, end = co.parse_period(period)
+    if not start or not end:
+        return "", ""
+    if not re.search(r'\d{4}', period) and re.match(r'^\d{4}-\d{2}-\d{2}$', updated or ''):
+        year = int(updated[:4])
+        start, end = f"{year}{start[4:]}", f"{year}{end[4:]}"
+    # 연말-연초 행사
+    return co._wrap_year_end(start, end)
+
+
+def records_from_rows(rows, outlet):
+    """시트 행(헤더 제외) → {event_id: 피드 레코드}"""
+    records = {}
+    for row in rows:
+        if len(row) < 13 or not row[0] or not row[1] or not row[12]:
+            continue
+        event_id = row[12]
+        rec = records.get(event_id)
+        if rec is None:
+            start, end = period_dates(row[1], row[11])
+            if not start or not end:
+                continue
+            rec = records[event_id] = {
+                'id': event_id, 'outlet': outlet, 'title': row[0], 'start': start, 'end': end,
+                'thumbnail': row[4], 'desc': row[6], 'items': [],
+            }
+        if any(row[7:10]):
+            rec['items'].append([row[7], row[8], row[9]])
+    return records
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--title', default='outlet-data', help='Spreadsheet title')
+    ap.add_argument('--out', default=None, help='Output path (default: OUTLET_EVENTS_FEED_PATH / apps/web/public/events.json)')
+    ap.add_argument('--no-compress', action='store_true', help='Skip the .gz/.br variants')
+    args = ap.parse_args()
+
+    updates = {}
+    for sheet_name, outlet in SHEETS:
+        _, worksheet = co._open_worksheet(args.title, sheet_name)
+        values = worksheet.get_all_values()
+        if values and values[0] == co.SHEET_HEADERS:
+            values = values[1:]
+        records = records_from_rows(values, outlet)
+        print(f"📥 [{outlet}] 시트 {len(values)}행 → 행사 {len(records)}개")
+        updates.update(records)
+
+    total, changed = co.write_events_feed(args.out, updates=updates, compress=not args.no_compress)
+    co.finish_fake_sheets()
+    print(f"✅ events.json {'갱신' if changed else '변경 없음'}: 총 {total}개 행사")
+
+
+if __name__ == '__main__':
+    main()
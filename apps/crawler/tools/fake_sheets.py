@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+In-process, gspread-compatible stand-in for the Google Sheets calls the crawler makes.
+
+Implements only what upload_to_google_sheet / insert_rows_to_google_sheet use:
+  client.open(title) → spreadsheet.worksheet(name) / add_worksheet(...) / batch_update(body)
+  worksheet.get_all_values() / col_values(n) / clear() / update(range, values)
+
+Every call that would be an HTTP request against the real API is recorded with the
+JSON payload size sent and received, so upload strategies can be compared by API calls
+and bytes. An optional simulated latency (fixed + per-byte) makes timing comparable too.
+
+Use from the crawler:
+  OUTLET_SHEETS_FAKE=/tmp/sheets.json python3 apps/crawler/crawler_organized.py
+(the sheet contents are loaded from / saved to that JSON file, and call stats are printed)
+
+Usage (inspect a saved state file):
+  python3 apps/crawler/tools/fake_sheets.py /tmp/sheets.json
+"""
+
+import os
+import json
+import time
+import argparse
+import threading
+
+
+class WorksheetNotFound(LookupError):
+    pass
+
+
+def _size(obj):
+    return len(json.dumps(obj, ensure_ascii=False).encode('utf-8'))
+
+
+def _a1_row_col(a1):
+    """'A1' → (0, 0), 'C5' → (4, 2)"""
+    letters = ''.join(ch for ch in a1 if ch.isalpha()).upper()
+    digits = ''.join(ch for ch in a1 if ch.isdigit())
+    col = 0
+    for ch in letters:
+        col = col * 26 + (ord(ch) - 64)
+    return int(digits or 1) - 1, max(col, 1) - 1
+
+
+class FakeSheetsClient:
+    """gspread.Client 대용. sheets: {spreadsheet title: {worksheet name: [[cell, ...], ...]}}"""
+
+    WorksheetNotFound = WorksheetNotFound
+
+    def __init__(self, sheets=None, latency=0.0, bytes_per_sec=0.0, path=None):
+        self.sheets = sheets if sheets is not None else {}
+        self.latency = latency
+        self.bytes_per_sec = bytes_per_sec
+        self.path = path
+        self.calls = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        sheets = {}
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                sheets = json.load(f)
+        return cls(sheets=sheets, path=path, **kwargs)
+
+    def save(self, path=None):
+        path = path or self.path
+        if not path:
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.sheets, f, ensure_ascii=False)
+
+    def _record(self, method, sent, received):
+        with self._lock:
+            self.calls.append({'method': method, 'sent': sent, 'received': received})
+        if self.latency or self.bytes_per_sec:
+            delay = self.latency
+            if self.bytes_per_sec:
+                delay += (sent + received) / self.bytes_per_sec
+            time.sleep(delay)
+
+    def stats(self):
+        by_method = {}
+        for c in self.calls:
+            m = by_method.setdefault(c['method'], {'calls': 0, 'sent': 0, 'received': 0})
+            m['calls'] += 1
+            m['sent'] += c['sent']
+            m['received'] += c['received']
+        return {
+            'calls': len(self.calls),
+            'sent': sum(c['sent'] for c in self.calls),
+            'received': sum(c['received'] for c in self.calls),
+            'by_method': by_method,
+        }
+
+    def open(self, title):
+        self._record('open', _size({'q': title}), _size({'title': title}))
+        return FakeSpreadsheet(self, title, self.sheets.setdefault(title, {}))
+
+
+class FakeSpreadsheet:
+    def __init__(self, client, title, worksheets):
+        self.client = client
+        self.title = title
+        self.id = f"fake-{title}"
+        self._worksheets = worksheets
+
+    def _by_id(self, sheet_id):
+        for i, name in enumerate(self._worksheets):
+            if i == sheet_id:
+                return name
+        raise WorksheetNotFound(sheet_id)
+
+    def worksheet(self, name):
+        self.client._record('worksheet', 0, _size(list(self._worksheets)))
+        if name not in self._worksheets:
+            raise WorksheetNotFound(name)
+        return FakeWorksheet(self, name)
+
+    def add_worksheet(self, title, rows, cols):
+        self.client._record('add_worksheet', _size({'title': title, 'rows': rows, 'cols': cols}), 0)
+        self._worksheets.setdefault(title, [])
+        return FakeWorksheet(self, title)
+
+    def batch_update(self, body):
+        """spreadsheets.batchUpdate: insertDimension(ROWS) / updateCells(userEnteredValue)만 지원"""
+        self.client._record('batch_update', _size(body), _size({'replies': [{}] * len(body.get('requests', []))}))
+        for req in body.get('requests', []):
+            if 'insertDimension' in req:
+                rng = req['insertDimension']['range']
+                if rng.get('dimension') != 'ROWS':
+                    raise NotImplementedError('only ROWS insertDimension is supported')
+                values = self._worksheets[self._by_id(rng['sheetId'])]
+                start, end = rng['startIndex'], rng['endIndex']
+                while len(values) < start:
+                    values.append([])
+                values[start:start] = [[] for _ in range(end - start)]
+            elif 'updateCells' in req:
+                uc = req['updateCells']
+                start = uc['start']
+                values = self._worksheets[self._by_id(start['sheetId'])]
+                for r, row in enumerate(uc.get('rows', [])):
+                    ri = start.get('rowIndex', 0) + r
+                    while len(values) <= ri:
+                        values.append([])
+                    target = values[ri]
+                    for c, cell in enumerate(row.get('values', [])):
+                        ci = start.get('columnIndex', 0) + c
+                        while len(target) <= ci:
+                            target.append('')
+                        target[ci] = cell.get('userEnteredValue', {}).get('stringValue', '')
+            else:
+                raise NotImplementedError(f"unsupported request: {list(req)}")
+        return {'replies': []}
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, name):
+        self.spreadsheet = spreadsheet
+        self.client = spreadsheet.client
+        self.title = name
+        self.id = list(spreadsheet._worksheets).index(name)
+
+    @property
+    def _values(self):
+        return self.spreadsheet._worksheets[self.title]
+
+    def get_all_values(self):
+        values = [list(r) for r in self._values]
+        self.client._record('get_all_values', 0, _size({'values': values}))
+        return values
+
+    def col_values(self, col):
+        values = [r[col - 1] if len(r) >= col else '' for r in self._values]
+        while values and values[-1] == '':
+            values.pop()
+        self.client._record('col_values', 0, _size({'values': [[v] for v in values]}))
+        return values
+
+    def clear(self):
+        self.client._record('clear', 0, 0)
+        self._values.clear()
+
+    def update(self, range_name, values=None):
+        # gspread 5: update('A1', values) / gspread 6: update(values, 'A1')
+        if not isinstance(range_name, str):
+            range_name, values = values or 'A1', range_name
+        self.client._record('update', _size({'range': range_name, 'values': values}), 0)
+        row0, col0 = _a1_row_col(range_name)
+        target = self._values
+        for r, row in enumerate(values):
+            while len(target) <= row0 + r:
+                target.append([])
+            cells = target[row0 + r]
+            for c, v in enumerate(row):
+                while len(cells) <= col0 + c:
+                    cells.append('')
+                cells[col0 + c] = '' if v is None else str(v)
+        return {}
+
+
+def format_stats(stats):
+    lines = [f"calls {stats['calls']}, sent {stats['sent']:,} B, received {stats['received']:,} B"]
+    for method, m in sorted(stats['by_method'].items()):
+        lines.append(f"  {method:<15} {m['calls']:>4} calls  sent {m['sent']:>12,} B  received {m['received']:>12,} B")
+    return "\n".join(lines)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('state', help='JSON state file written via OUTLET_SHEETS_FAKE')
+    args = ap.parse_args()
+    client = FakeSheetsClient.load(args.state)
+    for title, worksheets in client.sheets.items():
+        for name, values in worksheets.items():
+            print(f"{title} / {name}: {len(values)} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+URL 매핑(url-mapping.json) 형식과 이벤트 ID 해석 규칙.
+
+v1: {event_id: filename}. add_comprehensive_mapping이 이벤트마다 기본 ID와 _02/_03/_04,
+    9자리 축약형 변형까지 최대 8개 키를 기록합니다.
+v2: {"version": 2, "files": [filename, ...], "events": [[event_id, files 번호], ...]}
+    규칙으로 해석되지 않는 ID만 저장합니다 (기본 ID + 기본 ID와 다른 예전 페이지를 가리키는
+    변형). events는 ID 순으로 정렬되어 있고, 대상 파일명은 files에 한 번씩만 들어갑니다.
+
+해석 규칙 (add_comprehensive_mapping의 역순):
+  1. 저장된 ID와 정확히 일치
+  2. _02/_03/_04 접미사를 뗀 ID와 일치
+  3. (접미사를 뗀) ID가 9자리면 그 ID로 시작하는 첫 12자리 ID
+
+크롤러는 메모리에서 v1 형태(expand 결과)를 그대로 쓰고 저장할 때만 v2로 압축하며, v1 파일도
+그대로 읽습니다. 같은 규칙의 JS 구현은 js_resolver()가 생성합니다
+(apps/web/public/url-mapping-resolver.js, Cloudflare 워커).
+
+브라우저용 샤드 (apps/web/public/url-mapping/):
+  manifest.json        {"version", "hash", "prefix_len", "ids", "shards": {접두어: "shards/<접두어>.<내용 해시>.json"}}
+  shards/*.json        v2 형식, 해당 접두어의 이벤트만
+샤드 키는 변형 접미사를 뗀 ID의 앞 9자리(FNV-1a 32비트 16진수의 앞 prefix_len자리)라서, 한 ID를
+해석하는 데 필요한 항목(기본 ID, 변형, 9자리로 시작하는 12자리 ID)은 항상 같은 샤드에 있습니다.
+샤드 파일명에 내용 해시가 들어가므로 영구 캐시할 수 있고, 직전 매니페스트가 가리키던 샤드는
+한 세대 남겨 둡니다 (캐시된 매니페스트로 받은 샤드 경로가 바로 404가 되지 않도록).
+
+사용법:
+  python3 apps/crawler/url_mapping.py                 # 요약
+  python3 apps/crawler/url_mapping.py migrate         # v1 → v2 변환 (모든 기존 키 검증 후 저장)
+  python3 apps/crawler/url_mapping.py js              # JS 해석기 재생성
+  python3 apps/crawler/url_mapping.py shards          # 샤드 + 매니페스트 생성 후 검증
+  python3 apps/crawler/url_mapping.py verify          # 기존 샤드 검증만
+"""
+
+import os
+import re
+import json
+import hashlib
+import argparse
+from bisect import bisect_left
+
+MAPPING_VERSION = 2
+VARIANT_SUFFIXES = ("_02", "_03", "_04")
+SHORT_ID_LEN = 9
+FULL_ID_LEN = 12
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.normpath(os.path.join(BASE_DIR, "../web/public/url-mapping.json"))
+JS_PATH = os.path.normpath(os.path.join(BASE_DIR, "../web/public/url-mapping-resolver.js"))
+SHARDS_DIR = os.path.normpath(os.path.join(BASE_DIR, "../web/public/url-mapping"))
+
+SHARD_HASH = "fnv1a32"
+# 샤드당 평균 ID 수가 이 값 이하가 되는 가장 짧은 접두어 길이 사용
+SHARD_TARGET_IDS = 512
+SHARD_FILE_RE = re.compile(r"^[0-9a-f]+\.[0-9a-f]{10}\.json$")
+
+
+def split_variant(event_id):
+    """'abc_02' → ('abc', '_02'), 접미사가 없으면 (event_id, '')"""
+    for suffix in VARIANT_SUFFIXES:
+        if event_id.endswith(suffix) and len(event_id) > len(suffix):
+            return event_id[: -len(suffix)], suffix
+    return event_id, ""
+
+
+def is_full_id(event_id):
+    return len(event_id) == FULL_ID_LEN and "_" not in event_id
+
+
+def resolve(event_id, exact, by_short):
+    """해석 규칙. exact(id) → 대상 또는 None, by_short(9자리 ID) → 그 ID로 시작하는 첫 12자리 ID의 대상"""
+    target = exact(event_id)
+    if target is not None:
+        return target
+    base, suffix = split_variant(event_id)
+    if suffix:
+        target = exact(base)
+        if target is not None:
+            return target
+    if len(base) == SHORT_ID_LEN:
+        return by_short(base)
+    return None
+
+
+def legacy_variants(event_id):
+    """add_comprehensive_mapping이 event_id와 함께 추가하는 변형 ID들 (추가 순서대로)"""
+    base, suffix = split_variant(event_id)
+    if suffix == "_02":
+        variants = [base]
+    elif suffix:
+        variants = [event_id + "_02"]
+    else:
+        variants = [event_id + s for s in VARIANT_SUFFIXES]
+        if len(event_id) == FULL_ID_LEN:
+            short_id = event_id[:SHORT_ID_LEN]
+            variants += [short_id] + [short_id + s for s in VARIANT_SUFFIXES]
+    return variants
+
+
+def _rank(event_id):
+    # 0: 기본 ID, 1: 9자리 축약형, 2: 변형 (해석이 낮은 단계만 참조하므로 이 순서로 결정)
+    if split_variant(event_id)[1]:
+        return 2
+    return 1 if len(event_id) == SHORT_ID_LEN else 0
+
+
+def compact(mapping):
+    """{event_id: 대상} → 규칙으로 해석되지 않는 항목만 남긴 dict. 모든 키는 같은 대상으로 해석됩니다."""
+    stored = {}
+    short_index = {}
+    for event_id in sorted(mapping, key=lambda k: (_rank(k), k)):
+        target = mapping[event_id]
+        if _rank(event_id) == 0:
+            stored[event_id] = target
+            if is_full_id(event_id):
+                short_index.setdefault(event_id[:SHORT_ID_LEN], target)
+        elif resolve(event_id, stored.get, short_index.get) != target:
+            stored[event_id] = target
+    return stored
+
+
+def make_table(stored):
+    """{event_id: 대상} → {"ids": 정렬된 ID, "targets": files 번호, "files": 중복 제거된 대상}"""
+    ids = sorted(stored)
+    files = sorted(set(stored.values()))
+    index = {f: i for i, f in enumerate(files)}
+    return {"ids": ids, "targets": [index[stored[i]] for i in ids], "files": files}
+
+
+def lookup(table, event_id):
+    """make_table() 결과에서 event_id 해석 (이진 탐색). 없으면 None"""
+    ids, targets, files = table["ids"], table["targets"], table["files"]
+
+    def exact(key):
+        i = bisect_left(ids, key)
+        return files[targets[i]] if i < len(ids) and ids[i] == key else None
+
+    def by_short(short_id):
+        i = bisect_left(ids, short_id)
+        while i < len(ids) and ids[i].startswith(short_id):
+            if is_full_id(ids[i]):
+                return files[targets[i]]
+            i += 1
+        return None
+
+    return resolve(event_id, exact, by_short)
+
+
+def expand(table):
+    """table → v1 형태 {event_id: 대상}: 저장된 ID + 기본 ID마다 add_comprehensive_mapping이 만드는 변형
+    (예전 크롤러가 일부 변형만 만든 이벤트가 있어 v1 파일의 키보다 많을 수 있음)"""
+    full = {event_id: table["files"][t] for event_id, t in zip(table["ids"], table["targets"])}
+    for event_id in table["ids"]:
+        if _rank(event_id) != 0:
+            continue
+        for variant in legacy_variants(event_id):
+            if variant not in full:
+                target = lookup(table, variant)
+                if target is not None:
+                    full[variant] = target
+    return full
+
+
+def table_from_document(doc):
+    """url-mapping.json 내용(v2 또는 v1) → table"""
+    if isinstance(doc, dict) and doc.get("version") == MAPPING_VERSION:
+        events = doc.get("events", [])
+        return {"ids": [e[0] for e in events], "targets": [e[1] for e in events], "files": list(doc.get("files", []))}
+    if isinstance(doc, dict) and "version" not in doc:
+        return make_table(compact(doc))
+    raise ValueError(f"지원하지 않는 URL 매핑 버전: {doc.get('version') if isinstance(doc, dict) else type(doc).__name__}")
+
+
+def document_text(table):
+    """v2 JSON 텍스트. 파일명/이벤트 한 줄씩 (매 실행 diff가 바뀐 줄로만 보이도록)"""
+    dump = lambda v: json.dumps(v, ensure_ascii=False, separators=(",", ":"))
+    lines = ['{"version":%d,' % MAPPING_VERSION, '"files":[']
+    lines += [dump(f) + "," for f in table["files"]]
+    if table["files"]:
+        lines[-1] = lines[-1][:-1]
+    lines += ["],", '"events":[']
+    lines += [dump([i, t]) + "," for i, t in zip(table["ids"], table["targets"])]
+    if table["ids"]:
+        lines[-1] = lines[-1][:-1]
+    lines.append("]}")
+    return "\n".join(lines) + "\n"
+
+
+def load_table(path=DEFAULT_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return table_from_document(json.load(f))
+
+
+def load_mapping(path=DEFAULT_PATH):
+    """url-mapping.json(v1/v2) → v1 형태 dict (크롤러 메모리/리다이렉트 생성용)"""
+    return expand(load_table(path))
+
+
+def _write_if_changed(path, data):
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def write_table(path, table):
+    """table → v2로 저장 (내용이 같으면 쓰지 않음). (저장된 ID 수, 바이트 수, 변경 여부) 반환"""
+    data = document_text(table).encode("utf-8")
+    return len(table["ids"]), len(data), _write_if_changed(path, data)
+
+
+def write_mapping(path, mapping):
+    """v1 형태 dict → v2로 압축해 저장. write_table과 같은 값 반환"""
+    return write_table(path, make_table(compact(mapping)))
+
+
+def shard_key(event_id):
+    """변형 접미사를 뗀 ID의 앞 9자리 (해석에 필요한 ID들이 모두 공유)"""
+    return split_variant(event_id)[0][:SHORT_ID_LEN]
+
+
+def shard_hash(key):
+    h = 0x811C9DC5
+    for b in key.encode("utf-8"):
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return f"{h:08x}"
+
+
+def shard_of(event_id, prefix_len):
+    return shard_hash(shard_key(event_id))[:prefix_len]
+
+
+def shard_prefix_len(count, target=SHARD_TARGET_IDS):
+    prefix_len = 1
+    while count / 16 ** prefix_len > target and prefix_len < 8:
+        prefix_len += 1
+    return prefix_len
+
+
+def build_shards(table, prefix_len=None):
+    """table → (manifest, {상대 경로: 샤드 텍스트})"""
+    prefix_len = prefix_len or shard_prefix_len(len(table["ids"]))
+    groups = {}
+    for event_id, target in zip(table["ids"], table["targets"]):
+        groups.setdefault(shard_of(event_id, prefix_len), {})[event_id] = table["files"][target]
+    shards = {}
+    paths = {}
+    for prefix in sorted(groups):
+        text = document_text(make_table(groups[prefix]))
+        rel = f"shards/{prefix}.{hashlib.sha1(text.encode('utf-8')).hexdigest()[:10]}.json"
+        shards[rel] = text
+        paths[prefix] = rel
+    manifest = {
+        "version": MAPPING_VERSION,
+        "hash": SHARD_HASH,
+        "prefix_len": prefix_len,
+        "ids": len(table["ids"]),
+        "shards": paths,
+    }
+    return manifest, shards
+
+
+def _manifest_text(manifest):
+    return json.dumps(manifest, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+def _read_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _shard_files(out_dir):
+    shard_dir = os.path.join(out_dir, "shards")
+    if not os.path.isdir(shard_dir):
+        return []
+    return [f"shards/{name}" for name in sorted(os.listdir(shard_dir)) if SHARD_FILE_RE.match(name)]
+
+
+def write_shards(table, out_dir=SHARDS_DIR, prefix_len=None):
+    """샤드/매니페스트 저장. 새 샤드와 직전 매니페스트가 가리키던 샤드 외의 샤드 파일은 삭제.
+    (manifest, 새로 쓴 샤드 수, 삭제한 샤드 수) 반환"""
+    manifest, shards = build_shards(table, prefix_len)
+    previous = _read_manifest(out_dir) or {}
+    written = 0
+    for rel, text in shards.items():
+        path = os.path.join(out_dir, rel)
+        # 파일명에 내용 해시가 있으므로 이미 있으면 같은 내용
+        if not os.path.exists(path):
+            _write_if_changed(path, text.encode("utf-8"))
+            written += 1
+    _write_if_changed(os.path.join(out_dir, "manifest.json"), _manifest_text(manifest).encode("utf-8"))
+
+    keep = set(shards) | set((previous.get("shards") or {}).values())
+    removed = 0
+    for rel in _shard_files(out_dir):
+        if rel not in keep:
+            os.remove(os.path.join(out_dir, rel))
+            removed += 1
+    return manifest, written, removed
+
+
+def verify_shards(table, out_dir=SHARDS_DIR):
+    """샤드가 table과 같은 결과를 내는지 검사. 문제 목록 반환 (비어 있으면 정상)"""
+    manifest = _read_manifest(out_dir)
+    if manifest is None:
+        return [f"{out_dir}/manifest.json 없음"]
+    if manifest.get("version") != MAPPING_VERSION or manifest.get("hash") != SHARD_HASH:
+        return [f"지원하지 않는 매니페스트: version={manifest.get('version')}, hash={manifest.get('hash')}"]
+    prefix_len = manifest["prefix_len"]
+    problems = []
+    tables = {}
+    for prefix, rel in manifest["shards"].items():
+        try:
+            with open(os.path.join(out_dir, rel), "rb") as f:
+                raw = f.read()
+        except OSError:
+            problems.append(f"샤드 없음: {rel}")
+            continue
+        if not rel.endswith(f"/{prefix}.{hashlib.sha1(raw).hexdigest()[:10]}.json"):
+            problems.append(f"내용 해시 불일치: {rel}")
+        shard = table_from_document(json.loads(raw))
+        problems += [f"다른 샤드의 ID {i} in {rel}" for i in shard["ids"] if shard_of(i, prefix_len) != prefix]
+        tables[prefix] = shard
+    if problems:
+        return problems
+    stored = sum(len(t["ids"]) for t in tables.values())
+    if stored != len(table["ids"]) or manifest.get("ids") != stored:
+        problems.append(f"ID 수 불일치: 샤드 {stored}, 매니페스트 {manifest.get('ids')}, 매핑 {len(table['ids'])}")
+    empty = {"ids": [], "targets": [], "files": []}
+    # 저장된 ID와 모든 레거시 변형 키가 자기 샤드만으로 같은 대상으로 해석되는지
+    for event_id in expand(table):
+        got = lookup(tables.get(shard_of(event_id, prefix_len), empty), event_id)
+        if got != lookup(table, event_id):
+            problems.append(f"해석 불일치: {event_id} → {got}")
+    return problems
+
+
+def mismatches(mapping, table):
+    """mapping의 키 중 table에서 다른 대상으로 해석되는 키 목록"""
+    return [k for k, v in mapping.items() if lookup(table, k) != v]
+
+
+def js_resolver():
+    """브라우저/워커용 해석기 (resolve/lookup과 같은 규칙)"""
+    suffixes = "|".join(VARIANT_SUFFIXES)
+    return f"""// 이벤트 ID 해석 규칙 - apps/crawler/url_mapping.py가 생성 (직접 수정하지 마세요)
+// table: {{ ids: 정렬된 이벤트 ID, targets: ids 순서의 files 번호, files: 대상 }}
+// 1. 정확히 일치  2. _02/_03/_04 접미사를 뗀 ID  3. 9자리 ID면 그 ID로 시작하는 첫 12자리 ID
+var UrlMapping = (function () {{
+  var VERSION = {MAPPING_VERSION}
+  var VARIANT_RE = /^(.+)(?:{suffixes})$/
+
+  function lowerBound(ids, key) {{
+    var lo = 0, hi = ids.length
+    while (lo < hi) {{
+      var mid = (lo + hi) >>> 1
+      if (ids[mid] < key) lo = mid + 1
+      else hi = mid
+    }}
+    return lo
+  }}
+
+  function exact(table, id) {{
+    var i = lowerBound(table.ids, id)
+    return i < table.ids.length && table.ids[i] === id ? table.files[table.targets[i]] : null
+  }}
+
+  function byShortId(table, shortId) {{
+    for (var i = lowerBound(table.ids, shortId); i < table.ids.length && table.ids[i].startsWith(shortId); i++) {{
+      var id = table.ids[i]
+      if (id.length === {FULL_ID_LEN} && id.indexOf('_') < 0) return table.files[table.targets[i]]
+    }}
+    return null
+  }}
+
+  function lookup(table, id) {{
+    if (!id) return null
+    var hit = exact(table, id)
+    if (hit) return hit
+    var m = VARIANT_RE.exec(id)
+    var base = m ? m[1] : id
+    if (m) {{
+      hit = exact(table, base)
+      if (hit) return hit
+    }}
+    return base.length === {SHORT_ID_LEN} ? byShortId(table, base) : null
+  }}
+
+  // url-mapping.json 내용 → table (v1 {{id: 파일명}}도 허용)
+  function fromDocument(doc) {{
+    if (doc && doc.version === VERSION) {{
+      var events = doc.events || []
+      return {{
+        ids: events.map(function (e) {{ return e[0] }}),
+        targets: events.map(function (e) {{ return e[1] }}),
+        files: doc.files || []
+      }}
+    }}
+    var ids = Object.keys(doc || {{}}).sort()
+    return {{ ids: ids, targets: ids.map(function (_, i) {{ return i }}), files: ids.map(function (id) {{ return doc[id] }}) }}
+  }}
+
+  // 샤드 접두어: 접미사를 뗀 ID의 앞 9자리 → FNV-1a 32비트 16진수 앞 prefixLen자리
+  function shardOf(id, prefixLen) {{
+    var m = VARIANT_RE.exec(id)
+    var key = Array.from(m ? m[1] : id).slice(0, {SHORT_ID_LEN}).join('')
+    var bytes = new TextEncoder().encode(key)
+    var h = 0x811c9dc5
+    for (var i = 0; i < bytes.length; i++) h = Math.imul(h ^ bytes[i], 0x01000193) >>> 0
+    return ('0000000' + h.toString(16)).slice(-8).slice(0, prefixLen)
+  }}
+
+  return {{ VERSION: VERSION, lookup: lookup, fromDocument: fromDocument, shardOf: shardOf }}
+}})()
+"""
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("command", nargs="?", default="info", choices=("info", "migrate", "js", "shards", "verify"))
+    ap.add_argument("--in", dest="src", default=DEFAULT_PATH, help="읽을 url-mapping.json (v1/v2)")
+    ap.add_argument("--out", default=None, help="migrate: 저장 경로 (기본: --in 덮어쓰기), js: 해석기 경로")
+    ap.add_argument("--out-dir", default=SHARDS_DIR, help="shards/verify: 샤드 디렉토리")
+    ap.add_argument("--prefix-len", type=int, default=None, help="shards: 접두어 길이 (기본: ID 수로 결정)")
+    args = ap.parse_args()
+
+    if args.command == "js":
+        out = args.out or JS_PATH
+        with open(out, "w", encoding="utf-8") as f:
+            f.write(js_resolver())
+        print(f"✅ JS 해석기 생성: {out}")
+        return
+
+    with open(args.src, "rb") as f:
+        raw = f.read()
+    doc = json.loads(raw)
+    table = table_from_document(doc)
+    version = doc.get("version", 1)
+    print(f"📋 {args.src}: v{version}, {len(raw):,} B, 저장된 ID {len(table['ids']):,}개, 대상 {len(table['files']):,}개")
+    if args.command == "info":
+        return
+
+    if args.command in ("shards", "verify"):
+        if args.command == "shards":
+            manifest, written, removed = write_shards(table, args.out_dir, args.prefix_len)
+            sizes = [os.path.getsize(os.path.join(args.out_dir, rel)) for rel in manifest["shards"].values()]
+            print(f"🧩 샤드 {len(sizes)}개 (접두어 {manifest['prefix_len']}자리, 새로 씀 {written}, 삭제 {removed}): "
+                  f"평균 {sum(sizes) // max(len(sizes), 1):,} B, 최대 {max(sizes, default=0):,} B, "
+                  f"매니페스트 {os.path.getsize(os.path.join(args.out_dir, 'manifest.json')):,} B")
+        problems = verify_shards(table, args.out_dir)
+        if problems:
+            raise SystemExit(f"❌ 샤드 검증 실패 {len(problems)}건: {problems[:5]}")
+        print(f"✅ 샤드 검증 통과: {args.out_dir} (키 {len(expand(table)):,}개 모두 자기 샤드만으로 같은 대상)")
+        return
+
+    # v1 키 전체가 v2에서 같은 대상으로 해석되는지 확인한 뒤 저장
+    legacy = doc if version == 1 else expand(table)
+    wrong = mismatches(legacy, table)
+    if wrong:
+        raise SystemExit(f"❌ {len(wrong)}개 키가 다르게 해석됨: {wrong[:5]}")
+    out = args.out or args.src
+    stored, size, changed = write_mapping(out, legacy)
+    extra = len(expand(table)) - len(legacy)
+    print(f"✅ v{MAPPING_VERSION} {'저장' if changed else '변경 없음'}: {out} ({size:,} B, {len(raw) / size:.1f}x 작음)")
+    print(f"   기존 키 {len(legacy):,}개 모두 같은 대상으로 해석, 저장된 ID {stored:,}개"
+          + (f", 규칙으로 새로 해석되는 변형 {extra:,}개" if extra > 0 else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,16 @@
   let rawEvents = [];
   let selectedOutlet = "ALL";
   let selectedBrands = new Set();  // 복수 선택을 위한 Set
-  let urlMapping = {};  // URL 매핑 캐시
+  let urlMapping = UrlMapping.fromDocument({});  // 전체 URL 매핑 (url-mapping-resolver.js 테이블, 샤드를 못 쓸 때)
+  let mappingManifest = null;  // 샤드 매니페스트 (/url-mapping/manifest.json). 있으면 샤드 모드
+  const mappingShards = {};    // 샤드 접두어 → { promise, table }
 
   // 디버깅용 전역 노출 (즉시 설정)
   window._debug = {
     get rawEvents() { return rawEvents; },
     get urlMapping() { return urlMapping; },
+    get mappingManifest() { return mappingManifest; },
+    get mappingShards() { return mappingShards; },
     get calendar() { return calendar; }
   };
   console.log('✅ _debug 객체가 window에 등록되었습니다.');
@@ -54,46 +58,31 @@
         const event = info.event;
         const id = event.extendedProps.event_id;
         if (id) {
-          // UUID에서 shortId 추출
-          let shortId = id;
-          if (id.includes('-')) {
-            const parts = id.split('-');
-            shortId = parts[parts.length - 1];
-          }
-
-          // 캐시된 매핑 사용 (변형 ID도 체크)
-          let filename = urlMapping[id] || urlMapping[shortId];
-          if (!filename) {
-            // _02가 있으면 기본 ID로 시도
-            if (shortId.endsWith('_02')) {
-              const baseId = shortId.slice(0, -3);
-              filename = urlMapping[baseId];
+          // 매핑 조회 (변형 ID도 체크, 샤드 모드면 필요한 샤드만 받음)
+          openEventPage(id).then(found => {
+            if (found) {
+              // GA: 캘린더 이벤트 클릭
+              sendGA('calendar_event_click', {
+                event_id: id,
+                title: event.title || '',
+                outlet: (event.extendedProps && event.extendedProps.outlet) || '',
+                start: event.startStr || event.start || '',
+                end: event.endStr || event.end || ''
+              });
+            } else {
+              console.error(`매핑되지 않은 이벤트 클릭됨 - ${id}`);
+              alert("상세 페이지를 찾을 수 없습니다.");
             }
-            // 기본 ID면 _02 변형으로 시도
-            else {
-              filename = urlMapping[shortId + '_02'];
-            }
-          }
-          
-          if (filename) {
-            const url = `/pages/${filename}`;
-            // GA: 캘린더 이벤트 클릭
-            sendGA('calendar_event_click', {
-              event_id: id,
-              title: event.title || '',
-              outlet: (event.extendedProps && event.extendedProps.outlet) || '',
-              start: event.startStr || event.start || '',
-              end: event.endStr || event.end || ''
-            });
-            window.open(url, "_blank");
-          } else {
-            console.error(`매핑되지 않은 이벤트 클릭됨 - ${id}`);
-            alert("상세 페이지를 찾을 수 없습니다.");
-          }
+          });
         } else {
           alert("상세 페이지를 찾을 수 없습니다.");
         }
       },
+      // 마우스를 올리면 클릭 전에 샤드를 미리 받아 둠
+      eventMouseEnter: function (info) {
+        const id = info.event.extendedProps.event_id;
+        if (id) loadMappingShards(id);
+      },
     });
     calendar.render();
   }
@@ -212,29 +201,10 @@
       const endExclusive = endDate.toISOString().split('T')[0];
 
       // URL 매핑이 없는 이벤트는 제외 (변형 ID도 체크)
-      // eventId가 UUID 형식(예: 78565274-4f6e-420f-9df7-f2ba0c6c1728)이면 마지막 부분 추출
-      let shortId = eventId;
-      if (eventId && eventId.includes('-')) {
-        const parts = eventId.split('-');
-        shortId = parts[parts.length - 1]; // 마지막 부분 (예: f2ba0c6c1728)
-      }
-
-      let mappedFilename = urlMapping[eventId] || urlMapping[shortId];
-      if (!mappedFilename) {
-        // _02가 있으면 기본 ID로 시도
-        if (shortId.endsWith('_02')) {
-          const baseId = shortId.slice(0, -3);
-          mappedFilename = urlMapping[baseId];
-        }
-        // 기본 ID면 _02 변형으로 시도
-        else {
-          mappedFilename = urlMapping[shortId + '_02'];
-        }
-      }
-      
+      const mappedFilename = findMappedFilename(eventId);
       if (!mappedFilename) {
         noMappingCount++;
-        console.log(`⚠️ 매핑되지 않은 이벤트 제외: eventId="${eventId}", shortId="${shortId}", title="${title}"`);
+        console.log(`⚠️ 매핑되지 않은 이벤트 제외: eventId="${eventId}", shortId="${eventShortId(eventId)}", title="${title}"`);
         continue;
       }
 
@@ -265,6 +235,143 @@
     return result;
   }
 
+  // eventId가 UUID 형식(예: 78565274-4f6e-420f-9df7-f2ba0c6c1728)이면 마지막 부분 (예: f2ba0c6c1728)
+  function eventShortId(eventId) {
+    if (eventId && eventId.includes('-')) {
+      const parts = eventId.split('-');
+      return parts[parts.length - 1];
+    }
+    return eventId;
+  }
+
+  // 매핑에서 차례로 찾아볼 키 (_02/_03/_04, 9자리 축약형 변형은 해석기가 규칙으로 처리)
+  function mappingKeys(eventId) {
+    if (!eventId) return [];
+    const shortId = eventShortId(eventId);
+    const keys = [eventId];
+    if (shortId !== eventId) keys.push(shortId);
+    // 기본 ID면 _02 변형으로도 시도
+    if (!/_0\d$/.test(shortId)) keys.push(shortId + '_02');
+    return keys;
+  }
+
+  // 키를 조회할 테이블 (샤드 모드에서 아직 받지 않은 샤드면 null)
+  function tableFor(key) {
+    if (!mappingManifest) return urlMapping;
+    const shard = mappingShards[UrlMapping.shardOf(key, mappingManifest.prefix_len)];
+    return shard ? shard.table : null;
+  }
+
+  // eventId → 매핑된 파일명 (없거나 샤드를 아직 받지 않았으면 undefined)
+  function findMappedFilename(eventId) {
+    for (const key of mappingKeys(eventId)) {
+      const table = tableFor(key);
+      const mappedFilename = table && UrlMapping.lookup(table, key);
+      if (mappedFilename) return mappedFilename;
+    }
+    return undefined;
+  }
+
+  function fetchMappingShard(rel) {
+    return fetch(`/url-mapping/${rel}`).then(response => {
+      if (!response.ok) throw new Error(`HTTP ${response.status}`);
+      return response.json();
+    });
+  }
+
+  // eventId 조회에 필요한 샤드를 받아 둠 (샤드 모드가 아니면 바로 완료, 실패해도 reject하지 않음)
+  function loadMappingShards(eventId) {
+    if (!mappingManifest) return Promise.resolve();
+    const manifest = mappingManifest;
+    const prefixes = new Set(mappingKeys(eventId).map(key => UrlMapping.shardOf(key, manifest.prefix_len)));
+    return Promise.all(Array.from(prefixes, prefix => {
+      if (mappingShards[prefix]) return mappingShards[prefix].promise;
+      const shard = mappingShards[prefix] = { table: null, promise: null };
+      const rel = manifest.shards[prefix];
+      // 매니페스트에 없는 접두어 = 해당 ID 없음
+      const loading = rel ? fetchMappingShard(rel).catch(error =>
+        // 배포로 샤드가 바뀌었으면 매니페스트를 다시 받아 한 번 재시도
+        fetchMappingManifest().then(fresh => {
+          const freshRel = fresh.prefix_len === manifest.prefix_len && fresh.shards[prefix];
+          if (!freshRel || freshRel === rel) throw error;
+          manifest.shards[prefix] = freshRel;
+          return fetchMappingShard(freshRel);
+        })
+      ) : Promise.resolve({});
+      shard.promise = loading
+        .then(doc => { shard.table = UrlMapping.fromDocument(doc); })
+        .catch(error => {
+          delete mappingShards[prefix];
+          console.warn(`URL 매핑 샤드 로드 실패 (${prefix}):`, error);
+        });
+      return shard.promise;
+    }));
+  }
+
+  // eventId → Promise<매핑된 파일명 | undefined>
+  function resolveMappedFilename(eventId) {
+    return loadMappingShards(eventId).then(() => findMappedFilename(eventId));
+  }
+
+  // 상세 페이지를 새 탭으로 엶 (매핑이 없으면 fallbackUrl). Promise<매핑 여부>
+  function openEventPage(eventId, fallbackUrl) {
+    const filename = findMappedFilename(eventId);
+    if (filename || !mappingManifest) {
+      const url = filename ? `/pages/${filename}` : fallbackUrl;
+      if (url) window.open(url, '_blank');
+      return Promise.resolve(Boolean(filename));
+    }
+    // 샤드를 받는 동안 팝업 차단에 걸리지 않도록 클릭 시점에 빈 탭을 먼저 엶
+    const win = window.open('', '_blank');
+    return resolveMappedFilename(eventId).then(mappedFilename => {
+      const url = mappedFilename ? `/pages/${mappedFilename}` : fallbackUrl;
+      if (!url) {
+        if (win) win.close();
+      } else if (win) {
+        win.location.href = url;
+      } else {
+        window.open(url, '_blank');
+      }
+      return Boolean(mappedFilename);
+    });
+  }
+
+  // 크롤러가 만든 정적 피드(events.json) → parseSheetData와 같은 형태의 이벤트 목록
+  // 피드 레코드: { id, outlet, title, start, end(포함), thumbnail, desc, items: [[브랜드, 제품명, 가격], ...] }
+  function parseEventsFeed(feed) {
+    const result = [];
+    let noMappingCount = 0;
+    for (const e of feed.events || []) {
+      // 샤드 모드에서는 거르지 않음 (피드는 크롤러가 상세 페이지를 만든 행사만 담고, 매핑은 클릭 시 확인)
+      if (!mappingManifest && !findMappedFilename(e.id)) {
+        noMappingCount++;
+        continue;
+      }
+      // 시작일이 종료일보다 큰 경우 (연말-연초 이벤트, 이전 피드) 종료일 연도 조정
+      let end = e.end;
+      if (e.start > end) {
+        const [y, m, d] = end.split('-');
+        end = `${parseInt(y) + 1}-${m}-${d}`;
+      }
+      // FullCalendar의 end는 exclusive이므로 하루 추가
+      const endDate = new Date(end);
+      endDate.setDate(endDate.getDate() + 1);
+      result.push({
+        title: `[${e.outlet}] ${e.title}`,
+        start: e.start,
+        end: endDate.toISOString().split('T')[0],
+        endDisplay: end,
+        description: e.desc,
+        outlet: e.outlet,
+        items: (e.items || []).map(([brand, product, price]) => ({ brand, product, price })),
+        thumbnail: e.thumbnail,
+        event_id: e.id
+      });
+    }
+    console.log(`📊 이벤트 피드: ${result.length}개 이벤트 (매핑없음: ${noMappingCount})`);
+    return result;
+  }
+
   function parseDate(str) {
     const clean = str.replace(/\([^)]*\)/g, '').trim();
     if (!clean.includes('.')) return null;
@@ -287,18 +394,47 @@
     return `${year}-${m}-${d}`;
   }
 
-  function loadUrlMapping() {
+  function fetchMappingManifest() {
+    return fetch('/url-mapping/manifest.json', { cache: 'no-cache' })
+      .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+      })
+      .then(manifest => {
+        if (manifest.version !== UrlMapping.VERSION || manifest.hash !== 'fnv1a32') {
+          throw new Error(`지원하지 않는 매니페스트: version=${manifest.version}, hash=${manifest.hash}`);
+        }
+        return manifest;
+      });
+  }
+
+  // 전체 매핑 (url-mapping.json). 성공하면 샤드 모드 해제
+  function loadFullUrlMapping() {
     return fetch('/url-mapping.json')
       .then(response => response.json())
       .then(mapping => {
-        urlMapping = mapping;
-        console.log(`📋 URL 매핑 로드됨: ${Object.keys(mapping).length}개`);
+        urlMapping = UrlMapping.fromDocument(mapping);
+        mappingManifest = null;
+        console.log(`📋 URL 매핑 로드됨: ${urlMapping.ids.length}개`);
       })
       .catch(error => {
         console.warn('URL 매핑 로드 실패:', error);
       });
   }
 
+  // 샤드 매니페스트만 받고 샤드는 클릭할 때 받음. 매니페스트가 없으면 전체 매핑
+  function loadUrlMapping() {
+    return fetchMappingManifest()
+      .then(manifest => {
+        mappingManifest = manifest;
+        console.log(`📋 URL 매핑 매니페스트 로드됨: ${manifest.ids}개, 샤드 ${Object.keys(manifest.shards).length}개`);
+      })
+      .catch(error => {
+        console.warn('URL 매핑 매니페스트 로드 실패, 전체 매핑을 사용합니다:', error);
+        return loadFullUrlMapping();
+      });
+  }
+
   function updateHighlightEvents() {
     const today = new Date();
     const currentDateStr = today.toISOString().split('T')[0]; // YYYY-MM-DD 형태
@@ -342,31 +478,15 @@
           li.style.borderRadius = '4px';
           li.style.border = '1px solid #e9ecef';
           
+          li.addEventListener('mouseenter', () => {
+            if (event.event_id) loadMappingShards(event.event_id);
+          });
           li.addEventListener('click', () => {
             const id = event.event_id;
             if (id) {
-              // UUID에서 shortId 추출
-              let shortId = id;
-              if (id.includes('-')) {
-                const parts = id.split('-');
-                shortId = parts[parts.length - 1];
-              }
-
-              let filename = urlMapping[id] || urlMapping[shortId];
-              if (!filename) {
-                // _02가 있으면 기본 ID로 시도
-                if (shortId.endsWith('_02')) {
-                  const baseId = shortId.slice(0, -3);
-                  filename = urlMapping[baseId];
-                }
-                // 기본 ID면 _02 변형으로 시도
-                else {
-                  filename = urlMapping[shortId + '_02'];
-                }
-              }
-
-              if (filename) {
-                const url = `/pages/${filename}`;
+              // 매핑이 없으면 기존 URL (리다이렉트 규칙으로 새 URL로 이동)
+              openEventPage(id, `/pages/event-${eventShortId(id)}.html`).then(found => {
+                if (!found) return;
                 // GA: 하이라이트 클릭
                 sendGA('highlight_click', {
                   event_id: id,
@@ -375,11 +495,7 @@
                   start: event.start || '',
                   end: event.endDisplay || event.end || ''
                 });
-                window.open(url, '_blank');
-              } else {
-                const url = `/pages/event-${shortId}.html`;
-                window.open(url, '_blank');
-              }
+              });
             }
           });
           
@@ -401,28 +517,10 @@
         const li = document.createElement('li');
         const id = event.event_id;
 
-        // UUID에서 shortId 추출
-        let shortId = id;
-        if (id && id.includes('-')) {
-          const parts = id.split('-');
-          shortId = parts[parts.length - 1];
-        }
+        let url = `/pages/event-${eventShortId(id)}.html`; // 기본 URL
 
-        let url = `/pages/event-${shortId}.html`; // 기본 URL
-
-        // URL 매핑이 있으면 사용 (변형 ID도 체크)
-        let filename = urlMapping[id] || urlMapping[shortId];
-        if (!filename) {
-          // _02가 있으면 기본 ID로 시도
-          if (shortId.endsWith('_02')) {
-            const baseId = shortId.slice(0, -3);
-            filename = urlMapping[baseId];
-          }
-          // 기본 ID면 _02 변형으로 시도
-          else {
-            filename = urlMapping[shortId + '_02'];
-          }
-        }
+        // URL 매핑이 있으면 사용 (변형 ID도 체크). 샤드 모드에서는 받아 둔 샤드에 있을 때만
+        const filename = id ? findMappedFilename(id) : undefined;
 
         if (filename) {
           url = `/pages/${filename}`;
@@ -463,14 +561,33 @@
         ).then(results => {
           rawEvents = results.flat();
           console.log(`📊 총 이벤트 수: ${rawEvents.length}개 (매핑된 이벤트만)`);
-          initCalendar(rawEvents);
-          buildBrandFilter();
-          updateHighlightEvents(); // 하이라이트 이벤트 업데이트 추가
+          showEvents();
         });
       });
     });
   }
 
+  function showEvents() {
+    initCalendar(rawEvents);
+    buildBrandFilter();
+    updateHighlightEvents(); // 하이라이트 이벤트 업데이트 추가
+  }
+
+  // 정적 피드 우선 로드 (API 호출/키 없이 캐시 가능한 파일 하나). 실패하거나 비어 있으면 reject
+  function loadEventsFeed() {
+    return fetch('/events.json')
+      .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        return response.json();
+      })
+      .then(feed => {
+        const events = parseEventsFeed(feed);
+        if (!events.length) throw new Error('empty feed');
+        rawEvents = events;
+        showEvents();
+      });
+  }
+
   // 테스트용 더미 데이터 함수
   function loadDummyData() {
     console.log('🧪 더미 데이터로 테스트 중...');
@@ -553,9 +670,13 @@
     }
   }
 
-  // URL 매핑 로드 후 데이터 로드
+  // URL 매핑 로드 후 데이터 로드 (정적 피드 → 실패 시 Google Sheets/더미 데이터)
   loadUrlMapping().then(() => {
-    checkApiAndLoad();
+    loadEventsFeed().catch(error => {
+      console.warn('이벤트 피드 로드 실패, 기존 방식으로 로드합니다:', error);
+      // 시트 데이터는 매핑으로 거르므로 전체 매핑이 필요
+      (mappingManifest ? loadFullUrlMapping() : Promise.resolve()).then(checkApiAndLoad);
+    });
     // GA 디버그 모드일 때 핑 전송
     if (debugMode) sendGA('debug_ping', { page: location.pathname });
   });
@@ -0,0 +1,69 @@
+// 이벤트 ID 해석 규칙 - apps/crawler/url_mapping.py가 생성 (직접 수정하지 마세요)
+// table: { ids: 정렬된 이벤트 ID, targets: ids 순서의 files 번호, files: 대상 }
+// 1. 정확히 일치  2. _02/_03/_04 접미사를 뗀 ID  3. 9자리 ID면 그 ID로 시작하는 첫 12자리 ID
+var UrlMapping = (function () {
+  var VERSION = 2
+  var VARIANT_RE = /^(.+)(?:_02|_03|_04)$/
+
+  function lowerBound(ids, key) {
+    var lo = 0, hi = ids.length
+    while (lo < hi) {
+      var mid = (lo + hi) >>> 1
+      if (ids[mid] < key) lo = mid + 1
+      else hi = mid
+    }
+    return lo
+  }
+
+  function exact(table, id) {
+    var i = lowerBound(table.ids, id)
+    return i < table.ids.length && table.ids[i] === id ? table.files[table.targets[i]] : null
+  }
+
+  function byShortId(table, shortId) {
+    for (var i = lowerBound(table.ids, shortId); i < table.ids.length && table.ids[i].startsWith(shortId); i++) {
+      var id = table.ids[i]
+      if (id.length === 12 && id.indexOf('_') < 0) return table.files[table.targets[i]]
+    }
+    return null
+  }
+
+  function lookup(table, id) {
+    if (!id) return null
+    var hit = exact(table, id)
+    if (hit) return hit
+    var m = VARIANT_RE.exec(id)
+    var base = m ? m[1] : id
+    if (m) {
+      hit = exact(table, base)
+      if (hit) return hit
+    }
+    return base.length === 9 ? byShortId(table, base) : null
+  }
+
+  // url-mapping.json 내용 → table (v1 {id: 파일명}도 허용)
+  function fromDocument(doc) {
+    if (doc && doc.version === VERSION) {
+      var events = doc.events || []
+      return {
+        ids: events.map(function (e) { return e[0] }),
+        targets: events.map(function (e) { return e[1] }),
+        files: doc.files || []
+      }
+    }
+    var ids = Object.keys(doc || {}).sort()
+    return { ids: ids, targets: ids.map(function (_, i) { return i }), files: ids.map(function (id) { return doc[id] }) }
+  }
+
+  // 샤드 접두어: 접미사를 뗀 ID의 앞 9자리 → FNV-1a 32비트 16진수 앞 prefixLen자리
+  function shardOf(id, prefixLen) {
+    var m = VARIANT_RE.exec(id)
+    var key = Array.from(m ? m[1] : id).slice(0, 9).join('')
+    var bytes = new TextEncoder().encode(key)
+    var h = 0x811c9dc5
+    for (var i = 0; i < bytes.length; i++) h = Math.imul(h ^ bytes[i], 0x01000193) >>> 0
+    return ('0000000' + h.toString(16)).slice(-8).slice(0, prefixLen)
+  }
+
+  return { VERSION: VERSION, lookup: lookup, fromDocument: fromDocument, shardOf: shardOf }
+})()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark related-events lookup in enhance_pages_internal_links on synthetic pages.
+
+- legacy: per page, list the directory, stat + read every same-branch file and regex
+  its <h1> (the original collect_related, O(N²) file reads)
+- index:  build_related_index once from manifest records, then collect_related per page
+
+The legacy scan is fully timed only up to --legacy-max pages; above that it is timed on
+--sample pages and extrapolated to N (marked with '~'). Both methods are checked to
+return the same top-5 for the sampled pages.
+
+Usage:
+  python3 apps/web/tools/bench_related.py --sizes 1000,10000,50000
+"""
+
+import os
+import re
+import time
+import random
+import shutil
+import argparse
+import tempfile
+
+from enhance_pages_internal_links import build_related_index, collect_related
+
+BRANCHES = ('songdo', 'gimpo', 'spaceone')
+
+
+def legacy_parse_title(html: str, fallback: str) -> str:
+    m = re.search(r'<h1[^>]*>(.*?)</h1>', html, flags=re.S)
+    if m:
+        inner = re.sub(r'<[^>]+>', '', m.group(1))
+        return inner.strip() or fallback
+    return fallback
+
+
+def legacy_collect_related(pages_dir: str, branch_en: str, current_file: str) -> list:
+    candidates = []
+    prefix = branch_en + '-'
+    for fn in os.listdir(pages_dir):
+        if not fn.endswith('.html') or not fn.startswith(prefix) or fn == current_file:
+            continue
+        path = os.path.join(pages_dir, fn)
+        mtime = os.path.getmtime(path)
+        with open(path, 'r', encoding='utf-8') as rf:
+            title = legacy_parse_title(rf.read(), fn[:-5])
+        candidates.append((mtime, fn[len(prefix):-5], title))
+    candidates.sort(key=lambda x: -x[0])
+    return candidates[:5]
+
+
+def make_pages(pages_dir: str, n: int, seed: int = 42) -> list:
+    """Write n synthetic pages (distinct mtimes) and return their manifest-style records."""
+    rnd = random.Random(seed)
+    base = time.time() - 86400 * 365
+    offsets = rnd.sample(range(n * 10), n)
+    records = []
+    for i in range(n):
+        branch = BRANCHES[i % len(BRANCHES)]
+        slug = f'event-{i:06d}'
+        fn = f'{branch}-{slug}.html'
+        title = f'[{branch}] 행사 {i}'
+        path = os.path.join(pages_dir, fn)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'<!DOCTYPE html>\n<html><head><title>{title}</title></head>\n'
+                    f'<body><h1>{title}</h1>\n<p>{"본문 " * 200}</p></body></html>\n')
+        mtime = base + offsets[i]
+        os.utime(path, (mtime, mtime))
+        records.append({'branch': branch, 'slug': slug, 'filename': fn,
+                        'title': title, 'mtime': os.path.getmtime(path)})
+    records.sort(key=lambda r: r['filename'])
+    return records
+
+
+def bench(n: int, legacy_max: int, sample: int) -> dict:
+    tmp = tempfile.mkdtemp(prefix='bench_related_')
+    try:
+        records = make_pages(tmp, n)
+
+        t0 = time.perf_counter()
+        index = build_related_index(records)
+        results = {r['filename']: collect_related(r['branch'], r['filename'], index) for r in records}
+        index_s = time.perf_counter() - t0
+
+        rnd = random.Random(n)
+        targets = records if n <= legacy_max else rnd.sample(records, min(sample, n))
+        t0 = time.perf_counter()
+        for r in targets:
+            legacy = legacy_collect_related(tmp, r['branch'], r['filename'])
+            assert legacy == results[r['filename']], r['filename']
+        legacy_s = (time.perf_counter() - t0) * n / len(targets)
+        return {'n': n, 'index_s': index_s, 'legacy_s': legacy_s, 'estimated': len(targets) < n}
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--sizes', default='1000,10000,50000')
+    ap.add_argument('--legacy-max', type=int, default=1000, help='Fully time the legacy scan up to this many pages')
+    ap.add_argument('--sample', type=int, default=20, help='Pages timed for the legacy scan above --legacy-max')
+    args = ap.parse_args()
+
+    print(f"{'pages':>8} {'legacy':>12} {'index':>10} {'speedup':>9}")
+    for n in [int(x) for x in args.sizes.split(',') if x.strip()]:
+        r = bench(n, args.legacy_max, args.sample)
+        mark = '~' if r['estimated'] else ' '
+        speedup = r['legacy_s'] / r['index_s'] if r['index_s'] else float('inf')
+        print(f"{r['n']:>8} {mark}{r['legacy_s']:>10.2f}s {r['index_s']:>9.3f}s {speedup:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the generated Cloudflare worker: the old object-literal table (one key per
+mapping entry, variants included) against the compact table build_worker() emits now
+(canonical IDs + rule-resolved variants + deduplicated target paths).
+
+Synthetic mappings are built with the crawler's own add_comprehensive_mapping, so every
+event gets its _02/_03/_04 and 9-character variants. --legacy of the events use the old
+9-character IDs and --drift of them are re-crawled under a new title, which leaves their
+variants pointing at the old page (as in the real url-mapping.json).
+
+Per case it reports script size (raw/gzip), compact table build time, and Python lookup
+cost (dict vs compact_lookup), and asserts every mapping key resolves to the same page.
+With node on PATH it also measures worker cold start (compile + first lookup) and
+per-lookup cost of both scripts on a --sample of keys (the old getNewUrl() rebuilds its
+whole table on every call), and checks the compact JS getNewUrl() on every key.
+
+Usage:
+  python3 apps/web/tools/bench_worker_lookup.py
+  python3 apps/web/tools/bench_worker_lookup.py --events 10000,100000 --real --no-node
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import random
+import shutil
+import hashlib
+import argparse
+import tempfile
+import subprocess
+
+from build_redirects import (build_worker, compact_lookup, compact_worker_table, load_mapping,
+                             redirect_entries, EVENT_PATH_PREFIX)
+
+TOOLS = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.abspath(os.path.join(TOOLS, '..', '..', '..'))
+sys.path.insert(0, os.path.join(REPO, 'apps', 'crawler'))
+
+import crawler_organized as co  # type: ignore
+
+BRANCHES = ('songdo', 'gimpo', 'spaceone')
+
+NODE_BENCH = r"""
+const vm = require('vm'), fs = require('fs')
+const [script, keysPath, expectedPath, runs, sample] = process.argv.slice(1)
+const source = fs.readFileSync(script, 'utf8')
+const keys = JSON.parse(fs.readFileSync(keysPath, 'utf8'))
+const cold = []
+let ctx
+for (let r = 0; r < Number(runs); r++) {
+  const t0 = process.hrtime.bigint()
+  ctx = vm.createContext({ addEventListener() {}, process })
+  // 실행마다 소스를 달리해 V8 컴파일 캐시를 피함
+  new vm.Script(source + `\n// run ${r}`).runInContext(ctx)
+  ctx.getNewUrl(keys[0])
+  cold.push(Number(process.hrtime.bigint() - t0) / 1e6)
+}
+let mismatches = 0
+if (expectedPath) {
+  const expected = JSON.parse(fs.readFileSync(expectedPath, 'utf8'))
+  keys.forEach((k, i) => { if (ctx.getNewUrl(k) !== expected[i]) mismatches++ })
+}
+// 시간 측정은 표본 키로, 루프는 워커 컨텍스트 안에서 (컨텍스트 경계 호출 비용 제외)
+const step = Math.max(1, Math.floor(keys.length / Number(sample)))
+ctx.timed = keys.filter((_, i) => i % step === 0)
+const [lookupNs, sink] = vm.runInContext(`(() => {
+  let sink = 0
+  for (const k of timed) sink += (getNewUrl(k) || '').length
+  const t0 = process.hrtime.bigint()
+  for (let r = 0; r < 3; r++) for (const k of timed) sink += (getNewUrl(k) || '').length
+  return [Number(process.hrtime.bigint() - t0) / (3 * timed.length), sink]
+})()`, ctx)
+cold.sort((a, b) => a - b)
+console.log(JSON.stringify({ cold_ms: cold[cold.length >> 1], lookup_ns: lookupNs, mismatches, sink }))
+"""
+
+
+def legacy_worker(entries):
+    """The previous build_worker() output: one object-literal key per mapping entry."""
+    lines = ["function getNewUrl(oldPath) {", "  const urlMappings = {"]
+    lines += [f"    '{old}': '{new}'," for old, new in entries]
+    lines += ["  }", "  return urlMappings[oldPath] || null", "}", ""]
+    return "addEventListener('fetch', event => {})\n\n" + "\n".join(lines)
+
+
+def synth_mapping(events, legacy, drift, seed):
+    rnd = random.Random(seed)
+    co.url_mapping = {}
+    ids = []
+    for i in range(events):
+        event_id = hashlib.sha1(f"{seed}:{i}".encode()).hexdigest()[:9 if rnd.random() < legacy else 12]
+        branch = BRANCHES[i % len(BRANCHES)]
+        co.add_comprehensive_mapping(event_id, f"{branch}-행사-{i}-{rnd.randrange(10 ** 6)}.html")
+        ids.append((event_id, branch, i))
+    for event_id, branch, i in ids:
+        if rnd.random() < drift:
+            # 재크롤링으로 제목이 바뀜: 기본 ID만 새 파일, 변형은 예전 파일 유지
+            co.add_comprehensive_mapping(event_id, f"{branch}-행사-{i}-수정.html")
+    return co.url_mapping
+
+
+def _gz(data):
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def _ns_per_lookup(fn, keys, repeat=3):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for k in keys:
+            fn(k)
+        elapsed = (time.perf_counter() - t0) / len(keys) * 1e9
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _node(node, script, keys_path, expected_path, runs, sample):
+    out = subprocess.run([node, '-e', NODE_BENCH, script, keys_path, expected_path or '', str(runs), str(sample)],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def bench_case(name, mapping, node, runs, sample):
+    entries = redirect_entries(mapping)
+    table = dict(entries)
+    keys = [old for old, _ in entries]
+
+    t0 = time.perf_counter()
+    compact_table = compact_worker_table(entries)
+    build_s = time.perf_counter() - t0
+    legacy_js = legacy_worker(entries).encode('utf-8')
+    compact_js = build_worker(entries).encode('utf-8')
+
+    prefix_len = len(EVENT_PATH_PREFIX)
+    compact = lambda path: compact_lookup(compact_table, path[prefix_len:-5])
+    wrong = sum(1 for old, new in entries if compact(old) != new)
+    assert wrong == 0, f"{name}: {wrong} key(s) resolve differently"
+
+    print(f"== {name}: {len(mapping):,} mapping keys → {len(compact_table['ids']):,} stored IDs, "
+          f"{len(compact_table['files']):,} target paths "
+          f"(table build {build_s * 1000:.0f} ms)")
+    print(f"   script size   legacy {len(legacy_js):>12,} B (gzip {_gz(legacy_js):>10,})   "
+          f"compact {len(compact_js):>12,} B (gzip {_gz(compact_js):>10,})   "
+          f"{len(legacy_js) / len(compact_js):.1f}x smaller")
+    print(f"   python lookup legacy {_ns_per_lookup(table.get, keys):>8.0f} ns   "
+          f"compact {_ns_per_lookup(compact, keys):>8.0f} ns")
+
+    if node:
+        tmp = tempfile.mkdtemp(prefix='bench_worker_')
+        try:
+            paths = {}
+            for label, data in (('legacy', legacy_js), ('compact', compact_js)):
+                paths[label] = os.path.join(tmp, f'{label}.js')
+                with open(paths[label], 'wb') as f:
+                    f.write(data)
+            keys_path = os.path.join(tmp, 'keys.json')
+            expected_path = os.path.join(tmp, 'expected.json')
+            with open(keys_path, 'w', encoding='utf-8') as f:
+                json.dump(keys, f, ensure_ascii=False)
+            with open(expected_path, 'w', encoding='utf-8') as f:
+                json.dump([table[k] for k in keys], f, ensure_ascii=False)
+            # 기존 스크립트는 getNewUrl 호출마다 표 전체를 다시 만들므로 일치 검사는 compact만
+            res = {label: _node(node, path, keys_path, expected_path if label == 'compact' else None, runs, sample)
+                   for label, path in paths.items()}
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        assert res['compact']['mismatches'] == 0, f"{name}: JS getNewUrl disagrees on {res['compact']['mismatches']} key(s)"
+        print(f"   node cold     legacy {res['legacy']['cold_ms']:>8.1f} ms   compact {res['compact']['cold_ms']:>8.1f} ms")
+        print(f"   node lookup   legacy {res['legacy']['lookup_ns']:>8.0f} ns   compact {res['compact']['lookup_ns']:>8.0f} ns")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--events', default='10000,100000', help='Comma-separated synthetic event counts')
+    ap.add_argument('--legacy', type=float, default=0.1, help='Share of events with 9-character IDs')
+    ap.add_argument('--drift', type=float, default=0.15, help='Share of events re-crawled under a new title')
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--real', action='store_true', help='Also benchmark apps/web/public/url-mapping.json')
+    ap.add_argument('--runs', type=int, default=5, help='Node cold-start runs (median reported)')
+    ap.add_argument('--sample', type=int, default=1000, help='Keys timed per node lookup measurement')
+    ap.add_argument('--no-node', action='store_true', help='Skip the node measurements')
+    args = ap.parse_args()
+
+    node = None if args.no_node else shutil.which('node')
+    if not node and not args.no_node:
+        print("ℹ️ node not found: JS cold start/lookup skipped")
+
+    if args.real:
+        mapping = load_mapping(os.path.join(TOOLS, '..', 'public', 'url-mapping.json'))
+        bench_case('url-mapping.json', mapping, node, args.runs, args.sample)
+    for n in (int(x) for x in args.events.split(',') if x.strip()):
+        bench_case(f'{n:,} events', synth_mapping(n, args.legacy, args.drift, args.seed), node, args.runs, args.sample)
+    print("\n✅ every mapping key resolves to the same page in both tables")
+
+
+if __name__ == '__main__':
+    main()
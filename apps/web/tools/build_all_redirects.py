@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Build every redirect artifact from url-mapping.json in one pass.
+
+The mapping is read and turned into (old path, pretty path) entries once; each target
+is rendered from those entries:
+
+  redirects  apps/web/public/_redirects            (Cloudflare Pages)
+  htaccess   apps/web/tools/generated_redirects.htaccess
+  worker     apps/web/tools/cloudflare_worker_complete.js
+  json       --json PATH: {"/pages/event-<id>.html": "/branch/slug"} lookup (optional)
+
+_redirects keeps its hand-written rules (hotfixes, rewrites, manual 301s); only the
+block between the "BEGIN/END generated" markers is replaced. On first run the existing
+generated /pages/event-*.html lines are moved into that block.
+
+A stamp file (apps/web/.cache/build_all_redirects.json, untracked) records the input
+hash of each target and the hash of what was written. A target whose inputs and output
+file are unchanged is skipped without rendering; a rendered target identical to the
+file on disk is not rewritten. Time and output size are reported per target.
+
+Usage:
+  python3 apps/web/tools/build_all_redirects.py
+  python3 apps/web/tools/build_all_redirects.py --only redirects,worker --json /tmp/redirects.json
+  python3 apps/web/tools/build_all_redirects.py --force
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import argparse
+
+from build_redirects import build_htaccess_redirects, build_worker, redirect_entries
+import url_mapping  # apps/crawler (경로는 build_redirects가 추가)
+
+TOOLS = os.path.dirname(os.path.abspath(__file__))
+WEB = os.path.dirname(TOOLS)
+PUBLIC = os.path.join(WEB, 'public')
+MAPPING = os.path.join(PUBLIC, 'url-mapping.json')
+STAMP = os.path.join(WEB, '.cache', 'build_all_redirects.json')
+
+# 렌더링 방식이 바뀌면 올려서 기존 스탬프를 무효화
+GENERATOR_VERSION = 4
+
+BEGIN_MARK = '# BEGIN generated: /pages/event-<id>.html -> pretty URL (build_all_redirects.py)'
+END_MARK = '# END generated'
+GENERATED_LINE_RE = re.compile(r'^/pages/event-\S+\.html\s+\S+\s+301$')
+DEFAULT_PAGES_HEAD = [
+    '/songdo/*    /pages/songdo-:splat.html   200',
+    '/gimpo/*     /pages/gimpo-:splat.html    200',
+    '/spaceone/*  /pages/spaceone-:splat.html 200',
+]
+# Cloudflare Pages _redirects 한도 (초과분은 적용되지 않음)
+PAGES_STATIC_LIMIT = 2000
+PAGES_DYNAMIC_LIMIT = 100
+
+
+def _sha(*parts) -> str:
+    h = hashlib.sha256()
+    for p in parts:
+        h.update(p if isinstance(p, bytes) else str(p).encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def pages_redirects_head(existing: str | None) -> str:
+    """Hand-written part of _redirects: everything outside the generated block."""
+    if existing is None:
+        return '\n'.join(DEFAULT_PAGES_HEAD)
+    lines = existing.splitlines()
+    if BEGIN_MARK in lines:
+        start = lines.index(BEGIN_MARK)
+        end = lines.index(END_MARK, start) if END_MARK in lines[start:] else len(lines) - 1
+        lines = lines[:start] + lines[end + 1:]
+    else:
+        lines = [l for l in lines if not GENERATED_LINE_RE.match(l.strip())]
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return '\n'.join(lines)
+
+
+def build_pages_redirects(entries, head: str) -> str:
+    lines = [head, '', BEGIN_MARK] if head else [BEGIN_MARK]
+    lines += [f'{old}   {new}   301' for old, new in entries]
+    lines.append(END_MARK)
+    return '\n'.join(lines) + '\n'
+
+
+def build_json_lookup(entries) -> str:
+    return json.dumps(dict(entries), ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def count_pages_rules(text: str):
+    static = dynamic = 0
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < 2 or fields[0].startswith('#'):
+            continue
+        if '*' in fields[0] or ':' in fields[0]:
+            dynamic += 1
+        else:
+            static += 1
+    return static, dynamic
+
+
+def make_targets(out_dir: str, redirects_path: str, json_path: str | None):
+    """name -> (output path, extra input text, render(entries, extra) -> str)"""
+    existing = _read(redirects_path)
+    head = pages_redirects_head(existing.decode('utf-8') if existing is not None else None)
+    targets = {
+        'redirects': (redirects_path, head, build_pages_redirects),
+        'htaccess': (os.path.join(out_dir, 'generated_redirects.htaccess'), '',
+                     lambda entries, _: build_htaccess_redirects(entries)),
+        'worker': (os.path.join(out_dir, 'cloudflare_worker_complete.js'), '',
+                   lambda entries, _: build_worker(entries)),
+    }
+    if json_path:
+        targets['json'] = (json_path, '', lambda entries, _: build_json_lookup(entries))
+    return targets
+
+
+def run(mapping_path=MAPPING, out_dir=TOOLS, redirects_path=None, json_path=None,
+        only=None, force=False, stamp_path=STAMP):
+    """Build targets; returns [(name, status, seconds, bytes, path)] with status
+    'written' | 'same' (rendered, identical to disk) | 'skipped' (inputs unchanged)."""
+    redirects_path = redirects_path or os.path.join(PUBLIC, '_redirects')
+    t0 = time.perf_counter()
+    mapping_bytes = _read(mapping_path)
+    if mapping_bytes is None:
+        raise FileNotFoundError(mapping_path)
+    mapping_hash = _sha(mapping_bytes)
+    entries = None
+    load_s = time.perf_counter() - t0
+
+    try:
+        with open(stamp_path, 'r', encoding='utf-8') as f:
+            stamps = json.load(f)
+    except (OSError, ValueError):
+        stamps = {}
+
+    report = []
+    for name, (path, extra, render) in make_targets(out_dir, redirects_path, json_path).items():
+        if only and name not in only:
+            continue
+        started = time.perf_counter()
+        inputs = _sha(GENERATOR_VERSION, name, mapping_hash, extra)
+        current = _read(path)
+        stamp = stamps.get(name, {})
+        if (not force and current is not None and stamp.get('path') == os.path.abspath(path)
+                and stamp.get('inputs') == inputs and stamp.get('output') == _sha(current)):
+            report.append((name, 'skipped', time.perf_counter() - started, len(current), path))
+            continue
+        if entries is None:
+            # 매핑 파싱/정렬은 렌더링이 필요한 첫 대상에서 한 번만
+            t1 = time.perf_counter()
+            # v1/v2 모두 읽고, 레거시 변형 키까지 펼쳐서 정적 규칙 생성
+            entries = redirect_entries(url_mapping.expand(url_mapping.table_from_document(json.loads(mapping_bytes))))
+            load_s += time.perf_counter() - t1
+        data = render(entries, extra).encode('utf-8')
+        status = 'same'
+        if data != current:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            tmp = path + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+            status = 'written'
+        stamps[name] = {'path': os.path.abspath(path), 'inputs': inputs, 'output': _sha(data)}
+        report.append((name, status, time.perf_counter() - started, len(data), path))
+
+    os.makedirs(os.path.dirname(os.path.abspath(stamp_path)), exist_ok=True)
+    with open(stamp_path, 'w', encoding='utf-8') as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+    return report, load_s, len(entries) if entries is not None else None
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--mapping', default=MAPPING, help='Path to url-mapping.json')
+    ap.add_argument('--out-dir', default=TOOLS, help='Output directory for the htaccess/worker files')
+    ap.add_argument('--redirects', default=os.path.join(PUBLIC, '_redirects'), help='Cloudflare Pages _redirects path')
+    ap.add_argument('--json', default=None, help='Also write a JSON lookup table to this path')
+    ap.add_argument('--only', default='', help='Comma-separated targets (redirects,htaccess,worker,json)')
+    ap.add_argument('--force', action='store_true', help='Render every target even if inputs are unchanged')
+    args = ap.parse_args()
+
+    only = {n.strip() for n in args.only.split(',') if n.strip()}
+    unknown = only - {'redirects', 'htaccess', 'worker', 'json'}
+    if unknown:
+        ap.error(f"unknown target(s): {', '.join(sorted(unknown))}")
+
+    started = time.time()
+    report, load_s, entry_count = run(args.mapping, args.out_dir, args.redirects, args.json,
+                                      only=only, force=args.force)
+    print(f"📋 mapping: {args.mapping}" + (f" ({entry_count} redirects, {load_s * 1000:.0f} ms)" if entry_count is not None else ""))
+    for name, status, seconds, size, path in report:
+        mark = {'written': '✅', 'same': '🟰', 'skipped': '⏭️'}[status]
+        print(f"  {mark} {name:<9} {status:<7} {seconds * 1000:>8.1f} ms {size:>10,} B  {path}")
+        if name == 'redirects':
+            with open(path, 'r', encoding='utf-8') as f:
+                static, dynamic = count_pages_rules(f.read())
+            if static > PAGES_STATIC_LIMIT or dynamic > PAGES_DYNAMIC_LIMIT:
+                print(f"  ⚠️ _redirects: {static} static / {dynamic} dynamic rules exceeds the Cloudflare Pages "
+                      f"limit ({PAGES_STATIC_LIMIT} / {PAGES_DYNAMIC_LIMIT}); the rest must come from the worker")
+    print(f"⏱️ total {time.time() - started:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,56 +11,19 @@ Rules included:
 - 200 rewrites for /{branch}/{slug} -> /pages/{branch}-{slug}.html
 - 301 normalization for /pages/{branch}-{slug}.html -> /{branch}/{slug}
 - 301 mapping for /pages/event-<id>.html -> /{branch}/{slug}
-"""
-
-import os
-import json
-from typing import Dict, Tuple
-
-BASE = os.path.dirname(os.path.abspath(__file__))
-PUBLIC_DIR = os.path.abspath(os.path.join(BASE, '..', 'public'))
-MAPPING_PATH = os.path.join(PUBLIC_DIR, 'url-mapping.json')
-OUTPUT = os.path.join(PUBLIC_DIR, '_redirects')
 
+The event mapping block is generated by build_all_redirects.py (the `redirects`
+target); hand-written rules outside that block are kept. Use build_all_redirects.py
+to build _redirects together with the htaccess/worker artifacts.
+"""
 
-def filename_to_pretty(filename: str) -> Tuple[str, str]:
-    name = filename[:-5] if filename.endswith('.html') else filename
-    if name.startswith('songdo-'):
-        return 'songdo', name.replace('songdo-', 'songdo/')
-    if name.startswith('gimpo-'):
-        return 'gimpo', name.replace('gimpo-', 'gimpo/')
-    if name.startswith('spaceone-'):
-        return 'spaceone', name.replace('spaceone-', 'spaceone/')
-    return '', ''
+from build_all_redirects import run
 
 
 def main():
-    # Load mapping
-    mapping: Dict[str, str] = json.load(open(MAPPING_PATH, encoding='utf-8'))
-
-    lines = []
-
-    # 200 rewrites (pretty URL -> physical file)
-    lines.append('/songdo/*    /pages/songdo-:splat.html   200')
-    lines.append('/gimpo/*     /pages/gimpo-:splat.html    200')
-    lines.append('/spaceone/*  /pages/spaceone-:splat.html 200')
-
-    # NOTE: Avoid adding physical -> pretty 301 rules here to prevent
-    # potential rewrite loops on Pages when combined with 200 rewrites.
-
-    # 301 event mapping (old event ids -> pretty)
-    for event_id, filename in sorted(mapping.items(), key=lambda x: x[0]):
-        branch, pretty = filename_to_pretty(filename)
-        if not branch:
-            continue
-        old = f'/pages/event-{event_id}.html'
-        new = f'/{pretty}'
-        lines.append(f'{old}   {new}   301')
-
-    os.makedirs(os.path.dirname(OUTPUT), exist_ok=True)
-    with open(OUTPUT, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines) + '\n')
-    print(f'✅ Wrote {OUTPUT} with {len(lines)} rules')
+    report, _, _ = run(only={'redirects'})
+    for name, status, seconds, size, path in report:
+        print(f'✅ {path}: {status} ({size:,} B, {seconds * 1000:.0f} ms)')
 
 
 if __name__ == '__main__':
@@ -6,7 +6,7 @@ Generate redirect artifacts from url-mapping.json (single source of truth).
 
 Outputs (in apps/web/tools/):
 - generated_redirects.htaccess  (RewriteRule lines for old -> pretty URLs)
-- cloudflare_worker_complete.js (Workers mapping table for redirects)
+- cloudflare_worker_complete.js (Workers redirect lookup: canonical IDs + deduplicated target table)
 
 Usage:
   python3 apps/web/tools/build_redirects.py
@@ -14,9 +14,14 @@ Usage:
 """
 
 import os
+import sys
 import json
 import argparse
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "crawler"))
+
+import url_mapping  # noqa: E402  (apps/crawler/url_mapping.py: mapping format + variant rules)
 
 
 def parse_args():
@@ -55,29 +60,59 @@ def filename_to_pretty_path(filename: str) -> Tuple[str, str]:
 
 
 def load_mapping(mapping_path: str) -> Dict[str, str]:
-    with open(mapping_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """url-mapping.json (v1 or v2) -> {event_id: filename} with every legacy variant key."""
+    return url_mapping.load_mapping(mapping_path)
 
 
-def build_htaccess_redirects(mapping: Dict[str, str]) -> str:
-    lines = [
-        "# 2. 기존 pages/event-*.html 파일들을 새로운 구조로 리다이렉트 (301 리다이렉트)",
-    ]
+def redirect_entries(mapping: Dict[str, str]) -> List[Tuple[str, str]]:
+    """[('/pages/event-<id>.html', '/branch/slug'), ...] sorted by event id (pretty-URL files only)."""
+    entries = []
     for event_id, filename in sorted(mapping.items(), key=lambda x: x[0]):
         branch, pretty = filename_to_pretty_path(filename)
         if not branch:
             continue
-        old = f"pages/event-{event_id}.html"
-        new = f"/{pretty}"
-        lines.append(f"RewriteRule ^{old}$ {new} [R=301,L]")
+        entries.append((f"/pages/event-{event_id}.html", f"/{pretty}"))
+    return entries
+
+
+def build_htaccess_redirects(entries: List[Tuple[str, str]]) -> str:
+    lines = [
+        "# 2. 기존 pages/event-*.html 파일들을 새로운 구조로 리다이렉트 (301 리다이렉트)",
+    ]
+    for old, new in entries:
+        lines.append(f"RewriteRule ^{old[1:]}$ {new} [R=301,L]")
     lines.append("")
     return "\n".join(lines)
 
 
-def build_worker(mapping: Dict[str, str]) -> str:
+EVENT_PATH_PREFIX = "/pages/event-"
+
+
+def compact_worker_table(entries: List[Tuple[str, str]]) -> Dict[str, list]:
+    """Entries -> url_mapping table ({ids, targets, files}) keyed by event id, pretty paths as targets.
+
+    Only the IDs the variant rules cannot reproduce are kept: canonical IDs, plus variants
+    that still point at an older page than their base ID.
+    """
+    by_id = {old[len(EVENT_PATH_PREFIX):-len(".html")]: new for old, new in entries}
+    return url_mapping.make_table(url_mapping.compact(by_id))
+
+
+def compact_lookup(table: Dict[str, list], event_id: str) -> Optional[str]:
+    """Python twin of the worker's getNewUrl() (minus the path prefix/suffix)."""
+    return url_mapping.lookup(table, event_id)
+
+
+def _js_list(values) -> str:
+    return json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_worker(entries: List[Tuple[str, str]]) -> str:
+    table = compact_worker_table(entries)
     body = [
         "// 클라우드플레어 Workers Script",
-        "// URL 리다이렉트 처리 - 자동 생성됨",
+        "// URL 리다이렉트 처리 - 자동 생성됨 (build_redirects.py)",
+        f"// 매핑 {len(entries)}개 → ID {len(table['ids'])}개, 대상 경로 {len(table['files'])}개",
         "",
         "addEventListener('fetch', event => {",
         "  event.respondWith(handleRequest(event.request))",
@@ -92,7 +127,7 @@ def build_worker(mapping: Dict[str, str]) -> str:
         "    const newUrl = getNewUrl(pathname)",
         "    if (newUrl) {",
         "      // 301 영구 리다이렉트",
-        "      return Response.redirect(newUrl, 301)",
+        "      return Response.redirect(new URL(newUrl, url).toString(), 301)",
         "    }",
         "  }",
         "  ",
@@ -100,21 +135,23 @@ def build_worker(mapping: Dict[str, str]) -> str:
         "  return fetch(request)",
         "}",
         "",
-        "function getNewUrl(oldPath) {",
-        "  // URL 매핑 테이블",
-        "  const urlMappings = {",
+        "// 대상 경로 (중복 제거)",
+        "const FILES = [",
     ]
-    for event_id, filename in sorted(mapping.items(), key=lambda x: x[0]):
-        branch, pretty = filename_to_pretty_path(filename)
-        if not branch:
-            continue
-        old = f"/pages/event-{event_id}.html"
-        new = f"/{pretty}"
-        body.append(f"    '{old}': '{new}',")
+    body += [f"  {json.dumps(f, ensure_ascii=False)}," for f in table["files"]]
     body += [
-        "  }",
-        "  return urlMappings[oldPath] || null",
+        "]",
+        "// 정렬된 이벤트 ID와 FILES 번호. _02/_03/_04, 9자리 축약형 변형은 규칙으로 해석하고",
+        "// 기본 ID와 다른 페이지를 가리키는 변형만 따로 저장",
+        f"const IDS = {_js_list(table['ids'])}",
+        f"const TARGETS = {_js_list(table['targets'])}",
+        "const TABLE = { ids: IDS, targets: TARGETS, files: FILES }",
+        "",
+        url_mapping.js_resolver(),
+        "function getNewUrl(oldPath) {",
+        "  return UrlMapping.lookup(TABLE, oldPath.slice('/pages/event-'.length, -'.html'.length))",
         "}",
+        "",
     ]
     return "\n".join(body)
 
@@ -122,15 +159,16 @@ def build_worker(mapping: Dict[str, str]) -> str:
 def main():
     args = parse_args()
     mapping = load_mapping(args.mapping)
+    entries = redirect_entries(mapping)
 
     # Generate htaccess redirect rules
-    htaccess_rules = build_htaccess_redirects(mapping)
+    htaccess_rules = build_htaccess_redirects(entries)
     ht_out = os.path.join(args.out_dir, "generated_redirects.htaccess")
     with open(ht_out, "w", encoding="utf-8") as f:
         f.write(htaccess_rules)
 
     # Generate Cloudflare worker
-    worker_js = build_worker(mapping)
+    worker_js = build_worker(entries)
     wk_out = os.path.join(args.out_dir, "cloudflare_worker_complete.js")
     with open(wk_out, "w", encoding="utf-8") as f:
         f.write(worker_js)
@@ -4,7 +4,7 @@
 """
 Basic SEO sanity checks for apps/web/public:
 - sitemap.xml exists and contains site root and privacy.html
-- url-mapping.json loads and has entries
+- url-mapping.json (v1 or v2) loads and has entries
 - pages directory has at least N files
 """
 
@@ -30,6 +30,11 @@ def main():
     assert os.path.exists(mapping), 'url-mapping.json missing'
     data = json.load(open(mapping, encoding='utf-8'))
     assert isinstance(data, dict) and len(data) > 0, 'url-mapping.json empty'
+    # v2: {"version": 2, "files": [...], "events": [[id, file index], ...]}
+    if 'version' in data:
+        assert data['version'] == 2, f"unknown url-mapping.json version: {data['version']}"
+        data = dict(data.get('events') or [])
+        assert len(data) > 0, 'url-mapping.json has no events'
 
     # pages
     count = 0
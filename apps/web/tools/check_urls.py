@@ -2,7 +2,13 @@
 # -*- coding: utf-8 -*-
 
 """
-Simple URL checker for status/redirect chains.
+Concurrent URL checker for status/redirect chains.
+
+URLs are checked on a thread pool (--jobs) with at most --per-host requests in flight
+per host, reusing one keep-alive session per host. HEAD is tried first and falls back
+to GET when the server rejects it (405/501) or the HEAD request fails. With -F every
+redirect hop is recorded (status + URL). Results print in input order; --report
+writes them with a latency summary (p50/p90/p95/p99) as JSON or CSV.
 
 Usage examples:
   # From a file
@@ -12,15 +18,38 @@ Usage examples:
   python3 apps/web/tools/list_recent_urls.py --days 3 --limit 50 --encode \
     | python3 apps/web/tools/check_urls.py -F
 
+  # Every pretty URL + every legacy /pages/event-<id>.html, against the local stand-in
+  python3 apps/web/tools/serve_local.py --port 8000 &
+  python3 apps/web/tools/check_urls.py --all --base http://127.0.0.1:8000 -F --report report.json
+
 Options:
   -F/--follow     Follow redirects (report final status)
   -t/--timeout    Timeout seconds per request (default 10)
-  -H/--head       Use HEAD (default); add --no-head to force GET
+  --no-head       Use GET only (default: HEAD, falling back to GET)
+  -j/--jobs       Concurrent requests (default 16)
+  --per-host      Concurrent requests per host (default 8)
+  --report        Write results to .json or .csv
+  --all           Check the site's own URLs (manifest + url-mapping.json) instead of input
+  --base          Base URL for --all, or to re-host input URLs (e.g. a local stand-in)
+  -q/--quiet      Print only failures and the summary
 """
 
+import os
+import csv
 import sys
+import json
+import time
 import argparse
+import threading
+from urllib.parse import quote, urlsplit, urlunsplit
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_SITE_BASE = os.environ.get('SITE_BASE_URL', 'https://discounts.deluxo.co.kr')
+HEAD_FALLBACK_STATUSES = (405, 501)
+
 
 def read_urls(path: str | None):
     if path:
@@ -35,19 +64,155 @@ def read_urls(path: str | None):
             if u:
                 yield u
 
-def check(url: str, follow: bool, timeout: float, method: str):
-    try:
-        s = requests.Session()
-        s.max_redirects = 10
-        allow = follow
-        if method == 'HEAD':
-            resp = s.head(url, allow_redirects=allow, timeout=timeout)
-        else:
-            resp = s.get(url, allow_redirects=allow, timeout=timeout)
-        chain = [h.url for h in resp.history] + [resp.url]
-        return resp.status_code, chain
-    except Exception as e:
-        return None, [f"ERROR: {e}"]
+
+def site_urls(base: str):
+    """Pretty URLs of every detail page (manifest) + legacy /pages/event-<id>.html paths."""
+    from page_manifest import PAGES, PUBLIC, load_pages
+    from build_redirects import load_mapping
+    base = base.rstrip('/')
+    for rec in load_pages(PAGES):
+        yield f"{base}/{quote(rec['branch'])}/{quote(rec['slug'])}"
+    mapping = load_mapping(os.path.join(PUBLIC, 'url-mapping.json'))
+    for event_id in sorted(mapping):
+        yield f"{base}/pages/event-{quote(event_id)}.html"
+
+
+def rebase(url: str, base: str) -> str:
+    """Swap scheme/host of url for those of base (path and query kept)."""
+    b, u = urlsplit(base), urlsplit(url)
+    return urlunsplit((b.scheme, b.netloc, u.path, u.query, u.fragment))
+
+
+class Checker:
+    """Per-host sessions and concurrency limits shared by the worker threads."""
+
+    def __init__(self, follow: bool, timeout: float, use_head: bool, per_host: int, pool_size: int):
+        self.follow = follow
+        self.timeout = timeout
+        self.use_head = use_head
+        self.per_host = per_host
+        self.pool_size = pool_size
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._slots = {}
+
+    def _host(self, netloc: str):
+        with self._lock:
+            if netloc not in self._sessions:
+                s = requests.Session()
+                s.max_redirects = 10
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                s.mount('http://', adapter)
+                s.mount('https://', adapter)
+                self._sessions[netloc] = s
+                self._slots[netloc] = threading.BoundedSemaphore(self.per_host)
+            return self._sessions[netloc], self._slots[netloc]
+
+    def _request(self, session, method: str, url: str):
+        # stream=True: GET 폴백에서도 본문은 받지 않음
+        resp = session.request(method, url, allow_redirects=self.follow, timeout=self.timeout, stream=True)
+        resp.close()
+        return resp
+
+    def check(self, url: str) -> dict:
+        session, slot = self._host(urlsplit(url).netloc)
+        result = {'url': url, 'status': None, 'method': None, 'final_url': url,
+                  'chain': [], 'elapsed_ms': 0.0, 'error': '', 'head_fallback': False}
+        with slot:
+            # 지연 시간은 호스트 슬롯을 얻은 뒤부터 (대기 시간 제외)
+            started = time.perf_counter()
+            resp = None
+            try:
+                if self.use_head:
+                    try:
+                        resp = self._request(session, 'HEAD', url)
+                        result['method'] = 'HEAD'
+                    except requests.RequestException:
+                        resp = None
+                    if resp is None or resp.status_code in HEAD_FALLBACK_STATUSES:
+                        resp = None
+                        result['head_fallback'] = True
+                if resp is None:
+                    resp = self._request(session, 'GET', url)
+                    result['method'] = 'GET'
+                hops = list(resp.history) + [resp]
+                result['status'] = resp.status_code
+                result['chain'] = [{'status': h.status_code, 'url': h.url} for h in hops]
+                result['final_url'] = resp.url
+                if not self.follow and resp.is_redirect:
+                    result['final_url'] = resp.headers.get('Location', resp.url)
+            except Exception as e:
+                result['error'] = f"{type(e).__name__}: {e}"
+            result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return round(sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo), 2)
+
+
+def is_bad(r: dict) -> bool:
+    return r['status'] is None or not (200 <= r['status'] < 400)
+
+
+def summarize(results, wall_s: float) -> dict:
+    latencies = sorted(r['elapsed_ms'] for r in results)
+    return {
+        'count': len(results),
+        'ok': sum(1 for r in results if r['status'] is not None and 200 <= r['status'] < 300),
+        'redirected': sum(1 for r in results if len(r['chain']) > 1 or r['final_url'] != r['url']),
+        'bad': sum(1 for r in results if r['status'] is not None and is_bad(r)),
+        'errors': sum(1 for r in results if r['status'] is None),
+        'head_fallbacks': sum(1 for r in results if r['head_fallback']),
+        'wall_s': round(wall_s, 3),
+        'urls_per_s': round(len(results) / wall_s, 1) if wall_s else 0.0,
+        'latency_ms': {
+            'p50': percentile(latencies, 50), 'p90': percentile(latencies, 90),
+            'p95': percentile(latencies, 95), 'p99': percentile(latencies, 99),
+            'max': latencies[-1] if latencies else 0.0,
+            'mean': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        },
+    }
+
+
+def write_report(path: str, results, summary: dict):
+    if path.endswith('.csv'):
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            w = csv.writer(f)
+            w.writerow(['url', 'status', 'method', 'hops', 'final_url', 'elapsed_ms', 'error', 'chain'])
+            for r in results:
+                chain = ' -> '.join(f"{h['status']} {h['url']}" for h in r['chain'])
+                w.writerow([r['url'], r['status'] if r['status'] is not None else '', r['method'] or '',
+                            max(0, len(r['chain']) - 1), r['final_url'], r['elapsed_ms'], r['error'], chain])
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'results': results}, f, ensure_ascii=False, indent=2)
+
+
+def format_line(r: dict) -> str:
+    if r['status'] is None:
+        return f"[ERR] {r['url']} -> {r['error']}"
+    hops = len(r['chain']) - 1
+    if hops > 0:
+        return f"[RD{hops}] {r['url']} -> {r['final_url']} ({r['status']})"
+    return f"[{'BAD' if is_bad(r) else 'OK '}] {r['url']} ({r['status']})"
+
+
+def run(urls, checker: Checker, jobs: int, on_result=None):
+    """Check urls concurrently; returns results in input order."""
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as ex:
+        for r in ex.map(checker.check, urls):
+            results.append(r)
+            if on_result:
+                on_result(r)
+    return results
+
 
 def main():
     ap = argparse.ArgumentParser()
@@ -55,24 +220,45 @@ def main():
     ap.add_argument('-F', '--follow', action='store_true', help='Follow redirects')
     ap.add_argument('-t', '--timeout', type=float, default=10.0)
     ap.add_argument('--no-head', action='store_true', help='Use GET instead of HEAD')
+    ap.add_argument('-j', '--jobs', type=int, default=16, help='Concurrent requests')
+    ap.add_argument('--per-host', type=int, default=8, help='Concurrent requests per host')
+    ap.add_argument('--report', default=None, help='Write a .json or .csv report')
+    ap.add_argument('--all', action='store_true', help='Check all pretty + legacy URLs of the site')
+    ap.add_argument('--base', default=None, help='Base URL for --all / re-host input URLs')
+    ap.add_argument('-q', '--quiet', action='store_true', help='Print only failures and the summary')
     args = ap.parse_args()
 
-    method = 'GET' if args.no_head else 'HEAD'
-    any_bad = False
-    for url in read_urls(args.file):
-        code, chain = check(url, args.follow, args.timeout, method)
-        if code is None:
-            print(f"[ERR] {url} -> {' -> '.join(chain)}")
-            any_bad = True
-            continue
-        if len(chain) > 1:
-            print(f"[RD{len(chain)-1}] {url} -> {chain[-1]} ({code})")
-        else:
-            print(f"[OK ] {url} ({code})")
-        if not (200 <= code < 400):
-            any_bad = True
-    sys.exit(1 if any_bad else 0)
+    if args.all:
+        urls = list(site_urls(args.base or DEFAULT_SITE_BASE))
+    else:
+        urls = list(read_urls(args.file))
+        if args.base:
+            urls = [rebase(u, args.base) for u in urls]
+
+    jobs = max(1, args.jobs)
+    checker = Checker(args.follow, args.timeout, not args.no_head,
+                      per_host=max(1, args.per_host), pool_size=jobs)
+
+    def on_result(r):
+        if not args.quiet or is_bad(r):
+            print(format_line(r), flush=True)
+
+    started = time.perf_counter()
+    results = run(urls, checker, jobs, on_result)
+    summary = summarize(results, time.perf_counter() - started)
+
+    lat = summary['latency_ms']
+    print(f"\n📊 {summary['count']} URL(s) in {summary['wall_s']:.2f}s ({summary['urls_per_s']}/s): "
+          f"ok {summary['ok']}, redirected {summary['redirected']}, bad {summary['bad']}, errors {summary['errors']}, "
+          f"HEAD→GET {summary['head_fallbacks']}", file=sys.stderr)
+    print(f"   latency ms: p50 {lat['p50']}, p90 {lat['p90']}, p95 {lat['p95']}, p99 {lat['p99']}, max {lat['max']}",
+          file=sys.stderr)
+    if args.report:
+        write_report(args.report, results, summary)
+        print(f"   report: {args.report}", file=sys.stderr)
+
+    sys.exit(1 if any(is_bad(r) for r in results) else 0)
+
 
 if __name__ == '__main__':
     main()
-
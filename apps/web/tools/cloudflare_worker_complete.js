@@ -1,5 +1,6 @@
 // 클라우드플레어 Workers Script
-// URL 리다이렉트 처리 - 자동 생성됨
+// URL 리다이렉트 처리 - 자동 생성됨 (build_redirects.py)
+// 매핑 4520개 → ID 1233개, 대상 경로 829개
 
 addEventListener('fetch', event => {
   event.respondWith(handleRequest(event.request))
@@ -14,7 +15,7 @@ async function handleRequest(request) {
     const newUrl = getNewUrl(pathname)
     if (newUrl) {
       // 301 영구 리다이렉트
-      return Response.redirect(newUrl, 301)
+      return Response.redirect(new URL(newUrl, url).toString(), 301)
     }
   }
   
@@ -22,2403 +23,914 @@ async function handleRequest(request) {
   return fetch(request)
 }
 
-function getNewUrl(oldPath) {
-  // URL 매핑 테이블
-  const urlMappings = {
-    '/pages/event-0007f6768.html': '/spaceone/데상트-그룹전-데상트-최대-50-off',
-    '/pages/event-0007f6768_02.html': '/songdo/가을-맞이-런닝-필수템-ⅳ',
-    '/pages/event-00ab21111.html': '/songdo/opening-soon-아트박스-9-17-수',
-    '/pages/event-00ab21111905.html': '/songdo/아트박스-추석-프로모션',
-    '/pages/event-00ab21111905_02.html': '/songdo/opening-soon-아트박스-9-17-수',
-    '/pages/event-00ab21111905_03.html': '/songdo/opening-soon-아트박스-9-17-수',
-    '/pages/event-00ab21111905_04.html': '/songdo/opening-soon-아트박스-9-17-수',
-    '/pages/event-00ab21111_02.html': '/songdo/opening-soon-아트박스-9-17-수',
-    '/pages/event-00ab21111_03.html': '/songdo/opening-soon-아트박스-9-17-수',
-    '/pages/event-00ab21111_04.html': '/songdo/opening-soon-아트박스-9-17-수',
-    '/pages/event-01c84919a.html': '/songdo/입주-이사-특별-혜택-전자랜드-리바트',
-    '/pages/event-01c84919a_02.html': '/songdo/입주-이사-특별-혜택-전자랜드-리바트',
-    '/pages/event-028e7af9a.html': '/spaceone/클리어런스-위켄드-한-눈에-보기-인기-브랜드',
-    '/pages/event-028e7af9a45b.html': '/spaceone/클리어런스-위켄드-lucky-특가상품-40선',
-    '/pages/event-028e7af9a45b_02.html': '/spaceone/클리어런스-위켄드-한-눈에-보기-인기-브랜드',
-    '/pages/event-028e7af9a45b_03.html': '/spaceone/클리어런스-위켄드-한-눈에-보기-인기-브랜드',
-    '/pages/event-028e7af9a45b_04.html': '/spaceone/클리어런스-위켄드-한-눈에-보기-인기-브랜드',
-    '/pages/event-028e7af9a_02.html': '/spaceone/클리어런스-위켄드-한-눈에-보기-인기-브랜드',
-    '/pages/event-028e7af9a_03.html': '/spaceone/클리어런스-위켄드-한-눈에-보기-인기-브랜드',
-    '/pages/event-028e7af9a_04.html': '/spaceone/클리어런스-위켄드-한-눈에-보기-인기-브랜드',
-    '/pages/event-02f6c710d.html': '/spaceone/살로몬-f-w-아우터-추천-상품',
-    '/pages/event-02f6c710d_02.html': '/spaceone/살로몬-가을-맞이-특가-제안',
-    '/pages/event-033ef46ec.html': '/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종',
-    '/pages/event-033ef46ec4c3.html': '/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종',
-    '/pages/event-033ef46ec4c3_02.html': '/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종',
-    '/pages/event-033ef46ec4c3_03.html': '/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종',
-    '/pages/event-033ef46ec4c3_04.html': '/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종',
-    '/pages/event-033ef46ec_02.html': '/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종',
-    '/pages/event-033ef46ec_03.html': '/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종',
-    '/pages/event-033ef46ec_04.html': '/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종',
-    '/pages/event-039682e96.html': '/gimpo/2025-golf-fair-브랜드별-할인혜택',
-    '/pages/event-039682e96682.html': '/gimpo/2025-golf-fair-브랜드별-할인혜택',
-    '/pages/event-039682e96682_02.html': '/gimpo/2025-golf-fair-브랜드별-할인혜택',
-    '/pages/event-039682e96682_03.html': '/gimpo/2025-golf-fair-브랜드별-할인혜택',
-    '/pages/event-039682e96682_04.html': '/gimpo/2025-golf-fair-브랜드별-할인혜택',
-    '/pages/event-039682e96_02.html': '/gimpo/2025-golf-fair-브랜드별-할인혜택',
-    '/pages/event-039682e96_03.html': '/gimpo/2025-golf-fair-브랜드별-할인혜택',
-    '/pages/event-039682e96_04.html': '/gimpo/2025-golf-fair-브랜드별-할인혜택',
-    '/pages/event-04053b3d5.html': '/songdo/mz-패션-쇼핑-프로모션',
-    '/pages/event-04053b3d5_02.html': '/songdo/mz-패션-쇼핑-프로모션',
-    '/pages/event-0474baa6f.html': '/songdo/미샤-스페셜-위크',
-    '/pages/event-0474baa6f6ec.html': '/songdo/미샤-스페셜-위크',
-    '/pages/event-0474baa6f6ec_02.html': '/songdo/미샤-스페셜-위크',
-    '/pages/event-0474baa6f6ec_03.html': '/songdo/미샤-스페셜-위크',
-    '/pages/event-0474baa6f6ec_04.html': '/songdo/미샤-스페셜-위크',
-    '/pages/event-0474baa6f_02.html': '/songdo/미샤-스페셜-위크',
-    '/pages/event-0474baa6f_03.html': '/songdo/미샤-스페셜-위크',
-    '/pages/event-0474baa6f_04.html': '/songdo/미샤-스페셜-위크',
-    '/pages/event-06970f3b5.html': '/gimpo/데무-지고트-up-to-75-off',
-    '/pages/event-06970f3b5_02.html': '/gimpo/데무-지고트-up-to-75-off',
-    '/pages/event-06bda4be7.html': '/spaceone/new-open-만학',
-    '/pages/event-06bda4be7_02.html': '/spaceone/new-open-만학',
-    '/pages/event-075f69464cce.html': '/spaceone/아이잗바바-컬렉션-사계절-상품-특가-대전',
-    '/pages/event-075f69464cce_02.html': '/spaceone/아이잗바바-컬렉션-사계절-상품-특가-대전',
-    '/pages/event-07763a1aa.html': '/gimpo/new-open-하이퍼리트',
-    '/pages/event-07763a1aa457.html': '/gimpo/new-in-신상품-제안-하이퍼리트',
-    '/pages/event-07763a1aa457_02.html': '/gimpo/new-open-하이퍼리트',
-    '/pages/event-07763a1aa457_03.html': '/gimpo/new-open-하이퍼리트',
-    '/pages/event-07763a1aa457_04.html': '/gimpo/new-open-하이퍼리트',
-    '/pages/event-07763a1aa_02.html': '/gimpo/new-open-하이퍼리트',
-    '/pages/event-07763a1aa_03.html': '/gimpo/new-open-하이퍼리트',
-    '/pages/event-07763a1aa_04.html': '/gimpo/new-open-하이퍼리트',
-    '/pages/event-08e2c8bb14a4.html': '/songdo/팝업-플레이인더박스-with-mini-diy-market',
-    '/pages/event-094169881.html': '/songdo/스트릿-캐주얼-가을-특가-제안',
-    '/pages/event-094169881490.html': '/songdo/스트릿-캐주얼-가을-특가-제안',
-    '/pages/event-094169881490_02.html': '/songdo/스트릿-캐주얼-가을-특가-제안',
-    '/pages/event-094169881490_03.html': '/songdo/스트릿-캐주얼-가을-특가-제안',
-    '/pages/event-094169881490_04.html': '/songdo/스트릿-캐주얼-가을-특가-제안',
-    '/pages/event-094169881_02.html': '/songdo/스트릿-캐주얼-가을-특가-제안',
-    '/pages/event-094169881_03.html': '/songdo/스트릿-캐주얼-가을-특가-제안',
-    '/pages/event-094169881_04.html': '/songdo/스트릿-캐주얼-가을-특가-제안',
-    '/pages/event-0988a7514.html': '/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안',
-    '/pages/event-0988a7514335.html': '/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안',
-    '/pages/event-0988a7514335_02.html': '/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안',
-    '/pages/event-0988a7514335_03.html': '/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안',
-    '/pages/event-0988a7514335_04.html': '/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안',
-    '/pages/event-0988a7514_02.html': '/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안',
-    '/pages/event-0988a7514_03.html': '/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안',
-    '/pages/event-0988a7514_04.html': '/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안',
-    '/pages/event-0b67aac5e.html': '/spaceone/살로몬-윌슨-패밀리세일-최대-70-②',
-    '/pages/event-0b67aac5e_02.html': '/spaceone/살로몬-윌슨-패밀리세일-최대-70-②',
-    '/pages/event-0bf40a9e5.html': '/songdo/ready-to-f-w-영캐주얼-신상품-입고',
-    '/pages/event-0bf40a9e5818.html': '/songdo/영캐주얼-가을-프로모션',
-    '/pages/event-0bf40a9e5818_02.html': '/songdo/ready-to-f-w-영캐주얼-신상품-입고',
-    '/pages/event-0bf40a9e5818_03.html': '/songdo/ready-to-f-w-영캐주얼-신상품-입고',
-    '/pages/event-0bf40a9e5818_04.html': '/songdo/ready-to-f-w-영캐주얼-신상품-입고',
-    '/pages/event-0bf40a9e5_02.html': '/songdo/ready-to-f-w-영캐주얼-신상품-입고',
-    '/pages/event-0bf40a9e5_03.html': '/songdo/ready-to-f-w-영캐주얼-신상품-입고',
-    '/pages/event-0bf40a9e5_04.html': '/songdo/ready-to-f-w-영캐주얼-신상품-입고',
-    '/pages/event-0c6149a69.html': '/gimpo/라움-스타일-제안-vince-外',
-    '/pages/event-0c6149a69062.html': '/gimpo/라움-스타일-제안-vince-外',
-    '/pages/event-0c6149a69062_02.html': '/gimpo/라움-스타일-제안-vince-外',
-    '/pages/event-0c6149a69062_03.html': '/gimpo/라움-스타일-제안-vince-外',
-    '/pages/event-0c6149a69062_04.html': '/gimpo/라움-스타일-제안-vince-外',
-    '/pages/event-0c6149a69_02.html': '/gimpo/라움-스타일-제안-vince-外',
-    '/pages/event-0c6149a69_03.html': '/gimpo/라움-스타일-제안-vince-外',
-    '/pages/event-0c6149a69_04.html': '/gimpo/라움-스타일-제안-vince-外',
-    '/pages/event-0e7aff0542d7.html': '/gimpo/바버-사계절-상품전-up-to-60-off',
-    '/pages/event-0eff14b71.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-0eff14b71_02.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-0eff14b71_03.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-0eff14b71_04.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-0eff14b71cfd.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-0eff14b71cfd_02.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-0eff14b71cfd_03.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-0eff14b71cfd_04.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-0fda023b8.html': '/spaceone/커버낫키즈-lee키즈-특별-할인전',
-    '/pages/event-0fda023b8_02.html': '/spaceone/커버낫키즈-lee키즈-특별-할인전',
-    '/pages/event-0fda023b8_03.html': '/spaceone/커버낫키즈-lee키즈-특별-할인전',
-    '/pages/event-0fda023b8_04.html': '/spaceone/커버낫키즈-lee키즈-특별-할인전',
-    '/pages/event-0fda023b8e3d.html': '/spaceone/커버낫키즈-lee키즈-특별-할인전',
-    '/pages/event-0fda023b8e3d_02.html': '/spaceone/커버낫키즈-lee키즈-특별-할인전',
-    '/pages/event-0fda023b8e3d_03.html': '/spaceone/커버낫키즈-lee키즈-특별-할인전',
-    '/pages/event-0fda023b8e3d_04.html': '/spaceone/커버낫키즈-lee키즈-특별-할인전',
-    '/pages/event-0ff15a486.html': '/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外',
-    '/pages/event-0ff15a486_02.html': '/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外',
-    '/pages/event-0ff15a486_03.html': '/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外',
-    '/pages/event-0ff15a486_04.html': '/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外',
-    '/pages/event-0ff15a486a99.html': '/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外',
-    '/pages/event-0ff15a486a99_02.html': '/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外',
-    '/pages/event-0ff15a486a99_03.html': '/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外',
-    '/pages/event-0ff15a486a99_04.html': '/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外',
-    '/pages/event-100c1650a.html': '/songdo/가을-맞이-런닝-필수템-ⅲ',
-    '/pages/event-100c1650a4c1.html': '/songdo/가을-맞이-런닝-필수템-ⅲ',
-    '/pages/event-100c1650a4c1_02.html': '/songdo/가을-맞이-런닝-필수템-ⅲ',
-    '/pages/event-100c1650a4c1_03.html': '/songdo/가을-맞이-런닝-필수템-ⅲ',
-    '/pages/event-100c1650a4c1_04.html': '/songdo/가을-맞이-런닝-필수템-ⅲ',
-    '/pages/event-100c1650a_02.html': '/songdo/가을-맞이-런닝-필수템-ⅲ',
-    '/pages/event-100c1650a_03.html': '/songdo/가을-맞이-런닝-필수템-ⅲ',
-    '/pages/event-100c1650a_04.html': '/songdo/가을-맞이-런닝-필수템-ⅲ',
-    '/pages/event-10be92f36.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-10be92f3639f.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-10be92f3639f_02.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-10be92f3639f_03.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-10be92f3639f_04.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-10be92f36_02.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-10be92f36_03.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-10be92f36_04.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-10dd14373.html': '/gimpo/컨템포러리-스타일-제안',
-    '/pages/event-10dd143734f5.html': '/gimpo/컨템포러리-스타일-제안',
-    '/pages/event-10dd143734f5_02.html': '/gimpo/컨템포러리-스타일-제안',
-    '/pages/event-10dd143734f5_03.html': '/gimpo/컨템포러리-스타일-제안',
-    '/pages/event-10dd143734f5_04.html': '/gimpo/컨템포러리-스타일-제안',
-    '/pages/event-10dd14373_02.html': '/gimpo/컨템포러리-스타일-제안',
-    '/pages/event-10dd14373_03.html': '/gimpo/컨템포러리-스타일-제안',
-    '/pages/event-10dd14373_04.html': '/gimpo/컨템포러리-스타일-제안',
-    '/pages/event-10e43fcc7.html': '/spaceone/정관장-추석-선물세트-제안',
-    '/pages/event-10e43fcc7_02.html': '/spaceone/정관장-추석-선물세트-제안',
-    '/pages/event-111ea4995.html': '/songdo/renewal-open-언더아머',
-    '/pages/event-111ea499578e.html': '/songdo/renewal-open-언더아머',
-    '/pages/event-111ea499578e_02.html': '/songdo/renewal-open-언더아머',
-    '/pages/event-111ea499578e_03.html': '/songdo/renewal-open-언더아머',
-    '/pages/event-111ea499578e_04.html': '/songdo/renewal-open-언더아머',
-    '/pages/event-111ea4995_02.html': '/songdo/renewal-open-언더아머',
-    '/pages/event-111ea4995_03.html': '/songdo/renewal-open-언더아머',
-    '/pages/event-111ea4995_04.html': '/songdo/renewal-open-언더아머',
-    '/pages/event-1124ca63a.html': '/gimpo/ready-for-f-w-미샤-up-to-40-off',
-    '/pages/event-1124ca63a688.html': '/gimpo/ready-for-f-w-미샤-up-to-40-off',
-    '/pages/event-1124ca63a688_02.html': '/gimpo/ready-for-f-w-미샤-up-to-40-off',
-    '/pages/event-1124ca63a688_03.html': '/gimpo/ready-for-f-w-미샤-up-to-40-off',
-    '/pages/event-1124ca63a688_04.html': '/gimpo/ready-for-f-w-미샤-up-to-40-off',
-    '/pages/event-1124ca63a_02.html': '/gimpo/ready-for-f-w-미샤-up-to-40-off',
-    '/pages/event-1124ca63a_03.html': '/gimpo/ready-for-f-w-미샤-up-to-40-off',
-    '/pages/event-1124ca63a_04.html': '/gimpo/ready-for-f-w-미샤-up-to-40-off',
-    '/pages/event-119028065.html': '/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70',
-    '/pages/event-119028065055.html': '/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70',
-    '/pages/event-119028065055_02.html': '/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70',
-    '/pages/event-119028065055_03.html': '/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70',
-    '/pages/event-119028065055_04.html': '/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70',
-    '/pages/event-119028065_02.html': '/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70',
-    '/pages/event-119028065_03.html': '/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70',
-    '/pages/event-119028065_04.html': '/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70',
-    '/pages/event-126d14cb9.html': '/gimpo/renewal-open-브룩스브라더스',
-    '/pages/event-126d14cb9_02.html': '/gimpo/renewal-open-브룩스브라더스',
-    '/pages/event-13d2b44bb.html': '/songdo/new-open-라펠-lafel',
-    '/pages/event-13d2b44bb65a.html': '/songdo/new-open-라펠-lafel',
-    '/pages/event-13d2b44bb65a_02.html': '/songdo/new-open-라펠-lafel',
-    '/pages/event-13d2b44bb65a_03.html': '/songdo/new-open-라펠-lafel',
-    '/pages/event-13d2b44bb65a_04.html': '/songdo/new-open-라펠-lafel',
-    '/pages/event-13d2b44bb_02.html': '/songdo/new-open-라펠-lafel',
-    '/pages/event-13d2b44bb_03.html': '/songdo/new-open-라펠-lafel',
-    '/pages/event-13d2b44bb_04.html': '/songdo/new-open-라펠-lafel',
-    '/pages/event-1470ebbc3.html': '/songdo/필드-위의-존재감-스타일-완성-베이직-아이템',
-    '/pages/event-1470ebbc3_02.html': '/songdo/필드-위의-존재감-스타일-완성-베이직-아이템',
-    '/pages/event-1470ebbc3_03.html': '/songdo/필드-위의-존재감-스타일-완성-베이직-아이템',
-    '/pages/event-1470ebbc3_04.html': '/songdo/필드-위의-존재감-스타일-완성-베이직-아이템',
-    '/pages/event-1470ebbc3a09.html': '/songdo/필드-위-편안함과-멋내기-bag-shoes',
-    '/pages/event-1470ebbc3a09_02.html': '/songdo/필드-위의-존재감-스타일-완성-베이직-아이템',
-    '/pages/event-1470ebbc3a09_03.html': '/songdo/필드-위의-존재감-스타일-완성-베이직-아이템',
-    '/pages/event-1470ebbc3a09_04.html': '/songdo/필드-위의-존재감-스타일-완성-베이직-아이템',
-    '/pages/event-15434dc76.html': '/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80',
-    '/pages/event-15434dc7674e.html': '/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80',
-    '/pages/event-15434dc7674e_02.html': '/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80',
-    '/pages/event-15434dc7674e_03.html': '/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80',
-    '/pages/event-15434dc7674e_04.html': '/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80',
-    '/pages/event-15434dc76_02.html': '/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80',
-    '/pages/event-15434dc76_03.html': '/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80',
-    '/pages/event-15434dc76_04.html': '/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80',
-    '/pages/event-158ff7cba.html': '/songdo/new-open-cc콜렉트',
-    '/pages/event-158ff7cba_02.html': '/songdo/new-open-cc콜렉트',
-    '/pages/event-158ff7cba_03.html': '/songdo/new-open-cc콜렉트',
-    '/pages/event-158ff7cba_04.html': '/songdo/new-open-cc콜렉트',
-    '/pages/event-158ff7cbac6c.html': '/songdo/new-open-cc콜렉트',
-    '/pages/event-158ff7cbac6c_02.html': '/songdo/new-open-cc콜렉트',
-    '/pages/event-158ff7cbac6c_03.html': '/songdo/new-open-cc콜렉트',
-    '/pages/event-158ff7cbac6c_04.html': '/songdo/new-open-cc콜렉트',
-    '/pages/event-15a34eff3.html': '/songdo/renewal-open-오브제-obzee',
-    '/pages/event-15a34eff34fb.html': '/songdo/renewal-open-오브제-obzee',
-    '/pages/event-15a34eff34fb_02.html': '/songdo/renewal-open-오브제-obzee',
-    '/pages/event-15a34eff34fb_03.html': '/songdo/renewal-open-오브제-obzee',
-    '/pages/event-15a34eff34fb_04.html': '/songdo/renewal-open-오브제-obzee',
-    '/pages/event-15a34eff3_02.html': '/songdo/renewal-open-오브제-obzee',
-    '/pages/event-15a34eff3_03.html': '/songdo/renewal-open-오브제-obzee',
-    '/pages/event-15a34eff3_04.html': '/songdo/renewal-open-오브제-obzee',
-    '/pages/event-16772d820263.html': '/spaceone/가을-맞이-패밀리-세일-코닥-최대-70',
-    '/pages/event-16772d820263_02.html': '/spaceone/가을-맞이-패밀리-세일-코닥-최대-70',
-    '/pages/event-167bf7f51.html': '/spaceone/coming-soon-이끼덩굴-pop-up',
-    '/pages/event-167bf7f51670.html': '/spaceone/pop-up-이끼-덩굴',
-    '/pages/event-167bf7f51670_02.html': '/spaceone/coming-soon-이끼덩굴-pop-up',
-    '/pages/event-167bf7f51670_03.html': '/spaceone/coming-soon-이끼덩굴-pop-up',
-    '/pages/event-167bf7f51670_04.html': '/spaceone/coming-soon-이끼덩굴-pop-up',
-    '/pages/event-167bf7f51_02.html': '/spaceone/coming-soon-이끼덩굴-pop-up',
-    '/pages/event-167bf7f51_03.html': '/spaceone/coming-soon-이끼덩굴-pop-up',
-    '/pages/event-167bf7f51_04.html': '/spaceone/coming-soon-이끼덩굴-pop-up',
-    '/pages/event-18f2c91dd.html': '/spaceone/coming-soon-나이키-키즈',
-    '/pages/event-18f2c91dd_02.html': '/spaceone/family-weekend-①-추가할인-브랜드',
-    '/pages/event-1962a4bfc.html': '/songdo/happy-holiday-영캐주얼-프로모션',
-    '/pages/event-1962a4bfc_02.html': '/songdo/happy-holiday-영캐주얼-프로모션',
-    '/pages/event-196cb5468.html': '/spaceone/올리브영-이주의-추천-상품',
-    '/pages/event-196cb5468_02.html': '/spaceone/올리브영-올영픽-한정-특가',
-    '/pages/event-19fe27107.html': '/gimpo/에코-up-to-60-특가전',
-    '/pages/event-19fe27107_02.html': '/gimpo/에코-up-to-60-특가전',
-    '/pages/event-1b1d78329.html': '/spaceone/폴로-랄프로렌-아이코닉-스타일-제안',
-    '/pages/event-1b1d7832921f.html': '/spaceone/폴로-랄프로렌-아이코닉-스타일-제안',
-    '/pages/event-1b1d7832921f_02.html': '/spaceone/폴로-랄프로렌-아이코닉-스타일-제안',
-    '/pages/event-1b1d7832921f_03.html': '/spaceone/폴로-랄프로렌-아이코닉-스타일-제안',
-    '/pages/event-1b1d7832921f_04.html': '/spaceone/폴로-랄프로렌-아이코닉-스타일-제안',
-    '/pages/event-1b1d78329_02.html': '/spaceone/폴로-랄프로렌-아이코닉-스타일-제안',
-    '/pages/event-1b1d78329_03.html': '/spaceone/폴로-랄프로렌-아이코닉-스타일-제안',
-    '/pages/event-1b1d78329_04.html': '/spaceone/폴로-랄프로렌-아이코닉-스타일-제안',
-    '/pages/event-1b98bb9e2.html': '/songdo/아크테릭스-가을-산행-아이템-추천',
-    '/pages/event-1b98bb9e225a.html': '/songdo/아크테릭스-가을-산행-아이템-추천',
-    '/pages/event-1b98bb9e225a_02.html': '/songdo/아크테릭스-가을-산행-아이템-추천',
-    '/pages/event-1b98bb9e225a_03.html': '/songdo/아크테릭스-가을-산행-아이템-추천',
-    '/pages/event-1b98bb9e225a_04.html': '/songdo/아크테릭스-가을-산행-아이템-추천',
-    '/pages/event-1b98bb9e2_02.html': '/songdo/아크테릭스-가을-산행-아이템-추천',
-    '/pages/event-1b98bb9e2_03.html': '/songdo/아크테릭스-가을-산행-아이템-추천',
-    '/pages/event-1b98bb9e2_04.html': '/songdo/아크테릭스-가을-산행-아이템-추천',
-    '/pages/event-1bc24ac78.html': '/gimpo/말본골프-특별전-up-to-70-off',
-    '/pages/event-1bc24ac78_02.html': '/gimpo/말본골프-특별전-up-to-70-off',
-    '/pages/event-1c0c4aba12c6.html': '/gimpo/ready-for-f-w-킨더스코너-특가전-up-to-80',
-    '/pages/event-1c0c4aba12c6_02.html': '/gimpo/ready-for-f-w-킨더스코너-특가전-up-to-80',
-    '/pages/event-1d0d77557.html': '/spaceone/부모님을-위한-선물-닥스-daks-pop-up',
-    '/pages/event-1d0d77557_02.html': '/spaceone/부모님을-위한-선물-닥스-daks-pop-up',
-    '/pages/event-1d0d77557_03.html': '/spaceone/부모님을-위한-선물-닥스-daks-pop-up',
-    '/pages/event-1d0d77557_04.html': '/spaceone/부모님을-위한-선물-닥스-daks-pop-up',
-    '/pages/event-1d0d77557b4d.html': '/spaceone/new-open-닥스-daks-종합관',
-    '/pages/event-1d0d77557b4d_02.html': '/spaceone/부모님을-위한-선물-닥스-daks-pop-up',
-    '/pages/event-1d0d77557b4d_03.html': '/spaceone/부모님을-위한-선물-닥스-daks-pop-up',
-    '/pages/event-1d0d77557b4d_04.html': '/spaceone/부모님을-위한-선물-닥스-daks-pop-up',
-    '/pages/event-1df34dcd1.html': '/spaceone/위글위글-프로모션-위글5일장',
-    '/pages/event-1df34dcd1_02.html': '/spaceone/위글위글-프로모션-위글5일장',
-    '/pages/event-1e093cba7.html': '/gimpo/리빙-단독-특가전-빌레로이앤보흐-wmf-外',
-    '/pages/event-1e093cba7_02.html': '/gimpo/리빙-프로모션-및-행사-제안',
-    '/pages/event-1edd3db22.html': '/gimpo/팩토리-바쉬-럭셔리-아이템-제안',
-    '/pages/event-1edd3db22805.html': '/gimpo/팩토리-바쉬-럭셔리-아이템-제안',
-    '/pages/event-1edd3db22805_02.html': '/gimpo/팩토리-바쉬-럭셔리-아이템-제안',
-    '/pages/event-1edd3db22805_03.html': '/gimpo/팩토리-바쉬-럭셔리-아이템-제안',
-    '/pages/event-1edd3db22805_04.html': '/gimpo/팩토리-바쉬-럭셔리-아이템-제안',
-    '/pages/event-1edd3db22_02.html': '/gimpo/팩토리-바쉬-럭셔리-아이템-제안',
-    '/pages/event-1edd3db22_03.html': '/gimpo/팩토리-바쉬-럭셔리-아이템-제안',
-    '/pages/event-1edd3db22_04.html': '/gimpo/팩토리-바쉬-럭셔리-아이템-제안',
-    '/pages/event-2009d4e45.html': '/gimpo/삼성패션-festa-해외패션-up-to-80',
-    '/pages/event-2009d4e45833.html': '/gimpo/삼성패션-festa-해외패션-up-to-80',
-    '/pages/event-2009d4e45833_02.html': '/gimpo/삼성패션-festa-해외패션-up-to-80',
-    '/pages/event-2009d4e45833_03.html': '/gimpo/삼성패션-festa-해외패션-up-to-80',
-    '/pages/event-2009d4e45833_04.html': '/gimpo/삼성패션-festa-해외패션-up-to-80',
-    '/pages/event-2009d4e45_02.html': '/gimpo/삼성패션-festa-해외패션-up-to-80',
-    '/pages/event-2009d4e45_03.html': '/gimpo/삼성패션-festa-해외패션-up-to-80',
-    '/pages/event-2009d4e45_04.html': '/gimpo/삼성패션-festa-해외패션-up-to-80',
-    '/pages/event-20afd587c.html': '/songdo/pop-up-store-생과방-약과-리틀바잇모어',
-    '/pages/event-20afd587c_02.html': '/songdo/pop-up-store-생과방-약과-리틀바잇모어',
-    '/pages/event-20afd587c_03.html': '/songdo/pop-up-store-생과방-약과-리틀바잇모어',
-    '/pages/event-20afd587c_04.html': '/songdo/pop-up-store-생과방-약과-리틀바잇모어',
-    '/pages/event-20afd587ce61.html': '/songdo/pop-up-store-생과방-약과-리틀바잇모어',
-    '/pages/event-20afd587ce61_02.html': '/songdo/pop-up-store-생과방-약과-리틀바잇모어',
-    '/pages/event-20afd587ce61_03.html': '/songdo/pop-up-store-생과방-약과-리틀바잇모어',
-    '/pages/event-20afd587ce61_04.html': '/songdo/pop-up-store-생과방-약과-리틀바잇모어',
-    '/pages/event-22fe4d29f.html': '/spaceone/1년에-단-한번-최대-80-라코스테-클리어런스',
-    '/pages/event-22fe4d29f_02.html': '/spaceone/1년에-단-한번-최대-80-라코스테-클리어런스',
-    '/pages/event-22fe4d29f_03.html': '/spaceone/1년에-단-한번-최대-80-라코스테-클리어런스',
-    '/pages/event-22fe4d29f_04.html': '/spaceone/1년에-단-한번-최대-80-라코스테-클리어런스',
-    '/pages/event-22fe4d29fe19.html': '/spaceone/부모님을-위한-선물-라코스테-타임세일-위켄드',
-    '/pages/event-22fe4d29fe19_02.html': '/spaceone/1년에-단-한번-최대-80-라코스테-클리어런스',
-    '/pages/event-22fe4d29fe19_03.html': '/spaceone/1년에-단-한번-최대-80-라코스테-클리어런스',
-    '/pages/event-22fe4d29fe19_04.html': '/spaceone/1년에-단-한번-최대-80-라코스테-클리어런스',
-    '/pages/event-235d43407.html': '/gimpo/삼성패션-festa-special-weekend',
-    '/pages/event-235d4340761d.html': '/gimpo/삼성패션-festa-special-weekend',
-    '/pages/event-235d4340761d_02.html': '/gimpo/삼성패션-festa-special-weekend',
-    '/pages/event-235d4340761d_03.html': '/gimpo/삼성패션-festa-special-weekend',
-    '/pages/event-235d4340761d_04.html': '/gimpo/삼성패션-festa-special-weekend',
-    '/pages/event-235d43407_02.html': '/gimpo/삼성패션-festa-special-weekend',
-    '/pages/event-235d43407_03.html': '/gimpo/삼성패션-festa-special-weekend',
-    '/pages/event-235d43407_04.html': '/gimpo/삼성패션-festa-special-weekend',
-    '/pages/event-23bdcb0992a6.html': '/gimpo/renewal-open-뉴발란스-김포점-단독-프로모션',
-    '/pages/event-23bdcb0992a6_02.html': '/gimpo/renewal-open-뉴발란스-김포점-단독-프로모션',
-    '/pages/event-24b7a7044.html': '/spaceone/new-open-핫떡',
-    '/pages/event-24b7a7044_02.html': '/spaceone/new-open-핫떡',
-    '/pages/event-260bcf030.html': '/spaceone/bcbg-올앤선드리-사계절-특가상품-대전',
-    '/pages/event-260bcf030_02.html': '/spaceone/bcbg-올앤선드리-사계절-특가상품-대전',
-    '/pages/event-260bcf030_03.html': '/spaceone/bcbg-올앤선드리-사계절-특가상품-대전',
-    '/pages/event-260bcf030_04.html': '/spaceone/bcbg-올앤선드리-사계절-특가상품-대전',
-    '/pages/event-260bcf030ac5.html': '/spaceone/bcbg-올앤선드리-사계절-특가상품-대전',
-    '/pages/event-260bcf030ac5_02.html': '/spaceone/bcbg-올앤선드리-사계절-특가상품-대전',
-    '/pages/event-260bcf030ac5_03.html': '/spaceone/bcbg-올앤선드리-사계절-특가상품-대전',
-    '/pages/event-260bcf030ac5_04.html': '/spaceone/bcbg-올앤선드리-사계절-특가상품-대전',
-    '/pages/event-262d5eac3.html': '/spaceone/모조에스핀-f-w-상품-특가-대전',
-    '/pages/event-262d5eac36c3.html': '/spaceone/모조에스핀-f-w-상품-특가-대전',
-    '/pages/event-262d5eac36c3_02.html': '/spaceone/모조에스핀-f-w-상품-특가-대전',
-    '/pages/event-262d5eac36c3_03.html': '/spaceone/모조에스핀-f-w-상품-특가-대전',
-    '/pages/event-262d5eac36c3_04.html': '/spaceone/모조에스핀-f-w-상품-특가-대전',
-    '/pages/event-262d5eac3_02.html': '/spaceone/모조에스핀-f-w-상품-특가-대전',
-    '/pages/event-262d5eac3_03.html': '/spaceone/모조에스핀-f-w-상품-특가-대전',
-    '/pages/event-262d5eac3_04.html': '/spaceone/모조에스핀-f-w-상품-특가-대전',
-    '/pages/event-27151baab.html': '/gimpo/한섬-컨템포러리-스페셜위크-프로모션',
-    '/pages/event-27151baab212.html': '/gimpo/한섬-컨템포러리-스페셜위크-프로모션',
-    '/pages/event-27151baab212_02.html': '/gimpo/한섬-컨템포러리-스페셜위크-프로모션',
-    '/pages/event-27151baab212_03.html': '/gimpo/한섬-컨템포러리-스페셜위크-프로모션',
-    '/pages/event-27151baab212_04.html': '/gimpo/한섬-컨템포러리-스페셜위크-프로모션',
-    '/pages/event-27151baab_02.html': '/gimpo/한섬-컨템포러리-스페셜위크-프로모션',
-    '/pages/event-27151baab_03.html': '/gimpo/한섬-컨템포러리-스페셜위크-프로모션',
-    '/pages/event-27151baab_04.html': '/gimpo/한섬-컨템포러리-스페셜위크-프로모션',
-    '/pages/event-272a3d8e4.html': '/songdo/pop-up-써스데이아일랜드-가을-여행-스토리',
-    '/pages/event-272a3d8e4_02.html': '/songdo/pop-up-써스데이아일랜드-가을-여행-스토리',
-    '/pages/event-277468807.html': '/spaceone/언더아머-추가할인-프로모션',
-    '/pages/event-277468807_02.html': '/spaceone/언더아머-추가할인-프로모션',
-    '/pages/event-27faeee82.html': '/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company',
-    '/pages/event-27faeee82_02.html': '/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company',
-    '/pages/event-27faeee82_03.html': '/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company',
-    '/pages/event-27faeee82_04.html': '/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company',
-    '/pages/event-27faeee82f52.html': '/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company',
-    '/pages/event-27faeee82f52_02.html': '/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company',
-    '/pages/event-27faeee82f52_03.html': '/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company',
-    '/pages/event-27faeee82f52_04.html': '/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company',
-    '/pages/event-280a7527d.html': '/gimpo/진도모피-패밀리세일-up-to-90-off',
-    '/pages/event-280a7527d_02.html': '/gimpo/진도모피-패밀리세일-up-to-90-off',
-    '/pages/event-280a7527d_03.html': '/gimpo/진도모피-패밀리세일-up-to-90-off',
-    '/pages/event-280a7527d_04.html': '/gimpo/진도모피-패밀리세일-up-to-90-off',
-    '/pages/event-280a7527dce5.html': '/gimpo/진도모피-패밀리세일-up-to-90-off',
-    '/pages/event-280a7527dce5_02.html': '/gimpo/진도모피-패밀리세일-up-to-90-off',
-    '/pages/event-280a7527dce5_03.html': '/gimpo/진도모피-패밀리세일-up-to-90-off',
-    '/pages/event-280a7527dce5_04.html': '/gimpo/진도모피-패밀리세일-up-to-90-off',
-    '/pages/event-28bf366ce698.html': '/spaceone/가을-맞이-패밀리-세일-말본-최대-70',
-    '/pages/event-28bf366ce698_02.html': '/spaceone/가을-맞이-패밀리-세일-말본-최대-70',
-    '/pages/event-297e6fab8.html': '/gimpo/비이커-f-w-스타일-제안-메종키츠네-外',
-    '/pages/event-297e6fab88b1.html': '/gimpo/메종키츠네-비이커-특가전-up-to-70-off',
-    '/pages/event-297e6fab88b1_02.html': '/gimpo/비이커-f-w-스타일-제안-메종키츠네-外',
-    '/pages/event-297e6fab88b1_03.html': '/gimpo/비이커-f-w-스타일-제안-메종키츠네-外',
-    '/pages/event-297e6fab88b1_04.html': '/gimpo/비이커-f-w-스타일-제안-메종키츠네-外',
-    '/pages/event-297e6fab8_02.html': '/gimpo/비이커-f-w-스타일-제안-메종키츠네-外',
-    '/pages/event-297e6fab8_03.html': '/gimpo/비이커-f-w-스타일-제안-메종키츠네-外',
-    '/pages/event-297e6fab8_04.html': '/gimpo/비이커-f-w-스타일-제안-메종키츠네-外',
-    '/pages/event-2a3f5b096.html': '/spaceone/언더아머-시즌-패키지-프로모션',
-    '/pages/event-2a3f5b096_02.html': '/spaceone/언더아머-시즌-패키지-프로모션',
-    '/pages/event-2a3f5b096_03.html': '/spaceone/언더아머-시즌-패키지-프로모션',
-    '/pages/event-2a3f5b096_04.html': '/spaceone/언더아머-시즌-패키지-프로모션',
-    '/pages/event-2a3f5b096c8d.html': '/spaceone/언더아머-군인-추가-할인-프로모션',
-    '/pages/event-2a3f5b096c8d_02.html': '/spaceone/언더아머-시즌-패키지-프로모션',
-    '/pages/event-2a3f5b096c8d_03.html': '/spaceone/언더아머-시즌-패키지-프로모션',
-    '/pages/event-2a3f5b096c8d_04.html': '/spaceone/언더아머-시즌-패키지-프로모션',
-    '/pages/event-2ae36c8f7.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅱ',
-    '/pages/event-2ae36c8f7_02.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅱ',
-    '/pages/event-2ae36c8f7_03.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅱ',
-    '/pages/event-2ae36c8f7_04.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅱ',
-    '/pages/event-2ae36c8f7a70.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅰ',
-    '/pages/event-2ae36c8f7a70_02.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅱ',
-    '/pages/event-2ae36c8f7a70_03.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅱ',
-    '/pages/event-2ae36c8f7a70_04.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅱ',
-    '/pages/event-2b5737efc.html': '/spaceone/데무-demoo-family-sale',
-    '/pages/event-2b5737efc_02.html': '/spaceone/데무-demoo-family-sale',
-    '/pages/event-2b5737efc_03.html': '/spaceone/데무-demoo-family-sale',
-    '/pages/event-2b5737efc_04.html': '/spaceone/데무-demoo-family-sale',
-    '/pages/event-2b5737efca79.html': '/spaceone/데무-demoo-family-sale',
-    '/pages/event-2b5737efca79_02.html': '/spaceone/데무-demoo-family-sale',
-    '/pages/event-2b5737efca79_03.html': '/spaceone/데무-demoo-family-sale',
-    '/pages/event-2b5737efca79_04.html': '/spaceone/데무-demoo-family-sale',
-    '/pages/event-2c3b1eaae.html': '/spaceone/coming-soon-베베드피노-이월특가전',
-    '/pages/event-2c3b1eaae_02.html': '/spaceone/coming-soon-베베드피노-이월특가전',
-    '/pages/event-2c8bb14a4.html': '/songdo/팝업-플레이인더박스-with-mini-diy-market',
-    '/pages/event-2c8bb14a4_02.html': '/songdo/팝업-플레이인더박스-with-mini-diy-market',
-    '/pages/event-2d1208bbf.html': '/spaceone/스노우피크-메가-클리어런스-세일-최대-60-off',
-    '/pages/event-2d1208bbf_02.html': '/spaceone/스노우피크-메가-클리어런스-세일-최대-60-off',
-    '/pages/event-2d5f6c694.html': '/gimpo/아웃도어-f-w-아이템-제안-ⅰ',
-    '/pages/event-2d5f6c694_02.html': '/gimpo/아웃도어-f-w-아이템-제안-ⅰ',
-    '/pages/event-2e06037cb.html': '/songdo/happy-holiday-해외패션-acc',
-    '/pages/event-2e06037cb92e.html': '/songdo/happy-holiday-해외패션-acc',
-    '/pages/event-2e06037cb92e_02.html': '/songdo/happy-holiday-해외패션-acc',
-    '/pages/event-2e06037cb92e_03.html': '/songdo/happy-holiday-해외패션-acc',
-    '/pages/event-2e06037cb92e_04.html': '/songdo/happy-holiday-해외패션-acc',
-    '/pages/event-2e06037cb_02.html': '/songdo/happy-holiday-해외패션-acc',
-    '/pages/event-2e06037cb_03.html': '/songdo/happy-holiday-해외패션-acc',
-    '/pages/event-2e06037cb_04.html': '/songdo/happy-holiday-해외패션-acc',
-    '/pages/event-2e13084fb.html': '/songdo/텐텐-데이-탑텐키즈-1-1',
-    '/pages/event-2e13084fb_02.html': '/songdo/텐텐-데이-탑텐키즈-1-1',
-    '/pages/event-2f6c27eed.html': '/gimpo/지포어-스페셜-팝업-up-to-65-off',
-    '/pages/event-2f6c27eed_02.html': '/gimpo/지포어-스페셜-팝업-up-to-65-off',
-    '/pages/event-2f6c27eed_03.html': '/gimpo/지포어-스페셜-팝업-up-to-65-off',
-    '/pages/event-2f6c27eed_04.html': '/gimpo/지포어-스페셜-팝업-up-to-65-off',
-    '/pages/event-2f6c27eedbfe.html': '/gimpo/지포어-스페셜-팝업-up-to-65-off',
-    '/pages/event-2f6c27eedbfe_02.html': '/gimpo/지포어-스페셜-팝업-up-to-65-off',
-    '/pages/event-2f6c27eedbfe_03.html': '/gimpo/지포어-스페셜-팝업-up-to-65-off',
-    '/pages/event-2f6c27eedbfe_04.html': '/gimpo/지포어-스페셜-팝업-up-to-65-off',
-    '/pages/event-2f7c2fbe6849.html': '/songdo/opening-soon-코데즈컴바인-언더웨어-게스-언더웨어',
-    '/pages/event-2f7c2fbe6849_02.html': '/songdo/opening-soon-코데즈컴바인-언더웨어-게스-언더웨어',
-    '/pages/event-30ae84b5e.html': '/songdo/가을-맞이-런닝-필수템-ⅰ',
-    '/pages/event-30ae84b5e898.html': '/songdo/가을-맞이-런닝-필수템-ⅰ',
-    '/pages/event-30ae84b5e898_02.html': '/songdo/가을-맞이-런닝-필수템-ⅰ',
-    '/pages/event-30ae84b5e898_03.html': '/songdo/가을-맞이-런닝-필수템-ⅰ',
-    '/pages/event-30ae84b5e898_04.html': '/songdo/가을-맞이-런닝-필수템-ⅰ',
-    '/pages/event-30ae84b5e_02.html': '/songdo/가을-맞이-런닝-필수템-ⅰ',
-    '/pages/event-30ae84b5e_03.html': '/songdo/가을-맞이-런닝-필수템-ⅰ',
-    '/pages/event-30ae84b5e_04.html': '/songdo/가을-맞이-런닝-필수템-ⅰ',
-    '/pages/event-312e7d40b.html': '/songdo/pop-up-store-리틀바잇모어',
-    '/pages/event-312e7d40b_02.html': '/songdo/pop-up-store-리틀바잇모어',
-    '/pages/event-312e7d40b_03.html': '/songdo/pop-up-store-리틀바잇모어',
-    '/pages/event-312e7d40b_04.html': '/songdo/pop-up-store-리틀바잇모어',
-    '/pages/event-312e7d40be46.html': '/songdo/pop-up-store-리틀바잇모어',
-    '/pages/event-312e7d40be46_02.html': '/songdo/pop-up-store-리틀바잇모어',
-    '/pages/event-312e7d40be46_03.html': '/songdo/pop-up-store-리틀바잇모어',
-    '/pages/event-312e7d40be46_04.html': '/songdo/pop-up-store-리틀바잇모어',
-    '/pages/event-32cb4d4a4.html': '/gimpo/해외패션-스페셜-혜택',
-    '/pages/event-32cb4d4a4_02.html': '/gimpo/해외패션-스페셜-혜택',
-    '/pages/event-332c65983.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-332c65983_02.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-332c65983_03.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-332c65983_04.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-332c65983f68.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-332c65983f68_02.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-332c65983f68_03.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-332c65983f68_04.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-342842e9c.html': '/gimpo/현대홈쇼핑플러스샵-명품-스타일-제안',
-    '/pages/event-342842e9c_02.html': '/gimpo/현대홈쇼핑플러스샵-명품-스타일-제안',
-    '/pages/event-342842e9c_03.html': '/gimpo/현대홈쇼핑플러스샵-명품-스타일-제안',
-    '/pages/event-342842e9c_04.html': '/gimpo/현대홈쇼핑플러스샵-명품-스타일-제안',
-    '/pages/event-342842e9cb63.html': '/gimpo/현대홈쇼핑플러스샵-명품-특가-제안',
-    '/pages/event-342842e9cb63_02.html': '/gimpo/현대홈쇼핑플러스샵-명품-스타일-제안',
-    '/pages/event-342842e9cb63_03.html': '/gimpo/현대홈쇼핑플러스샵-명품-스타일-제안',
-    '/pages/event-342842e9cb63_04.html': '/gimpo/현대홈쇼핑플러스샵-명품-스타일-제안',
-    '/pages/event-351d2465c.html': '/spaceone/coming-soon-룩캐스트-lookast',
-    '/pages/event-351d2465c_02.html': '/spaceone/coming-soon-룩캐스트-lookast',
-    '/pages/event-35adc07e7.html': '/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전',
-    '/pages/event-35adc07e74bf.html': '/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전',
-    '/pages/event-35adc07e74bf_02.html': '/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전',
-    '/pages/event-35adc07e74bf_03.html': '/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전',
-    '/pages/event-35adc07e74bf_04.html': '/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전',
-    '/pages/event-35adc07e7_02.html': '/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전',
-    '/pages/event-35adc07e7_03.html': '/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전',
-    '/pages/event-35adc07e7_04.html': '/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전',
-    '/pages/event-35bc49837.html': '/gimpo/해외패션-f-w-스페셜-위캔드-ⅰ',
-    '/pages/event-35bc49837_02.html': '/gimpo/해외패션-스페셜-위켄드-ⅱ',
-    '/pages/event-363c5fb87.html': '/gimpo/아웃도어-f-w-아이템-제안-ⅱ',
-    '/pages/event-363c5fb87_02.html': '/gimpo/아웃도어-f-w-아이템-제안-ⅱ',
-    '/pages/event-366639f10.html': '/gimpo/pop-up-gs건설-단독주택-브랜드-자이가이스트',
-    '/pages/event-366639f10_02.html': '/gimpo/pop-up-gs건설-단독주택-브랜드-자이가이스트',
-    '/pages/event-3789c9c0e.html': '/spaceone/bash-해외-브랜드-특가전',
-    '/pages/event-3789c9c0e964.html': '/spaceone/bash-해외-브랜드-특가전',
-    '/pages/event-3789c9c0e964_02.html': '/spaceone/bash-해외-브랜드-특가전',
-    '/pages/event-3789c9c0e964_03.html': '/spaceone/bash-해외-브랜드-특가전',
-    '/pages/event-3789c9c0e964_04.html': '/spaceone/bash-해외-브랜드-특가전',
-    '/pages/event-3789c9c0e_02.html': '/spaceone/bash-해외-브랜드-특가전',
-    '/pages/event-3789c9c0e_03.html': '/spaceone/bash-해외-브랜드-특가전',
-    '/pages/event-3789c9c0e_04.html': '/spaceone/bash-해외-브랜드-특가전',
-    '/pages/event-37e89ee4d.html': '/gimpo/pop-up-스페인-편집샵-gurapa-lab',
-    '/pages/event-37e89ee4d_02.html': '/gimpo/pop-up-스페인-편집샵-gurapa-lab',
-    '/pages/event-38f884d36771.html': '/gimpo/리바트-리듬페스타',
-    '/pages/event-38f884d36771_02.html': '/gimpo/리바트-리듬페스타',
-    '/pages/event-3982d1208bbf.html': '/spaceone/스노우피크-메가-클리어런스-세일-최대-60-off',
-    '/pages/event-3982d1208bbf_02.html': '/spaceone/스노우피크-메가-클리어런스-세일-최대-60-off',
-    '/pages/event-3b8bbe2c1.html': '/spaceone/추워지는-계절-golf-아우터-특가-제안',
-    '/pages/event-3b8bbe2c1_02.html': '/spaceone/추워지는-계절-golf-아우터-특가-제안',
-    '/pages/event-3cbe93e28.html': '/spaceone/이새-bcbg-올앤선드리-특가상품-대전',
-    '/pages/event-3cbe93e282ab.html': '/spaceone/이새-bcbg-올앤선드리-특가상품-대전',
-    '/pages/event-3cbe93e282ab_02.html': '/spaceone/이새-bcbg-올앤선드리-특가상품-대전',
-    '/pages/event-3cbe93e282ab_03.html': '/spaceone/이새-bcbg-올앤선드리-특가상품-대전',
-    '/pages/event-3cbe93e282ab_04.html': '/spaceone/이새-bcbg-올앤선드리-특가상품-대전',
-    '/pages/event-3cbe93e28_02.html': '/spaceone/이새-bcbg-올앤선드리-특가상품-대전',
-    '/pages/event-3cbe93e28_03.html': '/spaceone/이새-bcbg-올앤선드리-특가상품-대전',
-    '/pages/event-3cbe93e28_04.html': '/spaceone/이새-bcbg-올앤선드리-특가상품-대전',
-    '/pages/event-3d0a13bd6.html': '/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off',
-    '/pages/event-3d0a13bd6403.html': '/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off',
-    '/pages/event-3d0a13bd6403_02.html': '/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off',
-    '/pages/event-3d0a13bd6403_03.html': '/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off',
-    '/pages/event-3d0a13bd6403_04.html': '/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off',
-    '/pages/event-3d0a13bd6_02.html': '/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off',
-    '/pages/event-3d0a13bd6_03.html': '/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off',
-    '/pages/event-3d0a13bd6_04.html': '/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off',
-    '/pages/event-3d32ba0fa.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-3d32ba0fa063.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-3d32ba0fa063_02.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-3d32ba0fa063_03.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-3d32ba0fa063_04.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-3d32ba0fa_02.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-3d32ba0fa_03.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-3d32ba0fa_04.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-3de7f754a.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-3de7f754a9e7.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-3de7f754a9e7_02.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-3de7f754a9e7_03.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-3de7f754a9e7_04.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-3de7f754a_02.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-3de7f754a_03.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-3de7f754a_04.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-3deb03ddfa1b.html': '/gimpo/헨리코튼-사계절-상품전-up-to-60-off',
-    '/pages/event-40dfb648c.html': '/spaceone/winelist-다가오는-연휴-와인-선물세트-추천',
-    '/pages/event-40dfb648c_02.html': '/spaceone/winelist-다가오는-연휴-와인-선물세트-추천',
-    '/pages/event-413e4c330.html': '/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off',
-    '/pages/event-413e4c330394.html': '/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off',
-    '/pages/event-413e4c330394_02.html': '/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off',
-    '/pages/event-413e4c330394_03.html': '/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off',
-    '/pages/event-413e4c330394_04.html': '/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off',
-    '/pages/event-413e4c330_02.html': '/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off',
-    '/pages/event-413e4c330_03.html': '/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off',
-    '/pages/event-413e4c330_04.html': '/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off',
-    '/pages/event-4157343b9.html': '/songdo/td페어-타미힐피거-최대-70',
-    '/pages/event-4157343b9_02.html': '/songdo/td페어-타미힐피거-최대-70',
-    '/pages/event-4157343b9_03.html': '/songdo/td페어-타미힐피거-최대-70',
-    '/pages/event-4157343b9_04.html': '/songdo/td페어-타미힐피거-최대-70',
-    '/pages/event-4157343b9f0f.html': '/songdo/td페어-타미힐피거-최대-70',
-    '/pages/event-4157343b9f0f_02.html': '/songdo/td페어-타미힐피거-최대-70',
-    '/pages/event-4157343b9f0f_03.html': '/songdo/td페어-타미힐피거-최대-70',
-    '/pages/event-4157343b9f0f_04.html': '/songdo/td페어-타미힐피거-최대-70',
-    '/pages/event-4206c96fd.html': '/gimpo/스트릿-캐주얼-특가전-i-up-to-70',
-    '/pages/event-4206c96fd171.html': '/spaceone/최초-마리떼프랑소와저버-비케이브-대전-②',
-    '/pages/event-4206c96fd171_02.html': '/gimpo/스트릿-캐주얼-특가전-i-up-to-70',
-    '/pages/event-4206c96fd171_03.html': '/gimpo/스트릿-캐주얼-특가전-i-up-to-70',
-    '/pages/event-4206c96fd171_04.html': '/gimpo/스트릿-캐주얼-특가전-i-up-to-70',
-    '/pages/event-4206c96fd_02.html': '/gimpo/스트릿-캐주얼-특가전-i-up-to-70',
-    '/pages/event-4206c96fd_03.html': '/gimpo/스트릿-캐주얼-특가전-i-up-to-70',
-    '/pages/event-4206c96fd_04.html': '/gimpo/스트릿-캐주얼-특가전-i-up-to-70',
-    '/pages/event-42961dd82.html': '/songdo/크리스-가을-골프-특가전-핑',
-    '/pages/event-42961dd82186.html': '/songdo/크리스-가을-골프-특가전-핑',
-    '/pages/event-42961dd82186_02.html': '/songdo/크리스-가을-골프-특가전-핑',
-    '/pages/event-42961dd82186_03.html': '/songdo/크리스-가을-골프-특가전-핑',
-    '/pages/event-42961dd82186_04.html': '/songdo/크리스-가을-골프-특가전-핑',
-    '/pages/event-42961dd82_02.html': '/songdo/크리스-가을-골프-특가전-핑',
-    '/pages/event-42961dd82_03.html': '/songdo/크리스-가을-골프-특가전-핑',
-    '/pages/event-42961dd82_04.html': '/songdo/크리스-가을-골프-특가전-핑',
-    '/pages/event-4393f2e0b.html': '/songdo/올리브영-올영세일',
-    '/pages/event-4393f2e0b_02.html': '/songdo/올리브영-올영세일',
-    '/pages/event-4393f2e0b_03.html': '/songdo/올리브영-올영세일',
-    '/pages/event-4393f2e0b_04.html': '/songdo/올리브영-올영세일',
-    '/pages/event-4393f2e0bf10.html': '/songdo/올리브영-올영세일',
-    '/pages/event-4393f2e0bf10_02.html': '/songdo/올리브영-올영세일',
-    '/pages/event-4393f2e0bf10_03.html': '/songdo/올리브영-올영세일',
-    '/pages/event-4393f2e0bf10_04.html': '/songdo/올리브영-올영세일',
-    '/pages/event-443ec2a37.html': '/gimpo/메이크업-특가-제안',
-    '/pages/event-443ec2a37_02.html': '/gimpo/메이크업-특가-제안',
-    '/pages/event-443ec2a37_03.html': '/gimpo/메이크업-특가-제안',
-    '/pages/event-443ec2a37_04.html': '/gimpo/메이크업-특가-제안',
-    '/pages/event-443ec2a37e06.html': '/gimpo/코스메틱-10월-프로모션',
-    '/pages/event-443ec2a37e06_02.html': '/gimpo/메이크업-특가-제안',
-    '/pages/event-443ec2a37e06_03.html': '/gimpo/메이크업-특가-제안',
-    '/pages/event-443ec2a37e06_04.html': '/gimpo/메이크업-특가-제안',
-    '/pages/event-4604d62f4.html': '/gimpo/업사이클빌리지-페스티벌-제품-안내-아웃도어',
-    '/pages/event-4604d62f45b2.html': '/gimpo/업사이클빌리지-페스티벌-제품-안내-패션',
-    '/pages/event-4604d62f45b2_02.html': '/gimpo/업사이클빌리지-페스티벌-제품-안내-아웃도어',
-    '/pages/event-4604d62f45b2_03.html': '/gimpo/업사이클빌리지-페스티벌-제품-안내-아웃도어',
-    '/pages/event-4604d62f45b2_04.html': '/gimpo/업사이클빌리지-페스티벌-제품-안내-아웃도어',
-    '/pages/event-4604d62f4_02.html': '/gimpo/업사이클빌리지-페스티벌-제품-안내-아웃도어',
-    '/pages/event-4604d62f4_03.html': '/gimpo/업사이클빌리지-페스티벌-제품-안내-아웃도어',
-    '/pages/event-4604d62f4_04.html': '/gimpo/업사이클빌리지-페스티벌-제품-안내-아웃도어',
-    '/pages/event-4610c0ed6.html': '/gimpo/쉬즈미스-스타일제안',
-    '/pages/event-4610c0ed63c8.html': '/gimpo/쉬즈미스-스타일제안',
-    '/pages/event-4610c0ed63c8_02.html': '/gimpo/쉬즈미스-스타일제안',
-    '/pages/event-4610c0ed63c8_03.html': '/gimpo/쉬즈미스-스타일제안',
-    '/pages/event-4610c0ed63c8_04.html': '/gimpo/쉬즈미스-스타일제안',
-    '/pages/event-4610c0ed6_02.html': '/gimpo/쉬즈미스-스타일제안',
-    '/pages/event-4610c0ed6_03.html': '/gimpo/쉬즈미스-스타일제안',
-    '/pages/event-4610c0ed6_04.html': '/gimpo/쉬즈미스-스타일제안',
-    '/pages/event-471f33928.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-471f33928252.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-471f33928252_02.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-471f33928252_03.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-471f33928252_04.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-471f33928_02.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-471f33928_03.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-471f33928_04.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-494d5345d.html': '/songdo/new-open-분더커피바',
-    '/pages/event-494d5345d4fe.html': '/songdo/new-open-분더커피바',
-    '/pages/event-494d5345d4fe_02.html': '/songdo/new-open-분더커피바',
-    '/pages/event-494d5345d4fe_03.html': '/songdo/new-open-분더커피바',
-    '/pages/event-494d5345d4fe_04.html': '/songdo/new-open-분더커피바',
-    '/pages/event-494d5345d_02.html': '/songdo/new-open-분더커피바',
-    '/pages/event-494d5345d_03.html': '/songdo/new-open-분더커피바',
-    '/pages/event-494d5345d_04.html': '/songdo/new-open-분더커피바',
-    '/pages/event-498211093.html': '/songdo/아동-인기브랜드-특가전-아이러브제이-프렌치캣-나이키키즈',
-    '/pages/event-498211093_02.html': '/songdo/아동-인기브랜드-특가전-아이러브제이-프렌치캣-나이키키즈',
-    '/pages/event-499616854.html': '/songdo/마리엘렌-모피-전문-팝업-오픈',
-    '/pages/event-4996168541d4.html': '/songdo/마리엘렌-모피-전문-팝업-오픈',
-    '/pages/event-4996168541d4_02.html': '/songdo/마리엘렌-모피-전문-팝업-오픈',
-    '/pages/event-4996168541d4_03.html': '/songdo/마리엘렌-모피-전문-팝업-오픈',
-    '/pages/event-4996168541d4_04.html': '/songdo/마리엘렌-모피-전문-팝업-오픈',
-    '/pages/event-499616854_02.html': '/songdo/마리엘렌-모피-전문-팝업-오픈',
-    '/pages/event-499616854_03.html': '/songdo/마리엘렌-모피-전문-팝업-오픈',
-    '/pages/event-499616854_04.html': '/songdo/마리엘렌-모피-전문-팝업-오픈',
-    '/pages/event-49cccf0df.html': '/spaceone/winelist-와지트-위크-특가',
-    '/pages/event-49cccf0df_02.html': '/spaceone/winelist-와지트-위크-특가',
-    '/pages/event-49cccf0df_03.html': '/spaceone/winelist-와지트-위크-특가',
-    '/pages/event-49cccf0df_04.html': '/spaceone/winelist-와지트-위크-특가',
-    '/pages/event-49cccf0dfd96.html': '/spaceone/와지트-위크-기념-f-b-혜택-콜키지-프리',
-    '/pages/event-49cccf0dfd96_02.html': '/spaceone/winelist-와지트-위크-특가',
-    '/pages/event-49cccf0dfd96_03.html': '/spaceone/winelist-와지트-위크-특가',
-    '/pages/event-49cccf0dfd96_04.html': '/spaceone/winelist-와지트-위크-특가',
-    '/pages/event-4a9e4e7df.html': '/gimpo/띠어리-f-w-특가전-up-to-70-off',
-    '/pages/event-4a9e4e7df_02.html': '/gimpo/띠어리-f-w-특가전-up-to-70-off',
-    '/pages/event-4a9e4e7df_03.html': '/gimpo/띠어리-f-w-특가전-up-to-70-off',
-    '/pages/event-4a9e4e7df_04.html': '/gimpo/띠어리-f-w-특가전-up-to-70-off',
-    '/pages/event-4a9e4e7dff95.html': '/gimpo/띠어리-f-w-특가전-up-to-70-off',
-    '/pages/event-4a9e4e7dff95_02.html': '/gimpo/띠어리-f-w-특가전-up-to-70-off',
-    '/pages/event-4a9e4e7dff95_03.html': '/gimpo/띠어리-f-w-특가전-up-to-70-off',
-    '/pages/event-4a9e4e7dff95_04.html': '/gimpo/띠어리-f-w-특가전-up-to-70-off',
-    '/pages/event-4be0caaf8.html': '/songdo/opening-soon-파타고니아',
-    '/pages/event-4be0caaf8744.html': '/songdo/opening-soon-파타고니아',
-    '/pages/event-4be0caaf8744_02.html': '/songdo/opening-soon-파타고니아',
-    '/pages/event-4be0caaf8744_03.html': '/songdo/opening-soon-파타고니아',
-    '/pages/event-4be0caaf8744_04.html': '/songdo/opening-soon-파타고니아',
-    '/pages/event-4be0caaf8_02.html': '/songdo/opening-soon-파타고니아',
-    '/pages/event-4be0caaf8_03.html': '/songdo/opening-soon-파타고니아',
-    '/pages/event-4be0caaf8_04.html': '/songdo/opening-soon-파타고니아',
-    '/pages/event-4c084e883.html': '/songdo/가을-맞이-런닝-필수템-ⅴ',
-    '/pages/event-4c084e883_02.html': '/songdo/가을-맞이-런닝-필수템-ⅴ',
-    '/pages/event-4c084e883_03.html': '/songdo/가을-맞이-런닝-필수템-ⅴ',
-    '/pages/event-4c084e883_04.html': '/songdo/가을-맞이-런닝-필수템-ⅴ',
-    '/pages/event-4c084e883e87.html': '/songdo/가을-맞이-런닝-필수템-ⅴ',
-    '/pages/event-4c084e883e87_02.html': '/songdo/가을-맞이-런닝-필수템-ⅴ',
-    '/pages/event-4c084e883e87_03.html': '/songdo/가을-맞이-런닝-필수템-ⅴ',
-    '/pages/event-4c084e883e87_04.html': '/songdo/가을-맞이-런닝-필수템-ⅴ',
-    '/pages/event-4c681d323b9c.html': '/spaceone/new-open-정희',
-    '/pages/event-4c681d323b9c_02.html': '/spaceone/new-open-정희',
-    '/pages/event-4c85c3b74.html': '/songdo/미리-준비하는-겨울-아동-아우터-제안',
-    '/pages/event-4c85c3b74510.html': '/songdo/미리-준비하는-겨울-아동-아우터-제안',
-    '/pages/event-4c85c3b74510_02.html': '/songdo/미리-준비하는-겨울-아동-아우터-제안',
-    '/pages/event-4c85c3b74510_03.html': '/songdo/미리-준비하는-겨울-아동-아우터-제안',
-    '/pages/event-4c85c3b74510_04.html': '/songdo/미리-준비하는-겨울-아동-아우터-제안',
-    '/pages/event-4c85c3b74_02.html': '/songdo/미리-준비하는-겨울-아동-아우터-제안',
-    '/pages/event-4c85c3b74_03.html': '/songdo/미리-준비하는-겨울-아동-아우터-제안',
-    '/pages/event-4c85c3b74_04.html': '/songdo/미리-준비하는-겨울-아동-아우터-제안',
-    '/pages/event-4da40e024.html': '/songdo/필드-위의-자유로움-아노락-스웨터-추천',
-    '/pages/event-4da40e024_02.html': '/songdo/필드-위의-자유로움-아노락-스웨터-추천',
-    '/pages/event-4da40e024_03.html': '/songdo/필드-위의-자유로움-아노락-스웨터-추천',
-    '/pages/event-4da40e024_04.html': '/songdo/필드-위의-자유로움-아노락-스웨터-추천',
-    '/pages/event-4da40e024d9b.html': '/songdo/필드-위의-자유로움-아노락-스웨터-추천',
-    '/pages/event-4da40e024d9b_02.html': '/songdo/필드-위의-자유로움-아노락-스웨터-추천',
-    '/pages/event-4da40e024d9b_03.html': '/songdo/필드-위의-자유로움-아노락-스웨터-추천',
-    '/pages/event-4da40e024d9b_04.html': '/songdo/필드-위의-자유로움-아노락-스웨터-추천',
-    '/pages/event-4e3ac25b0.html': '/spaceone/new-open-사우스케이프-①',
-    '/pages/event-4e3ac25b0130.html': '/spaceone/가을-골프-룩-제안-사우스케이프-최대-40-off',
-    '/pages/event-4e3ac25b0130_02.html': '/spaceone/new-open-사우스케이프-①',
-    '/pages/event-4e3ac25b0130_03.html': '/spaceone/new-open-사우스케이프-①',
-    '/pages/event-4e3ac25b0130_04.html': '/spaceone/new-open-사우스케이프-①',
-    '/pages/event-4e3ac25b0_02.html': '/spaceone/new-open-사우스케이프-①',
-    '/pages/event-4e3ac25b0_03.html': '/spaceone/new-open-사우스케이프-①',
-    '/pages/event-4e3ac25b0_04.html': '/spaceone/new-open-사우스케이프-①',
-    '/pages/event-4eb26cdf2.html': '/spaceone/남양주시-아름다운가게와-함께하는-어린이-플리마켓',
-    '/pages/event-4eb26cdf2_02.html': '/spaceone/남양주시-아름다운가게와-함께하는-어린이-플리마켓',
-    '/pages/event-4f3401a87.html': '/spaceone/7大-클리어런스-로아앤제인-up-to-50-off',
-    '/pages/event-4f3401a87_02.html': '/spaceone/family-weekend-③-h-point-프로모션',
-    '/pages/event-4f86e5a8c.html': '/spaceone/pop-up-브라운브레스-brownbreath',
-    '/pages/event-4f86e5a8c_02.html': '/spaceone/pop-up-브라운브레스-brownbreath',
-    '/pages/event-4feabdc0c.html': '/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스',
-    '/pages/event-4feabdc0c2ec.html': '/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스',
-    '/pages/event-4feabdc0c2ec_02.html': '/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스',
-    '/pages/event-4feabdc0c2ec_03.html': '/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스',
-    '/pages/event-4feabdc0c2ec_04.html': '/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스',
-    '/pages/event-4feabdc0c_02.html': '/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스',
-    '/pages/event-4feabdc0c_03.html': '/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스',
-    '/pages/event-4feabdc0c_04.html': '/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스',
-    '/pages/event-50ba4d74591d.html': '/spaceone/프리미엄-워치-특가-제안',
-    '/pages/event-51cd04064.html': '/spaceone/리바트-특가-프로모션',
-    '/pages/event-51cd04064_02.html': '/spaceone/리바트-특가-프로모션',
-    '/pages/event-51cd04064_03.html': '/spaceone/리바트-특가-프로모션',
-    '/pages/event-51cd04064_04.html': '/spaceone/리바트-특가-프로모션',
-    '/pages/event-51cd04064abf.html': '/spaceone/리바트-특가-프로모션',
-    '/pages/event-51cd04064abf_02.html': '/spaceone/리바트-특가-프로모션',
-    '/pages/event-51cd04064abf_03.html': '/spaceone/리바트-특가-프로모션',
-    '/pages/event-51cd04064abf_04.html': '/spaceone/리바트-특가-프로모션',
-    '/pages/event-530e306eb.html': '/gimpo/new-open-모이모키',
-    '/pages/event-530e306eb_02.html': '/gimpo/new-open-모이모키',
-    '/pages/event-543c914a3.html': '/gimpo/pop-up-store-닥터데이빗-명품수선',
-    '/pages/event-543c914a3_02.html': '/gimpo/pop-up-store-닥터데이빗-명품수선',
-    '/pages/event-55b283500.html': '/gimpo/스포츠-special-week-ⅰ',
-    '/pages/event-55b283500619.html': '/gimpo/스포츠-special-week-ⅰ',
-    '/pages/event-55b283500619_02.html': '/gimpo/스포츠-special-week-ⅰ',
-    '/pages/event-55b283500619_03.html': '/gimpo/스포츠-special-week-ⅰ',
-    '/pages/event-55b283500619_04.html': '/gimpo/스포츠-special-week-ⅰ',
-    '/pages/event-55b283500_02.html': '/gimpo/스포츠-special-week-ⅰ',
-    '/pages/event-55b283500_03.html': '/gimpo/스포츠-special-week-ⅰ',
-    '/pages/event-55b283500_04.html': '/gimpo/스포츠-special-week-ⅰ',
-    '/pages/event-5790946bd.html': '/songdo/현아-빵픽-①-가을-메뉴-소개',
-    '/pages/event-5790946bd881.html': '/songdo/현아-빵픽-②-신메뉴-소개',
-    '/pages/event-5790946bd881_02.html': '/songdo/현아-빵픽-①-가을-메뉴-소개',
-    '/pages/event-5790946bd881_03.html': '/songdo/현아-빵픽-①-가을-메뉴-소개',
-    '/pages/event-5790946bd881_04.html': '/songdo/현아-빵픽-①-가을-메뉴-소개',
-    '/pages/event-5790946bd_02.html': '/songdo/현아-빵픽-①-가을-메뉴-소개',
-    '/pages/event-5790946bd_03.html': '/songdo/현아-빵픽-①-가을-메뉴-소개',
-    '/pages/event-5790946bd_04.html': '/songdo/현아-빵픽-①-가을-메뉴-소개',
-    '/pages/event-57a46be97.html': '/songdo/스톤헨지-주얼리-기프트-특가-제안',
-    '/pages/event-57a46be97104.html': '/songdo/스톤헨지-주얼리-기프트-특가-제안',
-    '/pages/event-57a46be97104_02.html': '/songdo/스톤헨지-주얼리-기프트-특가-제안',
-    '/pages/event-57a46be97104_03.html': '/songdo/스톤헨지-주얼리-기프트-특가-제안',
-    '/pages/event-57a46be97104_04.html': '/songdo/스톤헨지-주얼리-기프트-특가-제안',
-    '/pages/event-57a46be97_02.html': '/songdo/스톤헨지-주얼리-기프트-특가-제안',
-    '/pages/event-57a46be97_03.html': '/songdo/스톤헨지-주얼리-기프트-특가-제안',
-    '/pages/event-57a46be97_04.html': '/songdo/스톤헨지-주얼리-기프트-특가-제안',
-    '/pages/event-58b7d2712.html': '/gimpo/ready-for-f-w-페트레이-특가전',
-    '/pages/event-58b7d2712_02.html': '/gimpo/ready-for-f-w-페트레이-특가전',
-    '/pages/event-58da1feda.html': '/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안',
-    '/pages/event-58da1feda_02.html': '/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안',
-    '/pages/event-58da1feda_03.html': '/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안',
-    '/pages/event-58da1feda_04.html': '/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안',
-    '/pages/event-58da1fedab8e.html': '/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안',
-    '/pages/event-58da1fedab8e_02.html': '/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안',
-    '/pages/event-58da1fedab8e_03.html': '/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안',
-    '/pages/event-58da1fedab8e_04.html': '/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안',
-    '/pages/event-59668e59c.html': '/spaceone/renewal-open-탠디-소다',
-    '/pages/event-59668e59c_02.html': '/spaceone/renewal-open-탠디-소다',
-    '/pages/event-59668e59c_03.html': '/spaceone/renewal-open-탠디-소다',
-    '/pages/event-59668e59c_04.html': '/spaceone/renewal-open-탠디-소다',
-    '/pages/event-59668e59cf6f.html': '/spaceone/renewal-open-탠디-소다',
-    '/pages/event-59668e59cf6f_02.html': '/spaceone/renewal-open-탠디-소다',
-    '/pages/event-59668e59cf6f_03.html': '/spaceone/renewal-open-탠디-소다',
-    '/pages/event-59668e59cf6f_04.html': '/spaceone/renewal-open-탠디-소다',
-    '/pages/event-5ba0b19e8.html': '/gimpo/new-open-노비스',
-    '/pages/event-5ba0b19e8_02.html': '/gimpo/노비스-nobis-스타일-제안',
-    '/pages/event-5bb40f1d0.html': '/spaceone/나이키-유나이트-프로모션-팝업-행사장',
-    '/pages/event-5bb40f1d0331.html': '/spaceone/나이키-유나이트-프로모션-팝업-행사장',
-    '/pages/event-5bb40f1d0331_02.html': '/spaceone/나이키-유나이트-프로모션-팝업-행사장',
-    '/pages/event-5bb40f1d0331_03.html': '/spaceone/나이키-유나이트-프로모션-팝업-행사장',
-    '/pages/event-5bb40f1d0331_04.html': '/spaceone/나이키-유나이트-프로모션-팝업-행사장',
-    '/pages/event-5bb40f1d0_02.html': '/spaceone/나이키-유나이트-프로모션-팝업-행사장',
-    '/pages/event-5bb40f1d0_03.html': '/spaceone/나이키-유나이트-프로모션-팝업-행사장',
-    '/pages/event-5bb40f1d0_04.html': '/spaceone/나이키-유나이트-프로모션-팝업-행사장',
-    '/pages/event-5caaaf952.html': '/gimpo/리바트-가을-페스티벌',
-    '/pages/event-5caaaf952_02.html': '/gimpo/리바트-가을-페스티벌',
-    '/pages/event-5cdf08c62.html': '/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천',
-    '/pages/event-5cdf08c62342.html': '/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천',
-    '/pages/event-5cdf08c62342_02.html': '/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천',
-    '/pages/event-5cdf08c62342_03.html': '/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천',
-    '/pages/event-5cdf08c62342_04.html': '/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천',
-    '/pages/event-5cdf08c62_02.html': '/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천',
-    '/pages/event-5cdf08c62_03.html': '/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천',
-    '/pages/event-5cdf08c62_04.html': '/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천',
-    '/pages/event-5df1afe50.html': '/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가',
-    '/pages/event-5df1afe50_02.html': '/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가',
-    '/pages/event-5df1afe50_03.html': '/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가',
-    '/pages/event-5df1afe50_04.html': '/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가',
-    '/pages/event-5df1afe50b72.html': '/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가',
-    '/pages/event-5df1afe50b72_02.html': '/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가',
-    '/pages/event-5df1afe50b72_03.html': '/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가',
-    '/pages/event-5df1afe50b72_04.html': '/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가',
-    '/pages/event-5eaae9977.html': '/gimpo/ready-for-f-w-르베이지-up-to-40-off',
-    '/pages/event-5eaae997740f.html': '/gimpo/르베이지-구호-스페셜위크-프로모션-up-to-50-off',
-    '/pages/event-5eaae997740f_02.html': '/gimpo/ready-for-f-w-르베이지-up-to-40-off',
-    '/pages/event-5eaae997740f_03.html': '/gimpo/ready-for-f-w-르베이지-up-to-40-off',
-    '/pages/event-5eaae997740f_04.html': '/gimpo/ready-for-f-w-르베이지-up-to-40-off',
-    '/pages/event-5eaae9977_02.html': '/gimpo/ready-for-f-w-르베이지-up-to-40-off',
-    '/pages/event-5eaae9977_03.html': '/gimpo/ready-for-f-w-르베이지-up-to-40-off',
-    '/pages/event-5eaae9977_04.html': '/gimpo/ready-for-f-w-르베이지-up-to-40-off',
-    '/pages/event-607b58c79.html': '/spaceone/추석-명절-선물세트-제안-ⅰ',
-    '/pages/event-607b58c79_02.html': '/spaceone/추석-명절-선물세트-구매혜택',
-    '/pages/event-6092722cb.html': '/songdo/9월-리빙-프로모션-템퍼-씰리',
-    '/pages/event-6092722cb_02.html': '/gimpo/리빙-프로모션-제안',
-    '/pages/event-60ff51f8e.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-60ff51f8e408.html': '/spaceone/가족을-위한-선물-폴로-랄프로렌-가을-상품-추천',
-    '/pages/event-60ff51f8e408_02.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-60ff51f8e408_03.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-60ff51f8e408_04.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-60ff51f8e_02.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-60ff51f8e_03.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-60ff51f8e_04.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-611cf2023.html': '/spaceone/family-weekend-②-한정-특가-상품',
-    '/pages/event-611cf2023_02.html': '/spaceone/family-weekend-②-한정-특가-상품',
-    '/pages/event-6146ecbac.html': '/spaceone/라코스테-균일가-프로모션',
-    '/pages/event-6146ecbac_02.html': '/spaceone/라코스테-균일가-프로모션',
-    '/pages/event-6146ecbac_03.html': '/spaceone/라코스테-균일가-프로모션',
-    '/pages/event-6146ecbac_04.html': '/spaceone/라코스테-균일가-프로모션',
-    '/pages/event-6146ecbaca18.html': '/spaceone/라코스테-buy-2-get-10-off',
-    '/pages/event-6146ecbaca18_02.html': '/spaceone/라코스테-균일가-프로모션',
-    '/pages/event-6146ecbaca18_03.html': '/spaceone/라코스테-균일가-프로모션',
-    '/pages/event-6146ecbaca18_04.html': '/spaceone/라코스테-균일가-프로모션',
-    '/pages/event-61d37e89ee4d.html': '/gimpo/pop-up-스페인-편집샵-gurapa-lab',
-    '/pages/event-6218948ab.html': '/gimpo/스노우피크-특가전-up-to-50-off',
-    '/pages/event-6218948ab_02.html': '/gimpo/스노우피크-특가전-up-to-50-off',
-    '/pages/event-622ad411e.html': '/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안',
-    '/pages/event-622ad411e8a0.html': '/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안',
-    '/pages/event-622ad411e8a0_02.html': '/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안',
-    '/pages/event-622ad411e8a0_03.html': '/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안',
-    '/pages/event-622ad411e8a0_04.html': '/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안',
-    '/pages/event-622ad411e_02.html': '/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안',
-    '/pages/event-622ad411e_03.html': '/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안',
-    '/pages/event-622ad411e_04.html': '/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안',
-    '/pages/event-62ddeebf1.html': '/songdo/슈즈-패션잡화-가을-특가-프로모션',
-    '/pages/event-62ddeebf13f0.html': '/songdo/슈즈-패션잡화-가을-특가-프로모션',
-    '/pages/event-62ddeebf13f0_02.html': '/songdo/슈즈-패션잡화-가을-특가-프로모션',
-    '/pages/event-62ddeebf13f0_03.html': '/songdo/슈즈-패션잡화-가을-특가-프로모션',
-    '/pages/event-62ddeebf13f0_04.html': '/songdo/슈즈-패션잡화-가을-특가-프로모션',
-    '/pages/event-62ddeebf1_02.html': '/songdo/슈즈-패션잡화-가을-특가-프로모션',
-    '/pages/event-62ddeebf1_03.html': '/songdo/슈즈-패션잡화-가을-특가-프로모션',
-    '/pages/event-62ddeebf1_04.html': '/songdo/슈즈-패션잡화-가을-특가-프로모션',
-    '/pages/event-6367ceaf3.html': '/gimpo/버버리-스페셜-프로모션',
-    '/pages/event-6367ceaf39ad.html': '/gimpo/버버리-스페셜-프로모션',
-    '/pages/event-6367ceaf39ad_02.html': '/gimpo/버버리-스페셜-프로모션',
-    '/pages/event-6367ceaf39ad_03.html': '/gimpo/버버리-스페셜-프로모션',
-    '/pages/event-6367ceaf39ad_04.html': '/gimpo/버버리-스페셜-프로모션',
-    '/pages/event-6367ceaf3_02.html': '/gimpo/버버리-스페셜-프로모션',
-    '/pages/event-6367ceaf3_03.html': '/gimpo/버버리-스페셜-프로모션',
-    '/pages/event-6367ceaf3_04.html': '/gimpo/버버리-스페셜-프로모션',
-    '/pages/event-63974e946.html': '/spaceone/도원스타일-계절-메뉴-출시',
-    '/pages/event-63974e946_02.html': '/spaceone/도원스타일-계절-메뉴-출시',
-    '/pages/event-63ae33551.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-80-off',
-    '/pages/event-63ae3355118a.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-80-off',
-    '/pages/event-63ae3355118a_02.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-80-off',
-    '/pages/event-63ae3355118a_03.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-80-off',
-    '/pages/event-63ae3355118a_04.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-80-off',
-    '/pages/event-63ae33551_02.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-80-off',
-    '/pages/event-63ae33551_03.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-80-off',
-    '/pages/event-63ae33551_04.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-80-off',
-    '/pages/event-640a72dbc.html': '/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택',
-    '/pages/event-640a72dbc8d2.html': '/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택',
-    '/pages/event-640a72dbc8d2_02.html': '/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택',
-    '/pages/event-640a72dbc8d2_03.html': '/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택',
-    '/pages/event-640a72dbc8d2_04.html': '/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택',
-    '/pages/event-640a72dbc_02.html': '/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택',
-    '/pages/event-640a72dbc_03.html': '/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택',
-    '/pages/event-640a72dbc_04.html': '/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택',
-    '/pages/event-6566686f5.html': '/songdo/몽블랑-가을-신규-상품-입고',
-    '/pages/event-6566686f57e0.html': '/songdo/몽블랑-홀리데이-기프트-제안',
-    '/pages/event-6566686f57e0_02.html': '/songdo/몽블랑-가을-신규-상품-입고',
-    '/pages/event-6566686f57e0_03.html': '/songdo/몽블랑-가을-신규-상품-입고',
-    '/pages/event-6566686f57e0_04.html': '/songdo/몽블랑-가을-신규-상품-입고',
-    '/pages/event-6566686f5_02.html': '/songdo/몽블랑-가을-신규-상품-입고',
-    '/pages/event-6566686f5_03.html': '/songdo/몽블랑-가을-신규-상품-입고',
-    '/pages/event-6566686f5_04.html': '/songdo/몽블랑-가을-신규-상품-입고',
-    '/pages/event-65ee270c0.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-65ee270c0_02.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-666f12133.html': '/songdo/닌텐도-대작-게임-포켓몬legendza-출시-10-16',
-    '/pages/event-666f12133_02.html': '/songdo/닌텐도-대작-게임-포켓몬legendza-출시-10-16',
-    '/pages/event-66827254b.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-66827254b2cf.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-66827254b2cf_02.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-66827254b2cf_03.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-66827254b2cf_04.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-66827254b_02.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-66827254b_03.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-66827254b_04.html': '/songdo/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-6747c15a7.html': '/spaceone/헤지스-upto-70-off',
-    '/pages/event-6747c15a70d3.html': '/spaceone/헤지스-upto-70-off',
-    '/pages/event-6747c15a70d3_02.html': '/spaceone/헤지스-upto-70-off',
-    '/pages/event-6747c15a70d3_03.html': '/spaceone/헤지스-upto-70-off',
-    '/pages/event-6747c15a70d3_04.html': '/spaceone/헤지스-upto-70-off',
-    '/pages/event-6747c15a7_02.html': '/spaceone/헤지스-upto-70-off',
-    '/pages/event-6747c15a7_03.html': '/spaceone/헤지스-upto-70-off',
-    '/pages/event-6747c15a7_04.html': '/spaceone/헤지스-upto-70-off',
-    '/pages/event-677585246.html': '/songdo/new-open-뭄알로이',
-    '/pages/event-677585246_02.html': '/songdo/new-open-뭄알로이',
-    '/pages/event-677585246_03.html': '/songdo/new-open-뭄알로이',
-    '/pages/event-677585246_04.html': '/songdo/new-open-뭄알로이',
-    '/pages/event-677585246e90.html': '/songdo/new-open-뭄알로이',
-    '/pages/event-677585246e90_02.html': '/songdo/new-open-뭄알로이',
-    '/pages/event-677585246e90_03.html': '/songdo/new-open-뭄알로이',
-    '/pages/event-677585246e90_04.html': '/songdo/new-open-뭄알로이',
-    '/pages/event-68089e6ff.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-68089e6ff4ae.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-68089e6ff4ae_02.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-68089e6ff4ae_03.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-68089e6ff4ae_04.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-68089e6ff_02.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-68089e6ff_03.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-68089e6ff_04.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-685084e76.html': '/songdo/가을-맞이-바람막이-쇼핑-제안',
-    '/pages/event-685084e762ad.html': '/songdo/가을-맞이-바람막이-쇼핑-제안',
-    '/pages/event-685084e762ad_02.html': '/songdo/가을-맞이-바람막이-쇼핑-제안',
-    '/pages/event-685084e762ad_03.html': '/songdo/가을-맞이-바람막이-쇼핑-제안',
-    '/pages/event-685084e762ad_04.html': '/songdo/가을-맞이-바람막이-쇼핑-제안',
-    '/pages/event-685084e76_02.html': '/songdo/가을-맞이-바람막이-쇼핑-제안',
-    '/pages/event-685084e76_03.html': '/songdo/가을-맞이-바람막이-쇼핑-제안',
-    '/pages/event-685084e76_04.html': '/songdo/가을-맞이-바람막이-쇼핑-제안',
-    '/pages/event-6922f1c58.html': '/gimpo/pop-up-로우로우-rawrow',
-    '/pages/event-6922f1c58_02.html': '/gimpo/pop-up-로우로우-rawrow',
-    '/pages/event-6922f1c58_03.html': '/gimpo/pop-up-로우로우-rawrow',
-    '/pages/event-6922f1c58_04.html': '/gimpo/pop-up-로우로우-rawrow',
-    '/pages/event-6922f1c58dcd.html': '/gimpo/pop-up-로우로우-rawrow',
-    '/pages/event-6922f1c58dcd_02.html': '/gimpo/pop-up-로우로우-rawrow',
-    '/pages/event-6922f1c58dcd_03.html': '/gimpo/pop-up-로우로우-rawrow',
-    '/pages/event-6922f1c58dcd_04.html': '/gimpo/pop-up-로우로우-rawrow',
-    '/pages/event-6ae98d3f0.html': '/songdo/송현아-카페-추천-②',
-    '/pages/event-6ae98d3f07c5.html': '/songdo/송현아-카페-추천-②',
-    '/pages/event-6ae98d3f07c5_02.html': '/songdo/송현아-카페-추천-②',
-    '/pages/event-6ae98d3f07c5_03.html': '/songdo/송현아-카페-추천-②',
-    '/pages/event-6ae98d3f07c5_04.html': '/songdo/송현아-카페-추천-②',
-    '/pages/event-6ae98d3f0_02.html': '/songdo/송현아-카페-추천-②',
-    '/pages/event-6ae98d3f0_03.html': '/songdo/송현아-카페-추천-②',
-    '/pages/event-6ae98d3f0_04.html': '/songdo/송현아-카페-추천-②',
-    '/pages/event-6b61ccbb9.html': '/spaceone/비클린-beclean-ttth',
-    '/pages/event-6b61ccbb9_02.html': '/spaceone/비클린-beclean-ttth',
-    '/pages/event-6b61ccbb9_03.html': '/spaceone/비클린-beclean-ttth',
-    '/pages/event-6b61ccbb9_04.html': '/spaceone/비클린-beclean-ttth',
-    '/pages/event-6b61ccbb9d81.html': '/spaceone/비클린-beclean-ttth',
-    '/pages/event-6b61ccbb9d81_02.html': '/spaceone/비클린-beclean-ttth',
-    '/pages/event-6b61ccbb9d81_03.html': '/spaceone/비클린-beclean-ttth',
-    '/pages/event-6b61ccbb9d81_04.html': '/spaceone/비클린-beclean-ttth',
-    '/pages/event-6b8ed3b94.html': '/spaceone/라코스테-스페셜-프로모션',
-    '/pages/event-6b8ed3b94_02.html': '/spaceone/라코스테-스페셜-프로모션',
-    '/pages/event-6b8ed3b94_03.html': '/spaceone/라코스테-스페셜-프로모션',
-    '/pages/event-6b8ed3b94_04.html': '/spaceone/라코스테-스페셜-프로모션',
-    '/pages/event-6b8ed3b94df3.html': '/spaceone/next-weekend-라코스테-최대-80-클리어런스',
-    '/pages/event-6b8ed3b94df3_02.html': '/spaceone/라코스테-스페셜-프로모션',
-    '/pages/event-6b8ed3b94df3_03.html': '/spaceone/라코스테-스페셜-프로모션',
-    '/pages/event-6b8ed3b94df3_04.html': '/spaceone/라코스테-스페셜-프로모션',
-    '/pages/event-6c13b07fc.html': '/spaceone/family-weekend-즈윌링-더-드림세일',
-    '/pages/event-6c13b07fc_02.html': '/spaceone/family-weekend-즈윌링-더-드림세일',
-    '/pages/event-6c4391f88.html': '/gimpo/new-open-double-jd-더블제이디',
-    '/pages/event-6c4391f88_02.html': '/gimpo/new-open-double-jd-더블제이디',
-    '/pages/event-6c4391f88_03.html': '/gimpo/new-open-double-jd-더블제이디',
-    '/pages/event-6c4391f88_04.html': '/gimpo/new-open-double-jd-더블제이디',
-    '/pages/event-6c4391f88ed1.html': '/gimpo/new-open-double-jd-더블제이디',
-    '/pages/event-6c4391f88ed1_02.html': '/gimpo/new-open-double-jd-더블제이디',
-    '/pages/event-6c4391f88ed1_03.html': '/gimpo/new-open-double-jd-더블제이디',
-    '/pages/event-6c4391f88ed1_04.html': '/gimpo/new-open-double-jd-더블제이디',
-    '/pages/event-6c73601ac.html': '/spaceone/pop-up-브렌우드-최대-70-할인',
-    '/pages/event-6c73601ac8f0.html': '/spaceone/pop-up-브렌우드-최대-70-할인',
-    '/pages/event-6c73601ac8f0_02.html': '/spaceone/pop-up-브렌우드-최대-70-할인',
-    '/pages/event-6c73601ac8f0_03.html': '/spaceone/pop-up-브렌우드-최대-70-할인',
-    '/pages/event-6c73601ac8f0_04.html': '/spaceone/pop-up-브렌우드-최대-70-할인',
-    '/pages/event-6c73601ac_02.html': '/spaceone/pop-up-브렌우드-최대-70-할인',
-    '/pages/event-6c73601ac_03.html': '/spaceone/pop-up-브렌우드-최대-70-할인',
-    '/pages/event-6c73601ac_04.html': '/spaceone/pop-up-브렌우드-최대-70-할인',
-    '/pages/event-6ccb890c7.html': '/songdo/뉴발란스-fw-인기-상품-특가전',
-    '/pages/event-6ccb890c7_02.html': '/songdo/뉴발란스-fw-인기-상품-특가전',
-    '/pages/event-6ccb890c7_03.html': '/songdo/뉴발란스-fw-인기-상품-특가전',
-    '/pages/event-6ccb890c7_04.html': '/songdo/뉴발란스-fw-인기-상품-특가전',
-    '/pages/event-6ccb890c7acb.html': '/songdo/뉴발란스-fw-인기-상품-특가전',
-    '/pages/event-6ccb890c7acb_02.html': '/songdo/뉴발란스-fw-인기-상품-특가전',
-    '/pages/event-6ccb890c7acb_03.html': '/songdo/뉴발란스-fw-인기-상품-특가전',
-    '/pages/event-6ccb890c7acb_04.html': '/songdo/뉴발란스-fw-인기-상품-특가전',
-    '/pages/event-6d3d09dc2.html': '/gimpo/스포츠-special-week',
-    '/pages/event-6d3d09dc26c3.html': '/gimpo/스포츠-special-week',
-    '/pages/event-6d3d09dc26c3_02.html': '/gimpo/스포츠-special-week',
-    '/pages/event-6d3d09dc26c3_03.html': '/gimpo/스포츠-special-week',
-    '/pages/event-6d3d09dc26c3_04.html': '/gimpo/스포츠-special-week',
-    '/pages/event-6d3d09dc2_02.html': '/gimpo/스포츠-special-week',
-    '/pages/event-6d3d09dc2_03.html': '/gimpo/스포츠-special-week',
-    '/pages/event-6d3d09dc2_04.html': '/gimpo/스포츠-special-week',
-    '/pages/event-6e04b38a8.html': '/gimpo/쿠론-닥스-핸드백-up-to-70-특가전',
-    '/pages/event-6e04b38a8_02.html': '/gimpo/쿠론-닥스-핸드백-up-to-70-특가전',
-    '/pages/event-6e87546d4.html': '/gimpo/coming-soon-노스페이스-에디션',
-    '/pages/event-6e87546d4788.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에-ⅰ',
-    '/pages/event-6e87546d4788_02.html': '/gimpo/coming-soon-노스페이스-에디션',
-    '/pages/event-6e87546d4788_03.html': '/gimpo/coming-soon-노스페이스-에디션',
-    '/pages/event-6e87546d4788_04.html': '/gimpo/coming-soon-노스페이스-에디션',
-    '/pages/event-6e87546d4_02.html': '/gimpo/coming-soon-노스페이스-에디션',
-    '/pages/event-6e87546d4_03.html': '/gimpo/coming-soon-노스페이스-에디션',
-    '/pages/event-6e87546d4_04.html': '/gimpo/coming-soon-노스페이스-에디션',
-    '/pages/event-6f6a163a3.html': '/songdo/new-open-듀베티카-duvetica',
-    '/pages/event-6f6a163a334e.html': '/songdo/듀베티카-duvetica-프리미엄-패딩-특가',
-    '/pages/event-6f6a163a334e_02.html': '/songdo/new-open-듀베티카-duvetica',
-    '/pages/event-6f6a163a334e_03.html': '/songdo/new-open-듀베티카-duvetica',
-    '/pages/event-6f6a163a334e_04.html': '/songdo/new-open-듀베티카-duvetica',
-    '/pages/event-6f6a163a3_02.html': '/songdo/new-open-듀베티카-duvetica',
-    '/pages/event-6f6a163a3_03.html': '/songdo/new-open-듀베티카-duvetica',
-    '/pages/event-6f6a163a3_04.html': '/songdo/new-open-듀베티카-duvetica',
-    '/pages/event-70049fe07.html': '/gimpo/삼성물산-family-스페셜데이-프로모션',
-    '/pages/event-70049fe070a7.html': '/gimpo/삼성물산-family-스페셜데이-프로모션',
-    '/pages/event-70049fe070a7_02.html': '/gimpo/삼성물산-family-스페셜데이-프로모션',
-    '/pages/event-70049fe070a7_03.html': '/gimpo/삼성물산-family-스페셜데이-프로모션',
-    '/pages/event-70049fe070a7_04.html': '/gimpo/삼성물산-family-스페셜데이-프로모션',
-    '/pages/event-70049fe07_02.html': '/gimpo/삼성물산-family-스페셜데이-프로모션',
-    '/pages/event-70049fe07_03.html': '/gimpo/삼성물산-family-스페셜데이-프로모션',
-    '/pages/event-70049fe07_04.html': '/gimpo/삼성물산-family-스페셜데이-프로모션',
-    '/pages/event-714f2fa2f.html': '/spaceone/올리브영-올영세일',
-    '/pages/event-714f2fa2f_02.html': '/spaceone/올리브영-올영세일',
-    '/pages/event-71e86b595.html': '/songdo/아디다스-뉴발란스-언더아머-abc마트-쇼핑-찬스',
-    '/pages/event-71e86b595_02.html': '/gimpo/스포츠-추천상품-제안',
-    '/pages/event-723129073.html': '/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey',
-    '/pages/event-723129073604.html': '/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey',
-    '/pages/event-723129073604_02.html': '/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey',
-    '/pages/event-723129073604_03.html': '/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey',
-    '/pages/event-723129073604_04.html': '/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey',
-    '/pages/event-723129073_02.html': '/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey',
-    '/pages/event-723129073_03.html': '/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey',
-    '/pages/event-723129073_04.html': '/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey',
-    '/pages/event-72d820263.html': '/spaceone/가을-맞이-패밀리-세일-코닥-최대-70',
-    '/pages/event-72d820263_02.html': '/spaceone/가을-맞이-패밀리-세일-코닥-최대-70',
-    '/pages/event-7397ae7fa.html': '/gimpo/시리즈-series-f-w-상품전',
-    '/pages/event-7397ae7fa791.html': '/gimpo/시리즈-series-f-w-상품전',
-    '/pages/event-7397ae7fa791_02.html': '/gimpo/시리즈-series-f-w-상품전',
-    '/pages/event-7397ae7fa791_03.html': '/gimpo/시리즈-series-f-w-상품전',
-    '/pages/event-7397ae7fa791_04.html': '/gimpo/시리즈-series-f-w-상품전',
-    '/pages/event-7397ae7fa_02.html': '/gimpo/시리즈-series-f-w-상품전',
-    '/pages/event-7397ae7fa_03.html': '/gimpo/시리즈-series-f-w-상품전',
-    '/pages/event-7397ae7fa_04.html': '/gimpo/시리즈-series-f-w-상품전',
-    '/pages/event-74420c1b2.html': '/songdo/한섬-브랜드-가을-쇼핑-프로모션',
-    '/pages/event-74420c1b2_02.html': '/songdo/한섬-브랜드-가을-쇼핑-프로모션',
-    '/pages/event-74420c1b2_03.html': '/songdo/한섬-브랜드-가을-쇼핑-프로모션',
-    '/pages/event-74420c1b2_04.html': '/songdo/한섬-브랜드-가을-쇼핑-프로모션',
-    '/pages/event-74420c1b2d06.html': '/songdo/한섬-브랜드-가을-쇼핑-프로모션',
-    '/pages/event-74420c1b2d06_02.html': '/songdo/한섬-브랜드-가을-쇼핑-프로모션',
-    '/pages/event-74420c1b2d06_03.html': '/songdo/한섬-브랜드-가을-쇼핑-프로모션',
-    '/pages/event-74420c1b2d06_04.html': '/songdo/한섬-브랜드-가을-쇼핑-프로모션',
-    '/pages/event-744329474.html': '/gimpo/쌤소나이트-패밀리세일-up-to-90',
-    '/pages/event-744329474_02.html': '/gimpo/쌤소나이트-패밀리세일-up-to-90',
-    '/pages/event-74e9e5099.html': '/spaceone/아이디룩-family-sale',
-    '/pages/event-74e9e509984a.html': '/spaceone/아이디룩-family-sale',
-    '/pages/event-74e9e509984a_02.html': '/spaceone/아이디룩-family-sale',
-    '/pages/event-74e9e509984a_03.html': '/spaceone/아이디룩-family-sale',
-    '/pages/event-74e9e509984a_04.html': '/spaceone/아이디룩-family-sale',
-    '/pages/event-74e9e5099_02.html': '/spaceone/아이디룩-family-sale',
-    '/pages/event-74e9e5099_03.html': '/spaceone/아이디룩-family-sale',
-    '/pages/event-74e9e5099_04.html': '/spaceone/아이디룩-family-sale',
-    '/pages/event-74f14ebfc.html': '/songdo/언더아머-hdex-송도점-단독-프로모션',
-    '/pages/event-74f14ebfc_02.html': '/songdo/언더아머-hdex-송도점-단독-프로모션',
-    '/pages/event-74f14ebfc_03.html': '/songdo/언더아머-hdex-송도점-단독-프로모션',
-    '/pages/event-74f14ebfc_04.html': '/songdo/언더아머-hdex-송도점-단독-프로모션',
-    '/pages/event-74f14ebfcafa.html': '/songdo/언더아머-hdex-송도점-단독-프로모션',
-    '/pages/event-74f14ebfcafa_02.html': '/songdo/언더아머-hdex-송도점-단독-프로모션',
-    '/pages/event-74f14ebfcafa_03.html': '/songdo/언더아머-hdex-송도점-단독-프로모션',
-    '/pages/event-74f14ebfcafa_04.html': '/songdo/언더아머-hdex-송도점-단독-프로모션',
-    '/pages/event-75bffb209.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-75bffb20994e.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-75bffb20994e_02.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-75bffb20994e_03.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-75bffb20994e_04.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-75bffb209_02.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-75bffb209_03.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-75bffb209_04.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-75de3cf71.html': '/spaceone/new-open-프리미엄-골프웨어-사우스케이프',
-    '/pages/event-75de3cf714ad.html': '/spaceone/라이프스타일-골프웨어-사우스케이프',
-    '/pages/event-75de3cf714ad_02.html': '/spaceone/new-open-프리미엄-골프웨어-사우스케이프',
-    '/pages/event-75de3cf714ad_03.html': '/spaceone/new-open-프리미엄-골프웨어-사우스케이프',
-    '/pages/event-75de3cf714ad_04.html': '/spaceone/new-open-프리미엄-골프웨어-사우스케이프',
-    '/pages/event-75de3cf71_02.html': '/spaceone/new-open-프리미엄-골프웨어-사우스케이프',
-    '/pages/event-75de3cf71_03.html': '/spaceone/new-open-프리미엄-골프웨어-사우스케이프',
-    '/pages/event-75de3cf71_04.html': '/spaceone/new-open-프리미엄-골프웨어-사우스케이프',
-    '/pages/event-763af35ab.html': '/gimpo/진캐주얼-스페셜-프로모션',
-    '/pages/event-763af35ab_02.html': '/songdo/마리떼프랑소와저버-가을-아이템-제안',
-    '/pages/event-76e75b4d0.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-76e75b4d09b3.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-76e75b4d09b3_02.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-76e75b4d09b3_03.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-76e75b4d09b3_04.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-76e75b4d0_02.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-76e75b4d0_03.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-76e75b4d0_04.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-77325862e.html': '/songdo/영스트릿-가을-특가전-up-to-70',
-    '/pages/event-77325862e21b.html': '/songdo/영스트릿-가을-특가전-up-to-70',
-    '/pages/event-77325862e21b_02.html': '/songdo/영스트릿-가을-특가전-up-to-70',
-    '/pages/event-77325862e21b_03.html': '/songdo/영스트릿-가을-특가전-up-to-70',
-    '/pages/event-77325862e21b_04.html': '/songdo/영스트릿-가을-특가전-up-to-70',
-    '/pages/event-77325862e_02.html': '/songdo/영스트릿-가을-특가전-up-to-70',
-    '/pages/event-77325862e_03.html': '/songdo/영스트릿-가을-특가전-up-to-70',
-    '/pages/event-77325862e_04.html': '/songdo/영스트릿-가을-특가전-up-to-70',
-    '/pages/event-77871c751.html': '/spaceone/메가박스-영화-6천원-할인',
-    '/pages/event-77871c751_02.html': '/spaceone/메가박스-영화-6천원-할인',
-    '/pages/event-783fa9b4f.html': '/songdo/에이샵-10월-특별-프로모션',
-    '/pages/event-783fa9b4f_02.html': '/songdo/에이샵-10월-특별-프로모션',
-    '/pages/event-7948627c3.html': '/songdo/해외패션-스페셜-프로모션',
-    '/pages/event-7948627c3_02.html': '/songdo/해외패션-스페셜-프로모션',
-    '/pages/event-7948627c3_03.html': '/songdo/해외패션-스페셜-프로모션',
-    '/pages/event-7948627c3_04.html': '/songdo/해외패션-스페셜-프로모션',
-    '/pages/event-7948627c3c9b.html': '/songdo/해외패션-스페셜-프로모션',
-    '/pages/event-7948627c3c9b_02.html': '/songdo/해외패션-스페셜-프로모션',
-    '/pages/event-7948627c3c9b_03.html': '/songdo/해외패션-스페셜-프로모션',
-    '/pages/event-7948627c3c9b_04.html': '/songdo/해외패션-스페셜-프로모션',
-    '/pages/event-7d0d72bbb7f3.html': '/songdo/opening-soon-대원샵-닌텐도-전문점-프리오픈-팝업',
-    '/pages/event-7d0d72bbb7f3_02.html': '/songdo/opening-soon-대원샵-닌텐도-전문점-프리오픈-팝업',
-    '/pages/event-7ddd50b68.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅱ',
-    '/pages/event-7ddd50b68_02.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅱ',
-    '/pages/event-7ddd50b68_03.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅱ',
-    '/pages/event-7ddd50b68_04.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅱ',
-    '/pages/event-7ddd50b68e49.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅱ',
-    '/pages/event-7ddd50b68e49_02.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅱ',
-    '/pages/event-7ddd50b68e49_03.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅱ',
-    '/pages/event-7ddd50b68e49_04.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅱ',
-    '/pages/event-7dfd93be7.html': '/spaceone/파브르의-비밀노트-곤충-파충류-체험전',
-    '/pages/event-7dfd93be7_02.html': '/spaceone/파브르의-비밀노트-곤충-파충류-체험전',
-    '/pages/event-7dfd93be7_03.html': '/spaceone/파브르의-비밀노트-곤충-파충류-체험전',
-    '/pages/event-7dfd93be7_04.html': '/spaceone/파브르의-비밀노트-곤충-파충류-체험전',
-    '/pages/event-7dfd93be7b3d.html': '/spaceone/현대아울렛-캠프닉-호로로랑-캠핑-가자',
-    '/pages/event-7dfd93be7b3d_02.html': '/spaceone/파브르의-비밀노트-곤충-파충류-체험전',
-    '/pages/event-7dfd93be7b3d_03.html': '/spaceone/파브르의-비밀노트-곤충-파충류-체험전',
-    '/pages/event-7dfd93be7b3d_04.html': '/spaceone/파브르의-비밀노트-곤충-파충류-체험전',
-    '/pages/event-7f3d15746.html': '/spaceone/7大-클리어런스-레노마-빨질레리-up-to-90-off',
-    '/pages/event-7f3d15746_02.html': '/spaceone/7大-클리어런스-레노마-빨질레리-up-to-90-off',
-    '/pages/event-806ba72a3.html': '/songdo/happy-holiday-영-스트릿-프로모션',
-    '/pages/event-806ba72a3_02.html': '/songdo/happy-holiday-영-스트릿-프로모션',
-    '/pages/event-806ba72a3_03.html': '/songdo/happy-holiday-영-스트릿-프로모션',
-    '/pages/event-806ba72a3_04.html': '/songdo/happy-holiday-영-스트릿-프로모션',
-    '/pages/event-806ba72a3adf.html': '/songdo/happy-holiday-영-스트릿-프로모션',
-    '/pages/event-806ba72a3adf_02.html': '/songdo/happy-holiday-영-스트릿-프로모션',
-    '/pages/event-806ba72a3adf_03.html': '/songdo/happy-holiday-영-스트릿-프로모션',
-    '/pages/event-806ba72a3adf_04.html': '/songdo/happy-holiday-영-스트릿-프로모션',
-    '/pages/event-81d323b9c.html': '/spaceone/new-open-정희',
-    '/pages/event-81d323b9c_02.html': '/spaceone/new-open-정희',
-    '/pages/event-83e1a193e.html': '/spaceone/아디다스팩토리-추가-할인-프로모션',
-    '/pages/event-83e1a193e_02.html': '/spaceone/아디다스팩토리-추가-할인-프로모션',
-    '/pages/event-84bd0aa1cad2.html': '/gimpo/폴로-랄프로렌-신상품-제안',
-    '/pages/event-84e2fd6c2.html': '/gimpo/아이러브제이-특가전-up-to-50',
-    '/pages/event-84e2fd6c2_02.html': '/gimpo/아이러브제이-특가전-up-to-50',
-    '/pages/event-8509a302a.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ',
-    '/pages/event-8509a302a138.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ',
-    '/pages/event-8509a302a138_02.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ',
-    '/pages/event-8509a302a138_03.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ',
-    '/pages/event-8509a302a138_04.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ',
-    '/pages/event-8509a302a_02.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ',
-    '/pages/event-8509a302a_03.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ',
-    '/pages/event-8509a302a_04.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ',
-    '/pages/event-85f4e3c16.html': '/spaceone/space1-쇼핑大축제-슈퍼h페스타',
-    '/pages/event-85f4e3c165b6.html': '/spaceone/space1-쇼핑大축제-슈퍼h페스타',
-    '/pages/event-85f4e3c165b6_02.html': '/spaceone/space1-쇼핑大축제-슈퍼h페스타',
-    '/pages/event-85f4e3c165b6_03.html': '/spaceone/space1-쇼핑大축제-슈퍼h페스타',
-    '/pages/event-85f4e3c165b6_04.html': '/spaceone/space1-쇼핑大축제-슈퍼h페스타',
-    '/pages/event-85f4e3c16_02.html': '/spaceone/space1-쇼핑大축제-슈퍼h페스타',
-    '/pages/event-85f4e3c16_03.html': '/spaceone/space1-쇼핑大축제-슈퍼h페스타',
-    '/pages/event-85f4e3c16_04.html': '/spaceone/space1-쇼핑大축제-슈퍼h페스타',
-    '/pages/event-86b93f82a.html': '/songdo/ready-to-f-w-여성패션-신상품-입고',
-    '/pages/event-86b93f82a6ac.html': '/songdo/여성패션-가을-신상품-입고',
-    '/pages/event-86b93f82a6ac_02.html': '/songdo/ready-to-f-w-여성패션-신상품-입고',
-    '/pages/event-86b93f82a6ac_03.html': '/songdo/ready-to-f-w-여성패션-신상품-입고',
-    '/pages/event-86b93f82a6ac_04.html': '/songdo/ready-to-f-w-여성패션-신상품-입고',
-    '/pages/event-86b93f82a_02.html': '/songdo/ready-to-f-w-여성패션-신상품-입고',
-    '/pages/event-86b93f82a_03.html': '/songdo/ready-to-f-w-여성패션-신상품-입고',
-    '/pages/event-86b93f82a_04.html': '/songdo/ready-to-f-w-여성패션-신상품-입고',
-    '/pages/event-871dbdfa9.html': '/songdo/송현아-카페-추천-①',
-    '/pages/event-871dbdfa91d7.html': '/songdo/송현아-카페-추천-①',
-    '/pages/event-871dbdfa91d7_02.html': '/songdo/송현아-카페-추천-①',
-    '/pages/event-871dbdfa91d7_03.html': '/songdo/송현아-카페-추천-①',
-    '/pages/event-871dbdfa91d7_04.html': '/songdo/송현아-카페-추천-①',
-    '/pages/event-871dbdfa9_02.html': '/songdo/송현아-카페-추천-①',
-    '/pages/event-871dbdfa9_03.html': '/songdo/송현아-카페-추천-①',
-    '/pages/event-871dbdfa9_04.html': '/songdo/송현아-카페-추천-①',
-    '/pages/event-87b9bb1b1.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ',
-    '/pages/event-87b9bb1b1_02.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ',
-    '/pages/event-87b9bb1b1_03.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ',
-    '/pages/event-87b9bb1b1_04.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ',
-    '/pages/event-87b9bb1b1df2.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ',
-    '/pages/event-87b9bb1b1df2_02.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ',
-    '/pages/event-87b9bb1b1df2_03.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ',
-    '/pages/event-87b9bb1b1df2_04.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ',
-    '/pages/event-883692b61.html': '/spaceone/코튼클럽-언더웨어-명절맞이-기프트대전',
-    '/pages/event-883692b610b2.html': '/spaceone/코튼클럽-언더웨어-기프트-대전',
-    '/pages/event-883692b610b2_02.html': '/spaceone/코튼클럽-언더웨어-명절맞이-기프트대전',
-    '/pages/event-883692b610b2_03.html': '/spaceone/코튼클럽-언더웨어-명절맞이-기프트대전',
-    '/pages/event-883692b610b2_04.html': '/spaceone/코튼클럽-언더웨어-명절맞이-기프트대전',
-    '/pages/event-883692b61_02.html': '/spaceone/코튼클럽-언더웨어-명절맞이-기프트대전',
-    '/pages/event-883692b61_03.html': '/spaceone/코튼클럽-언더웨어-명절맞이-기프트대전',
-    '/pages/event-883692b61_04.html': '/spaceone/코튼클럽-언더웨어-명절맞이-기프트대전',
-    '/pages/event-884d36771.html': '/gimpo/리바트-리듬페스타',
-    '/pages/event-884d36771_02.html': '/gimpo/리바트-리듬페스타',
-    '/pages/event-885cae896.html': '/gimpo/삼성패션-festa-르베이지-구호',
-    '/pages/event-885cae896_02.html': '/gimpo/삼성패션-festa-르베이지-구호',
-    '/pages/event-885cae896_03.html': '/gimpo/삼성패션-festa-르베이지-구호',
-    '/pages/event-885cae896_04.html': '/gimpo/삼성패션-festa-르베이지-구호',
-    '/pages/event-885cae896fc4.html': '/gimpo/삼성패션-festa-르베이지-구호',
-    '/pages/event-885cae896fc4_02.html': '/gimpo/삼성패션-festa-르베이지-구호',
-    '/pages/event-885cae896fc4_03.html': '/gimpo/삼성패션-festa-르베이지-구호',
-    '/pages/event-885cae896fc4_04.html': '/gimpo/삼성패션-festa-르베이지-구호',
-    '/pages/event-886ed9adf.html': '/spaceone/new-open-bbc-어스',
-    '/pages/event-886ed9adf_02.html': '/spaceone/bbc-어스-이주의-특가-상품',
-    '/pages/event-89eea47e6.html': '/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off',
-    '/pages/event-89eea47e6_02.html': '/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off',
-    '/pages/event-89eea47e6_03.html': '/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off',
-    '/pages/event-89eea47e6_04.html': '/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off',
-    '/pages/event-89eea47e6f6f.html': '/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off',
-    '/pages/event-89eea47e6f6f_02.html': '/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off',
-    '/pages/event-89eea47e6f6f_03.html': '/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off',
-    '/pages/event-89eea47e6f6f_04.html': '/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off',
-    '/pages/event-8ad581ac4.html': '/songdo/happy-holiday-아울렛-가격에-추가-할인',
-    '/pages/event-8ad581ac4874.html': '/songdo/happy-holiday-아울렛-가격에-추가-할인',
-    '/pages/event-8ad581ac4874_02.html': '/songdo/happy-holiday-아울렛-가격에-추가-할인',
-    '/pages/event-8ad581ac4874_03.html': '/songdo/happy-holiday-아울렛-가격에-추가-할인',
-    '/pages/event-8ad581ac4874_04.html': '/songdo/happy-holiday-아울렛-가격에-추가-할인',
-    '/pages/event-8ad581ac4_02.html': '/songdo/happy-holiday-아울렛-가격에-추가-할인',
-    '/pages/event-8ad581ac4_03.html': '/songdo/happy-holiday-아울렛-가격에-추가-할인',
-    '/pages/event-8ad581ac4_04.html': '/songdo/happy-holiday-아울렛-가격에-추가-할인',
-    '/pages/event-8ae654598.html': '/spaceone/스파이더-류현진-에디션-한정-판매',
-    '/pages/event-8ae654598_02.html': '/spaceone/스파이더-류현진-에디션-한정-판매',
-    '/pages/event-8bc839217.html': '/spaceone/라코스테-only-2days-타임세일',
-    '/pages/event-8bc8392179af.html': '/spaceone/라코스테-only-2days-타임세일',
-    '/pages/event-8bc8392179af_02.html': '/spaceone/라코스테-only-2days-타임세일',
-    '/pages/event-8bc8392179af_03.html': '/spaceone/라코스테-only-2days-타임세일',
-    '/pages/event-8bc8392179af_04.html': '/spaceone/라코스테-only-2days-타임세일',
-    '/pages/event-8bc839217_02.html': '/spaceone/라코스테-only-2days-타임세일',
-    '/pages/event-8bc839217_03.html': '/spaceone/라코스테-only-2days-타임세일',
-    '/pages/event-8bc839217_04.html': '/spaceone/라코스테-only-2days-타임세일',
-    '/pages/event-8c87a3cc5.html': '/gimpo/쌤소나이트-special-week',
-    '/pages/event-8c87a3cc5_02.html': '/gimpo/쌤소나이트-special-week',
-    '/pages/event-8ce597133.html': '/gimpo/new-open-아크메드라비',
-    '/pages/event-8ce597133790.html': '/gimpo/new-in-신상품-제안-아크메드라비',
-    '/pages/event-8ce597133790_02.html': '/gimpo/new-open-아크메드라비',
-    '/pages/event-8ce597133790_03.html': '/gimpo/new-open-아크메드라비',
-    '/pages/event-8ce597133790_04.html': '/gimpo/new-open-아크메드라비',
-    '/pages/event-8ce597133_02.html': '/gimpo/new-open-아크메드라비',
-    '/pages/event-8ce597133_03.html': '/gimpo/new-open-아크메드라비',
-    '/pages/event-8ce597133_04.html': '/gimpo/new-open-아크메드라비',
-    '/pages/event-8cfd9b174.html': '/songdo/새롭게-달라진-아이폰-아이폰-17시리즈-사전-예약',
-    '/pages/event-8cfd9b174_02.html': '/songdo/new-iphone-17-시리즈-출시-기념-구매-혜택',
-    '/pages/event-8d750f5af.html': '/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off',
-    '/pages/event-8d750f5af_02.html': '/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off',
-    '/pages/event-8d750f5af_03.html': '/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off',
-    '/pages/event-8d750f5af_04.html': '/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off',
-    '/pages/event-8d750f5afc73.html': '/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off',
-    '/pages/event-8d750f5afc73_02.html': '/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off',
-    '/pages/event-8d750f5afc73_03.html': '/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off',
-    '/pages/event-8d750f5afc73_04.html': '/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off',
-    '/pages/event-903bfc11f.html': '/spaceone/7大-클리어런스-락앤락-up-to-80-off',
-    '/pages/event-903bfc11f_02.html': '/spaceone/7大-클리어런스-락앤락-up-to-80-off',
-    '/pages/event-903bfc11f_03.html': '/spaceone/7大-클리어런스-락앤락-up-to-80-off',
-    '/pages/event-903bfc11f_04.html': '/spaceone/7大-클리어런스-락앤락-up-to-80-off',
-    '/pages/event-903bfc11fba8.html': '/spaceone/7大-클리어런스-락앤락-up-to-80-off',
-    '/pages/event-903bfc11fba8_02.html': '/spaceone/7大-클리어런스-락앤락-up-to-80-off',
-    '/pages/event-903bfc11fba8_03.html': '/spaceone/7大-클리어런스-락앤락-up-to-80-off',
-    '/pages/event-903bfc11fba8_04.html': '/spaceone/7大-클리어런스-락앤락-up-to-80-off',
-    '/pages/event-90799bd1875f.html': '/spaceone/라코스테-스페셜-프로모션',
-    '/pages/event-90e067fcd.html': '/gimpo/홀리데이빅찬스-아웃도어-프로모션',
-    '/pages/event-90e067fcd_02.html': '/gimpo/홀리데이빅찬스-아웃도어-프로모션',
-    '/pages/event-90e067fcd_03.html': '/gimpo/홀리데이빅찬스-아웃도어-프로모션',
-    '/pages/event-90e067fcd_04.html': '/gimpo/홀리데이빅찬스-아웃도어-프로모션',
-    '/pages/event-90e067fcdeac.html': '/gimpo/홀리데이빅찬스-아웃도어-프로모션',
-    '/pages/event-90e067fcdeac_02.html': '/gimpo/홀리데이빅찬스-아웃도어-프로모션',
-    '/pages/event-90e067fcdeac_03.html': '/gimpo/홀리데이빅찬스-아웃도어-프로모션',
-    '/pages/event-90e067fcdeac_04.html': '/gimpo/홀리데이빅찬스-아웃도어-프로모션',
-    '/pages/event-9149b410b.html': '/gimpo/프리미엄골프-스페셜-혜택',
-    '/pages/event-9149b410b_02.html': '/gimpo/프리미엄골프-스페셜-혜택',
-    '/pages/event-9149b410b_03.html': '/gimpo/프리미엄골프-스페셜-혜택',
-    '/pages/event-9149b410b_04.html': '/gimpo/프리미엄골프-스페셜-혜택',
-    '/pages/event-9149b410bb79.html': '/gimpo/프리미엄골프-스페셜-혜택',
-    '/pages/event-9149b410bb79_02.html': '/gimpo/프리미엄골프-스페셜-혜택',
-    '/pages/event-9149b410bb79_03.html': '/gimpo/프리미엄골프-스페셜-혜택',
-    '/pages/event-9149b410bb79_04.html': '/gimpo/프리미엄골프-스페셜-혜택',
-    '/pages/event-91614a34e.html': '/spaceone/1년에-단한번-소다-닥스-균일가-대전',
-    '/pages/event-91614a34e_02.html': '/spaceone/1년에-단한번-소다-닥스-균일가-대전',
-    '/pages/event-91614a34e_03.html': '/spaceone/1년에-단한번-소다-닥스-균일가-대전',
-    '/pages/event-91614a34e_04.html': '/spaceone/1년에-단한번-소다-닥스-균일가-대전',
-    '/pages/event-91614a34eaf3.html': '/spaceone/1년에-단한번-소다-닥스-균일가-대전',
-    '/pages/event-91614a34eaf3_02.html': '/spaceone/1년에-단한번-소다-닥스-균일가-대전',
-    '/pages/event-91614a34eaf3_03.html': '/spaceone/1년에-단한번-소다-닥스-균일가-대전',
-    '/pages/event-91614a34eaf3_04.html': '/spaceone/1년에-단한번-소다-닥스-균일가-대전',
-    '/pages/event-91df71879.html': '/spaceone/next-weekend-타미힐피거-f-w-최대-70-off',
-    '/pages/event-91df71879_02.html': '/spaceone/next-weekend-타미힐피거-f-w-최대-70-off',
-    '/pages/event-91df71879_03.html': '/spaceone/next-weekend-타미힐피거-f-w-최대-70-off',
-    '/pages/event-91df71879_04.html': '/spaceone/next-weekend-타미힐피거-f-w-최대-70-off',
-    '/pages/event-91df71879b37.html': '/spaceone/가족을-위한-선물-타미힐피거-최대-70-off',
-    '/pages/event-91df71879b37_02.html': '/spaceone/next-weekend-타미힐피거-f-w-최대-70-off',
-    '/pages/event-91df71879b37_03.html': '/spaceone/next-weekend-타미힐피거-f-w-최대-70-off',
-    '/pages/event-91df71879b37_04.html': '/spaceone/next-weekend-타미힐피거-f-w-최대-70-off',
-    '/pages/event-92e7e0483.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92e7e048323e.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92e7e048323e_02.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92e7e048323e_03.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92e7e048323e_04.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92e7e0483_02.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92e7e0483_03.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92e7e0483_04.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92edde30c.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92edde30c0ed.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92edde30c0ed_02.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92edde30c0ed_03.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92edde30c0ed_04.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92edde30c_02.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92edde30c_03.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92edde30c_04.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-92f6f7cbc.html': '/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off',
-    '/pages/event-92f6f7cbc8ca.html': '/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off',
-    '/pages/event-92f6f7cbc8ca_02.html': '/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off',
-    '/pages/event-92f6f7cbc8ca_03.html': '/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off',
-    '/pages/event-92f6f7cbc8ca_04.html': '/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off',
-    '/pages/event-92f6f7cbc_02.html': '/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off',
-    '/pages/event-92f6f7cbc_03.html': '/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off',
-    '/pages/event-92f6f7cbc_04.html': '/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off',
-    '/pages/event-95597a542.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-95597a5425cc.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-95597a5425cc_02.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-95597a5425cc_03.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-95597a5425cc_04.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-95597a542_02.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-95597a542_03.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-95597a542_04.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-95f2f7448.html': '/gimpo/renewal-open-헤지스-종합관',
-    '/pages/event-95f2f7448_02.html': '/gimpo/renewal-open-헤지스-종합관',
-    '/pages/event-95f2f7448_03.html': '/gimpo/renewal-open-헤지스-종합관',
-    '/pages/event-95f2f7448_04.html': '/gimpo/renewal-open-헤지스-종합관',
-    '/pages/event-95f2f7448ac5.html': '/gimpo/renewal-open-헤지스-종합관',
-    '/pages/event-95f2f7448ac5_02.html': '/gimpo/renewal-open-헤지스-종합관',
-    '/pages/event-95f2f7448ac5_03.html': '/gimpo/renewal-open-헤지스-종합관',
-    '/pages/event-95f2f7448ac5_04.html': '/gimpo/renewal-open-헤지스-종합관',
-    '/pages/event-96540a000.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-96540a000619.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-96540a000619_02.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-96540a000619_03.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-96540a000619_04.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-96540a000_02.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-96540a000_03.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-96540a000_04.html': '/gimpo/맛있는-김현아-f-b-제안',
-    '/pages/event-9668e733c.html': '/spaceone/템퍼-스페셜-웨딩-프로모션',
-    '/pages/event-9668e733c_02.html': '/spaceone/템퍼-나사인증-27주년-기념-프로모션',
-    '/pages/event-96a0c06f6.html': '/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀',
-    '/pages/event-96a0c06f603b.html': '/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀',
-    '/pages/event-96a0c06f603b_02.html': '/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀',
-    '/pages/event-96a0c06f603b_03.html': '/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀',
-    '/pages/event-96a0c06f603b_04.html': '/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀',
-    '/pages/event-96a0c06f6_02.html': '/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀',
-    '/pages/event-96a0c06f6_03.html': '/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀',
-    '/pages/event-96a0c06f6_04.html': '/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀',
-    '/pages/event-96b28e37e.html': '/songdo/집-꾸미기-좋은-계절-템퍼-씰리',
-    '/pages/event-96b28e37e_02.html': '/songdo/집-꾸미기-좋은-계절-템퍼-씰리',
-    '/pages/event-96c02eb5b.html': '/songdo/아이잗바바-최대-90-가을-패션-특가전',
-    '/pages/event-96c02eb5b1b0.html': '/songdo/아이잗바바-최대-90-가을-패션-특가전',
-    '/pages/event-96c02eb5b1b0_02.html': '/songdo/아이잗바바-최대-90-가을-패션-특가전',
-    '/pages/event-96c02eb5b1b0_03.html': '/songdo/아이잗바바-최대-90-가을-패션-특가전',
-    '/pages/event-96c02eb5b1b0_04.html': '/songdo/아이잗바바-최대-90-가을-패션-특가전',
-    '/pages/event-96c02eb5b_02.html': '/songdo/아이잗바바-최대-90-가을-패션-특가전',
-    '/pages/event-96c02eb5b_03.html': '/songdo/아이잗바바-최대-90-가을-패션-특가전',
-    '/pages/event-96c02eb5b_04.html': '/songdo/아이잗바바-최대-90-가을-패션-특가전',
-    '/pages/event-980d2377d.html': '/gimpo/ready-for-f-w-무스너클-신상품-제안',
-    '/pages/event-980d2377d4f1.html': '/gimpo/무스너클-스타일-제안',
-    '/pages/event-980d2377d4f1_02.html': '/gimpo/ready-for-f-w-무스너클-신상품-제안',
-    '/pages/event-980d2377d4f1_03.html': '/gimpo/ready-for-f-w-무스너클-신상품-제안',
-    '/pages/event-980d2377d4f1_04.html': '/gimpo/ready-for-f-w-무스너클-신상품-제안',
-    '/pages/event-980d2377d_02.html': '/gimpo/ready-for-f-w-무스너클-신상품-제안',
-    '/pages/event-980d2377d_03.html': '/gimpo/ready-for-f-w-무스너클-신상품-제안',
-    '/pages/event-980d2377d_04.html': '/gimpo/ready-for-f-w-무스너클-신상품-제안',
-    '/pages/event-9857109c3.html': '/spaceone/pop-up-더핀-the-pin',
-    '/pages/event-9857109c3_02.html': '/spaceone/pop-up-더핀-the-pin',
-    '/pages/event-9857109c3_03.html': '/spaceone/pop-up-더핀-the-pin',
-    '/pages/event-9857109c3_04.html': '/spaceone/pop-up-더핀-the-pin',
-    '/pages/event-9857109c3af1.html': '/spaceone/pop-up-더핀-the-pin',
-    '/pages/event-9857109c3af1_02.html': '/spaceone/pop-up-더핀-the-pin',
-    '/pages/event-9857109c3af1_03.html': '/spaceone/pop-up-더핀-the-pin',
-    '/pages/event-9857109c3af1_04.html': '/spaceone/pop-up-더핀-the-pin',
-    '/pages/event-98b2b0b4d.html': '/songdo/골프존-마켓-하반기-골프-대전',
-    '/pages/event-98b2b0b4d_02.html': '/songdo/골프존-마켓-하반기-골프-대전',
-    '/pages/event-98b2b0b4d_03.html': '/songdo/골프존-마켓-하반기-골프-대전',
-    '/pages/event-98b2b0b4d_04.html': '/songdo/골프존-마켓-하반기-골프-대전',
-    '/pages/event-98b2b0b4df13.html': '/songdo/골프존-마켓-하반기-골프-대전',
-    '/pages/event-98b2b0b4df13_02.html': '/songdo/골프존-마켓-하반기-골프-대전',
-    '/pages/event-98b2b0b4df13_03.html': '/songdo/골프존-마켓-하반기-골프-대전',
-    '/pages/event-98b2b0b4df13_04.html': '/songdo/골프존-마켓-하반기-골프-대전',
-    '/pages/event-9975db045.html': '/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off',
-    '/pages/event-9975db0452ff.html': '/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off',
-    '/pages/event-9975db0452ff_02.html': '/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off',
-    '/pages/event-9975db0452ff_03.html': '/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off',
-    '/pages/event-9975db0452ff_04.html': '/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off',
-    '/pages/event-9975db045_02.html': '/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off',
-    '/pages/event-9975db045_03.html': '/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off',
-    '/pages/event-9975db045_04.html': '/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off',
-    '/pages/event-99c463c49.html': '/spaceone/지포어-스페셜-pop-up-최대-65-off',
-    '/pages/event-99c463c49_02.html': '/spaceone/지포어-스페셜-pop-up-최대-65-off',
-    '/pages/event-9a018f2c91dd.html': '/spaceone/coming-soon-나이키-키즈',
-    '/pages/event-9a018f2c91dd_02.html': '/spaceone/coming-soon-나이키-키즈',
-    '/pages/event-9c65b7e53.html': '/songdo/집-꾸미기-좋은-계절-로라애슐리-알리페즈',
-    '/pages/event-9c65b7e53_02.html': '/songdo/집-꾸미기-좋은-계절-로라애슐리-알리페즈',
-    '/pages/event-9ca6e288d.html': '/spaceone/나이키-유나이트-추석-프로모션',
-    '/pages/event-9ca6e288d252.html': '/spaceone/나이키-유나이트-추석-프로모션',
-    '/pages/event-9ca6e288d252_02.html': '/spaceone/나이키-유나이트-추석-프로모션',
-    '/pages/event-9ca6e288d252_03.html': '/spaceone/나이키-유나이트-추석-프로모션',
-    '/pages/event-9ca6e288d252_04.html': '/spaceone/나이키-유나이트-추석-프로모션',
-    '/pages/event-9ca6e288d_02.html': '/spaceone/나이키-유나이트-추석-프로모션',
-    '/pages/event-9ca6e288d_03.html': '/spaceone/나이키-유나이트-추석-프로모션',
-    '/pages/event-9ca6e288d_04.html': '/spaceone/나이키-유나이트-추석-프로모션',
-    '/pages/event-9cde1536b.html': '/spaceone/데상트-그룹전-엄브로-최대-60-off',
-    '/pages/event-9cde1536b_02.html': '/gimpo/renewal-open-엄브로',
-    '/pages/event-9d9287f94.html': '/songdo/코스메틱-클럽-스페셜-프로모션',
-    '/pages/event-9d9287f944e1.html': '/songdo/뷰티-페어-더-코스메틱-클럽-기프트-특가-상품전',
-    '/pages/event-9d9287f944e1_02.html': '/songdo/코스메틱-클럽-스페셜-프로모션',
-    '/pages/event-9d9287f944e1_03.html': '/songdo/코스메틱-클럽-스페셜-프로모션',
-    '/pages/event-9d9287f944e1_04.html': '/songdo/코스메틱-클럽-스페셜-프로모션',
-    '/pages/event-9d9287f94_02.html': '/songdo/코스메틱-클럽-스페셜-프로모션',
-    '/pages/event-9d9287f94_03.html': '/songdo/코스메틱-클럽-스페셜-프로모션',
-    '/pages/event-9d9287f94_04.html': '/songdo/코스메틱-클럽-스페셜-프로모션',
-    '/pages/event-9da89da4a.html': '/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트',
-    '/pages/event-9da89da4a145.html': '/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트',
-    '/pages/event-9da89da4a145_02.html': '/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트',
-    '/pages/event-9da89da4a145_03.html': '/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트',
-    '/pages/event-9da89da4a145_04.html': '/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트',
-    '/pages/event-9da89da4a_02.html': '/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트',
-    '/pages/event-9da89da4a_03.html': '/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트',
-    '/pages/event-9da89da4a_04.html': '/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트',
-    '/pages/event-9e437a6c1.html': '/gimpo/영캐주얼-스페셜-프로모션',
-    '/pages/event-9e437a6c1_02.html': '/spaceone/7大-클리어런스-듀엘-up-to-70-off',
-    '/pages/event-a0d7ab6e0.html': '/spaceone/아쿠쉬네트-대전-②-풋조이-최대-70-off',
-    '/pages/event-a0d7ab6e0_02.html': '/spaceone/퍼포먼스-골프웨어-특가-①-풋조이-최대-70-50-off',
-    '/pages/event-a21f11097.html': '/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off',
-    '/pages/event-a21f11097_02.html': '/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off',
-    '/pages/event-a21f11097_03.html': '/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off',
-    '/pages/event-a21f11097_04.html': '/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off',
-    '/pages/event-a21f11097a44.html': '/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off',
-    '/pages/event-a21f11097a44_02.html': '/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off',
-    '/pages/event-a21f11097a44_03.html': '/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off',
-    '/pages/event-a21f11097a44_04.html': '/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off',
-    '/pages/event-a2977e139.html': '/gimpo/듀베티카-스타일-제안',
-    '/pages/event-a2977e139_02.html': '/gimpo/듀베티카-스타일-제안',
-    '/pages/event-a2977e139_03.html': '/gimpo/듀베티카-스타일-제안',
-    '/pages/event-a2977e139_04.html': '/gimpo/듀베티카-스타일-제안',
-    '/pages/event-a2977e139dad.html': '/gimpo/듀베티카-프리미엄-아우터-특가전-up-to-80-off',
-    '/pages/event-a2977e139dad_02.html': '/gimpo/듀베티카-스타일-제안',
-    '/pages/event-a2977e139dad_03.html': '/gimpo/듀베티카-스타일-제안',
-    '/pages/event-a2977e139dad_04.html': '/gimpo/듀베티카-스타일-제안',
-    '/pages/event-a2cf987e7.html': '/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전',
-    '/pages/event-a2cf987e7_02.html': '/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전',
-    '/pages/event-a2cf987e7_03.html': '/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전',
-    '/pages/event-a2cf987e7_04.html': '/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전',
-    '/pages/event-a2cf987e7dc5.html': '/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전',
-    '/pages/event-a2cf987e7dc5_02.html': '/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전',
-    '/pages/event-a2cf987e7dc5_03.html': '/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전',
-    '/pages/event-a2cf987e7dc5_04.html': '/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전',
-    '/pages/event-a3490810d.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-a3490810d3f2.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-a3490810d3f2_02.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-a3490810d3f2_03.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-a3490810d3f2_04.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-a3490810d_02.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-a3490810d_03.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-a3490810d_04.html': '/spaceone/pop-up-바버-house-of-tartan',
-    '/pages/event-a3fb626c1dc3.html': '/gimpo/ready-for-f-w-영캐주얼-신상품-제안',
-    '/pages/event-a3fb626c1dc3_02.html': '/gimpo/ready-for-f-w-영캐주얼-신상품-제안',
-    '/pages/event-a416d01dd.html': '/spaceone/비클린-beclean-오픈-기념-990원-특가',
-    '/pages/event-a416d01dd15e.html': '/spaceone/비클린-beclean-오픈-기념-990원-특가',
-    '/pages/event-a416d01dd15e_02.html': '/spaceone/비클린-beclean-오픈-기념-990원-특가',
-    '/pages/event-a416d01dd15e_03.html': '/spaceone/비클린-beclean-오픈-기념-990원-특가',
-    '/pages/event-a416d01dd15e_04.html': '/spaceone/비클린-beclean-오픈-기념-990원-특가',
-    '/pages/event-a416d01dd_02.html': '/spaceone/비클린-beclean-오픈-기념-990원-특가',
-    '/pages/event-a416d01dd_03.html': '/spaceone/비클린-beclean-오픈-기념-990원-특가',
-    '/pages/event-a416d01dd_04.html': '/spaceone/비클린-beclean-오픈-기념-990원-특가',
-    '/pages/event-a477de4e5.html': '/spaceone/백미당-해피위크',
-    '/pages/event-a477de4e5_02.html': '/spaceone/백미당-해피위크',
-    '/pages/event-a4b3afff2.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-a4b3afff2_02.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-a4b3afff2_03.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-a4b3afff2_04.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-a4b3afff2cfa.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-a4b3afff2cfa_02.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-a4b3afff2cfa_03.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-a4b3afff2cfa_04.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-a547cc21f.html': '/gimpo/게스-f-w-특가전-up-to-70',
-    '/pages/event-a547cc21f_02.html': '/spaceone/제너럴아이디어-진-베스트-상품전-②',
-    '/pages/event-a698f5476.html': '/songdo/나이키-최대-25-추가-할인',
-    '/pages/event-a698f5476_02.html': '/songdo/나이키-최대-25-추가-할인',
-    '/pages/event-a698f5476_03.html': '/songdo/나이키-최대-25-추가-할인',
-    '/pages/event-a698f5476_04.html': '/songdo/나이키-최대-25-추가-할인',
-    '/pages/event-a698f5476c66.html': '/songdo/나이키-최대-25-추가-할인',
-    '/pages/event-a698f5476c66_02.html': '/songdo/나이키-최대-25-추가-할인',
-    '/pages/event-a698f5476c66_03.html': '/songdo/나이키-최대-25-추가-할인',
-    '/pages/event-a698f5476c66_04.html': '/songdo/나이키-최대-25-추가-할인',
-    '/pages/event-a8148f692.html': '/gimpo/올리브영',
-    '/pages/event-a8148f692514.html': '/gimpo/올리브영',
-    '/pages/event-a8148f692514_02.html': '/gimpo/올리브영',
-    '/pages/event-a8148f692514_03.html': '/gimpo/올리브영',
-    '/pages/event-a8148f692514_04.html': '/gimpo/올리브영',
-    '/pages/event-a8148f692_02.html': '/gimpo/올리브영',
-    '/pages/event-a8148f692_03.html': '/gimpo/올리브영',
-    '/pages/event-a8148f692_04.html': '/gimpo/올리브영',
-    '/pages/event-a849cb38f.html': '/spaceone/new-open-스파이더',
-    '/pages/event-a849cb38f_02.html': '/spaceone/가을-스포츠-기획전-①-스파이더',
-    '/pages/event-a8b9d5881379.html': '/spaceone/파타고니아-전-품목-추가-20-할인',
-    '/pages/event-a90a0ef06.html': '/gimpo/renewal-open-닥스-종합관',
-    '/pages/event-a90a0ef06_02.html': '/gimpo/renewal-open-닥스-종합관',
-    '/pages/event-a9a17b011.html': '/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스',
-    '/pages/event-a9a17b011547.html': '/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스',
-    '/pages/event-a9a17b011547_02.html': '/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스',
-    '/pages/event-a9a17b011547_03.html': '/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스',
-    '/pages/event-a9a17b011547_04.html': '/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스',
-    '/pages/event-a9a17b011_02.html': '/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스',
-    '/pages/event-a9a17b011_03.html': '/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스',
-    '/pages/event-a9a17b011_04.html': '/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스',
-    '/pages/event-a9c2d3707.html': '/songdo/아디다스-최대-30-추가-할인',
-    '/pages/event-a9c2d3707_02.html': '/songdo/아디다스-최대-30-추가-할인',
-    '/pages/event-a9f5f730b.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트',
-    '/pages/event-a9f5f730b1e2.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트',
-    '/pages/event-a9f5f730b1e2_02.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트',
-    '/pages/event-a9f5f730b1e2_03.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트',
-    '/pages/event-a9f5f730b1e2_04.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트',
-    '/pages/event-a9f5f730b_02.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트',
-    '/pages/event-a9f5f730b_03.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트',
-    '/pages/event-a9f5f730b_04.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트',
-    '/pages/event-aa4d6ebc5.html': '/gimpo/슈슈앤크라-특가전-up-to-60',
-    '/pages/event-aa4d6ebc5_02.html': '/gimpo/슈슈앤크라-특가전-up-to-60',
-    '/pages/event-aac1524fc10e.html': '/songdo/pop-up-store-제스프리-키위-로드쇼',
-    '/pages/event-aaf25c164.html': '/songdo/린-lynn-최대-80-가을-패션-인기상품전',
-    '/pages/event-aaf25c16436d.html': '/songdo/린-lynn-최대-80-가을-패션-인기상품전',
-    '/pages/event-aaf25c16436d_02.html': '/songdo/린-lynn-최대-80-가을-패션-인기상품전',
-    '/pages/event-aaf25c16436d_03.html': '/songdo/린-lynn-최대-80-가을-패션-인기상품전',
-    '/pages/event-aaf25c16436d_04.html': '/songdo/린-lynn-최대-80-가을-패션-인기상품전',
-    '/pages/event-aaf25c164_02.html': '/songdo/린-lynn-최대-80-가을-패션-인기상품전',
-    '/pages/event-aaf25c164_03.html': '/songdo/린-lynn-최대-80-가을-패션-인기상품전',
-    '/pages/event-aaf25c164_04.html': '/songdo/린-lynn-최대-80-가을-패션-인기상품전',
-    '/pages/event-ab78f7e1b.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-ab78f7e1b8b0.html': '/spaceone/폴로-랄프로렌-가을-아우터-추천-10-사은-행사',
-    '/pages/event-ab78f7e1b8b0_02.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-ab78f7e1b8b0_03.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-ab78f7e1b8b0_04.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-ab78f7e1b_02.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-ab78f7e1b_03.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-ab78f7e1b_04.html': '/spaceone/폴로-랄프로렌-가을-신상품-제안',
-    '/pages/event-ad9699b25.html': '/spaceone/폴로-랄프로렌-acc-아이템-제안',
-    '/pages/event-ad9699b25_02.html': '/spaceone/폴로-랄프로렌-acc-아이템-제안',
-    '/pages/event-ad9699b25_03.html': '/spaceone/폴로-랄프로렌-acc-아이템-제안',
-    '/pages/event-ad9699b25_04.html': '/spaceone/폴로-랄프로렌-acc-아이템-제안',
-    '/pages/event-ad9699b25c6b.html': '/spaceone/폴로-랄프로렌-acc-아이템-제안',
-    '/pages/event-ad9699b25c6b_02.html': '/spaceone/폴로-랄프로렌-acc-아이템-제안',
-    '/pages/event-ad9699b25c6b_03.html': '/spaceone/폴로-랄프로렌-acc-아이템-제안',
-    '/pages/event-ad9699b25c6b_04.html': '/spaceone/폴로-랄프로렌-acc-아이템-제안',
-    '/pages/event-ad9f0094e.html': '/spaceone/인기-여성의류-사계절-상품-대전',
-    '/pages/event-ad9f0094e79f.html': '/spaceone/인기-여성의류-사계절-상품-대전',
-    '/pages/event-ad9f0094e79f_02.html': '/spaceone/인기-여성의류-사계절-상품-대전',
-    '/pages/event-ad9f0094e79f_03.html': '/spaceone/인기-여성의류-사계절-상품-대전',
-    '/pages/event-ad9f0094e79f_04.html': '/spaceone/인기-여성의류-사계절-상품-대전',
-    '/pages/event-ad9f0094e_02.html': '/spaceone/인기-여성의류-사계절-상품-대전',
-    '/pages/event-ad9f0094e_03.html': '/spaceone/인기-여성의류-사계절-상품-대전',
-    '/pages/event-ad9f0094e_04.html': '/spaceone/인기-여성의류-사계절-상품-대전',
-    '/pages/event-ae544b32b.html': '/gimpo/디스커버리-사계절-상품전',
-    '/pages/event-ae544b32b_02.html': '/gimpo/디스커버리-사계절-상품전',
-    '/pages/event-af59ef9c9152.html': '/spaceone/쌤소나이트-스페셜-프로모션',
-    '/pages/event-b034cd31f.html': '/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가',
-    '/pages/event-b034cd31f933.html': '/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가',
-    '/pages/event-b034cd31f933_02.html': '/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가',
-    '/pages/event-b034cd31f933_03.html': '/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가',
-    '/pages/event-b034cd31f933_04.html': '/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가',
-    '/pages/event-b034cd31f_02.html': '/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가',
-    '/pages/event-b034cd31f_03.html': '/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가',
-    '/pages/event-b034cd31f_04.html': '/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가',
-    '/pages/event-b03caf45a.html': '/songdo/찬바람이-불때-필드위-패션-리더',
-    '/pages/event-b03caf45a94e.html': '/songdo/찬바람이-불때-필드위-패션-리더',
-    '/pages/event-b03caf45a94e_02.html': '/songdo/찬바람이-불때-필드위-패션-리더',
-    '/pages/event-b03caf45a94e_03.html': '/songdo/찬바람이-불때-필드위-패션-리더',
-    '/pages/event-b03caf45a94e_04.html': '/songdo/찬바람이-불때-필드위-패션-리더',
-    '/pages/event-b03caf45a_02.html': '/songdo/찬바람이-불때-필드위-패션-리더',
-    '/pages/event-b03caf45a_03.html': '/songdo/찬바람이-불때-필드위-패션-리더',
-    '/pages/event-b03caf45a_04.html': '/songdo/찬바람이-불때-필드위-패션-리더',
-    '/pages/event-b0a9cde1536b.html': '/spaceone/데상트-그룹전-엄브로-최대-60-off',
-    '/pages/event-b0a9cde1536b_02.html': '/spaceone/데상트-그룹전-엄브로-최대-60-off',
-    '/pages/event-b17071f7e.html': '/spaceone/베베드피노-special-gift-증정',
-    '/pages/event-b17071f7e_02.html': '/spaceone/베베드피노-special-gift-증정',
-    '/pages/event-b1a9a81b1f5e.html': '/spaceone/나이키-유나이트-추가-할인-프로모션',
-    '/pages/event-b1d5b3e4e.html': '/gimpo/스트릿-캐주얼-특가전-ii-up-to-70',
-    '/pages/event-b1d5b3e4e869.html': '/gimpo/스트릿-캐주얼-특가전-ii-up-to-70',
-    '/pages/event-b1d5b3e4e869_02.html': '/gimpo/스트릿-캐주얼-특가전-ii-up-to-70',
-    '/pages/event-b1d5b3e4e869_03.html': '/gimpo/스트릿-캐주얼-특가전-ii-up-to-70',
-    '/pages/event-b1d5b3e4e869_04.html': '/gimpo/스트릿-캐주얼-특가전-ii-up-to-70',
-    '/pages/event-b1d5b3e4e_02.html': '/gimpo/스트릿-캐주얼-특가전-ii-up-to-70',
-    '/pages/event-b1d5b3e4e_03.html': '/gimpo/스트릿-캐주얼-특가전-ii-up-to-70',
-    '/pages/event-b1d5b3e4e_04.html': '/gimpo/스트릿-캐주얼-특가전-ii-up-to-70',
-    '/pages/event-b1dd06a9ebb4.html': '/gimpo/지포어-g-fore-f-w-신상품-제안',
-    '/pages/event-b1dd06a9ebb4_02.html': '/gimpo/지포어-g-fore-f-w-신상품-제안',
-    '/pages/event-b34a90a0ef06.html': '/gimpo/renewal-open-닥스-종합관',
-    '/pages/event-b34a90a0ef06_02.html': '/gimpo/renewal-open-닥스-종합관',
-    '/pages/event-b3bb190d1.html': '/songdo/뉴발란스-최대-20-추가-할인',
-    '/pages/event-b3bb190d1_02.html': '/songdo/뉴발란스-최대-20-추가-할인',
-    '/pages/event-b3bb190d1_03.html': '/songdo/뉴발란스-최대-20-추가-할인',
-    '/pages/event-b3bb190d1_04.html': '/songdo/뉴발란스-최대-20-추가-할인',
-    '/pages/event-b3bb190d1d5c.html': '/songdo/뉴발란스-최대-20-추가-할인',
-    '/pages/event-b3bb190d1d5c_02.html': '/songdo/뉴발란스-최대-20-추가-할인',
-    '/pages/event-b3bb190d1d5c_03.html': '/songdo/뉴발란스-최대-20-추가-할인',
-    '/pages/event-b3bb190d1d5c_04.html': '/songdo/뉴발란스-최대-20-추가-할인',
-    '/pages/event-b3cbd5460.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-b3cbd54602cf.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-b3cbd54602cf_02.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-b3cbd54602cf_03.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-b3cbd54602cf_04.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-b3cbd5460_02.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-b3cbd5460_03.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-b3cbd5460_04.html': '/songdo/new-open-더-코스메틱-컴퍼니-스토어',
-    '/pages/event-b3fcf6f72526.html': '/songdo/new-open-nobis-노비스',
-    '/pages/event-b41459fe5.html': '/songdo/happy-holiday-슈즈-백',
-    '/pages/event-b41459fe5_02.html': '/songdo/happy-holiday-슈즈-백',
-    '/pages/event-b41459fe5_03.html': '/songdo/happy-holiday-슈즈-백',
-    '/pages/event-b41459fe5_04.html': '/songdo/happy-holiday-슈즈-백',
-    '/pages/event-b41459fe5d37.html': '/songdo/happy-holiday-슈즈-백',
-    '/pages/event-b41459fe5d37_02.html': '/songdo/happy-holiday-슈즈-백',
-    '/pages/event-b41459fe5d37_03.html': '/songdo/happy-holiday-슈즈-백',
-    '/pages/event-b41459fe5d37_04.html': '/songdo/happy-holiday-슈즈-백',
-    '/pages/event-b42933b4a.html': '/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off',
-    '/pages/event-b42933b4a0c9.html': '/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off',
-    '/pages/event-b42933b4a0c9_02.html': '/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off',
-    '/pages/event-b42933b4a0c9_03.html': '/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off',
-    '/pages/event-b42933b4a0c9_04.html': '/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off',
-    '/pages/event-b42933b4a_02.html': '/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off',
-    '/pages/event-b42933b4a_03.html': '/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off',
-    '/pages/event-b42933b4a_04.html': '/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off',
-    '/pages/event-b48ae5a30.html': '/songdo/베이직캐주얼-9월-쇼핑-프로모션',
-    '/pages/event-b48ae5a30_02.html': '/songdo/베이직캐주얼-9월-쇼핑-프로모션',
-    '/pages/event-b522c2ea4.html': '/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off',
-    '/pages/event-b522c2ea487e.html': '/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off',
-    '/pages/event-b522c2ea487e_02.html': '/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off',
-    '/pages/event-b522c2ea487e_03.html': '/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off',
-    '/pages/event-b522c2ea487e_04.html': '/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off',
-    '/pages/event-b522c2ea4_02.html': '/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off',
-    '/pages/event-b522c2ea4_03.html': '/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off',
-    '/pages/event-b522c2ea4_04.html': '/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off',
-    '/pages/event-b581df34dcd1.html': '/spaceone/위글위글-프로모션-위글5일장',
-    '/pages/event-b581df34dcd1_02.html': '/spaceone/위글위글-프로모션-위글5일장',
-    '/pages/event-b626c1dc3.html': '/gimpo/ready-for-f-w-영캐주얼-신상품-제안',
-    '/pages/event-b626c1dc3_02.html': '/gimpo/ready-for-f-w-영캐주얼-신상품-제안',
-    '/pages/event-b67b94d94.html': '/spaceone/family-weekend-보니타하우스-세일페스타',
-    '/pages/event-b67b94d94_02.html': '/spaceone/family-weekend-보니타하우스-세일페스타',
-    '/pages/event-b88a4a043.html': '/gimpo/스포츠-special-week-ⅱ',
-    '/pages/event-b88a4a043_02.html': '/spaceone/다이나핏-최대-70-할인-특가전',
-    '/pages/event-b957cf3f6.html': '/songdo/스트릿패션-초특가전-피어-세터-lee',
-    '/pages/event-b957cf3f65b0.html': '/songdo/스트릿패션-초특가전-피어-세터-lee',
-    '/pages/event-b957cf3f65b0_02.html': '/songdo/스트릿패션-초특가전-피어-세터-lee',
-    '/pages/event-b957cf3f65b0_03.html': '/songdo/스트릿패션-초특가전-피어-세터-lee',
-    '/pages/event-b957cf3f65b0_04.html': '/songdo/스트릿패션-초특가전-피어-세터-lee',
-    '/pages/event-b957cf3f6_02.html': '/songdo/스트릿패션-초특가전-피어-세터-lee',
-    '/pages/event-b957cf3f6_03.html': '/songdo/스트릿패션-초특가전-피어-세터-lee',
-    '/pages/event-b957cf3f6_04.html': '/songdo/스트릿패션-초특가전-피어-세터-lee',
-    '/pages/event-b9d1cc396.html': '/spaceone/프리미엄-코스메틱-환절기-추천-상품',
-    '/pages/event-b9d1cc396_02.html': '/spaceone/프리미엄-코스메틱-환절기-추천-상품',
-    '/pages/event-b9d1cc396_03.html': '/spaceone/프리미엄-코스메틱-환절기-추천-상품',
-    '/pages/event-b9d1cc396_04.html': '/spaceone/프리미엄-코스메틱-환절기-추천-상품',
-    '/pages/event-b9d1cc396a44.html': '/spaceone/프리미엄-코스메틱-환절기-추천-상품',
-    '/pages/event-b9d1cc396a44_02.html': '/spaceone/프리미엄-코스메틱-환절기-추천-상품',
-    '/pages/event-b9d1cc396a44_03.html': '/spaceone/프리미엄-코스메틱-환절기-추천-상품',
-    '/pages/event-b9d1cc396a44_04.html': '/spaceone/프리미엄-코스메틱-환절기-추천-상품',
-    '/pages/event-ba0caa083.html': '/songdo/happy-holiday-여성패션-브랜드별-혜택',
-    '/pages/event-ba0caa0837fa.html': '/songdo/happy-holiday-여성패션-브랜드별-혜택',
-    '/pages/event-ba0caa0837fa_02.html': '/songdo/happy-holiday-여성패션-브랜드별-혜택',
-    '/pages/event-ba0caa0837fa_03.html': '/songdo/happy-holiday-여성패션-브랜드별-혜택',
-    '/pages/event-ba0caa0837fa_04.html': '/songdo/happy-holiday-여성패션-브랜드별-혜택',
-    '/pages/event-ba0caa083_02.html': '/songdo/happy-holiday-여성패션-브랜드별-혜택',
-    '/pages/event-ba0caa083_03.html': '/songdo/happy-holiday-여성패션-브랜드별-혜택',
-    '/pages/event-ba0caa083_04.html': '/songdo/happy-holiday-여성패션-브랜드별-혜택',
-    '/pages/event-bacea2684.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-bacea2684_02.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-bacea2684_03.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-bacea2684_04.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-bacea2684a1e.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-bacea2684a1e_02.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-bacea2684a1e_03.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-bacea2684a1e_04.html': '/gimpo/폴로-랄프로렌-10-사은-행사',
-    '/pages/event-bb17d7e59.html': '/gimpo/2025-golf-fair-브랜드별-구매혜택',
-    '/pages/event-bb17d7e59_02.html': '/gimpo/2025-golf-fair-브랜드별-구매혜택',
-    '/pages/event-bb17d7e59_03.html': '/gimpo/2025-golf-fair-브랜드별-구매혜택',
-    '/pages/event-bb17d7e59_04.html': '/gimpo/2025-golf-fair-브랜드별-구매혜택',
-    '/pages/event-bb17d7e59e57.html': '/gimpo/2025-golf-fair-브랜드별-구매혜택',
-    '/pages/event-bb17d7e59e57_02.html': '/gimpo/2025-golf-fair-브랜드별-구매혜택',
-    '/pages/event-bb17d7e59e57_03.html': '/gimpo/2025-golf-fair-브랜드별-구매혜택',
-    '/pages/event-bb17d7e59e57_04.html': '/gimpo/2025-golf-fair-브랜드별-구매혜택',
-    '/pages/event-bb52cbfcd.html': '/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off',
-    '/pages/event-bb52cbfcd_02.html': '/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off',
-    '/pages/event-bb52cbfcd_03.html': '/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off',
-    '/pages/event-bb52cbfcd_04.html': '/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off',
-    '/pages/event-bb52cbfcdf83.html': '/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off',
-    '/pages/event-bb52cbfcdf83_02.html': '/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off',
-    '/pages/event-bb52cbfcdf83_03.html': '/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off',
-    '/pages/event-bb52cbfcdf83_04.html': '/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off',
-    '/pages/event-bbe221210.html': '/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니',
-    '/pages/event-bbe22121045c.html': '/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니',
-    '/pages/event-bbe22121045c_02.html': '/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니',
-    '/pages/event-bbe22121045c_03.html': '/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니',
-    '/pages/event-bbe22121045c_04.html': '/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니',
-    '/pages/event-bbe221210_02.html': '/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니',
-    '/pages/event-bbe221210_03.html': '/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니',
-    '/pages/event-bbe221210_04.html': '/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니',
-    '/pages/event-bc3d29dd2.html': '/songdo/나이키-추가-할인-마지막-3일',
-    '/pages/event-bc3d29dd2025.html': '/songdo/나이키-추가-할인-마지막-3일',
-    '/pages/event-bc3d29dd2025_02.html': '/songdo/나이키-추가-할인-마지막-3일',
-    '/pages/event-bc3d29dd2025_03.html': '/songdo/나이키-추가-할인-마지막-3일',
-    '/pages/event-bc3d29dd2025_04.html': '/songdo/나이키-추가-할인-마지막-3일',
-    '/pages/event-bc3d29dd2_02.html': '/songdo/나이키-추가-할인-마지막-3일',
-    '/pages/event-bc3d29dd2_03.html': '/songdo/나이키-추가-할인-마지막-3일',
-    '/pages/event-bc3d29dd2_04.html': '/songdo/나이키-추가-할인-마지막-3일',
-    '/pages/event-bcb9d7bae.html': '/gimpo/바버-f-w-아우터-제안전',
-    '/pages/event-bcb9d7bae_02.html': '/gimpo/바버-f-w-아우터-제안전',
-    '/pages/event-bdd391f85.html': '/spaceone/아쿠쉬네트-대전-①-타이틀리스트-최대-60-off',
-    '/pages/event-bdd391f85_02.html': '/spaceone/아쿠쉬네트-대전-①-타이틀리스트-최대-60-off',
-    '/pages/event-bdeb0308f.html': '/gimpo/코치-스페셜위크',
-    '/pages/event-bdeb0308f5a5.html': '/gimpo/코치-스페셜위크',
-    '/pages/event-bdeb0308f5a5_02.html': '/gimpo/코치-스페셜위크',
-    '/pages/event-bdeb0308f5a5_03.html': '/gimpo/코치-스페셜위크',
-    '/pages/event-bdeb0308f5a5_04.html': '/gimpo/코치-스페셜위크',
-    '/pages/event-bdeb0308f_02.html': '/gimpo/코치-스페셜위크',
-    '/pages/event-bdeb0308f_03.html': '/gimpo/코치-스페셜위크',
-    '/pages/event-bdeb0308f_04.html': '/gimpo/코치-스페셜위크',
-    '/pages/event-be186aa38.html': '/spaceone/와지트-위크-in-현대아울렛',
-    '/pages/event-be186aa38_02.html': '/spaceone/와지트-위크-in-현대아울렛',
-    '/pages/event-be186aa38_03.html': '/spaceone/와지트-위크-in-현대아울렛',
-    '/pages/event-be186aa38_04.html': '/spaceone/와지트-위크-in-현대아울렛',
-    '/pages/event-be186aa38b6c.html': '/spaceone/와지트-위크-in-현대아울렛',
-    '/pages/event-be186aa38b6c_02.html': '/spaceone/와지트-위크-in-현대아울렛',
-    '/pages/event-be186aa38b6c_03.html': '/spaceone/와지트-위크-in-현대아울렛',
-    '/pages/event-be186aa38b6c_04.html': '/spaceone/와지트-위크-in-현대아울렛',
-    '/pages/event-bede35384.html': '/spaceone/space1-쇼핑大축제-슈퍼price페스타',
-    '/pages/event-bede353842e9.html': '/spaceone/space1-쇼핑大축제-슈퍼price페스타',
-    '/pages/event-bede353842e9_02.html': '/spaceone/space1-쇼핑大축제-슈퍼price페스타',
-    '/pages/event-bede353842e9_03.html': '/spaceone/space1-쇼핑大축제-슈퍼price페스타',
-    '/pages/event-bede353842e9_04.html': '/spaceone/space1-쇼핑大축제-슈퍼price페스타',
-    '/pages/event-bede35384_02.html': '/spaceone/space1-쇼핑大축제-슈퍼price페스타',
-    '/pages/event-bede35384_03.html': '/spaceone/space1-쇼핑大축제-슈퍼price페스타',
-    '/pages/event-bede35384_04.html': '/spaceone/space1-쇼핑大축제-슈퍼price페스타',
-    '/pages/event-bee0007f6768.html': '/spaceone/데상트-그룹전-데상트-최대-50-off',
-    '/pages/event-bee0007f6768_02.html': '/spaceone/데상트-그룹전-데상트-최대-50-off',
-    '/pages/event-beec5aa48.html': '/spaceone/홀리데이-스페셜-패키지',
-    '/pages/event-beec5aa48_02.html': '/spaceone/홀리데이-스페셜-패키지',
-    '/pages/event-beec5aa48_03.html': '/spaceone/홀리데이-스페셜-패키지',
-    '/pages/event-beec5aa48_04.html': '/spaceone/홀리데이-스페셜-패키지',
-    '/pages/event-beec5aa48b5c.html': '/spaceone/인기-브랜드-아울렛-가격에서-추가로-더-할인',
-    '/pages/event-beec5aa48b5c_02.html': '/spaceone/홀리데이-스페셜-패키지',
-    '/pages/event-beec5aa48b5c_03.html': '/spaceone/홀리데이-스페셜-패키지',
-    '/pages/event-beec5aa48b5c_04.html': '/spaceone/홀리데이-스페셜-패키지',
-    '/pages/event-bf6932721.html': '/songdo/마뗑킴-hago-week',
-    '/pages/event-bf6932721_02.html': '/songdo/마뗑킴-hago-week',
-    '/pages/event-c0076022a.html': '/gimpo/renewal-open-파렌-fahren',
-    '/pages/event-c0076022a_02.html': '/gimpo/renewal-open-파렌-fahren',
-    '/pages/event-c07a73abe.html': '/spaceone/pop-up-플리츠미-pleatsme',
-    '/pages/event-c07a73abe_02.html': '/spaceone/pop-up-플리츠미-pleatsme',
-    '/pages/event-c07a73abe_03.html': '/spaceone/pop-up-플리츠미-pleatsme',
-    '/pages/event-c07a73abe_04.html': '/spaceone/pop-up-플리츠미-pleatsme',
-    '/pages/event-c07a73abede9.html': '/spaceone/pop-up-플리츠미-pleatsme',
-    '/pages/event-c07a73abede9_02.html': '/spaceone/pop-up-플리츠미-pleatsme',
-    '/pages/event-c07a73abede9_03.html': '/spaceone/pop-up-플리츠미-pleatsme',
-    '/pages/event-c07a73abede9_04.html': '/spaceone/pop-up-플리츠미-pleatsme',
-    '/pages/event-c0dd9acd8.html': '/songdo/데무-미리보는-가을-겨울-패션-제안',
-    '/pages/event-c0dd9acd8766.html': '/songdo/가을-패션-제안-특가전-데무-쥬크',
-    '/pages/event-c0dd9acd8766_02.html': '/songdo/데무-미리보는-가을-겨울-패션-제안',
-    '/pages/event-c0dd9acd8766_03.html': '/songdo/데무-미리보는-가을-겨울-패션-제안',
-    '/pages/event-c0dd9acd8766_04.html': '/songdo/데무-미리보는-가을-겨울-패션-제안',
-    '/pages/event-c0dd9acd8_02.html': '/songdo/데무-미리보는-가을-겨울-패션-제안',
-    '/pages/event-c0dd9acd8_03.html': '/songdo/데무-미리보는-가을-겨울-패션-제안',
-    '/pages/event-c0dd9acd8_04.html': '/songdo/데무-미리보는-가을-겨울-패션-제안',
-    '/pages/event-c1beba053bbd.html': '/spaceone/오프웍스-super-sale',
-    '/pages/event-c23701a49.html': '/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복',
-    '/pages/event-c23701a49_02.html': '/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복',
-    '/pages/event-c23701a49_03.html': '/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복',
-    '/pages/event-c23701a49_04.html': '/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복',
-    '/pages/event-c23701a49eb3.html': '/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복',
-    '/pages/event-c23701a49eb3_02.html': '/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복',
-    '/pages/event-c23701a49eb3_03.html': '/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복',
-    '/pages/event-c23701a49eb3_04.html': '/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복',
-    '/pages/event-c26543c914a3.html': '/gimpo/pop-up-store-닥터데이빗-명품수선',
-    '/pages/event-c2e7f3fb2.html': '/spaceone/퍼포먼스-골프웨어-특가-②-데상트골프-최대-60-off',
-    '/pages/event-c2e7f3fb2_02.html': '/spaceone/퍼포먼스-골프웨어-특가-②-데상트골프-최대-60-off',
-    '/pages/event-c2f9b6b6e.html': '/songdo/가을-맞이-란제리-특가전-비너스-비비안-外',
-    '/pages/event-c2f9b6b6e5cd.html': '/songdo/가을-맞이-란제리-특가전-비너스-비비안-外',
-    '/pages/event-c2f9b6b6e5cd_02.html': '/songdo/가을-맞이-란제리-특가전-비너스-비비안-外',
-    '/pages/event-c2f9b6b6e5cd_03.html': '/songdo/가을-맞이-란제리-특가전-비너스-비비안-外',
-    '/pages/event-c2f9b6b6e5cd_04.html': '/songdo/가을-맞이-란제리-특가전-비너스-비비안-外',
-    '/pages/event-c2f9b6b6e_02.html': '/songdo/가을-맞이-란제리-특가전-비너스-비비안-外',
-    '/pages/event-c2f9b6b6e_03.html': '/songdo/가을-맞이-란제리-특가전-비너스-비비안-外',
-    '/pages/event-c2f9b6b6e_04.html': '/songdo/가을-맞이-란제리-특가전-비너스-비비안-外',
-    '/pages/event-c2fbe6849.html': '/songdo/opening-soon-코데즈컴바인-언더웨어-게스-언더웨어',
-    '/pages/event-c2fbe6849_02.html': '/songdo/opening-soon-코데즈컴바인-언더웨어-게스-언더웨어',
-    '/pages/event-c353bbd1e.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅰ',
-    '/pages/event-c353bbd1e_02.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅰ',
-    '/pages/event-c353bbd1e_03.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅰ',
-    '/pages/event-c353bbd1e_04.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅰ',
-    '/pages/event-c353bbd1ebcd.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅰ',
-    '/pages/event-c353bbd1ebcd_02.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅰ',
-    '/pages/event-c353bbd1ebcd_03.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅰ',
-    '/pages/event-c353bbd1ebcd_04.html': '/songdo/2025-추석-특선-더-현대적인-선물-ⅰ',
-    '/pages/event-c3608f7af.html': '/spaceone/내셔널지오그래픽키즈-다운-신상품-선공개',
-    '/pages/event-c3608f7af_02.html': '/spaceone/내셔널지오그래픽키즈-다운-신상품-선공개',
-    '/pages/event-c375318fd.html': '/gimpo/베베드피노-아이스비스킷-f-w-특가전-①',
-    '/pages/event-c375318fd_02.html': '/gimpo/베베드피노-아이스비스킷-f-w-특가전-②',
-    '/pages/event-c42fd210d.html': '/songdo/나이키-아디다스-뉴발란스-추가-할인',
-    '/pages/event-c42fd210d_02.html': '/songdo/나이키-아디다스-뉴발란스-추가-할인',
-    '/pages/event-c42fd210d_03.html': '/songdo/나이키-아디다스-뉴발란스-추가-할인',
-    '/pages/event-c42fd210d_04.html': '/songdo/나이키-아디다스-뉴발란스-추가-할인',
-    '/pages/event-c42fd210ddf4.html': '/songdo/나이키-아디다스-뉴발란스-추가-할인',
-    '/pages/event-c42fd210ddf4_02.html': '/songdo/나이키-아디다스-뉴발란스-추가-할인',
-    '/pages/event-c42fd210ddf4_03.html': '/songdo/나이키-아디다스-뉴발란스-추가-할인',
-    '/pages/event-c42fd210ddf4_04.html': '/songdo/나이키-아디다스-뉴발란스-추가-할인',
-    '/pages/event-c4aba12c6.html': '/gimpo/ready-for-f-w-킨더스코너-특가전-up-to-80',
-    '/pages/event-c4aba12c6_02.html': '/gimpo/ready-for-f-w-킨더스코너-특가전-up-to-80',
-    '/pages/event-c4fb440e34f7.html': '/gimpo/파타고니아-스페셜-위켄드-추가-20-off',
-    '/pages/event-c56264ceb.html': '/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off',
-    '/pages/event-c56264ceb_02.html': '/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off',
-    '/pages/event-c56264ceb_03.html': '/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off',
-    '/pages/event-c56264ceb_04.html': '/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off',
-    '/pages/event-c56264cebba4.html': '/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off',
-    '/pages/event-c56264cebba4_02.html': '/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off',
-    '/pages/event-c56264cebba4_03.html': '/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off',
-    '/pages/event-c56264cebba4_04.html': '/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off',
-    '/pages/event-c6b255136.html': '/spaceone/collect-them-all-팜팔스-팝업스토어',
-    '/pages/event-c6b255136_02.html': '/spaceone/collect-them-all-팜팔스-팝업스토어',
-    '/pages/event-c74d825e3.html': '/songdo/골든듀-로제도르-전품목-30-off',
-    '/pages/event-c74d825e3_02.html': '/songdo/골든듀-로제도르-전품목-30-off',
-    '/pages/event-c74d825e3_03.html': '/songdo/골든듀-로제도르-전품목-30-off',
-    '/pages/event-c74d825e3_04.html': '/songdo/골든듀-로제도르-전품목-30-off',
-    '/pages/event-c74d825e3d5a.html': '/songdo/골든듀-로제도르-골든-페스티발-마지막-3일-전품목-20-20-off',
-    '/pages/event-c74d825e3d5a_02.html': '/songdo/골든듀-로제도르-전품목-30-off',
-    '/pages/event-c74d825e3d5a_03.html': '/songdo/골든듀-로제도르-전품목-30-off',
-    '/pages/event-c74d825e3d5a_04.html': '/songdo/골든듀-로제도르-전품목-30-off',
-    '/pages/event-c768457e2.html': '/gimpo/전자랜드-lg전자-전시상품-특가제안',
-    '/pages/event-c768457e2_02.html': '/gimpo/전자랜드-lg전자-전시상품-특가제안',
-    '/pages/event-c768457e2_03.html': '/gimpo/전자랜드-lg전자-전시상품-특가제안',
-    '/pages/event-c768457e2_04.html': '/gimpo/전자랜드-lg전자-전시상품-특가제안',
-    '/pages/event-c768457e2e2a.html': '/gimpo/전자랜드-가전특가제안-아이폰-17',
-    '/pages/event-c768457e2e2a_02.html': '/gimpo/전자랜드-lg전자-전시상품-특가제안',
-    '/pages/event-c768457e2e2a_03.html': '/gimpo/전자랜드-lg전자-전시상품-특가제안',
-    '/pages/event-c768457e2e2a_04.html': '/gimpo/전자랜드-lg전자-전시상품-특가제안',
-    '/pages/event-c779dfa1b.html': '/songdo/스트릿캐주얼-추석-특집전-up-to-80-off',
-    '/pages/event-c779dfa1b2dc.html': '/songdo/스트릿캐주얼-추석-특집전-up-to-80-off',
-    '/pages/event-c779dfa1b2dc_02.html': '/songdo/스트릿캐주얼-추석-특집전-up-to-80-off',
-    '/pages/event-c779dfa1b2dc_03.html': '/songdo/스트릿캐주얼-추석-특집전-up-to-80-off',
-    '/pages/event-c779dfa1b2dc_04.html': '/songdo/스트릿캐주얼-추석-특집전-up-to-80-off',
-    '/pages/event-c779dfa1b_02.html': '/songdo/스트릿캐주얼-추석-특집전-up-to-80-off',
-    '/pages/event-c779dfa1b_03.html': '/songdo/스트릿캐주얼-추석-특집전-up-to-80-off',
-    '/pages/event-c779dfa1b_04.html': '/songdo/스트릿캐주얼-추석-특집전-up-to-80-off',
-    '/pages/event-c97bb6e9c.html': '/spaceone/winelist-김창수-위스키-출시',
-    '/pages/event-c97bb6e9c_02.html': '/spaceone/winelist-가성비-위스키-맥주-추천',
-    '/pages/event-c99714f2fa2f.html': '/spaceone/올리브영-올영세일',
-    '/pages/event-c99714f2fa2f_02.html': '/spaceone/올리브영-올영세일',
-    '/pages/event-c9c28a0b6.html': '/songdo/2025-추석-특선-더-현대적인-선물',
-    '/pages/event-c9c28a0b6646.html': '/songdo/2025-추석-특선-더-현대적인-선물',
-    '/pages/event-c9c28a0b6646_02.html': '/songdo/2025-추석-특선-더-현대적인-선물',
-    '/pages/event-c9c28a0b6646_03.html': '/songdo/2025-추석-특선-더-현대적인-선물',
-    '/pages/event-c9c28a0b6646_04.html': '/songdo/2025-추석-특선-더-현대적인-선물',
-    '/pages/event-c9c28a0b6_02.html': '/songdo/2025-추석-특선-더-현대적인-선물',
-    '/pages/event-c9c28a0b6_03.html': '/songdo/2025-추석-특선-더-현대적인-선물',
-    '/pages/event-c9c28a0b6_04.html': '/songdo/2025-추석-특선-더-현대적인-선물',
-    '/pages/event-ca49f82be.html': '/songdo/아트박스-가을-쇼핑-프로모션',
-    '/pages/event-ca49f82be33e.html': '/songdo/아트박스-가을-득템-쇼핑-제안',
-    '/pages/event-ca49f82be33e_02.html': '/songdo/아트박스-가을-쇼핑-프로모션',
-    '/pages/event-ca49f82be33e_03.html': '/songdo/아트박스-가을-쇼핑-프로모션',
-    '/pages/event-ca49f82be33e_04.html': '/songdo/아트박스-가을-쇼핑-프로모션',
-    '/pages/event-ca49f82be_02.html': '/songdo/아트박스-가을-쇼핑-프로모션',
-    '/pages/event-ca49f82be_03.html': '/songdo/아트박스-가을-쇼핑-프로모션',
-    '/pages/event-ca49f82be_04.html': '/songdo/아트박스-가을-쇼핑-프로모션',
-    '/pages/event-cab9e8140.html': '/spaceone/쁘렝땅-사계절-특가상품-대전',
-    '/pages/event-cab9e8140934.html': '/spaceone/쁘렝땅-사계절-특가상품-대전',
-    '/pages/event-cab9e8140934_02.html': '/spaceone/쁘렝땅-사계절-특가상품-대전',
-    '/pages/event-cab9e8140934_03.html': '/spaceone/쁘렝땅-사계절-특가상품-대전',
-    '/pages/event-cab9e8140934_04.html': '/spaceone/쁘렝땅-사계절-특가상품-대전',
-    '/pages/event-cab9e8140_02.html': '/spaceone/쁘렝땅-사계절-특가상품-대전',
-    '/pages/event-cab9e8140_03.html': '/spaceone/쁘렝땅-사계절-특가상품-대전',
-    '/pages/event-cab9e8140_04.html': '/spaceone/쁘렝땅-사계절-특가상품-대전',
-    '/pages/event-cb3f85f78.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ',
-    '/pages/event-cb3f85f78784.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ',
-    '/pages/event-cb3f85f78784_02.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ',
-    '/pages/event-cb3f85f78784_03.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ',
-    '/pages/event-cb3f85f78784_04.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ',
-    '/pages/event-cb3f85f78_02.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ',
-    '/pages/event-cb3f85f78_03.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ',
-    '/pages/event-cb3f85f78_04.html': '/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ',
-    '/pages/event-cb832cb4d4a4.html': '/gimpo/해외패션-스페셜-혜택',
-    '/pages/event-cb832cb4d4a4_02.html': '/gimpo/해외패션-스페셜-혜택',
-    '/pages/event-cb94e7005.html': '/spaceone/브룩스브라더스-인기-아이템-제안',
-    '/pages/event-cb94e7005_02.html': '/spaceone/브룩스브라더스-인기-아이템-제안',
-    '/pages/event-cb94e7005_03.html': '/spaceone/브룩스브라더스-인기-아이템-제안',
-    '/pages/event-cb94e7005_04.html': '/spaceone/브룩스브라더스-인기-아이템-제안',
-    '/pages/event-cb94e7005d5c.html': '/spaceone/브룩스브라더스-인기-아이템-제안',
-    '/pages/event-cb94e7005d5c_02.html': '/spaceone/브룩스브라더스-인기-아이템-제안',
-    '/pages/event-cb94e7005d5c_03.html': '/spaceone/브룩스브라더스-인기-아이템-제안',
-    '/pages/event-cb94e7005d5c_04.html': '/spaceone/브룩스브라더스-인기-아이템-제안',
-    '/pages/event-cbc13e673.html': '/gimpo/wine-whiskey',
-    '/pages/event-cbc13e6733ce.html': '/gimpo/wine-whiskey',
-    '/pages/event-cbc13e6733ce_02.html': '/gimpo/wine-whiskey',
-    '/pages/event-cbc13e6733ce_03.html': '/gimpo/wine-whiskey',
-    '/pages/event-cbc13e6733ce_04.html': '/gimpo/wine-whiskey',
-    '/pages/event-cbc13e673_02.html': '/gimpo/wine-whiskey',
-    '/pages/event-cbc13e673_03.html': '/gimpo/wine-whiskey',
-    '/pages/event-cbc13e673_04.html': '/gimpo/wine-whiskey',
-    '/pages/event-ce15b0b06.html': '/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전',
-    '/pages/event-ce15b0b06335.html': '/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전',
-    '/pages/event-ce15b0b06335_02.html': '/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전',
-    '/pages/event-ce15b0b06335_03.html': '/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전',
-    '/pages/event-ce15b0b06335_04.html': '/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전',
-    '/pages/event-ce15b0b06_02.html': '/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전',
-    '/pages/event-ce15b0b06_03.html': '/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전',
-    '/pages/event-ce15b0b06_04.html': '/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전',
-    '/pages/event-ce60151fa.html': '/spaceone/퀵실버록시-라스트-찬스-세일',
-    '/pages/event-ce60151fa_02.html': '/spaceone/퀵실버록시-라스트-찬스-세일',
-    '/pages/event-ce67b7608.html': '/gimpo/폴로-랄프로렌-f-w-신상품-제안',
-    '/pages/event-ce67b7608_02.html': '/gimpo/폴로-랄프로렌-f-w-신상품-제안',
-    '/pages/event-ce8bb9ab5.html': '/spaceone/남양주-청년기업-라쿠치-젤라또',
-    '/pages/event-ce8bb9ab5_02.html': '/spaceone/남양주-청년기업-라쿠치-젤라또',
-    '/pages/event-cf32f10f265d.html': '/songdo/pop-up-store-만석닭강정',
-    '/pages/event-cf6f72526.html': '/songdo/new-open-nobis-노비스',
-    '/pages/event-cf6f72526_02.html': '/songdo/new-open-nobis-노비스',
-    '/pages/event-d006e4249.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-d006e42497ec.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-d006e42497ec_02.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-d006e42497ec_03.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-d006e42497ec_04.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-d006e4249_02.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-d006e4249_03.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-d006e4249_04.html': '/songdo/pop-up-바버-barbour-house-of-tartan',
-    '/pages/event-d06a9ebb4.html': '/gimpo/지포어-g-fore-f-w-신상품-제안',
-    '/pages/event-d06a9ebb4_02.html': '/gimpo/프리미엄골프-라운드-스타일-제안-ⅰ',
-    '/pages/event-d07542f34.html': '/spaceone/테일러메이드-가을-특가-상품전-최대-60-off',
-    '/pages/event-d07542f34_02.html': '/spaceone/테일러메이드-가을-특가-상품전-최대-60-off',
-    '/pages/event-d07542f34_03.html': '/spaceone/테일러메이드-가을-특가-상품전-최대-60-off',
-    '/pages/event-d07542f34_04.html': '/spaceone/테일러메이드-가을-특가-상품전-최대-60-off',
-    '/pages/event-d07542f34e9d.html': '/spaceone/테일러메이드-가을-특가-상품전-최대-60-off',
-    '/pages/event-d07542f34e9d_02.html': '/spaceone/테일러메이드-가을-특가-상품전-최대-60-off',
-    '/pages/event-d07542f34e9d_03.html': '/spaceone/테일러메이드-가을-특가-상품전-최대-60-off',
-    '/pages/event-d07542f34e9d_04.html': '/spaceone/테일러메이드-가을-특가-상품전-최대-60-off',
-    '/pages/event-d1da17bce.html': '/spaceone/coming-soon-드로우핏-draw-fit',
-    '/pages/event-d1da17bce_02.html': '/spaceone/new-open-드로우핏-draw-fit',
-    '/pages/event-d22de2cb3.html': '/songdo/opening-soon-대원샵-닌텐도-전문점-9-18-목-오픈',
-    '/pages/event-d22de2cb3_02.html': '/songdo/닌텐도-대원샵-추석-혜택-last-3days',
-    '/pages/event-d59dea9fe.html': '/spaceone/웅가로셔츠-final-균일가전',
-    '/pages/event-d59dea9fe_02.html': '/spaceone/웅가로셔츠-final-균일가전',
-    '/pages/event-d59dea9fe_03.html': '/spaceone/웅가로셔츠-final-균일가전',
-    '/pages/event-d59dea9fe_04.html': '/spaceone/웅가로셔츠-final-균일가전',
-    '/pages/event-d59dea9fef47.html': '/spaceone/웅가로셔츠-final-균일가전',
-    '/pages/event-d59dea9fef47_02.html': '/spaceone/웅가로셔츠-final-균일가전',
-    '/pages/event-d59dea9fef47_03.html': '/spaceone/웅가로셔츠-final-균일가전',
-    '/pages/event-d59dea9fef47_04.html': '/spaceone/웅가로셔츠-final-균일가전',
-    '/pages/event-d5ac9f945.html': '/songdo/해외패션-가방-인기상품-특가전',
-    '/pages/event-d5ac9f94558b.html': '/songdo/해외패션-가방-인기상품-특가전',
-    '/pages/event-d5ac9f94558b_02.html': '/songdo/해외패션-가방-인기상품-특가전',
-    '/pages/event-d5ac9f94558b_03.html': '/songdo/해외패션-가방-인기상품-특가전',
-    '/pages/event-d5ac9f94558b_04.html': '/songdo/해외패션-가방-인기상품-특가전',
-    '/pages/event-d5ac9f945_02.html': '/songdo/해외패션-가방-인기상품-특가전',
-    '/pages/event-d5ac9f945_03.html': '/songdo/해외패션-가방-인기상품-특가전',
-    '/pages/event-d5ac9f945_04.html': '/songdo/해외패션-가방-인기상품-특가전',
-    '/pages/event-d5c11160b.html': '/spaceone/에잇세컨즈-아우터-week',
-    '/pages/event-d5c11160b_02.html': '/spaceone/에잇세컨즈-아우터-week',
-    '/pages/event-d67354950.html': '/spaceone/젝시믹스-골프-라인-시즌-오프',
-    '/pages/event-d67354950_02.html': '/spaceone/젝시믹스-골프-라인-시즌-오프',
-    '/pages/event-d72bbb7f3.html': '/songdo/opening-soon-닌텐도-전문점-대원샵-프리오픈-팝업',
-    '/pages/event-d72bbb7f3_02.html': '/songdo/pop-up-닌텐도-전문점-대원샵-프리오픈-팝업',
-    '/pages/event-d7f52968b.html': '/gimpo/무스너클-special-promotion',
-    '/pages/event-d7f52968b90b.html': '/gimpo/무스너클-스타일-제안',
-    '/pages/event-d7f52968b90b_02.html': '/gimpo/무스너클-special-promotion',
-    '/pages/event-d7f52968b90b_03.html': '/gimpo/무스너클-special-promotion',
-    '/pages/event-d7f52968b90b_04.html': '/gimpo/무스너클-special-promotion',
-    '/pages/event-d7f52968b_02.html': '/gimpo/무스너클-special-promotion',
-    '/pages/event-d7f52968b_03.html': '/gimpo/무스너클-special-promotion',
-    '/pages/event-d7f52968b_04.html': '/gimpo/무스너클-special-promotion',
-    '/pages/event-d8643bc30.html': '/songdo/가을-맞이-런닝-필수템-ⅱ',
-    '/pages/event-d8643bc30_02.html': '/songdo/가을-맞이-런닝-필수템-ⅱ',
-    '/pages/event-d8643bc30_03.html': '/songdo/가을-맞이-런닝-필수템-ⅱ',
-    '/pages/event-d8643bc30_04.html': '/songdo/가을-맞이-런닝-필수템-ⅱ',
-    '/pages/event-d8643bc30c15.html': '/songdo/abc마트-인기-슈즈-쇼핑-찬스',
-    '/pages/event-d8643bc30c15_02.html': '/songdo/가을-맞이-런닝-필수템-ⅱ',
-    '/pages/event-d8643bc30c15_03.html': '/songdo/가을-맞이-런닝-필수템-ⅱ',
-    '/pages/event-d8643bc30c15_04.html': '/songdo/가을-맞이-런닝-필수템-ⅱ',
-    '/pages/event-d8813c7b2.html': '/spaceone/pop-up-하고하우스-팝업스토어',
-    '/pages/event-d8813c7b2598.html': '/songdo/가을-영스트릿-대전-hago스토어-피어-등',
-    '/pages/event-d8813c7b2598_02.html': '/spaceone/pop-up-하고하우스-팝업스토어',
-    '/pages/event-d8813c7b2598_03.html': '/spaceone/pop-up-하고하우스-팝업스토어',
-    '/pages/event-d8813c7b2598_04.html': '/spaceone/pop-up-하고하우스-팝업스토어',
-    '/pages/event-d8813c7b2_02.html': '/spaceone/pop-up-하고하우스-팝업스토어',
-    '/pages/event-d8813c7b2_03.html': '/spaceone/pop-up-하고하우스-팝업스토어',
-    '/pages/event-d8813c7b2_04.html': '/spaceone/pop-up-하고하우스-팝업스토어',
-    '/pages/event-d8cb5a887.html': '/songdo/opening-soon-트래버틴',
-    '/pages/event-d8cb5a887_02.html': '/songdo/opening-soon-트래버틴',
-    '/pages/event-d8cb5a887_03.html': '/songdo/opening-soon-트래버틴',
-    '/pages/event-d8cb5a887_04.html': '/songdo/opening-soon-트래버틴',
-    '/pages/event-d8cb5a887b31.html': '/songdo/opening-soon-트래버틴',
-    '/pages/event-d8cb5a887b31_02.html': '/songdo/opening-soon-트래버틴',
-    '/pages/event-d8cb5a887b31_03.html': '/songdo/opening-soon-트래버틴',
-    '/pages/event-d8cb5a887b31_04.html': '/songdo/opening-soon-트래버틴',
-    '/pages/event-d8f560d4e.html': '/spaceone/나이키-유나이트-리뉴얼-안내',
-    '/pages/event-d8f560d4e_02.html': '/spaceone/나이키-유나이트-리뉴얼-안내',
-    '/pages/event-d9368256f.html': '/gimpo/삼성패션-festa-메종키츠네-비이커-준지',
-    '/pages/event-d9368256f_02.html': '/gimpo/삼성패션-festa-메종키츠네-비이커-준지',
-    '/pages/event-d9368256f_03.html': '/gimpo/삼성패션-festa-메종키츠네-비이커-준지',
-    '/pages/event-d9368256f_04.html': '/gimpo/삼성패션-festa-메종키츠네-비이커-준지',
-    '/pages/event-d9368256fb4a.html': '/gimpo/삼성패션-festa-메종키츠네-비이커-준지',
-    '/pages/event-d9368256fb4a_02.html': '/gimpo/삼성패션-festa-메종키츠네-비이커-준지',
-    '/pages/event-d9368256fb4a_03.html': '/gimpo/삼성패션-festa-메종키츠네-비이커-준지',
-    '/pages/event-d9368256fb4a_04.html': '/gimpo/삼성패션-festa-메종키츠네-비이커-준지',
-    '/pages/event-d959e6ac8.html': '/gimpo/골프-아웃도어-f-w-특가전',
-    '/pages/event-d959e6ac8_02.html': '/gimpo/골프-아웃도어-f-w-특가전',
-    '/pages/event-d959e6ac8_03.html': '/gimpo/골프-아웃도어-f-w-특가전',
-    '/pages/event-d959e6ac8_04.html': '/gimpo/골프-아웃도어-f-w-특가전',
-    '/pages/event-d959e6ac8aa6.html': '/gimpo/골프-아웃도어-f-w-특가전',
-    '/pages/event-d959e6ac8aa6_02.html': '/gimpo/골프-아웃도어-f-w-특가전',
-    '/pages/event-d959e6ac8aa6_03.html': '/gimpo/골프-아웃도어-f-w-특가전',
-    '/pages/event-d959e6ac8aa6_04.html': '/gimpo/골프-아웃도어-f-w-특가전',
-    '/pages/event-d96ae544b32b.html': '/gimpo/디스커버리-사계절-상품전',
-    '/pages/event-d96ae544b32b_02.html': '/gimpo/디스커버리-사계절-상품전',
-    '/pages/event-daddc330b.html': '/spaceone/브룩스브라더스-가을-신상품-제안',
-    '/pages/event-daddc330b11c.html': '/spaceone/브룩스브라더스-가을-신상-제안',
-    '/pages/event-daddc330b11c_02.html': '/spaceone/브룩스브라더스-가을-신상품-제안',
-    '/pages/event-daddc330b11c_03.html': '/spaceone/브룩스브라더스-가을-신상품-제안',
-    '/pages/event-daddc330b11c_04.html': '/spaceone/브룩스브라더스-가을-신상품-제안',
-    '/pages/event-daddc330b_02.html': '/spaceone/브룩스브라더스-가을-신상품-제안',
-    '/pages/event-daddc330b_03.html': '/spaceone/브룩스브라더스-가을-신상품-제안',
-    '/pages/event-daddc330b_04.html': '/spaceone/브룩스브라더스-가을-신상품-제안',
-    '/pages/event-db4d1da17bce.html': '/spaceone/coming-soon-드로우핏-draw-fit',
-    '/pages/event-db4d1da17bce_02.html': '/spaceone/coming-soon-드로우핏-draw-fit',
-    '/pages/event-db958b7d2712.html': '/gimpo/ready-for-f-w-페트레이-특가전',
-    '/pages/event-dc06e1f3d.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-dc06e1f3d3f1.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-dc06e1f3d3f1_02.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-dc06e1f3d3f1_03.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-dc06e1f3d3f1_04.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-dc06e1f3d_02.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-dc06e1f3d_03.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-dc06e1f3d_04.html': '/gimpo/스포츠-스페셜-프로모션',
-    '/pages/event-dc4cb84f0.html': '/spaceone/아이더-아우터-초특가전-최대-75-off',
-    '/pages/event-dc4cb84f0_02.html': '/spaceone/아이더-아우터-초특가전-최대-75-off',
-    '/pages/event-dc4cb84f0_03.html': '/spaceone/아이더-아우터-초특가전-최대-75-off',
-    '/pages/event-dc4cb84f0_04.html': '/spaceone/아이더-아우터-초특가전-최대-75-off',
-    '/pages/event-dc4cb84f0a04.html': '/spaceone/아이더-아우터-초특가전-최대-75-off',
-    '/pages/event-dc4cb84f0a04_02.html': '/spaceone/아이더-아우터-초특가전-최대-75-off',
-    '/pages/event-dc4cb84f0a04_03.html': '/spaceone/아이더-아우터-초특가전-최대-75-off',
-    '/pages/event-dc4cb84f0a04_04.html': '/spaceone/아이더-아우터-초특가전-최대-75-off',
-    '/pages/event-dcb0992a6.html': '/gimpo/renewal-open-뉴발란스-김포점-단독-프로모션',
-    '/pages/event-dcb0992a6_02.html': '/gimpo/renewal-open-뉴발란스-국내-최대매장-open',
-    '/pages/event-de367488a.html': '/gimpo/톰그레이하운드-스타일-제안',
-    '/pages/event-de367488a_02.html': '/gimpo/톰그레이하운드-스타일-제안',
-    '/pages/event-de367488a_03.html': '/gimpo/톰그레이하운드-스타일-제안',
-    '/pages/event-de367488a_04.html': '/gimpo/톰그레이하운드-스타일-제안',
-    '/pages/event-de367488aeff.html': '/gimpo/톰그레이하운드-스타일-제안',
-    '/pages/event-de367488aeff_02.html': '/gimpo/톰그레이하운드-스타일-제안',
-    '/pages/event-de367488aeff_03.html': '/gimpo/톰그레이하운드-스타일-제안',
-    '/pages/event-de367488aeff_04.html': '/gimpo/톰그레이하운드-스타일-제안',
-    '/pages/event-de83115e1.html': '/gimpo/오프라벨-리틀그라운드-f-w-특가전-①',
-    '/pages/event-de83115e1_02.html': '/gimpo/오프라벨-리틀그라운드-f-w-특가전-②',
-    '/pages/event-dec9a72b8.html': '/gimpo/미샤-day-프로모션-up-to-40-20-off',
-    '/pages/event-dec9a72b8_02.html': '/gimpo/미샤-day-프로모션-up-to-40-20-off',
-    '/pages/event-dec9a72b8_03.html': '/gimpo/미샤-day-프로모션-up-to-40-20-off',
-    '/pages/event-dec9a72b8_04.html': '/gimpo/미샤-day-프로모션-up-to-40-20-off',
-    '/pages/event-dec9a72b8df7.html': '/gimpo/미샤-day-프로모션-up-to-40-20-off',
-    '/pages/event-dec9a72b8df7_02.html': '/gimpo/미샤-day-프로모션-up-to-40-20-off',
-    '/pages/event-dec9a72b8df7_03.html': '/gimpo/미샤-day-프로모션-up-to-40-20-off',
-    '/pages/event-dec9a72b8df7_04.html': '/gimpo/미샤-day-프로모션-up-to-40-20-off',
-    '/pages/event-dee665658.html': '/gimpo/아디다스-특가-제안',
-    '/pages/event-dee6656585f3.html': '/gimpo/아디다스-스페셜-프로모션',
-    '/pages/event-dee6656585f3_02.html': '/gimpo/아디다스-특가-제안',
-    '/pages/event-dee6656585f3_03.html': '/gimpo/아디다스-특가-제안',
-    '/pages/event-dee6656585f3_04.html': '/gimpo/아디다스-특가-제안',
-    '/pages/event-dee665658_02.html': '/gimpo/아디다스-특가-제안',
-    '/pages/event-dee665658_03.html': '/gimpo/아디다스-특가-제안',
-    '/pages/event-dee665658_04.html': '/gimpo/아디다스-특가-제안',
-    '/pages/event-e033e15d6.html': '/songdo/바네사브루노-모조에스핀-가을패션-특가전',
-    '/pages/event-e033e15d6_02.html': '/songdo/바네사브루노-모조에스핀-가을패션-특가전',
-    '/pages/event-e033e15d6_03.html': '/songdo/바네사브루노-모조에스핀-가을패션-특가전',
-    '/pages/event-e033e15d6_04.html': '/songdo/바네사브루노-모조에스핀-가을패션-특가전',
-    '/pages/event-e033e15d6c55.html': '/songdo/바네사브루노-모조에스핀-가을패션-특가전',
-    '/pages/event-e033e15d6c55_02.html': '/songdo/바네사브루노-모조에스핀-가을패션-특가전',
-    '/pages/event-e033e15d6c55_03.html': '/songdo/바네사브루노-모조에스핀-가을패션-특가전',
-    '/pages/event-e033e15d6c55_04.html': '/songdo/바네사브루노-모조에스핀-가을패션-특가전',
-    '/pages/event-e0d37432e.html': '/gimpo/캘러웨이-사계절-상품전-up-to-70-off',
-    '/pages/event-e0d37432e_02.html': '/gimpo/캘러웨이-사계절-상품전-up-to-70-off',
-    '/pages/event-e1bd34aa8.html': '/spaceone/가을-스포츠-기획전-②-휠라',
-    '/pages/event-e1bd34aa8_02.html': '/spaceone/가을-스포츠-기획전-②-휠라',
-    '/pages/event-e24501241.html': '/spaceone/뉴발란스-추가-할인-프로모션',
-    '/pages/event-e2450124124f.html': '/spaceone/뉴발란스-추가-할인-프로모션',
-    '/pages/event-e2450124124f_02.html': '/spaceone/뉴발란스-추가-할인-프로모션',
-    '/pages/event-e2450124124f_03.html': '/spaceone/뉴발란스-추가-할인-프로모션',
-    '/pages/event-e2450124124f_04.html': '/spaceone/뉴발란스-추가-할인-프로모션',
-    '/pages/event-e24501241_02.html': '/spaceone/뉴발란스-추가-할인-프로모션',
-    '/pages/event-e24501241_03.html': '/spaceone/뉴발란스-추가-할인-프로모션',
-    '/pages/event-e24501241_04.html': '/spaceone/뉴발란스-추가-할인-프로모션',
-    '/pages/event-e377ef796.html': '/spaceone/winelist-가성비-와인-추천',
-    '/pages/event-e377ef796_02.html': '/spaceone/winelist-가성비-와인-추천',
-    '/pages/event-e4ac446a8.html': '/gimpo/renewal-open-골든듀',
-    '/pages/event-e4ac446a83e4.html': '/gimpo/renewal-open-골든듀',
-    '/pages/event-e4ac446a83e4_02.html': '/gimpo/renewal-open-골든듀',
-    '/pages/event-e4ac446a83e4_03.html': '/gimpo/renewal-open-골든듀',
-    '/pages/event-e4ac446a83e4_04.html': '/gimpo/renewal-open-골든듀',
-    '/pages/event-e4ac446a8_02.html': '/gimpo/renewal-open-골든듀',
-    '/pages/event-e4ac446a8_03.html': '/gimpo/renewal-open-골든듀',
-    '/pages/event-e4ac446a8_04.html': '/gimpo/renewal-open-골든듀',
-    '/pages/event-e534a2bb8.html': '/gimpo/케이투그룹-클리어런스-up-to-70',
-    '/pages/event-e534a2bb8_02.html': '/gimpo/케이투그룹-클리어런스-up-to-70',
-    '/pages/event-e534a2bb8_03.html': '/gimpo/케이투그룹-클리어런스-up-to-70',
-    '/pages/event-e534a2bb8_04.html': '/gimpo/케이투그룹-클리어런스-up-to-70',
-    '/pages/event-e534a2bb8f01.html': '/spaceone/아우터-구매는-지금-아웃도어-아우터-특가-제안',
-    '/pages/event-e534a2bb8f01_02.html': '/gimpo/케이투그룹-클리어런스-up-to-70',
-    '/pages/event-e534a2bb8f01_03.html': '/gimpo/케이투그룹-클리어런스-up-to-70',
-    '/pages/event-e534a2bb8f01_04.html': '/gimpo/케이투그룹-클리어런스-up-to-70',
-    '/pages/event-e663f65ec.html': '/gimpo/페트레이-특가제안',
-    '/pages/event-e663f65ec9e6.html': '/gimpo/renewal-open-페트레이',
-    '/pages/event-e663f65ec9e6_02.html': '/gimpo/페트레이-특가제안',
-    '/pages/event-e663f65ec9e6_03.html': '/gimpo/페트레이-특가제안',
-    '/pages/event-e663f65ec9e6_04.html': '/gimpo/페트레이-특가제안',
-    '/pages/event-e663f65ec_02.html': '/gimpo/페트레이-특가제안',
-    '/pages/event-e663f65ec_03.html': '/gimpo/페트레이-특가제안',
-    '/pages/event-e663f65ec_04.html': '/gimpo/페트레이-특가제안',
-    '/pages/event-e70604cba.html': '/songdo/renewal-open-쁘렝땅',
-    '/pages/event-e70604cba_02.html': '/songdo/renewal-open-쁘렝땅',
-    '/pages/event-e70604cba_03.html': '/songdo/renewal-open-쁘렝땅',
-    '/pages/event-e70604cba_04.html': '/songdo/renewal-open-쁘렝땅',
-    '/pages/event-e70604cbaac1.html': '/songdo/renewal-open-쁘렝땅',
-    '/pages/event-e70604cbaac1_02.html': '/songdo/renewal-open-쁘렝땅',
-    '/pages/event-e70604cbaac1_03.html': '/songdo/renewal-open-쁘렝땅',
-    '/pages/event-e70604cbaac1_04.html': '/songdo/renewal-open-쁘렝땅',
-    '/pages/event-e71cd71ab.html': '/gimpo/미샤-스타일제안',
-    '/pages/event-e71cd71ab_02.html': '/gimpo/미샤-스타일제안',
-    '/pages/event-e71cd71ab_03.html': '/gimpo/미샤-스타일제안',
-    '/pages/event-e71cd71ab_04.html': '/gimpo/미샤-스타일제안',
-    '/pages/event-e71cd71abeae.html': '/gimpo/미샤-스타일제안',
-    '/pages/event-e71cd71abeae_02.html': '/gimpo/미샤-스타일제안',
-    '/pages/event-e71cd71abeae_03.html': '/gimpo/미샤-스타일제안',
-    '/pages/event-e71cd71abeae_04.html': '/gimpo/미샤-스타일제안',
-    '/pages/event-e7b838add.html': '/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off',
-    '/pages/event-e7b838add2f2.html': '/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off',
-    '/pages/event-e7b838add2f2_02.html': '/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off',
-    '/pages/event-e7b838add2f2_03.html': '/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off',
-    '/pages/event-e7b838add2f2_04.html': '/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off',
-    '/pages/event-e7b838add_02.html': '/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off',
-    '/pages/event-e7b838add_03.html': '/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off',
-    '/pages/event-e7b838add_04.html': '/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off',
-    '/pages/event-e89a7770f.html': '/gimpo/ready-for-f-w-듀베티카-아이템-제안',
-    '/pages/event-e89a7770f4de.html': '/gimpo/듀베티카-특가-아이템-제안',
-    '/pages/event-e89a7770f4de_02.html': '/gimpo/ready-for-f-w-듀베티카-아이템-제안',
-    '/pages/event-e89a7770f4de_03.html': '/gimpo/ready-for-f-w-듀베티카-아이템-제안',
-    '/pages/event-e89a7770f4de_04.html': '/gimpo/ready-for-f-w-듀베티카-아이템-제안',
-    '/pages/event-e89a7770f_02.html': '/gimpo/ready-for-f-w-듀베티카-아이템-제안',
-    '/pages/event-e89a7770f_03.html': '/gimpo/ready-for-f-w-듀베티카-아이템-제안',
-    '/pages/event-e89a7770f_04.html': '/gimpo/ready-for-f-w-듀베티카-아이템-제안',
-    '/pages/event-e89bcc065.html': '/songdo/아디다스-최대-20-추가-할인',
-    '/pages/event-e89bcc065640.html': '/songdo/아디다스-최대-20-추가-할인',
-    '/pages/event-e89bcc065640_02.html': '/songdo/아디다스-최대-20-추가-할인',
-    '/pages/event-e89bcc065640_03.html': '/songdo/아디다스-최대-20-추가-할인',
-    '/pages/event-e89bcc065640_04.html': '/songdo/아디다스-최대-20-추가-할인',
-    '/pages/event-e89bcc065_02.html': '/songdo/아디다스-최대-20-추가-할인',
-    '/pages/event-e89bcc065_03.html': '/songdo/아디다스-최대-20-추가-할인',
-    '/pages/event-e89bcc065_04.html': '/songdo/아디다스-최대-20-추가-할인',
-    '/pages/event-e8b6b894d.html': '/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-e8b6b894d0ca.html': '/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-e8b6b894d0ca_02.html': '/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-e8b6b894d0ca_03.html': '/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-e8b6b894d0ca_04.html': '/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-e8b6b894d_02.html': '/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-e8b6b894d_03.html': '/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-e8b6b894d_04.html': '/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에',
-    '/pages/event-e9290e884.html': '/songdo/에코-슈즈-가을-맞이-특가상품전',
-    '/pages/event-e9290e884_02.html': '/songdo/에코-슈즈-가을-맞이-특가상품전',
-    '/pages/event-e9290e884_03.html': '/songdo/에코-슈즈-가을-맞이-특가상품전',
-    '/pages/event-e9290e884_04.html': '/songdo/에코-슈즈-가을-맞이-특가상품전',
-    '/pages/event-e9290e884cf3.html': '/songdo/에코-슈즈-닥스-핸드백-특가-상품전',
-    '/pages/event-e9290e884cf3_02.html': '/songdo/에코-슈즈-가을-맞이-특가상품전',
-    '/pages/event-e9290e884cf3_03.html': '/songdo/에코-슈즈-가을-맞이-특가상품전',
-    '/pages/event-e9290e884cf3_04.html': '/songdo/에코-슈즈-가을-맞이-특가상품전',
-    '/pages/event-e9c8c63e5.html': '/songdo/new-open-광화문-미진',
-    '/pages/event-e9c8c63e51e6.html': '/songdo/new-open-광화문-미진',
-    '/pages/event-e9c8c63e51e6_02.html': '/songdo/new-open-광화문-미진',
-    '/pages/event-e9c8c63e51e6_03.html': '/songdo/new-open-광화문-미진',
-    '/pages/event-e9c8c63e51e6_04.html': '/songdo/new-open-광화문-미진',
-    '/pages/event-e9c8c63e5_02.html': '/songdo/new-open-광화문-미진',
-    '/pages/event-e9c8c63e5_03.html': '/songdo/new-open-광화문-미진',
-    '/pages/event-e9c8c63e5_04.html': '/songdo/new-open-광화문-미진',
-    '/pages/event-e9f374322.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ',
-    '/pages/event-e9f3743228c1.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ',
-    '/pages/event-e9f3743228c1_02.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ',
-    '/pages/event-e9f3743228c1_03.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ',
-    '/pages/event-e9f3743228c1_04.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ',
-    '/pages/event-e9f374322_02.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ',
-    '/pages/event-e9f374322_03.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ',
-    '/pages/event-e9f374322_04.html': '/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ',
-    '/pages/event-e9f8503b7.html': '/gimpo/파타고니아-추가-20-off',
-    '/pages/event-e9f8503b7682.html': '/gimpo/파타고니아-추가-20-off',
-    '/pages/event-e9f8503b7682_02.html': '/gimpo/파타고니아-추가-20-off',
-    '/pages/event-e9f8503b7682_03.html': '/gimpo/파타고니아-추가-20-off',
-    '/pages/event-e9f8503b7682_04.html': '/gimpo/파타고니아-추가-20-off',
-    '/pages/event-e9f8503b7_02.html': '/gimpo/파타고니아-추가-20-off',
-    '/pages/event-e9f8503b7_03.html': '/gimpo/파타고니아-추가-20-off',
-    '/pages/event-e9f8503b7_04.html': '/gimpo/파타고니아-추가-20-off',
-    '/pages/event-ea452d803.html': '/spaceone/헨리코튼-f-w-upto-40-off',
-    '/pages/event-ea452d8036be.html': '/spaceone/헨리코튼-f-w-upto-40-off',
-    '/pages/event-ea452d8036be_02.html': '/spaceone/헨리코튼-f-w-upto-40-off',
-    '/pages/event-ea452d8036be_03.html': '/spaceone/헨리코튼-f-w-upto-40-off',
-    '/pages/event-ea452d8036be_04.html': '/spaceone/헨리코튼-f-w-upto-40-off',
-    '/pages/event-ea452d803_02.html': '/spaceone/헨리코튼-f-w-upto-40-off',
-    '/pages/event-ea452d803_03.html': '/spaceone/헨리코튼-f-w-upto-40-off',
-    '/pages/event-ea452d803_04.html': '/spaceone/헨리코튼-f-w-upto-40-off',
-    '/pages/event-ea57386f7.html': '/gimpo/삼성패션-festa-띠어리-up-to-70',
-    '/pages/event-ea57386f7_02.html': '/gimpo/삼성패션-festa-띠어리-up-to-70',
-    '/pages/event-ea57386f7_03.html': '/gimpo/삼성패션-festa-띠어리-up-to-70',
-    '/pages/event-ea57386f7_04.html': '/gimpo/삼성패션-festa-띠어리-up-to-70',
-    '/pages/event-ea57386f7b53.html': '/gimpo/삼성패션-festa-띠어리-up-to-70',
-    '/pages/event-ea57386f7b53_02.html': '/gimpo/삼성패션-festa-띠어리-up-to-70',
-    '/pages/event-ea57386f7b53_03.html': '/gimpo/삼성패션-festa-띠어리-up-to-70',
-    '/pages/event-ea57386f7b53_04.html': '/gimpo/삼성패션-festa-띠어리-up-to-70',
-    '/pages/event-eae01964f.html': '/gimpo/타미힐피거-f-w-상품전-up-to-70-off',
-    '/pages/event-eae01964f_02.html': '/gimpo/타미힐피거-패밀리-상품전-up-to-70-off',
-    '/pages/event-ebad81fe3.html': '/gimpo/브룩스브라더스-사계절-상품전',
-    '/pages/event-ebad81fe3_02.html': '/gimpo/브룩스브라더스-사계절-상품전',
-    '/pages/event-ed79f9b59.html': '/gimpo/추석맞이-특가전-mlb-up-to-70',
-    '/pages/event-ed79f9b59_02.html': '/gimpo/추석맞이-특가전-mlb-up-to-70',
-    '/pages/event-ed79f9b59_03.html': '/gimpo/추석맞이-특가전-mlb-up-to-70',
-    '/pages/event-ed79f9b59_04.html': '/gimpo/추석맞이-특가전-mlb-up-to-70',
-    '/pages/event-ed79f9b59d00.html': '/gimpo/추석맞이-특가전-mlb-up-to-70',
-    '/pages/event-ed79f9b59d00_02.html': '/gimpo/추석맞이-특가전-mlb-up-to-70',
-    '/pages/event-ed79f9b59d00_03.html': '/gimpo/추석맞이-특가전-mlb-up-to-70',
-    '/pages/event-ed79f9b59d00_04.html': '/gimpo/추석맞이-특가전-mlb-up-to-70',
-    '/pages/event-edf11ac3d.html': '/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다',
-    '/pages/event-edf11ac3d2db.html': '/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다',
-    '/pages/event-edf11ac3d2db_02.html': '/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다',
-    '/pages/event-edf11ac3d2db_03.html': '/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다',
-    '/pages/event-edf11ac3d2db_04.html': '/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다',
-    '/pages/event-edf11ac3d_02.html': '/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다',
-    '/pages/event-edf11ac3d_03.html': '/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다',
-    '/pages/event-edf11ac3d_04.html': '/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다',
-    '/pages/event-efa735f13.html': '/gimpo/리바이스-f-w-시즌특가전-up-to-70',
-    '/pages/event-efa735f13443.html': '/gimpo/추석맞이-특가전-리바이스-up-to-70',
-    '/pages/event-efa735f13443_02.html': '/gimpo/리바이스-f-w-시즌특가전-up-to-70',
-    '/pages/event-efa735f13443_03.html': '/gimpo/리바이스-f-w-시즌특가전-up-to-70',
-    '/pages/event-efa735f13443_04.html': '/gimpo/리바이스-f-w-시즌특가전-up-to-70',
-    '/pages/event-efa735f13_02.html': '/gimpo/리바이스-f-w-시즌특가전-up-to-70',
-    '/pages/event-efa735f13_03.html': '/gimpo/리바이스-f-w-시즌특가전-up-to-70',
-    '/pages/event-efa735f13_04.html': '/gimpo/리바이스-f-w-시즌특가전-up-to-70',
-    '/pages/event-f043aef3d.html': '/songdo/키즈-페스타-아동-브랜드-특별-프로모션',
-    '/pages/event-f043aef3d_02.html': '/songdo/키즈-페스타-아동-브랜드-특별-프로모션',
-    '/pages/event-f0b5d3da4.html': '/songdo/제너럴아이디어-9월-프로모션',
-    '/pages/event-f0b5d3da4_02.html': '/songdo/제너럴아이디어-9월-프로모션',
-    '/pages/event-f0b5d3da4_03.html': '/songdo/제너럴아이디어-9월-프로모션',
-    '/pages/event-f0b5d3da4_04.html': '/songdo/제너럴아이디어-9월-프로모션',
-    '/pages/event-f0b5d3da4cc3.html': '/spaceone/제너럴아이디어-진-베스트-상품전-①',
-    '/pages/event-f0b5d3da4cc3_02.html': '/songdo/제너럴아이디어-9월-프로모션',
-    '/pages/event-f0b5d3da4cc3_03.html': '/songdo/제너럴아이디어-9월-프로모션',
-    '/pages/event-f0b5d3da4cc3_04.html': '/songdo/제너럴아이디어-9월-프로모션',
-    '/pages/event-f11be6597.html': '/songdo/가을-데님-대전-게스-리바이스-ck진',
-    '/pages/event-f11be6597_02.html': '/songdo/가을-데님-대전-게스-리바이스-ck진',
-    '/pages/event-f11be6597_03.html': '/songdo/가을-데님-대전-게스-리바이스-ck진',
-    '/pages/event-f11be6597_04.html': '/songdo/가을-데님-대전-게스-리바이스-ck진',
-    '/pages/event-f11be6597e51.html': '/songdo/가을-데님-대전-게스-리바이스-ck진',
-    '/pages/event-f11be6597e51_02.html': '/songdo/가을-데님-대전-게스-리바이스-ck진',
-    '/pages/event-f11be6597e51_03.html': '/songdo/가을-데님-대전-게스-리바이스-ck진',
-    '/pages/event-f11be6597e51_04.html': '/songdo/가을-데님-대전-게스-리바이스-ck진',
-    '/pages/event-f1efaeeb3.html': '/gimpo/골프존마켓-2025-하반기-골프대전',
-    '/pages/event-f1efaeeb3_02.html': '/gimpo/골프존마켓-2025-하반기-골프대전',
-    '/pages/event-f1efaeeb3_03.html': '/gimpo/골프존마켓-2025-하반기-골프대전',
-    '/pages/event-f1efaeeb3_04.html': '/gimpo/골프존마켓-2025-하반기-골프대전',
-    '/pages/event-f1efaeeb3fba.html': '/gimpo/골프존마켓-2025-하반기-골프대전',
-    '/pages/event-f1efaeeb3fba_02.html': '/gimpo/골프존마켓-2025-하반기-골프대전',
-    '/pages/event-f1efaeeb3fba_03.html': '/gimpo/골프존마켓-2025-하반기-골프대전',
-    '/pages/event-f1efaeeb3fba_04.html': '/gimpo/골프존마켓-2025-하반기-골프대전',
-    '/pages/event-f2b8be75c.html': '/spaceone/미샤-special-week',
-    '/pages/event-f2b8be75c8de.html': '/spaceone/미샤-special-week',
-    '/pages/event-f2b8be75c8de_02.html': '/spaceone/미샤-special-week',
-    '/pages/event-f2b8be75c8de_03.html': '/spaceone/미샤-special-week',
-    '/pages/event-f2b8be75c8de_04.html': '/spaceone/미샤-special-week',
-    '/pages/event-f2b8be75c_02.html': '/spaceone/미샤-special-week',
-    '/pages/event-f2b8be75c_03.html': '/spaceone/미샤-special-week',
-    '/pages/event-f2b8be75c_04.html': '/spaceone/미샤-special-week',
-    '/pages/event-f366ce698.html': '/spaceone/가을-맞이-패밀리-세일-말본-최대-70',
-    '/pages/event-f366ce698_02.html': '/spaceone/가을-맞이-패밀리-세일-말본-최대-70',
-    '/pages/event-f3951ff8c.html': '/spaceone/남양주-청년기업-큐어링랩',
-    '/pages/event-f3951ff8c_02.html': '/spaceone/남양주-청년기업-큐어링랩',
-    '/pages/event-f4387ddb4.html': '/gimpo/ready-for-f-w-베네통-시슬리-up-to-70',
-    '/pages/event-f4387ddb4954.html': '/gimpo/ready-for-f-w-베네통-시슬리-up-to-70',
-    '/pages/event-f4387ddb4954_02.html': '/gimpo/ready-for-f-w-베네통-시슬리-up-to-70',
-    '/pages/event-f4387ddb4954_03.html': '/gimpo/ready-for-f-w-베네통-시슬리-up-to-70',
-    '/pages/event-f4387ddb4954_04.html': '/gimpo/ready-for-f-w-베네통-시슬리-up-to-70',
-    '/pages/event-f4387ddb4_02.html': '/gimpo/ready-for-f-w-베네통-시슬리-up-to-70',
-    '/pages/event-f4387ddb4_03.html': '/gimpo/ready-for-f-w-베네통-시슬리-up-to-70',
-    '/pages/event-f4387ddb4_04.html': '/gimpo/ready-for-f-w-베네통-시슬리-up-to-70',
-    '/pages/event-f4ec74ba0.html': '/spaceone/현아-시그니처-페스티벌-룰렛-이벤트',
-    '/pages/event-f4ec74ba04ac.html': '/spaceone/현아-시그니처-페스티벌-룰렛-이벤트',
-    '/pages/event-f4ec74ba04ac_02.html': '/spaceone/현아-시그니처-페스티벌-룰렛-이벤트',
-    '/pages/event-f4ec74ba04ac_03.html': '/spaceone/현아-시그니처-페스티벌-룰렛-이벤트',
-    '/pages/event-f4ec74ba04ac_04.html': '/spaceone/현아-시그니처-페스티벌-룰렛-이벤트',
-    '/pages/event-f4ec74ba0_02.html': '/spaceone/현아-시그니처-페스티벌-룰렛-이벤트',
-    '/pages/event-f4ec74ba0_03.html': '/spaceone/현아-시그니처-페스티벌-룰렛-이벤트',
-    '/pages/event-f4ec74ba0_04.html': '/spaceone/현아-시그니처-페스티벌-룰렛-이벤트',
-    '/pages/event-f4fc93540.html': '/spaceone/new-open-드로우핏-draw-fit',
-    '/pages/event-f4fc93540_02.html': '/spaceone/new-open-드로우핏-draw-fit',
-    '/pages/event-f50358de6.html': '/gimpo/올영세일',
-    '/pages/event-f50358de6_02.html': '/gimpo/올영세일',
-    '/pages/event-f50358de6_03.html': '/gimpo/올영세일',
-    '/pages/event-f50358de6_04.html': '/gimpo/올영세일',
-    '/pages/event-f50358de6aa5.html': '/gimpo/올영세일',
-    '/pages/event-f50358de6aa5_02.html': '/gimpo/올영세일',
-    '/pages/event-f50358de6aa5_03.html': '/gimpo/올영세일',
-    '/pages/event-f50358de6aa5_04.html': '/gimpo/올영세일',
-    '/pages/event-f51f5a22f.html': '/spaceone/부모님을-위한-선물-페트레이-패딩-특집',
-    '/pages/event-f51f5a22f8cc.html': '/spaceone/부모님을-위한-선물-페트레이-패딩-특집',
-    '/pages/event-f51f5a22f8cc_02.html': '/spaceone/부모님을-위한-선물-페트레이-패딩-특집',
-    '/pages/event-f51f5a22f8cc_03.html': '/spaceone/부모님을-위한-선물-페트레이-패딩-특집',
-    '/pages/event-f51f5a22f8cc_04.html': '/spaceone/부모님을-위한-선물-페트레이-패딩-특집',
-    '/pages/event-f51f5a22f_02.html': '/spaceone/부모님을-위한-선물-페트레이-패딩-특집',
-    '/pages/event-f51f5a22f_03.html': '/spaceone/부모님을-위한-선물-페트레이-패딩-특집',
-    '/pages/event-f51f5a22f_04.html': '/spaceone/부모님을-위한-선물-페트레이-패딩-특집',
-    '/pages/event-f52965d3e.html': '/spaceone/최초-마리떼프랑소와저버-비케이브-대전-①',
-    '/pages/event-f52965d3e923.html': '/songdo/가을-mz-쇼핑-특가전-마리떼프랑소와저버-제너럴아이디어',
-    '/pages/event-f52965d3e923_02.html': '/spaceone/최초-마리떼프랑소와저버-비케이브-대전-①',
-    '/pages/event-f52965d3e923_03.html': '/spaceone/최초-마리떼프랑소와저버-비케이브-대전-①',
-    '/pages/event-f52965d3e923_04.html': '/spaceone/최초-마리떼프랑소와저버-비케이브-대전-①',
-    '/pages/event-f52965d3e_02.html': '/spaceone/최초-마리떼프랑소와저버-비케이브-대전-①',
-    '/pages/event-f52965d3e_03.html': '/spaceone/최초-마리떼프랑소와저버-비케이브-대전-①',
-    '/pages/event-f52965d3e_04.html': '/spaceone/최초-마리떼프랑소와저버-비케이브-대전-①',
-    '/pages/event-f53d844cc.html': '/songdo/진도모피-모피-전문-팝업-오픈',
-    '/pages/event-f53d844cc_02.html': '/songdo/진도모피-모피-전문-팝업-오픈',
-    '/pages/event-f53d844cc_03.html': '/songdo/진도모피-모피-전문-팝업-오픈',
-    '/pages/event-f53d844cc_04.html': '/songdo/진도모피-모피-전문-팝업-오픈',
-    '/pages/event-f53d844ccd07.html': '/songdo/진도모피-모피-전문-팝업-오픈',
-    '/pages/event-f53d844ccd07_02.html': '/songdo/진도모피-모피-전문-팝업-오픈',
-    '/pages/event-f53d844ccd07_03.html': '/songdo/진도모피-모피-전문-팝업-오픈',
-    '/pages/event-f53d844ccd07_04.html': '/songdo/진도모피-모피-전문-팝업-오픈',
-    '/pages/event-f56c4d0d5.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-f56c4d0d5_02.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-f56c4d0d5_03.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-f56c4d0d5_04.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-f56c4d0d5cb6.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-f56c4d0d5cb6_02.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-f56c4d0d5cb6_03.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-f56c4d0d5cb6_04.html': '/gimpo/남성-스페셜-프로모션',
-    '/pages/event-f5701fefc.html': '/songdo/키즈페스타-mlb키즈-탑텐키즈-최대-70-특가전',
-    '/pages/event-f5701fefc_02.html': '/songdo/키즈페스타-mlb키즈-탑텐키즈-최대-70-특가전',
-    '/pages/event-f5d86f929.html': '/spaceone/pop-up-sjyp-단독전-최대-80-할인',
-    '/pages/event-f5d86f929_02.html': '/spaceone/pop-up-sjyp-단독전-최대-80-할인',
-    '/pages/event-f5dd2ce21.html': '/songdo/ready-to-f-w-해외패션-신상품-입고',
-    '/pages/event-f5dd2ce218fe.html': '/songdo/해외패션-가을-신상품-입고',
-    '/pages/event-f5dd2ce218fe_02.html': '/songdo/ready-to-f-w-해외패션-신상품-입고',
-    '/pages/event-f5dd2ce218fe_03.html': '/songdo/ready-to-f-w-해외패션-신상품-입고',
-    '/pages/event-f5dd2ce218fe_04.html': '/songdo/ready-to-f-w-해외패션-신상품-입고',
-    '/pages/event-f5dd2ce21_02.html': '/songdo/ready-to-f-w-해외패션-신상품-입고',
-    '/pages/event-f5dd2ce21_03.html': '/songdo/ready-to-f-w-해외패션-신상품-입고',
-    '/pages/event-f5dd2ce21_04.html': '/songdo/ready-to-f-w-해외패션-신상품-입고',
-    '/pages/event-f6406bda4be7.html': '/spaceone/new-open-만학',
-    '/pages/event-f6406bda4be7_02.html': '/spaceone/new-open-만학',
-    '/pages/event-f69464cce.html': '/spaceone/아이잗바바-컬렉션-사계절-상품-특가-대전',
-    '/pages/event-f69464cce_02.html': '/spaceone/아이잗바바-컬렉션-사계절-상품-특가-대전',
-    '/pages/event-f69f90bb8.html': '/songdo/폴로-브룩스브라더스-가을-신상품-제안',
-    '/pages/event-f69f90bb86a3.html': '/songdo/happy-holiday-폴로-타미힐피거-외-혜택',
-    '/pages/event-f69f90bb86a3_02.html': '/songdo/폴로-브룩스브라더스-가을-신상품-제안',
-    '/pages/event-f69f90bb86a3_03.html': '/songdo/폴로-브룩스브라더스-가을-신상품-제안',
-    '/pages/event-f69f90bb86a3_04.html': '/songdo/폴로-브룩스브라더스-가을-신상품-제안',
-    '/pages/event-f69f90bb8_02.html': '/songdo/폴로-브룩스브라더스-가을-신상품-제안',
-    '/pages/event-f69f90bb8_03.html': '/songdo/폴로-브룩스브라더스-가을-신상품-제안',
-    '/pages/event-f69f90bb8_04.html': '/songdo/폴로-브룩스브라더스-가을-신상품-제안',
-    '/pages/event-f790c79f065f.html': '/spaceone/renewal-open-핸드백-슈즈',
-    '/pages/event-f872968a7.html': '/spaceone/골프존마켓-최대-행사-하반기-골프-대전',
-    '/pages/event-f872968a7_02.html': '/spaceone/골프존마켓-최대-행사-하반기-골프-대전',
-    '/pages/event-f872968a7_03.html': '/spaceone/골프존마켓-최대-행사-하반기-골프-대전',
-    '/pages/event-f872968a7_04.html': '/spaceone/골프존마켓-최대-행사-하반기-골프-대전',
-    '/pages/event-f872968a7d42.html': '/spaceone/골프존마켓-최대-행사-하반기-골프-대전',
-    '/pages/event-f872968a7d42_02.html': '/spaceone/골프존마켓-최대-행사-하반기-골프-대전',
-    '/pages/event-f872968a7d42_03.html': '/spaceone/골프존마켓-최대-행사-하반기-골프-대전',
-    '/pages/event-f872968a7d42_04.html': '/spaceone/골프존마켓-최대-행사-하반기-골프-대전',
-    '/pages/event-f89c88bfb.html': '/spaceone/로제도르-스페셜-혜택-최대-50',
-    '/pages/event-f89c88bfb697.html': '/spaceone/로제도르-스페셜-혜택-최대-50',
-    '/pages/event-f89c88bfb697_02.html': '/spaceone/로제도르-스페셜-혜택-최대-50',
-    '/pages/event-f89c88bfb697_03.html': '/spaceone/로제도르-스페셜-혜택-최대-50',
-    '/pages/event-f89c88bfb697_04.html': '/spaceone/로제도르-스페셜-혜택-최대-50',
-    '/pages/event-f89c88bfb_02.html': '/spaceone/로제도르-스페셜-혜택-최대-50',
-    '/pages/event-f89c88bfb_03.html': '/spaceone/로제도르-스페셜-혜택-최대-50',
-    '/pages/event-f89c88bfb_04.html': '/spaceone/로제도르-스페셜-혜택-최대-50',
-    '/pages/event-f8f55251b.html': '/spaceone/renewal-open-주얼리-프로모션',
-    '/pages/event-f8f55251b874.html': '/spaceone/renewal-open-주얼리-프로모션',
-    '/pages/event-f8f55251b874_02.html': '/spaceone/renewal-open-주얼리-프로모션',
-    '/pages/event-f8f55251b874_03.html': '/spaceone/renewal-open-주얼리-프로모션',
-    '/pages/event-f8f55251b874_04.html': '/spaceone/renewal-open-주얼리-프로모션',
-    '/pages/event-f8f55251b_02.html': '/spaceone/renewal-open-주얼리-프로모션',
-    '/pages/event-f8f55251b_03.html': '/spaceone/renewal-open-주얼리-프로모션',
-    '/pages/event-f8f55251b_04.html': '/spaceone/renewal-open-주얼리-프로모션',
-    '/pages/event-f98bb7014.html': '/songdo/2025-첫-진도모피-최대-90-패밀리-대전',
-    '/pages/event-f98bb7014_02.html': '/songdo/2025-첫-진도모피-최대-90-패밀리-대전',
-    '/pages/event-f98bb7014_03.html': '/songdo/2025-첫-진도모피-최대-90-패밀리-대전',
-    '/pages/event-f98bb7014_04.html': '/songdo/2025-첫-진도모피-최대-90-패밀리-대전',
-    '/pages/event-f98bb7014ae2.html': '/songdo/2025-첫-진도모피-최대-90-패밀리-대전',
-    '/pages/event-f98bb7014ae2_02.html': '/songdo/2025-첫-진도모피-최대-90-패밀리-대전',
-    '/pages/event-f98bb7014ae2_03.html': '/songdo/2025-첫-진도모피-최대-90-패밀리-대전',
-    '/pages/event-f98bb7014ae2_04.html': '/songdo/2025-첫-진도모피-최대-90-패밀리-대전',
-    '/pages/event-fa7036b1d.html': '/spaceone/7大-클리어런스-페세리코-up-to-80-off',
-    '/pages/event-fa7036b1d_02.html': '/spaceone/7大-클리어런스-페세리코-up-to-80-off',
-    '/pages/event-fa7b08eb0.html': '/songdo/썬쿠-suncoo-고별전',
-    '/pages/event-fa7b08eb0_02.html': '/songdo/썬쿠-suncoo-고별전',
-    '/pages/event-fbfadce0a.html': '/spaceone/닥스-daks-종합관-가을-아우터-제안',
-    '/pages/event-fbfadce0a55a.html': '/spaceone/닥스-daks-종합관-가을-아우터-제안',
-    '/pages/event-fbfadce0a55a_02.html': '/spaceone/닥스-daks-종합관-가을-아우터-제안',
-    '/pages/event-fbfadce0a55a_03.html': '/spaceone/닥스-daks-종합관-가을-아우터-제안',
-    '/pages/event-fbfadce0a55a_04.html': '/spaceone/닥스-daks-종합관-가을-아우터-제안',
-    '/pages/event-fbfadce0a_02.html': '/spaceone/닥스-daks-종합관-가을-아우터-제안',
-    '/pages/event-fbfadce0a_03.html': '/spaceone/닥스-daks-종합관-가을-아우터-제안',
-    '/pages/event-fbfadce0a_04.html': '/spaceone/닥스-daks-종합관-가을-아우터-제안',
-    '/pages/event-fc9629249.html': '/spaceone/7大-클리어런스-레노마ㆍ빨질레리-up-to-90-off',
-    '/pages/event-fc9629249_02.html': '/spaceone/7大-클리어런스-레노마ㆍ빨질레리-up-to-90-off',
-    '/pages/event-fd7e91d30.html': '/songdo/유니클로-가을맞이-프로모션',
-    '/pages/event-fd7e91d309d2.html': '/songdo/유니클로-가을맞이-프로모션',
-    '/pages/event-fd7e91d309d2_02.html': '/songdo/유니클로-가을맞이-프로모션',
-    '/pages/event-fd7e91d309d2_03.html': '/songdo/유니클로-가을맞이-프로모션',
-    '/pages/event-fd7e91d309d2_04.html': '/songdo/유니클로-가을맞이-프로모션',
-    '/pages/event-fd7e91d30_02.html': '/songdo/유니클로-가을맞이-프로모션',
-    '/pages/event-fd7e91d30_03.html': '/songdo/유니클로-가을맞이-프로모션',
-    '/pages/event-fd7e91d30_04.html': '/songdo/유니클로-가을맞이-프로모션',
-    '/pages/event-fda5f2e21.html': '/songdo/new-open-보난자커피',
-    '/pages/event-fda5f2e21_02.html': '/songdo/new-open-보난자커피',
-    '/pages/event-fda5f2e21_03.html': '/songdo/new-open-보난자커피',
-    '/pages/event-fda5f2e21_04.html': '/songdo/new-open-보난자커피',
-    '/pages/event-fda5f2e21b93.html': '/songdo/new-open-보난자커피',
-    '/pages/event-fda5f2e21b93_02.html': '/songdo/new-open-보난자커피',
-    '/pages/event-fda5f2e21b93_03.html': '/songdo/new-open-보난자커피',
-    '/pages/event-fda5f2e21b93_04.html': '/songdo/new-open-보난자커피',
-    '/pages/event-fda836417.html': '/songdo/리스트-가을-얼리-특가전',
-    '/pages/event-fda8364179dd.html': '/songdo/리스트-가을-얼리-특가전',
-    '/pages/event-fda8364179dd_02.html': '/songdo/리스트-가을-얼리-특가전',
-    '/pages/event-fda8364179dd_03.html': '/songdo/리스트-가을-얼리-특가전',
-    '/pages/event-fda8364179dd_04.html': '/songdo/리스트-가을-얼리-특가전',
-    '/pages/event-fda836417_02.html': '/songdo/리스트-가을-얼리-특가전',
-    '/pages/event-fda836417_03.html': '/songdo/리스트-가을-얼리-특가전',
-    '/pages/event-fda836417_04.html': '/songdo/리스트-가을-얼리-특가전',
-    '/pages/event-fdb1d4b97.html': '/gimpo/세컨더리캐비닛-특가전-up-to-50',
-    '/pages/event-fdb1d4b97_02.html': '/gimpo/세컨더리캐비닛-특가전-up-to-50',
-    '/pages/event-fdd886ed9adf.html': '/spaceone/new-open-bbc-어스',
-    '/pages/event-fdd886ed9adf_02.html': '/spaceone/new-open-bbc-어스',
+// 대상 경로 (중복 제거)
+const FILES = [
+  "/gimpo/2025-golf-fair-브랜드별-구매혜택",
+  "/gimpo/2025-golf-fair-브랜드별-할인혜택",
+  "/gimpo/bcbg-all-sundry-up-to-80-off",
+  "/gimpo/coming-soon-노스페이스-에디션",
+  "/gimpo/cp컴퍼니-코에보-f-w-아우터-상품전",
+  "/gimpo/f-b-슈퍼위켄드-프로모션",
+  "/gimpo/mlb-가을-겨울-상품-특가전",
+  "/gimpo/new-in-신상품-제안-아크메드라비",
+  "/gimpo/new-open-double-jd-더블제이디",
+  "/gimpo/new-open-o-donut-오도넛",
+  "/gimpo/new-open-노비스",
+  "/gimpo/new-open-모이모키",
+  "/gimpo/new-open-밀리스트",
+  "/gimpo/new-open-세이브힐즈",
+  "/gimpo/new-open-아양로-호두과자",
+  "/gimpo/new-open-아크메드라비",
+  "/gimpo/new-open-제임스펄스-up-to-60-30-off",
+  "/gimpo/new-open-하이퍼리트",
+  "/gimpo/pop-up-gs건설-단독주택-브랜드-자이가이스트",
+  "/gimpo/pop-up-store-닥터데이빗-명품수선",
+  "/gimpo/pop-up-store-퐁신당",
+  "/gimpo/pop-up-로우로우-rawrow",
+  "/gimpo/pop-up-메종플레장-버터",
+  "/gimpo/pop-up-사브르",
+  "/gimpo/pop-up-스페인-편집샵-gurapa-lab",
+  "/gimpo/pop-up-위캔그라운드",
+  "/gimpo/pop-up-프리미엄-패딩-캐나다구스",
+  "/gimpo/pop-up-헤리티지-카니발-하이리무진-lounge",
+  "/gimpo/ready-for-f-w-듀베티카-아이템-제안",
+  "/gimpo/ready-for-f-w-듀엘-쥬크-up-to-70",
+  "/gimpo/ready-for-f-w-르베이지-up-to-40-off",
+  "/gimpo/ready-for-f-w-무스너클-신상품-제안",
+  "/gimpo/ready-for-f-w-미샤-up-to-40-off",
+  "/gimpo/ready-for-f-w-베네통-시슬리-up-to-70",
+  "/gimpo/ready-for-f-w-영캐주얼-신상품-제안",
+  "/gimpo/ready-for-f-w-킨더스코너-특가전-up-to-80",
+  "/gimpo/ready-for-f-w-톰그레이하운드-up-to-70-off",
+  "/gimpo/ready-for-f-w-페트레이-특가전",
+  "/gimpo/ready-for-f-w-한섬-컨템포러리-대전-up-to-90-off",
+  "/gimpo/renewal-open-골든듀",
+  "/gimpo/renewal-open-뉴발란스-국내-최대매장-open",
+  "/gimpo/renewal-open-뉴발란스-김포점-단독-프로모션",
+  "/gimpo/renewal-open-닥스-종합관",
+  "/gimpo/renewal-open-브룩스브라더스",
+  "/gimpo/renewal-open-엄브로",
+  "/gimpo/renewal-open-파렌-fahren",
+  "/gimpo/renewal-open-페트레이",
+  "/gimpo/renewal-open-헤지스-종합관",
+  "/gimpo/renewal-프룻바이도레",
+  "/gimpo/wine-whiskey",
+  "/gimpo/게스-f-w-특가전-up-to-70",
+  "/gimpo/겨울맞이-연말-식사-제안",
+  "/gimpo/골든듀-신년-세일",
+  "/gimpo/골프-아웃도어-f-w-특가전",
+  "/gimpo/골프웨어-f-w상품-스타일-제안-ⅰ",
+  "/gimpo/골프웨어-f-w상품-스타일-제안-ⅱ",
+  "/gimpo/골프존마켓-2025-하반기-골프대전",
+  "/gimpo/골프존마켓-md-s-pick-클럽제안",
+  "/gimpo/나이키-스페셜-팝업",
+  "/gimpo/남성-스페셜-프로모션",
+  "/gimpo/남성-트렌디캐주얼-f-w-아우터-상품전",
+  "/gimpo/남성패션-영패션-특가전-빈폴-sjyp-썬쿠-外",
+  "/gimpo/내셔널지오그래픽-f-w-특가전",
+  "/gimpo/내셔널지오그래픽-윈터-세일-페스타",
+  "/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에",
+  "/gimpo/노스페이스-에디션-쇼핑과-기부를-한번에ⅱ",
+  "/gimpo/뉴발란스키즈-프로모션",
+  "/gimpo/더-코스메틱-컴퍼니-스토어",
+  "/gimpo/데무-지고트-up-to-75-off",
+  "/gimpo/동우모피-up-to-80-65-off",
+  "/gimpo/동우모피-근화모피-특가전-up-to-80-off",
+  "/gimpo/듀베티카-스타일-제안",
+  "/gimpo/듀베티카-아우터-제안-up-to-70-off",
+  "/gimpo/듀베티카-아우터-제안-up-to-80-off",
+  "/gimpo/듀베티카-특가-아이템-제안",
+  "/gimpo/듀베티카-프리미엄-패딩-특가전-up-to-70-off",
+  "/gimpo/디스커버리-사계절-상품전",
+  "/gimpo/디즈니스토어-토이-피규어-1-1-프로모션",
+  "/gimpo/띠어리-f-w-특가전-up-to-70-off",
+  "/gimpo/라움-스타일-제안-vince-外",
+  "/gimpo/라움-아우터-특가전-up-to-70-off",
+  "/gimpo/라코스테-f-w-상품전",
+  "/gimpo/로얄코펜하겐-멤버스-데이-최대-70-off",
+  "/gimpo/로제도르-홀리데이-light-me",
+  "/gimpo/르베이지-구호-띠어리-시즌오프-up-to-60-off",
+  "/gimpo/르베이지-구호-스페셜위크-프로모션-up-to-50-off",
+  "/gimpo/리바이스-f-w-시즌특가전-up-to-70",
+  "/gimpo/리바이스-f-w-특가전-up-to-70",
+  "/gimpo/리바트-가구-프로모션-제안",
+  "/gimpo/리바트-가을-페스티벌",
+  "/gimpo/리바트-리듬페스타",
+  "/gimpo/리바트-클리어런스",
+  "/gimpo/리빙-단독-특가전-빌레로이앤보흐-wmf-外",
+  "/gimpo/리빙-리뉴얼-오픈-템퍼-시디즈-오덴세",
+  "/gimpo/리빙-프로모션-제안",
+  "/gimpo/마리떼프랑소와저버-시즌오프-50",
+  "/gimpo/마리떼프랑소와저버-시즌오프-최대-50",
+  "/gimpo/마크앤로나-f-w-특가전-up-to-70",
+  "/gimpo/말본골프-특별전-up-to-70-off",
+  "/gimpo/맛있는-김현아-f-b-제안",
+  "/gimpo/메르세데스-벤츠-christmas-drive-with-hansung",
+  "/gimpo/메이크업-특가-제안",
+  "/gimpo/메종키츠네-비이커-특가전-up-to-70-off",
+  "/gimpo/모던하우스키즈-크리스마스-선물-특가전",
+  "/gimpo/모이모키-특가전-up-to-60",
+  "/gimpo/모조에스핀-스페셜위크-up-to-40-20-off",
+  "/gimpo/무스너클-special-promotion",
+  "/gimpo/무스너클-스타일-제안",
+  "/gimpo/무스너클-프리미엄-아우터-제안",
+  "/gimpo/미샤-day-프로모션-up-to-40-20-off",
+  "/gimpo/미샤-스타일제안",
+  "/gimpo/바바리안-모터스-x-김현아-미니-팝업-전시",
+  "/gimpo/바버-barbour-f-w-상품전",
+  "/gimpo/바버-f-w-아우터-제안전",
+  "/gimpo/바버-사계절-상품전-up-to-60-off",
+  "/gimpo/버버리-스페셜-프로모션",
+  "/gimpo/베베드피노-아이스비스킷-f-w-특가전-①",
+  "/gimpo/베베드피노-아이스비스킷-f-w-특가전-②",
+  "/gimpo/본가스시-오늘을-특별하게-만드는-단-하나-스시케이크",
+  "/gimpo/브룩스브라더스-사계절-상품전",
+  "/gimpo/비이커-f-w-스타일-제안-메종키츠네-外",
+  "/gimpo/비이커-메종키츠네-up-to-60-off",
+  "/gimpo/비이커-메종키츠네-시즌오프-특가전-up-to-60-off",
+  "/gimpo/빈-블루테일-특가전-up-to-50",
+  "/gimpo/쁘렝땅-기비-키이스-up-to-80-70-off",
+  "/gimpo/산드로-마쥬-f-w-시즌오프-up-to-50-20-off",
+  "/gimpo/삼성물산-family-스페셜데이-프로모션",
+  "/gimpo/삼성패션-festa-special-weekend",
+  "/gimpo/삼성패션-festa-띠어리-up-to-70",
+  "/gimpo/삼성패션-festa-르베이지-구호",
+  "/gimpo/삼성패션-festa-메종키츠네-비이커-준지",
+  "/gimpo/삼성패션-festa-메종키츠네-비이커-준지-up-to-70-off",
+  "/gimpo/삼성패션-festa-해외패션-up-to-80",
+  "/gimpo/세인트앤드류스-f-w-상품-제안",
+  "/gimpo/세컨더리캐비닛-특가전-up-to-50",
+  "/gimpo/쉬즈미스-스타일제안",
+  "/gimpo/슈슈앤크라-특가전-up-to-60",
+  "/gimpo/슈퍼위켄드-특별한-혜택-영캐주얼",
+  "/gimpo/슈퍼위켄드-특별한-혜택-진-스트릿-캐주얼",
+  "/gimpo/스노우피크-특가전-up-to-50-off",
+  "/gimpo/스트릿-캐주얼-특가전-i-up-to-70",
+  "/gimpo/스트릿-캐주얼-특가전-ii-up-to-70",
+  "/gimpo/스트릿캐주얼-겨울세일-커버낫-아크메드라비",
+  "/gimpo/스트릿캐주얼-아우터-대전-버커루-커버낫-mlb-최대-80",
+  "/gimpo/스트릿캐주얼-커버낫-윈터-세일-60",
+  "/gimpo/스포츠-f-w-상품-제안",
+  "/gimpo/스포츠-special-week",
+  "/gimpo/스포츠-special-week-ⅰ",
+  "/gimpo/스포츠-special-week-ⅱ",
+  "/gimpo/스포츠-special-프로모션",
+  "/gimpo/스포츠-겨울상품-최대-70-특가전",
+  "/gimpo/스포츠-스페셜-프로모션",
+  "/gimpo/시리즈-series-f-w-상품전",
+  "/gimpo/신년맞이-네파-up-to-70-off",
+  "/gimpo/신년맞이-영아우터-특집-최대-70",
+  "/gimpo/신년맞이-영캐주얼-진스포티",
+  "/gimpo/신년맞이-특가-르베이지-구호-띠어리-up-to-60-off",
+  "/gimpo/신년맞이-특가-쉬즈미스-up-to-80-off",
+  "/gimpo/신년맞이-특가-프로모션-한섬-family",
+  "/gimpo/신년맞이-프리미엄골프",
+  "/gimpo/쌤소나이트-special-week",
+  "/gimpo/쌤소나이트-패밀리세일-up-to-90",
+  "/gimpo/아디다스-언더아머-프로모션-제안",
+  "/gimpo/아디다스-특가-제안",
+  "/gimpo/아디다스-프로모션-상품제안",
+  "/gimpo/아웃도어-f-w-아이템-제안-ⅰ",
+  "/gimpo/아웃도어-f-w-아이템-제안-ⅱ",
+  "/gimpo/아웃도어-f-w-특가전-up-to-60-off",
+  "/gimpo/아웃도어-f-w-특가전-up-to-70-off",
+  "/gimpo/아웃도어-f-w상품-스타일-제안-ⅰ",
+  "/gimpo/아웃도어-슈퍼위켄드-프로모션",
+  "/gimpo/아이러브제이-특가전-up-to-50",
+  "/gimpo/아이잗바바-겨울상품-특가전-up-to-80-off",
+  "/gimpo/아이잗바바-패밀리세일-특가전",
+  "/gimpo/아주오토리움-x-김현아-volvo-팝업-전시",
+  "/gimpo/아크메드라비-210에디트-f-w-상품-최대-50-할인",
+  "/gimpo/아크메드라비-f-w-상품-최대-50-할인",
+  "/gimpo/아크테릭스-고객-감사-프로모션",
+  "/gimpo/어뉴골프-겨울상품-제안",
+  "/gimpo/어뉴골프-스페셜-프로모션",
+  "/gimpo/언더아머-프로모션-상품제안",
+  "/gimpo/업사이클빌리지-페스티벌-제품-안내-아웃도어",
+  "/gimpo/업사이클빌리지-페스티벌-제품-안내-패션",
+  "/gimpo/에코-up-to-60-특가전",
+  "/gimpo/영캐주얼-f-w-아우터-제안",
+  "/gimpo/영캐주얼-스페셜-프로모션",
+  "/gimpo/영캐주얼-아우터-특가전-up-to-75",
+  "/gimpo/영캐주얼-크리스마스-시즌-본매장-프로모션-특가-①",
+  "/gimpo/영캐주얼-크리스마스-시즌-본매장-프로모션-특가-②",
+  "/gimpo/영컨템포러리-더일마-f-w-브랜드-초대전",
+  "/gimpo/영패션-아우터-특가전-최대-80-할인",
+  "/gimpo/영패션-크리스마스-시즌-진캐주얼-본매장-프로모션",
+  "/gimpo/오프라벨-리틀그라운드-f-w-특가전-①",
+  "/gimpo/오프라벨-리틀그라운드-f-w-특가전-②",
+  "/gimpo/올리브영",
+  "/gimpo/올리브영-2025-어워즈-아이템",
+  "/gimpo/올리브영-블랙프라이데이",
+  "/gimpo/올영세일",
+  "/gimpo/올젠-겨울-상품전-up-to-70-off",
+  "/gimpo/와코루-균일가전-데무-아우터-특가전",
+  "/gimpo/왁-waac-추가-20-할인",
+  "/gimpo/쟈딕-볼테르-최대-70-시즌오프-특가-제안",
+  "/gimpo/쟈딕앤볼테르-f-w-대전-up-to-90-off",
+  "/gimpo/전자랜드-lg전자-전시상품-특가제안",
+  "/gimpo/전자랜드-가전-특가-제안",
+  "/gimpo/전자랜드-소형가전-최저가-도전",
+  "/gimpo/지고트-f-w-특가전-up-to-80-off",
+  "/gimpo/지고트-겨울상품-특가전-up-to-80-off",
+  "/gimpo/지포어-g-fore-f-w-신상품-제안",
+  "/gimpo/지포어-스페셜-팝업-up-to-65-off",
+  "/gimpo/진ㆍ스트릿-캐주얼-신상품-제안",
+  "/gimpo/진도모피-근화모피-프리미엄-모피-특가전",
+  "/gimpo/진도모피-패밀리세일-up-to-90-off",
+  "/gimpo/진캐주얼-스페셜-프로모션",
+  "/gimpo/진캐주얼-크리스마스-본매장-프로모션-특가",
+  "/gimpo/추석맞이-특가전-mlb-up-to-70",
+  "/gimpo/추석맞이-특가전-리바이스-up-to-70",
+  "/gimpo/캘러웨이-사계절-상품전-up-to-70-off",
+  "/gimpo/커버낫-클리어런스-최대-70-할인",
+  "/gimpo/컨템포러리-스타일-제안",
+  "/gimpo/컬럼비아-winter-festa",
+  "/gimpo/케이투그룹-클리어런스-up-to-70",
+  "/gimpo/코치-스페셜위크",
+  "/gimpo/쿠론-닥스-핸드백-up-to-70-특가전",
+  "/gimpo/키즈-크리스마스-선물-상품전",
+  "/gimpo/킨더스코너-특가전-up-to-80",
+  "/gimpo/타미힐피거-f-w-상품전-up-to-70-off",
+  "/gimpo/타미힐피거-패밀리-상품전-up-to-70-off",
+  "/gimpo/타미힐피거-패밀리-상품전-up-to-80-off",
+  "/gimpo/타이틀리스트-f-w-상품-제안",
+  "/gimpo/톰그레이하운드-스타일-제안",
+  "/gimpo/톰그레이하운드-폼스튜디오-라움-f-w-스타일-제안",
+  "/gimpo/톰그레이하운드-폼스튜디오-시즌오프-up-to-60-off",
+  "/gimpo/투미-패밀리-세일",
+  "/gimpo/트렌디캐주얼-f-w-아우터-제안",
+  "/gimpo/파타고니아-스페셜-위켄드-추가-20-off",
+  "/gimpo/파타고니아-추가-20-off",
+  "/gimpo/팩토리-바쉬-럭셔리-아이템-제안",
+  "/gimpo/팩토리-바쉬-해외패션",
+  "/gimpo/페트레이-듀베티카-프리미엄-패딩-특가-제안",
+  "/gimpo/페트레이-특가제안",
+  "/gimpo/폴로-랄프로렌-10-사은-행사",
+  "/gimpo/폴로-랄프로렌-f-w-신상품-제안",
+  "/gimpo/폴로-랄프로렌-special-promotion",
+  "/gimpo/폴로-랄프로렌-신상품-제안",
+  "/gimpo/폼스튜디오-f-w-특가제안-up-to-80-off",
+  "/gimpo/폼스튜디오ㆍ라움-f-w-스타일-제안",
+  "/gimpo/프리미엄-모피-특가전-진도-근화-동우-外-up-to-80-65-off",
+  "/gimpo/프리미엄-모피-특가전-진도-근화-동우-外-up-to-80-off",
+  "/gimpo/프리미엄-패딩-노비스-무스너클스-인기상품-특가-제안",
+  "/gimpo/프리미엄-패딩-듀베티카-up-to-70-off",
+  "/gimpo/프리미엄-패딩-페트레이-up-to-80",
+  "/gimpo/프리미엄골프-라운드-스타일-제안-ⅱ",
+  "/gimpo/프리미엄골프-슈퍼위켄드-프로모션",
+  "/gimpo/프리미엄골프-스페셜-혜택",
+  "/gimpo/플랫폼플레이스-f-w-인기-상품-제안",
+  "/gimpo/하이퍼리트-210에디트-f-w-상품-최대-50-할인",
+  "/gimpo/한섬-family-holiday-gift",
+  "/gimpo/한섬-국내패션-스페셜-프로모션",
+  "/gimpo/한섬-국내패션-아우터-페스타-프로모션",
+  "/gimpo/한섬-컨템포러리-스페셜위크-프로모션",
+  "/gimpo/한섬-해외패션-스페셜위크-프로모션",
+  "/gimpo/해외패션-f-w-스페셜-위캔드-ⅰ",
+  "/gimpo/해외패션-스페셜-위켄드",
+  "/gimpo/해외패션-스페셜-혜택",
+  "/gimpo/헨리코튼-사계절-상품전-up-to-60-off",
+  "/gimpo/현대아울렛-커넥트현대-백화점-vip-선정-적립금액-기준-변경",
+  "/gimpo/현대홈쇼핑플러스샵-겨울아이템-특가전",
+  "/gimpo/현대홈쇼핑플러스샵-명품-스타일-제안",
+  "/gimpo/홀리데이빅찬스-아웃도어-프로모션",
+  "/songdo/2025-첫-진도모피-최대-90-패밀리-대전",
+  "/songdo/2025-추석-특선-더-현대적인-선물",
+  "/songdo/2025-추석-특선-더-현대적인-선물-ⅰ",
+  "/songdo/2025-추석-특선-더-현대적인-선물-ⅱ",
+  "/songdo/2025-추석-특선-더-현대적인-선물-정관장-구매-혜택",
+  "/songdo/9월-리빙-프로모션-템퍼-씰리",
+  "/songdo/abc마트-인기-슈즈-쇼핑-찬스",
+  "/songdo/apple-watch와-함께-새해-결심을-꾸준한-습관으로",
+  "/songdo/dkny-클럽모나코-최대-90-가을-패션-특가전",
+  "/songdo/hago스토어-new-face",
+  "/songdo/happy-holiday-슈즈-백",
+  "/songdo/happy-holiday-아울렛-가격에-추가-할인",
+  "/songdo/happy-holiday-여성패션-브랜드별-혜택",
+  "/songdo/happy-holiday-영-스트릿-프로모션",
+  "/songdo/happy-holiday-영캐주얼-프로모션",
+  "/songdo/happy-holiday-폴로-타미힐피거-외-혜택",
+  "/songdo/happy-holiday-해외패션-acc",
+  "/songdo/hdex-새해-맞이-쇼핑-찬스",
+  "/songdo/k2-아이더-내셔널지오그래픽-아우터-특가전",
+  "/songdo/k2-아이더-노르디스크-fw-특가전",
+  "/songdo/korea-grand-sale",
+  "/songdo/korea-grand-sale-songdo",
+  "/songdo/mz-패션-쇼핑-프로모션",
+  "/songdo/new-iphone-17-시리즈-출시-기념-구매-혜택",
+  "/songdo/new-open-cc콜렉트",
+  "/songdo/new-open-nobis-노비스",
+  "/songdo/new-open-ugg-어그",
+  "/songdo/new-open-광화문-미진",
+  "/songdo/new-open-더-코스메틱-컴퍼니-스토어",
+  "/songdo/new-open-더-코스메틱-컴퍼니-스토어-오픈-기념-특가-이벤트",
+  "/songdo/new-open-듀베티카-duvetica",
+  "/songdo/new-open-라펠-lafel",
+  "/songdo/new-open-뭄알로이",
+  "/songdo/new-open-보난자커피",
+  "/songdo/new-open-분더커피바",
+  "/songdo/new-open-파타고니아",
+  "/songdo/opening-soon-닌텐도-전문점-대원샵-프리오픈-팝업",
+  "/songdo/opening-soon-대원샵-닌텐도-전문점-9-18-목-오픈",
+  "/songdo/opening-soon-대원샵-닌텐도-전문점-프리오픈-팝업",
+  "/songdo/opening-soon-아트박스-9-17-수",
+  "/songdo/opening-soon-코데즈컴바인-언더웨어-게스-언더웨어",
+  "/songdo/opening-soon-트래버틴",
+  "/songdo/opening-soon-파타고니아",
+  "/songdo/pop-up-cc-paul",
+  "/songdo/pop-up-store-리틀바잇모어",
+  "/songdo/pop-up-store-만석닭강정",
+  "/songdo/pop-up-store-생과방-약과-리틀바잇모어",
+  "/songdo/pop-up-store-제스프리-키위-로드쇼",
+  "/songdo/pop-up-store-청년떡집-명례헌",
+  "/songdo/pop-up-store-티니핑-x-샌드캐슬",
+  "/songdo/pop-up-store-프리미엄-비타민-솔가-당점-단독-특가",
+  "/songdo/pop-up-store-하이디라오-컵누들",
+  "/songdo/pop-up-계란빵-클럽",
+  "/songdo/pop-up-교보문고-크리스마스마켓",
+  "/songdo/pop-up-닌텐도-전문점-대원샵-프리오픈-팝업",
+  "/songdo/pop-up-도심-속-공주가-되는-드레스-대여-감성교복",
+  "/songdo/pop-up-레고-winter-gift-팝업",
+  "/songdo/pop-up-바버-barbour-house-of-tartan",
+  "/songdo/pop-up-브라운브레스-pre-winter-팝업",
+  "/songdo/pop-up-써스데이아일랜드-가을-여행-스토리",
+  "/songdo/pop-up-우아-oooa",
+  "/songdo/pop-up-잇미샤-크리스마스-팝업",
+  "/songdo/pop-up-쥬크-해피홀리데이-팝업",
+  "/songdo/pop-up-지방시-키즈-외-아동-수입-편집숍-아르케메종",
+  "/songdo/pop-up-팩토리바쉬-몽클레르-막스마라",
+  "/songdo/pop-up-페트레이-프리미엄-패딩",
+  "/songdo/pop-up-한강몽-찹쌀떡",
+  "/songdo/ready-to-f-w-여성패션-신상품-입고",
+  "/songdo/ready-to-f-w-영캐주얼-신상품-입고",
+  "/songdo/ready-to-f-w-해외패션-신상품-입고",
+  "/songdo/renewal-open-쁘렝땅",
+  "/songdo/renewal-open-언더아머",
+  "/songdo/renewal-open-오브제-obzee",
+  "/songdo/super-weekend-td-남성-fw-특가",
+  "/songdo/super-weekend-여성패션-스페셜-프로모션",
+  "/songdo/super-weekend-여성패션-한파대비-아우터-특가",
+  "/songdo/super-weekend-영스트릿-프로모션",
+  "/songdo/super-weekend-패밀리-리빙-아동-특별-프로모션",
+  "/songdo/super-weekend-홀린데이-up-to-60",
+  "/songdo/td페어-lf-f-w-특가전-바버-헤지스-닥스",
+  "/songdo/td페어-타미힐피거-최대-70",
+  "/songdo/가을-mz-쇼핑-특가전-마리떼프랑소와저버-제너럴아이디어",
+  "/songdo/가을-데님-대전-게스-리바이스-ck진",
+  "/songdo/가을-라운딩을-빛내-줄-프리미엄-골프-웨어",
+  "/songdo/가을-맞이-란제리-특가전-비너스-비비안-外",
+  "/songdo/가을-맞이-런닝-필수템-ⅰ",
+  "/songdo/가을-맞이-런닝-필수템-ⅱ",
+  "/songdo/가을-맞이-런닝-필수템-ⅲ",
+  "/songdo/가을-맞이-런닝-필수템-ⅳ",
+  "/songdo/가을-맞이-런닝-필수템-ⅴ",
+  "/songdo/가을-맞이-바람막이-쇼핑-제안",
+  "/songdo/가을-영스트릿-대전-hago스토어-피어-등",
+  "/songdo/가을-패션-제안-특가전-데무-쥬크",
+  "/songdo/겨울-맞이-아우터-쇼핑-찬스ⅰ",
+  "/songdo/겨울-맞이-아우터-쇼핑-찬스ⅱ",
+  "/songdo/겨울-맞이-아우터-쇼핑-찬스ⅲ",
+  "/songdo/겨울-맞이-아우터-쇼핑-찬스ⅳ",
+  "/songdo/겨울-베이직-캐주얼-특가전-마인드브릿지-코데즈컴바인",
+  "/songdo/겨울-영패션-쇼핑-프로모션",
+  "/songdo/겨울-패딩-특가-최대-80-리스트-vov-베네통",
+  "/songdo/골든구스-홀리데이-기프트-추천",
+  "/songdo/골든듀-로제도르-골든-페스티발-마지막-3일-전품목-20-20-off",
+  "/songdo/골든듀-로제도르-전품목-30-off",
+  "/songdo/골든듀-로제도르-해피뉴이어-세일-전품목-20-20-off",
+  "/songdo/골든듀-로제도르-홀리데이-프로모션",
+  "/songdo/골스튜디오-홀리데이-프로모션",
+  "/songdo/골프존-마켓-하반기-골프-대전",
+  "/songdo/교보문고-사인회-이벤트-넘버블럭스-김켈리",
+  "/songdo/교보문고-연말-goods-제안",
+  "/songdo/구호플러스-인기상품-up-to-50",
+  "/songdo/나이키-아디다스-뉴발란스-추가-할인",
+  "/songdo/나이키-최대-25-추가-할인",
+  "/songdo/나이키-추가-할인-마지막-3일",
+  "/songdo/나이키-추가-할인-전-제품-20",
+  "/songdo/나이키-추가할인-최대-25",
+  "/songdo/내셔널지오그래픽-현대-아울렛-단독-윈터세일-페스타",
+  "/songdo/네파-스파이더-크록스-fw-인기-상품-특가전",
+  "/songdo/노르디스크-쇼핑-찬스",
+  "/songdo/노르디스크-스파이더-다이나핏-아우터-특가전",
+  "/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅰ",
+  "/songdo/노스페이스-에디션-쇼핑과-기부를-한-번에-ⅱ",
+  "/songdo/노스페이스-에디션-쇼핑과-기부를-한번에",
+  "/songdo/노티드-크리스마스-케이크-사전예약",
+  "/songdo/뉴발란스-fw-인기-상품-특가전",
+  "/songdo/뉴발란스-최대-20-추가-할인",
+  "/songdo/닌텐도-대작-게임-포켓몬legendza-출시-10-16",
+  "/songdo/닌텐도-스위치2-대작-소개-포켓몬-legend-z-a",
+  "/songdo/닌텐도-프로모션-with-happy-holiday",
+  "/songdo/더-코스메틱-컴퍼니-홀리데이-기프트-특가전",
+  "/songdo/데무-미리보는-가을-겨울-패션-제안",
+  "/songdo/듀베티카-페트레이-최대-80-특가전",
+  "/songdo/듀엘-cc콜렉트-fw-아우터-특가전",
+  "/songdo/디디에두보-홀리데이-기프트-제안",
+  "/songdo/디스커버리-내셔널지오그래픽-스케쳐스-인기-상품-특가전",
+  "/songdo/디스커버리-블랙야크-스케쳐스-fw-특가전",
+  "/songdo/락포트-슈즈-가을맞이-특가전-전제품-20-off",
+  "/songdo/럭셔리-스페셜-위크",
+  "/songdo/레이브-루에브르-최대-70-클리어런스-특가",
+  "/songdo/로제도르-홀리데이-프로모션",
+  "/songdo/리빙-클리어런스-세일-템퍼-씰리-최대-60-off",
+  "/songdo/리스트-가을-얼리-특가전",
+  "/songdo/린-lynn-최대-80-가을-패션-인기상품전",
+  "/songdo/마뗑킴-hago-week",
+  "/songdo/마리떼프랑소와저버-가을-아이템-제안",
+  "/songdo/마리엘렌-모피-전문-팝업-오픈",
+  "/songdo/모조에스핀-연말-파티룩-아이템-특가-제안",
+  "/songdo/몽블랑-가을-신규-상품-입고",
+  "/songdo/몽블랑-홀리데이-기프트-제안",
+  "/songdo/몽슈슈-크리스마스-케이크-사전예약",
+  "/songdo/미니골드-홀리데이-프로모션",
+  "/songdo/미리-준비하는-겨울-아동-아우터-제안",
+  "/songdo/미샤-스페셜-위크",
+  "/songdo/바네사브루노-모조에스핀-가을패션-특가전",
+  "/songdo/베이글리스트x라크루뜨-크리스마스-사전예약",
+  "/songdo/베이직캐주얼-9월-쇼핑-프로모션",
+  "/songdo/베즐리-크리스마스-케이크-사전예약",
+  "/songdo/뷰티-슈퍼위켄드-더-코스메틱-컴퍼니-스페셜-프로모션",
+  "/songdo/뷰티-슈퍼위켄드-더-코스메틱-클럽-pop-up",
+  "/songdo/뷰티-슈퍼위켄드-바디샵-브랜드데이-전품목-30-sale",
+  "/songdo/뷰티-슈퍼위켄드-올리브영-블랙프라이데이-pop-up",
+  "/songdo/뷰티-페어-더-코스메틱-컴퍼니-추석-선물-추천",
+  "/songdo/브룩스브라더스-시즌오프",
+  "/songdo/블랙야크-네파-아우터-쇼핑-찬스",
+  "/songdo/블랙야크-스케쳐스-fw-인기-상품-특가전",
+  "/songdo/산드로-마쥬-최대-70-시즌오프-특가-제안",
+  "/songdo/살로몬-겨울-아우터-추천",
+  "/songdo/새롭게-달라진-아이폰-아이폰-17시리즈-사전-예약",
+  "/songdo/새해-맞이-닌텐도-100-당첨-행운볼-뽑기",
+  "/songdo/소상공인과-함께하는-동행-축제-in-송도",
+  "/songdo/송현아-겨울철-메뉴-추천",
+  "/songdo/송현아-식당가-홀리데이-프로모션",
+  "/songdo/송현아-카페-추천-①",
+  "/songdo/송현아-카페-추천-②",
+  "/songdo/슈슈앤크라-최대-60-특가전",
+  "/songdo/슈즈-패션잡화-가을-특가-프로모션",
+  "/songdo/스노우피크-다이나핏-아우터-특가전",
+  "/songdo/스와로브스키-기프트-스페셜",
+  "/songdo/스톤헨지-주얼리-기프트-특가-제안",
+  "/songdo/스트릿-캐주얼-가을-특가-제안",
+  "/songdo/스트릿-편집샵-프로모션-hago스토어-peer",
+  "/songdo/스트릿캐주얼-추석-특집전-up-to-80-off",
+  "/songdo/스트릿패션-초특가전-피어-세터-lee",
+  "/songdo/썬쿠-suncoo-고별전",
+  "/songdo/아동-인기브랜드-특가전-아이러브제이-프렌치캣-나이키키즈",
+  "/songdo/아디다스-뉴발란스-언더아머-abc마트-쇼핑-찬스",
+  "/songdo/아디다스-전제품-추가할인-30",
+  "/songdo/아디다스-최대-20-추가-할인",
+  "/songdo/아디다스-최대-30-추가-할인",
+  "/songdo/아디다스-추가-할인-최대-30",
+  "/songdo/아이잗바바-데무-가을패션-특가전",
+  "/songdo/아이잗바바-최대-90-가을-패션-특가전",
+  "/songdo/아크테릭스-가을-산행-아이템-추천",
+  "/songdo/아트박스-가을-쇼핑-프로모션",
+  "/songdo/아트박스-쇼핑-할인-혜택",
+  "/songdo/아트박스-추석-프로모션",
+  "/songdo/안다르-다이나핏-노르디스크-데상트-fw-특가전",
+  "/songdo/언더아머-black-5days",
+  "/songdo/언더아머-hdex-송도점-단독-프로모션",
+  "/songdo/언더아머-전품목-30-추가-할인",
+  "/songdo/언더아머-추가할인-최대-40",
+  "/songdo/에이샵-10월-특별-프로모션",
+  "/songdo/에코-슈즈-가을-맞이-특가상품전",
+  "/songdo/에코-슈즈-닥스-핸드백-특가-상품전",
+  "/songdo/에키노마에-크리스마스-슈톨렌-사전예약",
+  "/songdo/여성패션-가을-신상품-입고",
+  "/songdo/영란제리-특가전-코데즈컴바인이너",
+  "/songdo/영스트릿-가을-특가전-up-to-70",
+  "/songdo/영캐주얼-10월-쇼핑-제안",
+  "/songdo/영캐주얼-가을-대전-쥬크-듀엘-cc콜렉트",
+  "/songdo/영캐주얼-가을-최종가전-나이스클랍-리스트",
+  "/songdo/영캐주얼-가을-프로모션",
+  "/songdo/영캐주얼-겨울-초특가전-온앤온",
+  "/songdo/영캐주얼-아우터-패션-특집-최대-80-off",
+  "/songdo/영패션-가을-프로모션",
+  "/songdo/온앤온-조이그라이슨-최대-70-클리어런스-특가",
+  "/songdo/올리브영-올영세일",
+  "/songdo/올리브영-위켄드-프로모션",
+  "/songdo/유니버셜스튜디오-in-송도-pop-up-킹스크로스",
+  "/songdo/유니클로-가을맞이-프로모션",
+  "/songdo/유니클로-겨울-감사제-알려드립니다",
+  "/songdo/유니클로-크리스마스-스페셜-위크",
+  "/songdo/인기-골프웨어-어뉴골프-fw-특가-상품전",
+  "/songdo/입주-이사-특별-혜택-전자랜드-리바트",
+  "/songdo/제너럴아이디어-9월-프로모션",
+  "/songdo/제너럴아이디어-신년-대전-up-to-80-off",
+  "/songdo/제이에스티나-주얼리-핸드백-시계-스페셜-프로모션",
+  "/songdo/제이에스티나-홀리데이-프로모션",
+  "/songdo/젝시믹스-인기-상품-균일가전",
+  "/songdo/지오다노-연말-프로모션-holiday-special",
+  "/songdo/진도모피-모피-전문-팝업-오픈",
+  "/songdo/진캐주얼-겨울-프로모션",
+  "/songdo/집-꾸미기-좋은-계절-로라애슐리-알리페즈",
+  "/songdo/집-꾸미기-좋은-계절-템퍼-씰리",
+  "/songdo/찬바람이-불때-필드위-패션-리더",
+  "/songdo/추워진-날씨-아동-아우터-제안",
+  "/songdo/카르마커피-홀리데이-프로모션",
+  "/songdo/코스메틱-클럽-스페셜-프로모션",
+  "/songdo/코치-팝업스토어-단독-클리어런스-최대-85-off",
+  "/songdo/크리스-가을-골프-특가전-파리게이츠-마스터바니",
+  "/songdo/크리스-가을-골프-특가전-핑",
+  "/songdo/키즈-페스타-아동-브랜드-특별-프로모션",
+  "/songdo/키즈관-1주년-festa-뽀로로-인기-굿즈-특가전",
+  "/songdo/키즈페스타-mlb키즈-탑텐키즈-최대-70-특가전",
+  "/songdo/타미-헤지스-새해맞이-최대-80-할인",
+  "/songdo/타미힐피거-fw-클리어런스-최대-80",
+  "/songdo/타코네코",
+  "/songdo/탠디-미소페-fw-슈즈-균일가전",
+  "/songdo/텐텐-데이-탑텐키즈-1-1",
+  "/songdo/투미-tumi-시즌오프-특가-제안",
+  "/songdo/파타고니아-살로몬-인기-상품-추천",
+  "/songdo/파타고니아-아크테릭스-인기-아우터-제안",
+  "/songdo/팝업-플레이인더박스-with-mini-diy-market",
+  "/songdo/팩토리바쉬-해외패션-클리어런스-up-to-80-off",
+  "/songdo/폴로-브룩스브라더스-가을-신상품-제안",
+  "/songdo/프리미엄-패딩-페어-ⅱ-페트레이-peuterey",
+  "/songdo/프리미엄-패딩-페어-ⅲ-노비스-c-p-company",
+  "/songdo/프리미엄패딩-듀베티카-최대-70-특가-상품제안",
+  "/songdo/피어-25년-fw-시즌오프",
+  "/songdo/필드-위-편안함과-멋내기-bag-shoes",
+  "/songdo/필드-위의-자유로움-아노락-스웨터-추천",
+  "/songdo/필드-위의-존재감-스타일-완성-베이직-아이템",
+  "/songdo/핑-fw-인기-상품전",
+  "/songdo/하나투어-비즈니스-클래스-전용-상품",
+  "/songdo/한섬-브랜드-가을-쇼핑-프로모션",
+  "/songdo/한섬-브랜드-스페셜-프로모션",
+  "/songdo/한섬-해외패션-최대-80-톰그레이하운드-폼",
+  "/songdo/한파대비-모피특가-제안-진도모피-마리엘렌",
+  "/songdo/해외패션-가방-인기상품-특가전",
+  "/songdo/해외패션-가을-신상품-입고",
+  "/songdo/해외패션-스페셜-프로모션",
+  "/songdo/해외패션-클리어런스-대전-몽클레르-아미-a-p-c-外",
+  "/songdo/해외패션-클리어런스-홀리데이-특선-최대-80-off",
+  "/songdo/해외패션-프리미엄-아우터-특가전-몽클레르-톰브라운-外",
+  "/songdo/현대아울렛-커넥트현대-백화점-vip-선정-적립금액-기준-변경",
+  "/songdo/현대홈쇼핑플러스샵-인기상품-창고-개방전-최대-80",
+  "/songdo/현대홈쇼핑플러스샵-인기상품-최대-70-특가전",
+  "/songdo/현아-빵픽-①-가을-메뉴-소개",
+  "/songdo/현아-빵픽-②-신메뉴-소개",
+  "/songdo/홀리데이-와인-특가상품전",
+  "/songdo/휴고보스-투미-홀리데이-페스타",
+  "/spaceone/1년에-단-한번-최대-80-라코스테-클리어런스",
+  "/spaceone/1년에-단한번-소다-닥스-균일가-대전",
+  "/spaceone/2026-스페셜-혜택-special-price-40",
+  "/spaceone/2026-스페셜-혜택-행운-득템-1-1",
+  "/spaceone/7大-클리어런스-락앤락-up-to-80-off",
+  "/spaceone/7大-클리어런스-레노마-빨질레리-up-to-90-off",
+  "/spaceone/7大-클리어런스-레노마ㆍ빨질레리-up-to-90-off",
+  "/spaceone/7大-클리어런스-로아앤제인-up-to-50-off",
+  "/spaceone/7大-클리어런스-슈슈앤크라-up-to-60-off",
+  "/spaceone/7大-클리어런스-써스데이아일랜드-up-to-70-off",
+  "/spaceone/7大-클리어런스-페세리코-up-to-80-off",
+  "/spaceone/acc-특가-제안",
+  "/spaceone/bash-해외-브랜드-특가전",
+  "/spaceone/bbc-어스-이주의-특가-상품",
+  "/spaceone/bcbg-올앤선드리-사계절-특가상품-대전",
+  "/spaceone/collect-them-all-팜팔스-팝업스토어",
+  "/spaceone/comimg-soon-타미힐피거-f-w-최대-70-off",
+  "/spaceone/coming-soon-나이키-키즈",
+  "/spaceone/coming-soon-드로우핏-draw-fit",
+  "/spaceone/coming-soon-룩캐스트-lookast",
+  "/spaceone/coming-soon-리바트토탈-리뉴얼-오픈-프로모션",
+  "/spaceone/coming-soon-베베드피노-이월특가전",
+  "/spaceone/coming-soon-이끼덩굴-pop-up",
+  "/spaceone/coming-soon-현대아울렛-단독-폴로-랄프로렌-클리어런스",
+  "/spaceone/f-w-시즌-맞이-한섬-프리미엄-아우터-제안",
+  "/spaceone/family-weekend-①-추가할인-브랜드",
+  "/spaceone/family-weekend-②-한정-특가-상품",
+  "/spaceone/family-weekend-③-h-point-프로모션",
+  "/spaceone/family-weekend-보니타하우스-세일페스타",
+  "/spaceone/family-weekend-즈윌링-더-드림세일",
+  "/spaceone/holiday-select-package",
+  "/spaceone/last-chance-골든듀-최대-30-특가전",
+  "/spaceone/last-chance-영캐주얼-사계절-인기상품-클리어런스",
+  "/spaceone/new-open-bbc-어스",
+  "/spaceone/new-open-닥스-daks-종합관",
+  "/spaceone/new-open-드로우핏-draw-fit",
+  "/spaceone/new-open-룩캐스트-lookast",
+  "/spaceone/new-open-만학",
+  "/spaceone/new-open-사우스케이프-①",
+  "/spaceone/new-open-스파이더",
+  "/spaceone/new-open-어그-ugg-팝업스토어",
+  "/spaceone/new-open-정희",
+  "/spaceone/new-open-진도-동우-아르티리소-pop-up",
+  "/spaceone/new-open-코아시스",
+  "/spaceone/new-open-프리미엄-골프웨어-사우스케이프",
+  "/spaceone/new-open-핫떡",
+  "/spaceone/next-weekend-라코스테-최대-80-클리어런스",
+  "/spaceone/next-weekend-타미힐피거-f-w-최대-70-off",
+  "/spaceone/pop-up-ground-①-오리고",
+  "/spaceone/pop-up-ground-②-퍼글러",
+  "/spaceone/pop-up-sjyp-단독전-최대-80-할인",
+  "/spaceone/pop-up-군고구마",
+  "/spaceone/pop-up-더핀-the-pin",
+  "/spaceone/pop-up-명랑핫도그",
+  "/spaceone/pop-up-바버-house-of-tartan",
+  "/spaceone/pop-up-브라운브레스-brownbreath",
+  "/spaceone/pop-up-브렌우드-최대-70-할인",
+  "/spaceone/pop-up-에그릿",
+  "/spaceone/pop-up-올영블랙프라이데이",
+  "/spaceone/pop-up-이끼-덩굴",
+  "/spaceone/pop-up-클로기-clogy",
+  "/spaceone/pop-up-프리미엄-라이프스타일-마켓-마켓틸다",
+  "/spaceone/pop-up-프리미엄-비타민-솔가-space1-단독-특가",
+  "/spaceone/pop-up-플리츠미-pleatsme",
+  "/spaceone/pop-up-하고하우스-팝업스토어",
+  "/spaceone/renewal-open-전자랜드",
+  "/spaceone/renewal-open-주얼리-프로모션",
+  "/spaceone/renewal-open-탠디-소다",
+  "/spaceone/renewal-open-핸드백-슈즈",
+  "/spaceone/space1-쇼핑大축제-슈퍼h페스타",
+  "/spaceone/space1-쇼핑大축제-슈퍼price페스타",
+  "/spaceone/space1-첫눈-오는-날",
+  "/spaceone/winelist-가성비-와인-추천",
+  "/spaceone/winelist-금주-와인-추천",
+  "/spaceone/winelist-김창수-위스키-출시",
+  "/spaceone/winelist-다가오는-연휴-와인-선물세트-추천",
+  "/spaceone/winelist-신년-맞이-주류-추천",
+  "/spaceone/winelist-와지트-위크-특가",
+  "/spaceone/winelist-인기-와인-특가",
+  "/spaceone/winelist-인기-위스키-맥주-추천",
+  "/spaceone/가을-골프-룩-제안-사우스케이프-최대-40-off",
+  "/spaceone/가을-맞이-패밀리-세일-말본-최대-70",
+  "/spaceone/가을-맞이-패밀리-세일-코닥-최대-70",
+  "/spaceone/가을-스포츠-기획전-②-휠라",
+  "/spaceone/가을-향기-가득-국화-페스티벌",
+  "/spaceone/가을을-기다린-이유-골퍼들의-위시-리스트-타이틀리스트",
+  "/spaceone/가족을-위한-선물-타미힐피거-최대-70-off",
+  "/spaceone/가족을-위한-선물-폴로-랄프로렌-가을-상품-추천",
+  "/spaceone/겨울-아우터-쇼핑찬스-노스페이스-추가-10-off",
+  "/spaceone/겨울-아우터-쇼핑찬스-특가-상품-제안",
+  "/spaceone/경량다운-특가-상품전-②-k2-최대-50-30-off",
+  "/spaceone/골프웨어-특가전-①-캘러웨이-최대-60-off",
+  "/spaceone/골프웨어-특가전-②-테일러메이드-최대-70-50-off",
+  "/spaceone/골프존마켓-최대-행사-하반기-골프-대전",
+  "/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅰ",
+  "/spaceone/나를-위한-선물-남성-수트-셔츠-위켄드-ⅱ",
+  "/spaceone/나이키-유나이트-space1-단독-연말-스페셜",
+  "/spaceone/나이키-유나이트-리뉴얼-안내",
+  "/spaceone/나이키-유나이트-신년-프로모션",
+  "/spaceone/나이키-유나이트-윈터-시즌-오프",
+  "/spaceone/나이키-유나이트-추가-할인-프로모션",
+  "/spaceone/나이키-유나이트-추석-프로모션",
+  "/spaceone/나이키-유나이트-팝업-행사장",
+  "/spaceone/나이키-유나이트-프로모션",
+  "/spaceone/나이키-유나이트-프로모션-팝업-행사장",
+  "/spaceone/남성-니트-아우터-가을-스타일링-제안",
+  "/spaceone/남양주-청년기업-라쿠치-젤라또",
+  "/spaceone/남양주-청년기업-큐어링랩",
+  "/spaceone/남양주시-아름다운가게와-함께하는-어린이-플리마켓",
+  "/spaceone/내셔널지오그래픽키즈-다운-신상품-선공개",
+  "/spaceone/내셔널지오그래픽키즈-이월특가전",
+  "/spaceone/노스페이스-에디션-쇼핑과-기부를-한번에",
+  "/spaceone/뉴발란스-추가-할인-프로모션",
+  "/spaceone/다우닝-밀로티-가구-패밀리-세일",
+  "/spaceone/다이나핏-최대-70-할인-특가전",
+  "/spaceone/닥스-daks-종합관-가을-아우터-제안",
+  "/spaceone/닥스-daks-종합관-인기-아우터-제안",
+  "/spaceone/데무-demoo-family-sale",
+  "/spaceone/데상트-그룹전-데상트-최대-50-off",
+  "/spaceone/데상트-그룹전-엄브로-최대-60-off",
+  "/spaceone/도원스타일-계절-메뉴-출시",
+  "/spaceone/드로우핏-f-w-프로모션-안내",
+  "/spaceone/디즈니스토어-크리스마스-스페셜-위크-①",
+  "/spaceone/디즈니스토어-크리스마스-스페셜-위크-②",
+  "/spaceone/따뜻한-겨울나기-f-b-혜택-ⅰ",
+  "/spaceone/따뜻한-겨울나기-f-b-혜택-ⅱ",
+  "/spaceone/라운딩의-계절-가을-프리미엄-골프웨어-제안",
+  "/spaceone/라이프스타일-골프웨어-사우스케이프",
+  "/spaceone/라코스테-20-추가-할인-혜택",
+  "/spaceone/라코스테-buy-2-get-10-off",
+  "/spaceone/라코스테-only-2days-타임세일",
+  "/spaceone/라코스테-균일가-프로모션",
+  "/spaceone/라코스테-스페셜-프로모션",
+  "/spaceone/럭셔리-스페셜-위크-5-구매혜택",
+  "/spaceone/럭셔리-스페셜-위크-페트레이-아우터-특집전",
+  "/spaceone/럭셔리-스페셜-위크-해외패션-프로모션",
+  "/spaceone/레노마-캐주얼-대전-네파-아우터-특가전",
+  "/spaceone/로제도르-스페셜-혜택-최대-50",
+  "/spaceone/로제도르-홀리데이-스페셜",
+  "/spaceone/르베이지-lebeige-겨울맞이-특가-제안",
+  "/spaceone/리바트-특가-프로모션",
+  "/spaceone/마이클코어스-가을-맞이-핸드백-스페셜-제안",
+  "/spaceone/마이클코어스-핸드백-스페셜-제안",
+  "/spaceone/마인드브릿지-f-w-데일리-아이템-제안전",
+  "/spaceone/메가박스-영화-6천원-할인",
+  "/spaceone/모조에스핀-f-w-상품-특가-대전",
+  "/spaceone/무냐무냐-fw-특가상품전",
+  "/spaceone/미니도우-fw-특가상품전",
+  "/spaceone/미샤-special-week",
+  "/spaceone/밀짚모자-일당과-함께하는-현대아울렛",
+  "/spaceone/백미당-해피위크",
+  "/spaceone/베베드피노-special-gift-증정",
+  "/spaceone/베베드피노-이월특가전",
+  "/spaceone/본가스시-신메뉴",
+  "/spaceone/부모님을-위한-선물-닥스-daks-pop-up",
+  "/spaceone/부모님을-위한-선물-라코스테-타임세일-위켄드",
+  "/spaceone/부모님을-위한-선물-페트레이-패딩-특집",
+  "/spaceone/브룩스브라더스-가을-신상-제안",
+  "/spaceone/브룩스브라더스-가을-신상품-제안",
+  "/spaceone/브룩스브라더스-간절기-아우터-제안",
+  "/spaceone/브룩스브라더스-인기-아이템-제안",
+  "/spaceone/비클린-beclean-ttth",
+  "/spaceone/비클린-beclean-로에-팝업",
+  "/spaceone/비클린-beclean-베스트-아이템-제안",
+  "/spaceone/비클린-beclean-베스트-아이템-추천",
+  "/spaceone/비클린-beclean-오픈-기념-990원-특가",
+  "/spaceone/쁘렝땅-사계절-특가상품-대전",
+  "/spaceone/살로몬-f-w-아우터-추천-상품",
+  "/spaceone/살로몬-가을-맞이-특가-제안",
+  "/spaceone/살로몬-윌슨-패밀리세일-최대-70-②",
+  "/spaceone/쇼핑-하이라이트-한눈에-보기",
+  "/spaceone/슈퍼위켄드-남성-브랜드-혜택",
+  "/spaceone/스노우피크-메가-클리어런스-세일-최대-60-off",
+  "/spaceone/스케쳐스-추가-할인-프로모션",
+  "/spaceone/스파이더-류현진-에디션-한정-판매",
+  "/spaceone/스파이더-액티브웨어-특가-최대-80-off",
+  "/spaceone/스포츠-겨울-상품-특가전-①-스케쳐스-휠라",
+  "/spaceone/스포츠-겨울-상품-특가전-②-데상트-엄브로",
+  "/spaceone/시리즈-하이엔드-캐주얼룩-제안-upto-60-off",
+  "/spaceone/신원-패밀리세일-최대-80-off",
+  "/spaceone/쌤소나이트-스페셜-프로모션",
+  "/spaceone/아디다스팩토리-추가-할인-프로모션",
+  "/spaceone/아우터-구매는-지금-아웃도어-아우터-특가-제안",
+  "/spaceone/아이더-아우터-초특가전-최대-75-off",
+  "/spaceone/아이디룩-family-sale",
+  "/spaceone/아이잗바바-컬렉션-사계절-상품-특가-대전",
+  "/spaceone/아쿠쉬네트-대전-①-타이틀리스트-최대-60-off",
+  "/spaceone/아쿠쉬네트-대전-②-풋조이-최대-70-off",
+  "/spaceone/아크테릭스-가을-겨울-상품-제안",
+  "/spaceone/앤드지-가을-캐주얼-스타일-제안-upto-60-off",
+  "/spaceone/앤드지-겨울-얼리버드-특가-제안-upto-60-off",
+  "/spaceone/언더아머-군인-추가-할인-프로모션",
+  "/spaceone/언더아머-시즌-패키지-프로모션",
+  "/spaceone/언더아머-추가할인-프로모션",
+  "/spaceone/에고이스트-브랜드위크-최대-80-할인",
+  "/spaceone/에이샵-애플-11월-프로모션",
+  "/spaceone/에잇세컨즈-super-sale",
+  "/spaceone/에잇세컨즈-아우터-week",
+  "/spaceone/에잇세컨즈-이너-위크",
+  "/spaceone/연인을-위한-선물-비비안웨스트우드-가을-인기아이템-제안",
+  "/spaceone/영캐주얼-아우터-상품전-톰보이-보브",
+  "/spaceone/영캐주얼-클리어런스-up-to-70",
+  "/spaceone/오르시떼-홈웨어-팝업스토어",
+  "/spaceone/오프웍스-super-sale",
+  "/spaceone/올리브영-올영세일",
+  "/spaceone/올리브영-올영픽-한정-특가",
+  "/spaceone/올리브영-이주의-추천-상품",
+  "/spaceone/와지트-위크-in-현대아울렛",
+  "/spaceone/와지트-위크-기념-f-b-혜택-콜키지-프리",
+  "/spaceone/웅가로셔츠-final-균일가전",
+  "/spaceone/위글위글-프로모션-위글5일장",
+  "/spaceone/유니클로-new-year-special-week",
+  "/spaceone/유니클로-크리스마스-special-week",
+  "/spaceone/이새-bcbg-올앤선드리-특가상품-대전",
+  "/spaceone/인기-브랜드-아울렛-가격에서-추가-할인",
+  "/spaceone/인기-브랜드-아울렛-가격에서-추가로-더-할인",
+  "/spaceone/인기-여성의류-f-w-상품-대전",
+  "/spaceone/인기-여성의류-사계절-상품-대전",
+  "/spaceone/정관장-아울렛-특가",
+  "/spaceone/정관장-추석-선물세트-제안",
+  "/spaceone/제너럴아이디어-f-w-베스트-아이템-제안",
+  "/spaceone/제너럴아이디어-진-베스트-상품전-①",
+  "/spaceone/젝시믹스-골프-라인-시즌-오프",
+  "/spaceone/주말-공휴일-주차-요금-기준-변경-안내",
+  "/spaceone/지포어-스페셜-pop-up-최대-65-off",
+  "/spaceone/최초-마리떼프랑소와저버-비케이브-대전-①",
+  "/spaceone/최초-마리떼프랑소와저버-비케이브-대전-②",
+  "/spaceone/추석-명절-선물세트-구매혜택",
+  "/spaceone/추석-명절-선물세트-제안-ⅰ",
+  "/spaceone/추워지는-계절-golf-아우터-특가-제안",
+  "/spaceone/캉골키즈-이월특가전",
+  "/spaceone/캐릭터라인-팝업스토어-산리오-톰과제리-먼작귀",
+  "/spaceone/커버낫키즈-lee키즈-특별-할인전",
+  "/spaceone/코닥-인기-아이템-특가전",
+  "/spaceone/코튼클럽-언더웨어-기프트-대전",
+  "/spaceone/코튼클럽-언더웨어-명절맞이-기프트대전",
+  "/spaceone/퀵실버록시-라스트-찬스-세일",
+  "/spaceone/크리스마스-best-4-포토스팟-인증샷-이벤트",
+  "/spaceone/크리스마스-스탬프-event",
+  "/spaceone/크리스패션-패밀리세일-①-세인트앤드류스-최대-70-off",
+  "/spaceone/크리스패션-패밀리세일-②-핑-최대-85-off",
+  "/spaceone/클리어런스-위켄드-lucky-특가상품-40선",
+  "/spaceone/클리어런스-위켄드-한-눈에-보기-인기-브랜드",
+  "/spaceone/타미힐피거-추가-20-할인-혜택",
+  "/spaceone/테일러메이드-가을-특가-상품전-최대-60-off",
+  "/spaceone/템퍼-clearance-week",
+  "/spaceone/템퍼-스페셜-웨딩-프로모션",
+  "/spaceone/파브르의-비밀노트-곤충-파충류-체험전",
+  "/spaceone/파타고니아-전-품목-추가-20-할인",
+  "/spaceone/퍼포먼스-골프웨어-특가-①-풋조이-최대-70-50-off",
+  "/spaceone/퍼포먼스-골프웨어-특가-②-데상트골프-최대-60-off",
+  "/spaceone/폴로-랄프로렌-10-사은-행사",
+  "/spaceone/폴로-랄프로렌-acc-아이템-제안",
+  "/spaceone/폴로-랄프로렌-가을-신상품-제안",
+  "/spaceone/폴로-랄프로렌-가을-아우터-추천-10-사은-행사",
+  "/spaceone/폴로-랄프로렌-스테디셀러-스타일-제안",
+  "/spaceone/폴로-랄프로렌-아이코닉-스타일-제안",
+  "/spaceone/폴햄-f-w-베스트-상품-최대-60-할인",
+  "/spaceone/프리미엄-아웃도어-대전-①-최대-70-60-off",
+  "/spaceone/프리미엄-아웃도어-대전-②-최대-70-60-off",
+  "/spaceone/프리미엄-워치-특가-제안",
+  "/spaceone/프리미엄-코스메틱-특가-제안전",
+  "/spaceone/프리미엄-코스메틱-환절기-추천-상품",
+  "/spaceone/필드-위에서-더-우아한-사우스케이프-최대-50-off",
+  "/spaceone/한섬-special-promotion",
+  "/spaceone/한섬-아우터-페스타",
+  "/spaceone/한섬-크리스마스-금액-할인-프로모션",
+  "/spaceone/한섬-해외-패션-브랜드-스페셜위크-프로모션",
+  "/spaceone/해외패션-특가-제안",
+  "/spaceone/행사장-한-눈에-보기",
+  "/spaceone/헤지스-upto-70-off",
+  "/spaceone/헨리코튼-f-w-upto-40-off",
+  "/spaceone/현대아울렛-단독-남성-폴로-랄프로렌-클리어런스",
+  "/spaceone/현대아울렛-단독-아동-폴로-랄프로렌-클리어런스",
+  "/spaceone/현대아울렛-단독-여성-폴로-랄프로렌-클리어런스",
+  "/spaceone/현대아울렛-캠프닉-호로로랑-캠핑-가자",
+  "/spaceone/현아-시그니처-페스티벌-룰렛-이벤트",
+  "/spaceone/홀리데이-스페셜-패키지",
+  "/spaceone/휴고보스-스페셜-베네핏",
+]
+// 정렬된 이벤트 ID와 FILES 번호. _02/_03/_04, 9자리 축약형 변형은 규칙으로 해석하고
+// 기본 ID와 다른 페이지를 가리키는 변형만 따로 저장
+const IDS = ["0007f6768","0007f6768_02","00111647f752","00ab21111","00ab21111905","00ab21111905_02","00ab21111905_03","00ab21111905_04","00c2dafa3","00c6dc6f9911","0171c9488937","01c84919a","01f062f52","027b759541de","028e7af9a","028e7af9a45b","028e7af9a45b_02","028e7af9a45b_03","028e7af9a45b_04","02c15a6eb8b0","02f6c710d","02f6c710d_02","033ef46ec4c3","039682e96682","04053b3d5","0453c05e90ab","0474baa6f6ec","054376ac14f9","064d65621","06970f3b5","06af8d4940cf","06bda4be7","073109cac939","075f69464cce","0769c5bb3","07763a1aa","07763a1aa457","07763a1aa457_02","07763a1aa457_03","07763a1aa457_04","08e2c8bb14a4","0931936d4bcd","094169881490","0988a7514","0988a7514335","0988a7514335_02","0988a7514335_03","0988a7514335_04","0b232d278","0b67aac5e","0b75b9dacb10","0bf40a9e5","0bf40a9e5818","0bf40a9e5818_02","0bf40a9e5818_03","0bf40a9e5818_04","0c6149a69062","0cd92f5b1","0e20b40a8","0e20b40a8eea","0e20b40a8eea_02","0e20b40a8eea_03","0e20b40a8eea_04","0e37657c1","0e3aac56b615","0e5185aa8602","0e7aff0542d7","0eff14b71cfd","0f71f780ddce","0fda023b8e3d","0ff15a486a99","100c1650a4c1","10be92f3639f","10dd14373","10dd143734f5","10dd143734f5_02","10dd143734f5_03","10dd143734f5_04","10e43fcc7","10e43fcc7_02","111ea499578e","1124ca63a688","119028065055","126bb771b63f","126d14cb9","12b2cd2cdf79","12c081371","137acfd3c","13ac4954ea10","13d2b44bb65a","1470ebbc3","1470ebbc3a09","1470ebbc3a09_02","1470ebbc3a09_03","1470ebbc3a09_04","15434dc7674e","158ff7cba","158ff7cbac6c","158ff7cbac6c_02","158ff7cbac6c_03","158ff7cbac6c_04","15a34eff34fb","16772d820263","167bf7f51","167bf7f51670","167bf7f51670_02","167bf7f51670_03","167bf7f51670_04","1869cb229","18f2c91dd","18f2c91dd_02","1962a4bfc","1962a4bfc_02","196cb5468","196cb5468_02","19fe27107","1b1d7832921f","1b3a9ab13a24","1b5ec11f0947","1b98bb9e225a","1bc24ac78","1c0c4aba12c6","1c52874cf","1c52874cfb11","1c52874cfb11_02","1c52874cfb11_03","1c52874cfb11_04","1cc7617408c5","1d0d77557","1d0d77557b4d","1d0d77557b4d_02","1d0d77557b4d_03","1d0d77557b4d_04","1d6fa829b","1d6fa829b0b0","1d6fa829b0b0_02","1d6fa829b0b0_03","1d6fa829b0b0_04","1da948ee91ec","1dc1974c76fe","1df34dcd1","1e093cba7","1e093cba7_02","1e58c01e2c64","1e5fd91e4","1edd3db22","1edd3db22805","1edd3db22805_02","1edd3db22805_03","1edd3db22805_04","1f0c612c6","1f0c612c6997","1f0c612c6997_02","1f0c612c6997_03","1f0c612c6997_04","1f42e53362e7","2009d4e45833","200bb0a03ee7","20afd587ce61","22033a52b52b","22ad9c0aa","22fe4d29f","22fe4d29fe19","22fe4d29fe19_02","22fe4d29fe19_03","22fe4d29fe19_04","235d4340761d","23bdcb0992a6","24270582fd43","247eff464","247eff46467d","247eff46467d_02","247eff46467d_03","247eff46467d_04","24827d12c","248d4e847908","24b7a7044","260bcf030ac5","262d5eac36c3","27151baab212","272a3d8e4","2733df5e41f0","27659de2e4f4","277468807","277468807_02","27faeee82f52","280a7527d","280a7527dce5","280a7527dce5_02","280a7527dce5_03","280a7527dce5_04","2831e366c","2831e366c_02","2894a3aa5","28bf366ce698","294914db5581","297e6fab8","297e6fab88b1","297e6fab88b1_02","297e6fab88b1_03","297e6fab88b1_04","299ed0d14c46","2a2b53a0a52c","2a3f5b096","2a3f5b096c8d","2a3f5b096c8d_02","2a3f5b096c8d_03","2a3f5b096c8d_04","2ae36c8f7","2ae36c8f7a70","2ae36c8f7a70_02","2ae36c8f7a70_03","2ae36c8f7a70_04","2afadfa3f26b","2b5737efca79","2be7a5267cb6","2c3b1eaae","2c3b1eaae_02","2c8bb14a4","2ca7cee8e","2d03d0f4f","2d1208bbf","2d5f6c694","2d5f6c694_02","2e06037cb92e","2e13084fb","2e36078ed","2e36078ed7c3","2e36078ed7c3_02","2e36078ed7c3_03","2e36078ed7c3_04","2f41ac7507e5","2f63de35685e","2f6c27eedbfe","2f7c2fbe6849","2fe1ae417","2fe767b88b2d","30ae84b5e898","3106dcea0e41","312e7d40be46","32142f29ec47","32cb4d4a4","32d6d5b399f8","332c65983f68","333081b9e","333081b9ece9","333081b9ece9_02","333081b9ece9_03","333081b9ece9_04","334f1e260","33abfcd32","33abfcd321eb","33abfcd321eb_02","33abfcd321eb_03","33abfcd321eb_04","342842e9c","342842e9cb63","342842e9cb63_02","342842e9cb63_03","342842e9cb63_04","3482b6272be7","348477dc7255","34c901670","34c901670977","34c901670977_02","34c901670977_03","34c901670977_04","351d2465c","351d2465c_02","35adc07e7","35adc07e74bf","35adc07e74bf_02","35adc07e74bf_03","35adc07e74bf_04","35bc49837","35bc49837_02","3623a9757a89","363c5fb87","366639f10","36d080104","370da9df5845","3789c9c0e964","37e89ee4d","38b293924994","38f884d36771","3982d1208bbf","3992f9bee","3992f9bee7ee","3992f9bee7ee_02","3992f9bee7ee_03","3992f9bee7ee_04","3a01e8edf","3a18d1950","3b8bbe2c1","3cbe93e282ab","3d0a13bd6403","3d32ba0fa063","3de7f754a9e7","3deb03ddfa1b","3dfc06f06e09","3e04c4d58bc7","3e4c2b3f1","3e4c2b3f1a99","3e4c2b3f1a99_02","3e4c2b3f1a99_03","3e4c2b3f1a99_04","3ea587e074a4","3f277c52b480","3f572e96ae5a","40dfb648c","413e4c330394","4157343b9f0f","4206c96fd","4206c96fd171","4206c96fd171_02","4206c96fd171_03","4206c96fd171_04","42961dd82186","4393f2e0bf10","443ec2a37","443ec2a37e06","443ec2a37e06_02","443ec2a37e06_03","443ec2a37e06_04","4604d62f4","4604d62f45b2","4604d62f45b2_02","4604d62f45b2_03","4604d62f45b2_04","4610c0ed6","4610c0ed63c8","4610c0ed63c8_02","4610c0ed63c8_03","4610c0ed63c8_04","46ef50cd04f3","46f97dcefc9d","4704ec34a643","471f33928252","47600129e","485050a98212","48d74af77b9d","494d5345d4fe","4953196d1167","498211093","4996168541d4","49cccf0df","49cccf0dfd96","49cccf0dfd96_02","49cccf0dfd96_03","49cccf0dfd96_04","4a9e4e7dff95","4be0caaf8","4be0caaf8744","4be0caaf8744_02","4be0caaf8744_03","4be0caaf8744_04","4c084e883e87","4c681d323b9c","4c85c3b74510","4da40e024d9b","4e3ac25b0","4e3ac25b0130","4e3ac25b0130_02","4e3ac25b0130_03","4e3ac25b0130_04","4e5998c12","4e75bdfa27ba","4e9d76aaf8a5","4eb26cdf2","4f3401a87","4f3401a87_02","4f659b521051","4f86e5a8c","4feabdc0c2ec","5033239b3","5033239b3_02","50ba4d74591d","51cd04064abf","521a85bb5a20","530e306eb","535be9e83","53e1f3aee","543c914a3","549989dd3e95","552575ffc","55b283500619","5645464b6dc1","577e9467c39d","5790946bd","5790946bd881","5790946bd881_02","5790946bd881_03","5790946bd881_04","57a46be97104","58b7d2712","58da1fedab8e","59668e59cf6f","5a3b66d32de5","5add9e421","5add9e421c68","5add9e421c68_02","5add9e421c68_03","5add9e421c68_04","5b5bfaaa1","5b5bfaaa1_02","5ba0b19e8","5ba0b19e8_02","5bb40f1d0331","5bc7758ac","5bc7758ac524","5bc7758ac524_02","5bc7758ac524_03","5bc7758ac524_04","5c460e66816f","5c6b71f62","5caaaf952","5cdf08c62342","5d7e0750b","5d80aeea5b54","5df1afe50b72","5e0ac2e7ea4f","5eaae9977","5eaae997740f","5eaae997740f_02","5eaae997740f_03","5eaae997740f_04","601c35a434a7","604401871be7","607b58c79","607b58c79_02","6092722cb","6092722cb_02","60ff51f8e","60ff51f8e408","60ff51f8e408_02","60ff51f8e408_03","60ff51f8e408_04","611cf2023","6146ecbac","6146ecbaca18","6146ecbaca18_02","6146ecbaca18_03","6146ecbaca18_04","616ccd85eff4","61d37e89ee4d","6218948ab","622ad411e","622ad411e8a0","622ad411e8a0_02","622ad411e8a0_03","622ad411e8a0_04","6233ece395f1","629b1297f15e","629c6491988a","62ddeebf13f0","6367ceaf39ad","63974e946","63ae3355118a","640a72dbc8d2","651a2c3804e4","651f5b50d","6566686f5","6566686f57e0","6566686f57e0_02","6566686f57e0_03","6566686f57e0_04","65ee270c0","666f12133","666f12133_02","66827254b2cf","670d8e1552fc","673a9f499d9e","6747c15a70d3","675aa3ec5","675b3ff53","677585246e90","68009c5dcaa9","68089e6ff4ae","68228dc9d252","685084e762ad","6922f1c58dcd","697858090d24","697936aec","6a4f932c4214","6a6b8bb9b893","6ae98d3f07c5","6b61ccbb9d81","6b8ed3b94","6b8ed3b94df3","6b8ed3b94df3_02","6b8ed3b94df3_03","6b8ed3b94df3_04","6c13b07fc","6c4391f88ed1","6c73601ac8f0","6ccb890c7acb","6d028a910841","6d3d09dc26c3","6d9a6e97d489","6e04b38a8","6e71c6975","6e71c697552f","6e71c697552f_02","6e71c697552f_03","6e71c697552f_04","6e87546d4","6e87546d4788","6e87546d4788_02","6e87546d4788_03","6e87546d4788_04","6f6a163a3","6f6a163a334e","6f6a163a334e_02","6f6a163a334e_03","6f6a163a334e_04","6f7018dff","6f91b2f07df4","6fbc93c19128","6fe56fd7494b","70049fe070a7","714f2fa2f","71bad5f2c867","71e86b595","71e86b595_02","720d295cc","723129073604","72d820263","72dce5273","72dce5273a46","72dce5273a46_02","72dce5273a46_03","72dce5273a46_04","7397ae7fa791","73bc0b3fb","741cc523646b","74420c1b2d06","744329474","745510fe538d","74e9e509984a","74f14ebfcafa","75bffb20994e","75de3cf71","75de3cf714ad","75de3cf714ad_02","75de3cf714ad_03","75de3cf714ad_04","763af35ab","763af35ab_02","76e75b4d09b3","77325862e21b","77871c751","77aa88219","783fa9b4f","783fa9b4f_02","787531e5ece2","7948627c3c9b","79db833aa","79db833aad34","79db833aad34_02","79db833aad34_03","79db833aad34_04","7ac88ead803d","7bc03c315a44","7c6406def","7c6406def317","7c6406def317_02","7c6406def317_03","7c6406def317_04","7c98a29ad1b6","7caadc6cd280","7d0d72bbb7f3","7d9655ca0","7ddd50b68e49","7dfcb9da5960","7dfd93be7","7dfd93be7b3d","7dfd93be7b3d_02","7dfd93be7b3d_03","7dfd93be7b3d_04","7e25953e4cf4","7eb64239c","7f01ad164fe8","7f3d15746","806ba72a3","806ba72a3adf","806ba72a3adf_02","806ba72a3adf_03","806ba72a3adf_04","81c3ab26bd08","81d323b9c","83d1baa5f3e2","83e1a193e","84bd0aa1cad2","84d715b037b3","84e2fd6c2","8509a302a138","85f4e3c165b6","86a9028b5de5","86b93f82a","86b93f82a6ac","86b93f82a6ac_02","86b93f82a6ac_03","86b93f82a6ac_04","86e5f40a7aa1","871dbdfa91d7","878495067","87b9bb1b1df2","883692b61","883692b610b2","883692b610b2_02","883692b610b2_03","883692b610b2_04","884d36771","885cae896fc4","886ed9adf","886ed9adf_02","88b6783c8251","896a0d0a5","898aacc39d8f","899560983","899560983e01","899560983e01_02","899560983e01_03","899560983e01_04","89eea47e6f6f","8a3d6338a","8ad581ac4874","8ae654598","8b828175c7ed","8b8c96b97","8b8c96b977db","8b8c96b977db_02","8b8c96b977db_03","8b8c96b977db_04","8ba1ce6227bc","8bc839217","8bc8392179af","8bc8392179af_02","8bc8392179af_03","8bc8392179af_04","8c5e166e2da7","8c87a3cc5","8ce597133","8ce597133790","8ce597133790_02","8ce597133790_03","8ce597133790_04","8cfd9b174","8cfd9b174_02","8d750f5afc73","8dea7933f8bb","8edc89ee05fe","8f64e950c","903bfc11fba8","90799bd1875f","90945f02e","90945f02e_02","90e067fcdeac","90f0cd4f1f51","9149b410bb79","91614a34eaf3","91df71879","91df71879b37","91df71879b37_02","91df71879b37_03","91df71879b37_04","9246dc0efa8c","92e7e048323e","92edde30c0ed","92f6f7cbc8ca","933362fa180c","9386eff289a2","94220800906c","944d994bc9f4","95597a5425cc","957c6188a","95f2f7448ac5","95faae045169","96540a000619","9668e733c","9668e733c_02","96a0c06f603b","96b28e37e","96b28e37e_02","96c02eb5b","96c02eb5b1b0","96c02eb5b1b0_02","96c02eb5b1b0_03","96c02eb5b1b0_04","980d2377d","980d2377d4f1","980d2377d4f1_02","980d2377d4f1_03","980d2377d4f1_04","983b27bd0","984161e2e53c","9857109c3af1","98b2b0b4df13","9940f51a29f3","9975db0452ff","99c463c49","9a018f2c91dd","9a1816d8b","9a1816d8b524","9a1816d8b524_02","9a1816d8b524_03","9a1816d8b524_04","9a63edb68","9b213e2ceff8","9c5f840b2537","9c65b7e53","9ca6e288d252","9cde1536b","9cde1536b_02","9d2ecf97e","9d9287f94","9d9287f944e1","9d9287f944e1_02","9d9287f944e1_03","9d9287f944e1_04","9da89da4a145","9e437a6c1","9e437a6c1_02","9ebabf4af4b4","9f935b07b","9f935b07b_02","a0d7ab6e0","a0d7ab6e0_02","a0e0703b8119","a13eeb7f4098","a1f556376","a21f11097a44","a2977e139","a2977e139dad","a2977e139dad_02","a2977e139dad_03","a2977e139dad_04","a2cd90a1e621","a2cf987e7dc5","a3018104172e","a3490810d3f2","a3b385e569d8","a3fb626c1dc3","a416d01dd15e","a477de4e5","a4b3afff2cfa","a50f31f481d0","a532bc236a1a","a547cc21f","a547cc21f_02","a698f5476c66","a76167687f6b","a789f4312fe6","a7dd174a1","a7dd174a1b09","a7dd174a1b09_02","a7dd174a1b09_03","a7dd174a1b09_04","a80bcf90ac7a","a8148f692","a8148f692514","a8148f692514_02","a8148f692514_03","a8148f692514_04","a849cb38f","a849cb38f_02","a8b9d5881379","a90a0ef06","a90e3a5d1","a90e3a5d1_02","a9a17b011547","a9c2d3707","a9c48aa10","a9f5f730b1e2","aa4d6ebc5","aa4d6ebc5_02","aa649bdf1","aab0628c7","aab0628c774d","aab0628c774d_02","aab0628c774d_03","aab0628c774d_04","aac1524fc10e","aaf25c16436d","ab78f7e1b","ab78f7e1b8b0","ab78f7e1b8b0_02","ab78f7e1b8b0_03","ab78f7e1b8b0_04","ac4308212","ac461feea1c6","acc2d63b4c20","ad105b6b9a50","ad8181817064","ad9699b25","ad9699b25c6b","ad9699b25c6b_02","ad9699b25c6b_03","ad9699b25c6b_04","ad9f0094e79f","ae392404d656","ae544b32b","aef49e0d04c8","af59ef9c9152","afd9f2800ed6","b034cd31f933","b03caf45a94e","b05bc1a5c","b0a9cde1536b","b14664287086","b17071f7e","b1a9a81b1f5e","b1b92fc8672a","b1c94c70e","b1d5b3e4e869","b1dd06a9ebb4","b2215a4a0896","b307636f1","b34a90a0ef06","b3bb190d1d5c","b3cbd54602cf","b3e5531c0715","b3fcf6f72526","b40f68e8f67e","b41459fe5d37","b42933b4a0c9","b48ae5a30","b49c13c93","b49c13c93e4c","b49c13c93e4c_02","b49c13c93e4c_03","b49c13c93e4c_04","b522c2ea487e","b581d41aff1e","b581df34dcd1","b626c1dc3","b67b94d94","b88a4a043","b88a4a043_02","b92036836009","b957cf3f65b0","b9d1cc396a44","ba0caa0837fa","ba45451e06fd","bacea2684a1e","bb17d7e59e57","bb52cbfcd","bb52cbfcdf83","bb52cbfcdf83_02","bb52cbfcdf83_03","bb52cbfcdf83_04","bbe22121045c","bc3d29dd2025","bc6c32979","bcb9d7bae","bcb9d7bae_02","bd81eccfe8f8","bdd391f85","bdeb0308f5a5","be186aa38b6c","bede353842e9","bee0007f6768","bee6de23a","bee6de23aa5a","bee6de23aa5a_02","bee6de23aa5a_03","bee6de23aa5a_04","beec5aa48","beec5aa48b5c","beec5aa48b5c_02","beec5aa48b5c_03","beec5aa48b5c_04","bf6932721","bfb0ff985997","c0076022a","c047319ec0a4","c07a73abede9","c08d637376d7","c0dd9acd8","c0dd9acd8766","c0dd9acd8766_02","c0dd9acd8766_03","c0dd9acd8766_04","c1beba053bbd","c1f57e55d","c217df850239","c23701a49eb3","c26543c914a3","c2e7f3fb2","c2f9b6b6e5cd","c2fbe6849","c34b56693","c353bbd1ebcd","c3608f7af","c375318fd","c375318fd_02","c42fd210ddf4","c444c35ac528","c4482f0c7b90","c4aba12c6","c4c9caa7b","c4fb440e34f7","c56264cebba4","c5c0e7f59","c5c0e7f590a6","c5c0e7f590a6_02","c5c0e7f590a6_03","c5c0e7f590a6_04","c63bff80835c","c6627276f","c6627276f66c","c6627276f66c_02","c6627276f66c_03","c6627276f66c_04","c6a0c1d92a6a","c6b255136","c730221a3","c74d825e3","c74d825e3d5a","c74d825e3d5a_02","c74d825e3d5a_03","c74d825e3d5a_04","c768457e2","c768457e2e2a","c768457e2e2a_02","c768457e2e2a_03","c768457e2e2a_04","c779dfa1b2dc","c973ef83b","c97ac92fffd4","c97bb6e9c","c97bb6e9c_02","c99714f2fa2f","c9c28a0b6646","ca49f82be","ca49f82be33e","ca49f82be33e_02","ca49f82be33e_03","ca49f82be33e_04","cab9e8140934","cb0f88698340","cb3f85f78784","cb832cb4d4a4","cb94e7005","cb94e7005d5c","cb94e7005d5c_02","cb94e7005d5c_03","cb94e7005d5c_04","cbc13e6733ce","cbf5fa85b83c","cc0981084d1d","ce121f432","ce15b0b06335","ce3a73cb0096","ce60151fa","ce67b7608","ce8bb9ab5","cf32f10f265d","cf6f72526","cff5a707c850","d006e42497ec","d06a9ebb4","d06a9ebb4_02","d07542f34e9d","d14dd2c8345e","d1da17bce","d1da17bce_02","d22de2cb3","d22de2cb3_02","d30a65c1a0c4","d415d414f850","d48aa5a04","d48aa5a0477c","d48aa5a0477c_02","d48aa5a0477c_03","d48aa5a0477c_04","d4f543352260","d59dea9fef47","d5ac9f94558b","d5bc68f7825f","d5c11160b","d67354950","d6ae32034","d6ae32034_02","d715b3a8479b","d72bbb7f3","d72bbb7f3_02","d7f52968b","d7f52968b90b","d7f52968b90b_02","d7f52968b90b_03","d7f52968b90b_04","d8643bc30","d8643bc30c15","d8643bc30c15_02","d8643bc30c15_03","d8643bc30c15_04","d8813c7b2","d8813c7b2598","d8813c7b2598_02","d8813c7b2598_03","d8813c7b2598_04","d8cb5a887b31","d8f560d4e","d9368256f","d9368256fb4a","d9368256fb4a_02","d9368256fb4a_03","d9368256fb4a_04","d959e6ac8aa6","d96602ab00b1","d96ae544b32b","da65515fce46","daddc330b","daddc330b11c","daddc330b11c_02","daddc330b11c_03","daddc330b11c_04","db4d1da17bce","db958b7d2712","dc06e1f3d3f1","dc1e7faa4b22","dc4cb84f0a04","dc9a57bbfd2c","dcb0992a6","dcb0992a6_02","de367488a","de367488aeff","de367488aeff_02","de367488aeff_03","de367488aeff_04","de504bbfe","de83115e1","de83115e1_02","dec9a72b8df7","dedc49f9e","dedc49f9ec02","dedc49f9ec02_02","dedc49f9ec02_03","dedc49f9ec02_04","dee665658","dee6656585f3","dee6656585f3_02","dee6656585f3_03","dee6656585f3_04","e033e15d6c55","e0c0d6615f13","e0d37432e","e1878850cb4a","e1bd34aa8","e2450124124f","e35eb4e10","e377ef796","e47ac27a9","e4ac446a8","e4ac446a83e4","e4ac446a83e4_02","e4ac446a83e4_03","e4ac446a83e4_04","e5189d981","e5189d981933","e5189d981933_02","e5189d981933_03","e5189d981933_04","e534a2bb8","e534a2bb8f01","e534a2bb8f01_02","e534a2bb8f01_03","e534a2bb8f01_04","e65b69d0f","e663f65ec","e663f65ec9e6","e663f65ec9e6_02","e663f65ec9e6_03","e663f65ec9e6_04","e6e8c6749","e70604cbaac1","e71cd71abeae","e7b838add","e7b838add2f2","e7b838add2f2_02","e7b838add2f2_03","e7b838add2f2_04","e7d5dd334d46","e867e3aadad4","e89a7770f","e89a7770f4de","e89a7770f4de_02","e89a7770f4de_03","e89a7770f4de_04","e89bcc065640","e8b3dc65e13b","e8b6b894d0ca","e8ec9ecb29c4","e9290e884","e9290e884cf3","e9290e884cf3_02","e9290e884cf3_03","e9290e884cf3_04","e9c8c63e51e6","e9f3743228c1","e9f8503b7682","ea452d8036be","ea57386f7b53","ea915fc5c4cd","eae01964f","eae01964f_02","ebad81fe3","ed43b4c7b865","ed79f9b59d00","eddc5d697ee2","edf11ac3d2db","eeea11156b52","ef21415e1","ef21415e1_02","efa2712cffca","efa735f13","efa735f13443","efa735f13443_02","efa735f13443_03","efa735f13443_04","f00b3242447e","f043aef3d","f043aef3d_02","f0b5d3da4","f0b5d3da4cc3","f0b5d3da4cc3_02","f0b5d3da4cc3_03","f0b5d3da4cc3_04","f0d292c00a2a","f11be6597e51","f17adda85c07","f1efaeeb3fba","f2b8be75c8de","f2ba0c6c1728","f366ce698","f3951ff8c","f3deb369b","f3deb369b78c","f3deb369b78c_02","f3deb369b78c_03","f3deb369b78c_04","f4387ddb4","f4387ddb4954","f4387ddb4954_02","f4387ddb4954_03","f4387ddb4954_04","f44040550dcd","f4476e051","f4476e051_02","f4ec74ba04ac","f4fc93540","f4fc93540_02","f50358de6aa5","f51f5a22f","f51f5a22f8cc","f51f5a22f8cc_02","f51f5a22f8cc_03","f51f5a22f8cc_04","f52965d3e","f52965d3e923","f52965d3e923_02","f52965d3e923_03","f52965d3e923_04","f53d844cc","f53d844ccd07","f53d844ccd07_02","f53d844ccd07_03","f53d844ccd07_04","f56c4d0d5cb6","f5701fefc","f5d86f929","f5dd2ce21","f5dd2ce218fe","f5dd2ce218fe_02","f5dd2ce218fe_03","f5dd2ce218fe_04","f5f0a3215283","f610652d3e78","f613d2cf6d96","f62b042ffcc6","f6406bda4be7","f688e76cd135","f69464cce","f69f90bb8","f69f90bb86a3","f69f90bb86a3_02","f69f90bb86a3_03","f69f90bb86a3_04","f6e56b089","f6e56b089_02","f790c79f065f","f7be76229","f7be762299a6","f7be762299a6_02","f7be762299a6_03","f7be762299a6_04","f872968a7d42","f89c88bfb697","f8c3034f7b95","f8f55251b874","f98bb7014ae2","f9a32f41c","f9a32f41c5df","f9a32f41c5df_02","f9a32f41c5df_03","f9a32f41c5df_04","fa7036b1d","fa7b08eb0","faa38a02c","fac3ac6f2714","fb43e3d96","fb45b604e","fb45b604e246","fb45b604e246_02","fb45b604e246_03","fb45b604e246_04","fbfadce0a","fbfadce0a55a","fbfadce0a55a_02","fbfadce0a55a_03","fbfadce0a55a_04","fc23e9c4a962","fc7e0fe65","fc9629249","fcb8a7e1d183","fd7e91d309d2","fda5f2e21b93","fda8364179dd","fdabe52706b4","fdb1d4b97","fdd886ed9adf","ffa9963a7a4a"]
+const TARGETS = [668,358,401,309,464,309,309,309,279,170,494,492,423,478,792,791,792,792,792,289,717,718,333,1,292,2,421,403,548,68,150,587,207,735,548,17,256,17,17,17,521,159,448,691,692,691,691,691,813,719,640,338,480,338,338,338,79,111,243,814,243,243,243,322,773,787,114,298,439,782,540,357,148,219,261,219,219,219,769,768,341,32,29,433,43,823,752,154,55,301,530,528,530,530,530,544,294,184,294,294,294,342,632,572,609,572,572,572,375,567,575,284,479,756,755,183,806,331,386,461,98,35,672,673,672,672,672,379,704,584,704,704,704,247,248,247,247,247,648,388,760,92,94,809,234,237,238,237,237,237,121,122,121,121,121,496,132,123,316,387,590,550,705,550,550,550,127,41,336,639,435,639,639,639,574,263,595,564,695,260,329,343,699,743,145,525,212,592,212,212,212,674,675,473,631,561,120,102,120,120,120,313,296,742,741,742,742,742,390,389,390,390,390,552,667,720,571,702,521,13,748,722,165,167,286,517,720,580,720,720,720,328,599,209,310,425,593,355,440,314,242,264,332,151,408,374,408,408,408,326,95,96,95,95,95,268,267,268,268,268,146,370,455,458,455,455,455,569,586,404,364,404,404,404,262,263,466,166,18,487,143,562,24,766,90,722,75,250,75,75,75,377,218,779,763,559,241,650,265,531,446,87,191,87,87,87,48,406,689,625,507,350,140,776,140,140,140,509,485,101,67,101,101,101,181,182,181,181,181,135,157,135,135,135,334,242,469,99,378,419,174,304,634,453,414,627,758,627,627,627,78,312,305,312,312,312,359,591,420,529,588,630,588,588,588,498,729,751,658,557,577,206,605,349,179,178,810,690,652,11,225,392,19,484,641,147,149,727,546,547,546,546,546,447,37,749,617,728,713,714,713,713,713,142,144,10,249,654,290,291,290,290,290,601,318,89,430,615,220,320,57,30,85,30,30,30,497,5,778,777,275,94,803,637,803,803,803,576,681,679,681,681,681,807,24,139,246,80,246,246,246,198,365,69,444,115,670,228,274,663,515,416,417,416,416,416,59,395,396,391,77,20,820,367,82,302,816,650,180,360,21,485,323,66,720,442,711,682,596,682,682,682,579,8,606,393,808,146,60,223,231,245,231,231,231,3,64,3,3,3,300,400,300,300,300,25,608,712,100,126,754,149,454,149,84,524,632,764,621,764,764,764,152,723,491,533,161,9,734,467,327,594,677,594,594,594,213,413,298,476,694,449,470,277,783,539,214,155,214,214,214,385,189,173,172,173,173,173,169,419,308,660,273,363,797,825,797,797,797,397,726,828,555,283,483,283,283,283,16,591,445,731,244,353,171,252,619,287,337,474,337,337,337,490,441,693,645,785,784,785,785,785,90,129,583,563,762,104,489,261,817,261,261,261,790,505,281,724,642,168,153,168,168,168,288,680,678,680,680,680,527,160,15,7,15,15,15,436,293,789,330,780,418,554,682,239,251,269,190,254,551,597,636,597,597,597,103,604,604,36,429,598,81,610,99,638,47,149,99,796,795,781,502,409,460,459,460,460,460,31,107,31,31,31,125,26,602,376,526,558,774,567,211,70,211,211,211,761,686,188,501,651,669,44,233,506,427,506,506,506,635,185,137,500,23,22,737,799,118,398,475,124,71,73,71,71,71,532,465,549,604,653,34,715,700,327,200,156,50,138,381,415,27,573,822,573,573,573,581,194,195,194,194,194,589,725,798,42,622,626,582,457,93,299,136,443,6,72,239,72,72,72,317,411,803,804,803,803,803,91,811,654,14,649,802,805,802,802,802,767,495,76,12,730,149,612,503,4,669,345,701,650,516,513,141,208,514,94,42,394,298,319,295,344,280,38,424,655,721,655,655,655,405,434,760,34,578,148,664,801,451,812,282,407,241,0,522,541,522,522,522,508,382,133,113,112,255,736,222,757,620,668,210,346,210,210,210,827,765,827,827,827,412,534,45,815,613,381,399,362,399,399,399,753,61,224,325,19,800,354,310,603,272,659,116,117,380,740,253,35,431,235,739,258,259,258,258,258,542,738,177,738,738,738,384,565,201,372,371,372,372,372,203,204,203,203,203,450,770,51,624,629,754,271,462,463,462,462,462,716,187,65,264,710,709,710,710,710,49,394,242,83,278,743,786,242,656,315,295,703,327,208,54,794,373,568,585,307,437,750,426,520,519,520,520,520,688,759,537,683,747,772,366,432,58,306,324,106,108,106,106,106,356,276,356,356,356,614,361,614,614,614,311,647,130,131,130,130,130,53,335,76,811,708,707,708,708,708,568,37,151,486,733,383,41,40,230,232,230,230,230,696,192,193,109,788,819,788,788,788,163,164,163,163,163,422,369,217,482,633,662,438,622,504,39,52,39,39,39,477,481,477,477,477,221,732,221,221,221,162,240,46,240,240,240,205,340,110,566,793,566,566,566,348,607,28,74,28,28,28,456,518,661,402,471,472,471,471,471,297,644,236,821,128,745,226,227,119,97,215,321,611,685,676,229,199,86,216,86,86,86,535,510,347,493,771,493,493,493,824,352,368,56,698,511,631,657,62,63,62,62,62,33,186,33,33,33,428,628,623,826,585,671,197,706,684,706,706,706,775,351,775,775,775,499,536,499,499,499,59,512,600,339,538,339,339,339,646,553,202,545,587,105,735,523,285,523,523,523,570,88,618,543,266,543,543,543,643,687,818,616,270,176,175,176,176,176,560,452,744,679,241,257,158,257,257,257,665,666,665,665,665,196,697,556,468,488,303,410,457,134,583,746]
+const TABLE = { ids: IDS, targets: TARGETS, files: FILES }
+
+// 이벤트 ID 해석 규칙 - apps/crawler/url_mapping.py가 생성 (직접 수정하지 마세요)
+// table: { ids: 정렬된 이벤트 ID, targets: ids 순서의 files 번호, files: 대상 }
+// 1. 정확히 일치  2. _02/_03/_04 접미사를 뗀 ID  3. 9자리 ID면 그 ID로 시작하는 첫 12자리 ID
+var UrlMapping = (function () {
+  var VERSION = 2
+  var VARIANT_RE = /^(.+)(?:_02|_03|_04)$/
+
+  function lowerBound(ids, key) {
+    var lo = 0, hi = ids.length
+    while (lo < hi) {
+      var mid = (lo + hi) >>> 1
+      if (ids[mid] < key) lo = mid + 1
+      else hi = mid
+    }
+    return lo
+  }
+
+  function exact(table, id) {
+    var i = lowerBound(table.ids, id)
+    return i < table.ids.length && table.ids[i] === id ? table.files[table.targets[i]] : null
   }
-  return urlMappings[oldPath] || null
-}
\ No newline at end of file
+
+  function byShortId(table, shortId) {
+    for (var i = lowerBound(table.ids, shortId); i < table.ids.length && table.ids[i].startsWith(shortId); i++) {
+      var id = table.ids[i]
+      if (id.length === 12 && id.indexOf('_') < 0) return table.files[table.targets[i]]
+    }
+    return null
+  }
+
+  function lookup(table, id) {
+    if (!id) return null
+    var hit = exact(table, id)
+    if (hit) return hit
+    var m = VARIANT_RE.exec(id)
+    var base = m ? m[1] : id
+    if (m) {
+      hit = exact(table, base)
+      if (hit) return hit
+    }
+    return base.length === 9 ? byShortId(table, base) : null
+  }
+
+  // url-mapping.json 내용 → table (v1 {id: 파일명}도 허용)
+  function fromDocument(doc) {
+    if (doc && doc.version === VERSION) {
+      var events = doc.events || []
+      return {
+        ids: events.map(function (e) { return e[0] }),
+        targets: events.map(function (e) { return e[1] }),
+        files: doc.files || []
+      }
+    }
+    var ids = Object.keys(doc || {}).sort()
+    return { ids: ids, targets: ids.map(function (_, i) { return i }), files: ids.map(function (id) { return doc[id] }) }
+  }
+
+  // 샤드 접두어: 접미사를 뗀 ID의 앞 9자리 → FNV-1a 32비트 16진수 앞 prefixLen자리
+  function shardOf(id, prefixLen) {
+    var m = VARIANT_RE.exec(id)
+    var key = Array.from(m ? m[1] : id).slice(0, 9).join('')
+    var bytes = new TextEncoder().encode(key)
+    var h = 0x811c9dc5
+    for (var i = 0; i < bytes.length; i++) h = Math.imul(h ^ bytes[i], 0x01000193) >>> 0
+    return ('0000000' + h.toString(16)).slice(-8).slice(0, prefixLen)
+  }
+
+  return { VERSION: VERSION, lookup: lookup, fromDocument: fromDocument, shardOf: shardOf }
+})()
+
+function getNewUrl(oldPath) {
+  return UrlMapping.lookup(TABLE, oldPath.slice('/pages/event-'.length, -'.html'.length))
+}
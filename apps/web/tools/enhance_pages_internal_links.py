@@ -14,6 +14,8 @@ import os
 import re
 from html import escape
 
+from page_manifest import MANIFEST, load_pages, refresh_record, save_manifest
+
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # apps/web
 PUBLIC = os.path.join(ROOT, 'public')
 PAGES = os.path.join(PUBLIC, 'pages')
@@ -68,32 +70,37 @@ def build_breadcrumb_ui(branch_en: str, branch_ko: str, slug: str, title: str) -
     )
 
 
-def collect_related(branch_en: str, current_file: str) -> list:
-    candidates = []
-    prefix = branch_en + '-'
-    for fn in os.listdir(PAGES):
-        if not fn.endswith('.html'):
-            continue
-        if not fn.startswith(prefix):
-            continue
+def build_related_index(pages: list) -> dict:
+    """Per-branch list of (mtime, slug, title, filename), newest first. Built once per run."""
+    index = {}
+    for rec in pages:
+        index.setdefault(rec['branch'], []).append(
+            (rec['mtime'], rec['slug'], rec['title'] or rec['slug'], rec['filename']))
+    for items in index.values():
+        items.sort(key=lambda x: -x[0])
+    return index
+
+
+def touch_related(index: dict, rec: dict) -> None:
+    """Move a just-rewritten page to the front of its branch (it is now the newest)."""
+    items = index.get(rec['branch'], [])
+    for i, item in enumerate(items):
+        if item[3] == rec['filename']:
+            del items[i]
+            break
+    items.insert(0, (rec['mtime'], rec['slug'], rec['title'] or rec['slug'], rec['filename']))
+
+
+def collect_related(branch_en: str, current_file: str, index: dict) -> list:
+    """Top 5 same-branch pages, newest first, excluding the current page."""
+    related = []
+    for mtime, slug, title, fn in index.get(branch_en, []):
         if fn == current_file:
             continue
-        path = os.path.join(PAGES, fn)
-        try:
-            mtime = os.path.getmtime(path)
-        except Exception:
-            mtime = 0
-        # title extraction
-        try:
-            with open(path, 'r', encoding='utf-8') as rf:
-                html = rf.read()
-            title = parse_title(html, fn[:-5])
-        except Exception:
-            title = fn[:-5]
-        slug = fn[len(prefix):-5]
-        candidates.append((mtime, slug, title))
-    candidates.sort(key=lambda x: -x[0])
-    return candidates[:5]
+        related.append((mtime, slug, title))
+        if len(related) == 5:
+            break
+    return related
 
 
 def inject_if_missing(html: str, marker: str, insertion: str, where: str = 'before_head_end') -> str:
@@ -106,69 +113,77 @@ def inject_if_missing(html: str, marker: str, insertion: str, where: str = 'befo
     return html
 
 
+def enhance_html(content: str, rec: dict, related_index: dict) -> str:
+    """Inject breadcrumb UI/JSON-LD and related events into one page's HTML."""
+    fn = rec['filename']
+    branch_en = rec['branch']
+    slug = rec['slug']
+    branch_ko = BRANCH_KO[branch_en]
+
+    # Title
+    title = rec['title'] or parse_title(content, slug)
+
+    # Breadcrumb JSON-LD
+    bjson = build_breadcrumb_jsonld(branch_en, branch_ko, slug, title)
+    content2 = inject_if_missing(content, 'BreadcrumbList', bjson, 'before_head_end')
+
+    # Breadcrumb UI: replace 기존 "목록으로 돌아가기" 블록 또는 <h1> 앞에 삽입
+    ui = build_breadcrumb_ui(branch_en, branch_ko, slug, title)
+    if 'aria-label="Breadcrumb"' not in content2:
+        pattern = re.compile(r'<p[^>]*>\s*<!--\s*목록으로 돌아가기 링크\s*-->.*?</p>', re.S)
+        if pattern.search(content2):
+            content2 = pattern.sub(ui, content2, count=1)
+        else:
+            # insert before first <h1>
+            content2 = re.sub(r'(<h1[^>]*>)', ui + r'\n\1', content2, count=1)
+
+    # Related events block
+    if '관련 행사' not in content2:
+        related_items = collect_related(branch_en, fn, related_index)
+        if related_items:
+            lis = '\n'.join(
+                f'<li><a href="/{branch_en}/{slug}">{escape(title, quote=False)}</a></li>'
+                for _, slug, title in related_items
+            )
+            related_html = (
+                '\n    <section style="margin-top:2rem;">\n'
+                f'      <h2>관련 행사 ({branch_ko})</h2>\n'
+                '      <ul style="list-style:disc; margin-left:1.25rem;">\n'
+                f'        {lis}\n'
+                '      </ul>\n'
+                '    </section>\n'
+            )
+            marker = '<!-- 이벤트 공식 페이지 이동 배너 -->'
+            idx = content2.find(marker)
+            if idx != -1:
+                content2 = content2[:idx] + related_html + content2[idx:]
+            else:
+                # fallback: append before footer
+                content2 = content2.replace('</footer>', related_html + '\n    </footer>')
+    return content2
+
+
 def main():
     updated = 0
-    for fn in os.listdir(PAGES):
-        if not fn.endswith('.html'):
-            continue
-        base = fn[:-5]
-        if '-' not in base:
-            continue
-        branch_en = base.split('-', 1)[0]
-        if branch_en not in BRANCH_KO:
-            continue
-        slug = base[len(branch_en)+1:]
-        branch_ko = BRANCH_KO[branch_en]
-        path = os.path.join(PAGES, fn)
+    # 제목/지점/수정 시각은 페이지 매니페스트에서 (없거나 바뀐 파일만 HTML 파싱)
+    pages = load_pages(PAGES)
+    related_index = build_related_index(pages)
+    for rec in pages:
+        path = os.path.join(PAGES, rec['filename'])
         with open(path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        # Title
-        title = parse_title(content, slug)
-
-        # Breadcrumb JSON-LD
-        bjson = build_breadcrumb_jsonld(branch_en, branch_ko, slug, title)
-        content2 = inject_if_missing(content, 'BreadcrumbList', bjson, 'before_head_end')
-
-        # Breadcrumb UI: replace 기존 "목록으로 돌아가기" 블록 또는 <h1> 앞에 삽입
-        ui = build_breadcrumb_ui(branch_en, branch_ko, slug, title)
-        if 'aria-label="Breadcrumb"' not in content2:
-            pattern = re.compile(r'<p[^>]*>\s*<!--\s*목록으로 돌아가기 링크\s*-->.*?</p>', re.S)
-            if pattern.search(content2):
-                content2 = pattern.sub(ui, content2, count=1)
-            else:
-                # insert before first <h1>
-                content2 = re.sub(r'(<h1[^>]*>)', ui + r'\n\1', content2, count=1)
-
-        # Related events block
-        if '관련 행사' not in content2:
-            related_items = collect_related(branch_en, fn)
-            if related_items:
-                lis = '\n'.join(
-                    f'<li><a href="/{branch_en}/{slug}">{escape(title, quote=False)}</a></li>'
-                    for _, slug, title in related_items
-                )
-                related_html = (
-                    '\n    <section style="margin-top:2rem;">\n'
-                    f'      <h2>관련 행사 ({branch_ko})</h2>\n'
-                    '      <ul style="list-style:disc; margin-left:1.25rem;">\n'
-                    f'        {lis}\n'
-                    '      </ul>\n'
-                    '    </section>\n'
-                )
-                marker = '<!-- 이벤트 공식 페이지 이동 배너 -->'
-                idx = content2.find(marker)
-                if idx != -1:
-                    content2 = content2[:idx] + related_html + content2[idx:]
-                else:
-                    # fallback: append before footer
-                    content2 = content2.replace('</footer>', related_html + '\n    </footer>')
+        content2 = enhance_html(content, rec, related_index)
 
         if content2 != content:
             with open(path, 'w', encoding='utf-8') as f:
                 f.write(content2)
+            refresh_record(rec, path, content2)
+            touch_related(related_index, rec)
             updated += 1
 
+    if updated and os.path.exists(MANIFEST):
+        save_manifest(pages)
     print(f"Enhanced {updated} page(s)")
 
 
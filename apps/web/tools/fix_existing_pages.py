@@ -12,6 +12,8 @@ import json
 from datetime import datetime
 from bs4 import BeautifulSoup
 
+from page_manifest import MANIFEST, load_pages, refresh_record, save_manifest
+
 PAGES_DIR = os.path.join(os.path.dirname(__file__), "../public/pages")
 
 def get_event_status(start_date_iso, end_date_iso):
@@ -95,12 +97,8 @@ def generate_article_schema(title, description, thumbnail, update_date):
     }
     return f'<script type="application/ld+json">\n  {json.dumps(schema, ensure_ascii=False, indent=2)}\n  </script>'
 
-def fix_page(filepath):
-    """단일 페이지 수정"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    original_content = content
+def fix_html(content):
+    """HTML 문자열 수정 → (수정된 HTML, 변경 내역 리스트)"""
     changes = []
 
     # 1. 날짜 추출
@@ -142,6 +140,15 @@ def fix_page(filepath):
         content = re.sub(bad_date_pattern, '"endDate": ""', content)
         changes.append("잘못된 endDate 형식 수정")
 
+    return content, changes
+
+def fix_page(filepath):
+    """단일 페이지 수정"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        original_content = f.read()
+
+    content, changes = fix_html(original_content)
+
     # 변경사항 있으면 저장
     if content != original_content:
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -149,6 +156,16 @@ def fix_page(filepath):
         return changes
     return []
 
+def needs_check(record):
+    """매니페스트 레코드 기준으로 수정 대상이 될 수 있는 페이지인지 판단
+    - 유효한 시작/종료일이 모두 있고 종료되지 않은 페이지는 수정할 것이 없음
+    """
+    if record is None:
+        return True
+    start, end = record.get('start', ''), record.get('end', '')
+    valid = all(re.match(r'^\d{4}-\d{2}-\d{2}$', d) for d in (start, end))
+    return not valid or get_event_status(start, end) == "expired"
+
 def main():
     print("🔧 기존 페이지 SEO 문제 일괄 수정 시작...")
 
@@ -156,7 +173,10 @@ def main():
     noindex_count = 0
     schema_count = 0
 
+    # 페이지 매니페스트로 수정이 필요 없는 페이지는 읽지 않음 (매니페스트에 없는 파일은 모두 검사)
+    records = {rec['filename']: rec for rec in load_pages(PAGES_DIR)}
     pages = [f for f in os.listdir(PAGES_DIR) if f.endswith('.html')]
+    pages = [f for f in pages if needs_check(records.get(f))]
     total = len(pages)
 
     for i, filename in enumerate(pages, 1):
@@ -164,6 +184,9 @@ def main():
         changes = fix_page(filepath)
 
         if changes:
+            if filename in records:
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    refresh_record(records[filename], filepath, f.read())
             fixed_count += 1
             if "noindex 추가" in changes:
                 noindex_count += 1
@@ -171,6 +194,9 @@ def main():
                 schema_count += 1
             print(f"  [{i}/{total}] {filename}: {', '.join(changes)}")
 
+    if fixed_count and os.path.exists(MANIFEST):
+        save_manifest(records.values())
+
     print(f"\n✅ 완료!")
     print(f"   - 수정된 파일: {fixed_count}개")
     print(f"   - noindex 추가: {noindex_count}개")
@@ -10,15 +10,17 @@ Outputs (under apps/web/public):
   - events/gimpo.html         (gimpo only)
   - events/spaceone.html      (spaceone only)
 
-The script scans apps/web/public/pages for files named
+The script lists apps/web/public/pages files named
   {branch}-{slug}.html  where branch in {songdo,gimpo,spaceone}
-and reads the <h1> title to use as anchor text.
+from the crawler's page manifest (see page_manifest.py) and uses the
+<h1> title recorded there as anchor text.
 """
 
 import os
-from bs4 import BeautifulSoup
 from datetime import datetime
 
+from page_manifest import load_pages
+
 BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # apps/web
 PUBLIC = os.path.join(BASE, 'public')
 PAGES = os.path.join(PUBLIC, 'pages')
@@ -27,40 +29,13 @@ EVENTS_DIR = os.path.join(PUBLIC, 'events')
 
 def load_events():
     items = []
-    if not os.path.isdir(PAGES):
-        return items
-    for fn in sorted(os.listdir(PAGES)):
-        if not fn.endswith('.html'):
-            continue
-        name = fn[:-5]
-        if name.startswith('songdo-'):
-            branch = 'songdo'
-            slug = name.replace('songdo-', '')
-        elif name.startswith('gimpo-'):
-            branch = 'gimpo'
-            slug = name.replace('gimpo-', '')
-        elif name.startswith('spaceone-'):
-            branch = 'spaceone'
-            slug = name.replace('spaceone-', '')
-        else:
-            continue
-        path = os.path.join(PAGES, fn)
-        title = slug
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f, 'html.parser')
-                h1 = soup.find('h1')
-                if h1 and h1.get_text(strip=True):
-                    title = h1.get_text(strip=True)
-        except Exception:
-            pass
-        mtime = os.path.getmtime(path)
+    for rec in load_pages(PAGES):
         items.append({
-            'branch': branch,
-            'slug': slug,
-            'title': title,
-            'pretty': f"/{branch}/{slug}",
-            'mtime': mtime,
+            'branch': rec['branch'],
+            'slug': rec['slug'],
+            'title': rec['title'] or rec['slug'],
+            'pretty': f"/{rec['branch']}/{rec['slug']}",
+            'mtime': rec['mtime'],
         })
     # 최신순 정렬
     items.sort(key=lambda x: (-x['mtime'], x['title']))
@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 
 """
-List recent pretty URLs based on file mtime under apps/web/public/pages and /events.
+List recent pretty URLs based on the page manifest mtime (apps/web/public/pages)
+and file mtime under /events.
 Usage:
   python3 apps/web/tools/list_recent_urls.py --days 7 --limit 100
 """
@@ -11,6 +12,8 @@ import os
 import argparse
 from datetime import datetime, timedelta
 
+from page_manifest import load_pages
+
 BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # apps/web
 PUBLIC = os.path.join(BASE, 'public')
 PAGES = os.path.join(PUBLIC, 'pages')
@@ -19,23 +22,11 @@ DEFAULT_SITE_BASE = os.environ.get('SITE_BASE_URL', 'https://discounts.deluxo.co
 
 def iter_pages(days: int):
     cutoff = datetime.now() - timedelta(days=days)
-    if os.path.isdir(PAGES):
-        for fn in os.listdir(PAGES):
-            if not fn.endswith('.html'):
-                continue
-            name = fn[:-5]
-            if name.startswith('songdo-'):
-                url = '/songdo/' + name.replace('songdo-', '')
-            elif name.startswith('gimpo-'):
-                url = '/gimpo/' + name.replace('gimpo-', '')
-            elif name.startswith('spaceone-'):
-                url = '/spaceone/' + name.replace('spaceone-', '')
-            else:
-                continue
-            fp = os.path.join(PAGES, fn)
-            mtime = datetime.fromtimestamp(os.path.getmtime(fp))
-            if mtime >= cutoff:
-                yield (mtime, url)
+    # 상세 페이지: 매니페스트의 mtime(내용이 마지막으로 바뀐 시각) 사용
+    for rec in load_pages(PAGES):
+        mtime = datetime.fromtimestamp(rec['mtime'])
+        if mtime >= cutoff:
+            yield (mtime, f"/{rec['branch']}/{rec['slug']}")
 
     if os.path.isdir(EVENTS):
         for fn in os.listdir(EVENTS):
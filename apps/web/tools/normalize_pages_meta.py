@@ -7,16 +7,31 @@ Normalize existing detail pages:
 - Fill meta/OG/Twitter descriptions if empty (use 혜택 설명 → 기간/지점 fallback)
 - Normalize JSON-LD 'name' and 'description'
 - Normalize BreadcrumbList last item's name
+
+Pages whose content hash matches the sidecar cache (written by the same
+TOOL_VERSION) are skipped without parsing. --jobs spreads pages across processes.
+
+Usage:
+  python3 apps/web/tools/normalize_pages_meta.py
+  python3 apps/web/tools/normalize_pages_meta.py --jobs 0      # all cores
+  python3 apps/web/tools/normalize_pages_meta.py --no-cache    # re-parse every page
 """
 
 import os
 import re
 import json
+import time
+import hashlib
+import argparse
 from bs4 import BeautifulSoup
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # apps/web
 PUBLIC = os.path.join(ROOT, 'public')
 PAGES = os.path.join(PUBLIC, 'pages')
+CACHE_PATH = os.path.join(ROOT, '.cache', 'normalize_pages_meta.json')
+
+# 정규화 로직을 바꾸면 올려서 캐시를 무효화
+TOOL_VERSION = 1
 
 BRANCH_KO = {
     'songdo': '송도',
@@ -42,9 +57,158 @@ def parse_json_relaxed(text: str):
         return None
 
 
+def normalize_html(html: str, branch_ko: str) -> str:
+    """Return the normalized page HTML (same as input if nothing to change)."""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Title / H1
+    title_text = ''
+    if soup.title and soup.title.string:
+        title_text = norm(soup.title.string)
+        soup.title.string.replace_with(title_text)
+    h1 = soup.find('h1')
+    if h1:
+        h1_text = norm(h1.get_text(' ', strip=True))
+        title_text = title_text or h1_text
+        h1.clear(); h1.append(h1_text)
+
+    # Period / Desc
+    period_el = soup.select_one('div.period')
+    period = norm(period_el.get_text(' ', strip=True)) if period_el else ''
+    desc_p = soup.select_one('div.description p')
+    desc = norm(desc_p.get_text(' ', strip=True)) if desc_p else ''
+
+    # Meta desc (fallbacks)
+    if desc:
+        meta_desc = f"{title_text} | {desc}"
+    else:
+        fallback = period if period else f"현대 프리미엄 아울렛 {branch_ko} 행사"
+        meta_desc = f"{title_text} | {fallback}"
+
+    # <meta> description
+    mdesc = soup.find('meta', attrs={'name': 'description'})
+    if not mdesc:
+        mdesc = soup.new_tag('meta'); mdesc['name'] = 'description'; soup.head.append(mdesc)
+    mdesc['content'] = meta_desc
+
+    # OG/Twitter description
+    ogd = soup.find('meta', attrs={'property': 'og:description'})
+    if not ogd:
+        ogd = soup.new_tag('meta'); ogd['property'] = 'og:description'; soup.head.append(ogd)
+    ogd['content'] = desc or meta_desc
+
+    twd = soup.find('meta', attrs={'name': 'twitter:description'})
+    if not twd:
+        twd = soup.new_tag('meta'); twd['name'] = 'twitter:description'; soup.head.append(twd)
+    twd['content'] = desc or meta_desc
+
+    # Keywords normalization (optional)
+    kw = soup.find('meta', attrs={'name': 'keywords'})
+    if kw and kw.has_attr('content'):
+        kw['content'] = norm(kw['content'])
+
+    # OG/Twitter title normalization → use normalized title_text
+    ogt = soup.find('meta', attrs={'property': 'og:title'})
+    if ogt:
+        ogt['content'] = title_text
+    twt = soup.find('meta', attrs={'name': 'twitter:title'})
+    if twt:
+        twt['content'] = title_text
+
+    # Alt texts normalization
+    for img in soup.find_all('img'):
+        if img.has_attr('alt'):
+            img['alt'] = norm(img['alt'])
+
+    # JSON-LD blocks
+    for s in soup.find_all('script', attrs={'type': 'application/ld+json'}):
+        data = parse_json_relaxed(s.string or '')
+        if data is None:
+            continue
+        updated = False
+        objs = data.get('@graph') if isinstance(data, dict) and '@graph' in data else [data]
+        for o in objs:
+            if not isinstance(o, dict):
+                continue
+            if o.get('@type') == 'Event':
+                if 'name' in o:
+                    o['name'] = norm(o['name'])
+                    updated = True
+                if not norm(o.get('description', '')):
+                    o['description'] = desc or meta_desc
+                    updated = True
+            if o.get('@type') == 'BreadcrumbList':
+                try:
+                    items = o.get('itemListElement') or []
+                    if items:
+                        last = items[-1]
+                        if isinstance(last, dict) and 'name' in last:
+                            last['name'] = norm(last['name'])
+                            updated = True
+                except Exception:
+                    pass
+        if updated:
+            s.string.replace_with(json.dumps(data, ensure_ascii=False))
+
+    # Breadcrumb UI(last item) normalization
+    nav = soup.find('nav', attrs={'aria-label': 'Breadcrumb'})
+    if nav:
+        current = nav.find(attrs={'aria-current': 'page'})
+        if current:
+            current.clear(); current.append(title_text)
+
+    return str(soup)
+
+
+def normalize_file(path: str, branch_ko: str):
+    """Normalize one page in place. Returns (changed, hash of resulting content)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    new_html = normalize_html(html, branch_ko)
+    if new_html != html:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(new_html)
+    return new_html != html, content_hash(new_html)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def load_cache(path: str) -> dict:
+    """{filename: hash} of pages already normalized at TOOL_VERSION."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != TOOL_VERSION:
+        return {}
+    return data.get('pages') or {}
+
+
+def save_cache(path: str, pages: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'version': TOOL_VERSION, 'pages': pages}, f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp, path)
+
+
 def main():
-    changed = 0
-    for fn in os.listdir(PAGES):
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--pages', default=PAGES)
+    ap.add_argument('--jobs', type=int, default=1, help='Worker processes (0 = CPU count, 1 = serial)')
+    ap.add_argument('--cache', default=CACHE_PATH, help='Sidecar hash cache path')
+    ap.add_argument('--no-cache', action='store_true', help='Ignore and do not update the hash cache')
+    args = ap.parse_args()
+
+    started = time.time()
+    cache = {} if args.no_cache else load_cache(args.cache)
+    todo = []
+    skipped = 0
+    new_cache = {}
+    for fn in sorted(os.listdir(args.pages)):
         if not fn.endswith('.html'):
             continue
         base = fn[:-5]
@@ -53,115 +217,39 @@ def main():
         branch_en = base.split('-', 1)[0]
         if branch_en not in BRANCH_KO:
             continue
-        branch_ko = BRANCH_KO[branch_en]
-        path = os.path.join(PAGES, fn)
-        with open(path, 'r', encoding='utf-8') as f:
-            html = f.read()
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Title / H1
-        title_text = ''
-        if soup.title and soup.title.string:
-            title_text = norm(soup.title.string)
-            soup.title.string.replace_with(title_text)
-        h1 = soup.find('h1')
-        if h1:
-            h1_text = norm(h1.get_text(' ', strip=True))
-            title_text = title_text or h1_text
-            h1.clear(); h1.append(h1_text)
-
-        # Period / Desc
-        period_el = soup.select_one('div.period')
-        period = norm(period_el.get_text(' ', strip=True)) if period_el else ''
-        desc_p = soup.select_one('div.description p')
-        desc = norm(desc_p.get_text(' ', strip=True)) if desc_p else ''
-
-        # Meta desc (fallbacks)
-        if desc:
-            meta_desc = f"{title_text} | {desc}"
-        else:
-            fallback = period if period else f"현대 프리미엄 아울렛 {branch_ko} 행사"
-            meta_desc = f"{title_text} | {fallback}"
-
-        # <meta> description
-        mdesc = soup.find('meta', attrs={'name': 'description'})
-        if not mdesc:
-            mdesc = soup.new_tag('meta'); mdesc['name'] = 'description'; soup.head.append(mdesc)
-        mdesc['content'] = meta_desc
-
-        # OG/Twitter description
-        ogd = soup.find('meta', attrs={'property': 'og:description'})
-        if not ogd:
-            ogd = soup.new_tag('meta'); ogd['property'] = 'og:description'; soup.head.append(ogd)
-        ogd['content'] = desc or meta_desc
-
-        twd = soup.find('meta', attrs={'name': 'twitter:description'})
-        if not twd:
-            twd = soup.new_tag('meta'); twd['name'] = 'twitter:description'; soup.head.append(twd)
-        twd['content'] = desc or meta_desc
-
-        # Keywords normalization (optional)
-        kw = soup.find('meta', attrs={'name': 'keywords'})
-        if kw and kw.has_attr('content'):
-            kw['content'] = norm(kw['content'])
-
-        # OG/Twitter title normalization → use normalized title_text
-        ogt = soup.find('meta', attrs={'property': 'og:title'})
-        if ogt:
-            ogt['content'] = title_text
-        twt = soup.find('meta', attrs={'name': 'twitter:title'})
-        if twt:
-            twt['content'] = title_text
-
-        # Alt texts normalization
-        for img in soup.find_all('img'):
-            if img.has_attr('alt'):
-                img['alt'] = norm(img['alt'])
-
-        # JSON-LD blocks
-        for s in soup.find_all('script', attrs={'type': 'application/ld+json'}):
-            data = parse_json_relaxed(s.string or '')
-            if data is None:
-                continue
-            updated = False
-            objs = data.get('@graph') if isinstance(data, dict) and '@graph' in data else [data]
-            for o in objs:
-                if not isinstance(o, dict):
+        path = os.path.join(args.pages, fn)
+        if fn in cache:
+            # 현재 버전으로 이미 정규화된 내용이면 파싱 생략
+            with open(path, 'r', encoding='utf-8') as f:
+                if content_hash(f.read()) == cache[fn]:
+                    new_cache[fn] = cache[fn]
+                    skipped += 1
                     continue
-                if o.get('@type') == 'Event':
-                    if 'name' in o:
-                        o['name'] = norm(o['name'])
-                        updated = True
-                    if not norm(o.get('description', '')):
-                        o['description'] = desc or meta_desc
-                        updated = True
-                if o.get('@type') == 'BreadcrumbList':
-                    try:
-                        items = o.get('itemListElement') or []
-                        if items:
-                            last = items[-1]
-                            if isinstance(last, dict) and 'name' in last:
-                                last['name'] = norm(last['name'])
-                                updated = True
-                    except Exception:
-                        pass
-            if updated:
-                s.string.replace_with(json.dumps(data, ensure_ascii=False))
-
-        # Breadcrumb UI(last item) normalization
-        nav = soup.find('nav', attrs={'aria-label': 'Breadcrumb'})
-        if nav:
-            current = nav.find(attrs={'aria-current': 'page'})
-            if current:
-                current.clear(); current.append(title_text)
-
-        new_html = str(soup)
-        if new_html != html:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(new_html)
-            changed += 1
+        todo.append((fn, path, BRANCH_KO[branch_en]))
+
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs > 1 and len(todo) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results = list(ex.map(normalize_file,
+                                  [t[1] for t in todo], [t[2] for t in todo],
+                                  chunksize=max(1, len(todo) // (jobs * 4))))
+    else:
+        results = [normalize_file(path, branch_ko) for _, path, branch_ko in todo]
+
+    changed = 0
+    for (fn, _, _), (was_changed, digest) in zip(todo, results):
+        changed += was_changed
+        new_cache[fn] = digest
+    if not args.no_cache:
+        save_cache(args.cache, new_cache)
 
+    elapsed = time.time() - started
+    total = len(todo) + skipped
+    rate = total / elapsed if elapsed > 0 else 0.0
     print(f"Normalized {changed} page(s)")
+    print(f"  parsed {len(todo)}, skipped {skipped} (cached), {total} page(s) in {elapsed:.2f}s "
+          f"= {rate:.1f} pages/sec ({jobs} job(s))")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Read/update the page manifest written by the crawler (apps/crawler/pages-manifest.jsonl).
+
+Each JSON line describes one detail page under apps/web/public/pages:
+  id, branch, slug, filename, title, start, end, status, noindex, content_hash, mtime
+
+Tools call load_pages() instead of parsing every HTML file. Pages missing from the
+manifest, or whose mtime and content hash both changed, are scraped as a fallback.
+`mtime` is the time the page content last changed (kept when only the file time moved).
+The crawler imports this module too (record fields, filename split, HTML scrape,
+status), so both writers produce the same records.
+
+Usage:
+  python3 apps/web/tools/page_manifest.py            # summary
+  python3 apps/web/tools/page_manifest.py --write    # rebuild/refresh manifest from HTML
+"""
+
+import os
+import re
+import json
+import hashlib
+import argparse
+from datetime import datetime
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # apps/web
+PUBLIC = os.path.join(BASE, 'public')
+PAGES = os.path.join(PUBLIC, 'pages')
+MANIFEST = os.environ.get('OUTLET_MANIFEST_PATH', os.path.normpath(os.path.join(BASE, '..', 'crawler', 'pages-manifest.jsonl')))
+
+BRANCHES = ('songdo', 'gimpo', 'spaceone')
+FIELDS = ('id', 'branch', 'slug', 'filename', 'title', 'start', 'end',
+          'status', 'noindex', 'content_hash', 'mtime')
+
+EVENT_ID_RE = re.compile(r"event_id:\s*'([^']*)'")
+START_RE = re.compile(r'"startDate"\s*:\s*"([^"]+)"')
+END_RE = re.compile(r'"endDate"\s*:\s*"([^"]+)"')
+
+
+def split_filename(fn: str):
+    """'{branch}-{slug}.html' -> (branch, slug). Unknown branch -> ('', '')."""
+    if not fn.endswith('.html'):
+        return '', ''
+    for branch in BRANCHES:
+        if fn.startswith(branch + '-'):
+            return branch, fn[len(branch) + 1:-5]
+    return '', ''
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def event_status(start: str, end: str) -> str:
+    """'active' | 'upcoming' | 'expired' (crawler get_event_status와 동일)"""
+    today = datetime.today().date()
+    try:
+        if end and datetime.strptime(end, '%Y-%m-%d').date() < today:
+            return 'expired'
+        if start and datetime.strptime(start, '%Y-%m-%d').date() > today:
+            return 'upcoming'
+        return 'active'
+    except ValueError:
+        return 'active'
+
+
+def record_status(record: dict) -> str:
+    """Current status; recomputed from dates when the record has any."""
+    if record.get('start') or record.get('end'):
+        return event_status(record.get('start', ''), record.get('end', ''))
+    return record.get('status') or 'active'
+
+
+def scrape_page(path: str, fn: str, content: str = None) -> dict:
+    """Build a record from the HTML file itself (fallback when the manifest is stale)."""
+    from bs4 import BeautifulSoup
+
+    branch, slug = split_filename(fn)
+    if content is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    h1 = BeautifulSoup(content, 'html.parser').find('h1')
+    m_id = EVENT_ID_RE.search(content)
+    m_start = START_RE.search(content)
+    m_end = END_RE.search(content)
+    start = m_start.group(1) if m_start else ''
+    end = m_end.group(1) if m_end else ''
+    noindex = 'name="robots" content="noindex' in content
+    return {
+        'id': m_id.group(1) if m_id else '',
+        'branch': branch,
+        'slug': slug,
+        'filename': fn,
+        'title': h1.get_text(strip=True) if h1 else '',
+        'start': start,
+        'end': end,
+        'status': 'expired' if noindex else event_status(start, end),
+        'noindex': noindex,
+        'content_hash': content_hash(content),
+        'mtime': os.path.getmtime(path),
+    }
+
+
+def load_manifest(path: str = MANIFEST) -> dict:
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if rec.get('filename'):
+                records[rec['filename']] = rec
+    return records
+
+
+def load_pages(pages_dir: str = PAGES, manifest_path: str = MANIFEST, stats: dict = None) -> list:
+    """Records for every {branch}-{slug}.html in pages_dir, sorted by filename.
+
+    Manifest records are trusted when the file mtime matches or the content hash
+    still matches; everything else is scraped from HTML.
+    """
+    known = load_manifest(manifest_path)
+    records = []
+    scraped = 0
+    if os.path.isdir(pages_dir):
+        for fn in sorted(os.listdir(pages_dir)):
+            if not split_filename(fn)[0]:
+                continue
+            path = os.path.join(pages_dir, fn)
+            rec = known.get(fn)
+            if rec and rec.get('mtime') != os.path.getmtime(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                if rec.get('content_hash') != content_hash(content):
+                    rec = scrape_page(path, fn, content)
+                    scraped += 1
+            elif rec is None:
+                rec = scrape_page(path, fn)
+                scraped += 1
+            records.append(rec)
+    if stats is not None:
+        stats['manifest'] = len(known)
+        stats['scraped'] = scraped
+    return records
+
+
+def refresh_record(record: dict, path: str, content: str) -> None:
+    """Update hash/mtime/noindex after a tool rewrote the page."""
+    noindex = 'name="robots" content="noindex' in content
+    record['content_hash'] = content_hash(content)
+    record['mtime'] = os.path.getmtime(path)
+    record['noindex'] = noindex
+    if noindex:
+        record['status'] = 'expired'
+
+
+def save_manifest(records, path: str = MANIFEST) -> None:
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for rec in sorted(records, key=lambda r: r['filename']):
+            f.write(json.dumps({k: rec.get(k) for k in FIELDS}, ensure_ascii=False) + '\n')
+    os.replace(tmp, path)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--pages', default=PAGES)
+    ap.add_argument('--manifest', default=MANIFEST)
+    ap.add_argument('--write', action='store_true', help='Write the refreshed manifest back to --manifest')
+    args = ap.parse_args()
+
+    stats = {}
+    records = load_pages(args.pages, args.manifest, stats)
+    counts = {}
+    for rec in records:
+        status = record_status(rec)
+        counts[status] = counts.get(status, 0) + 1
+    print(f"pages: {len(records)} (manifest {stats['manifest']}, scraped {stats['scraped']})")
+    print('status: ' + ', '.join(f"{k}={v}" for k, v in sorted(counts.items())))
+    if args.write:
+        save_manifest(records, args.manifest)
+        print(f"✅ wrote {args.manifest}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Single-pass post-processing for detail pages under apps/web/public/pages.
+
+Each page is read once, passed through an ordered list of transform plugins on the
+same in-memory HTML string, and written once (only if something changed).
+
+Plugins (default order):
+  fix        fix_existing_pages.fix_html             (noindex / Event→Article / bad endDate)
+  enhance    enhance_pages_internal_links.enhance_html (breadcrumb + related events)
+  normalize  normalize_pages_meta.normalize_html     (title/meta/JSON-LD whitespace)
+
+A plugin is a function (html, record, ctx) -> html, where record is the page's
+manifest record (see page_manifest.py) and ctx holds shared per-run state
+(ctx['pages']: all records, ctx['related']: per-branch related-events index).
+To add a transform, write such a function and append it to PLUGINS.
+
+Usage:
+  python3 apps/web/tools/postprocess_pages.py
+  python3 apps/web/tools/postprocess_pages.py --only fix,normalize
+"""
+
+import os
+import time
+import argparse
+
+from page_manifest import PAGES, MANIFEST, load_pages, refresh_record, save_manifest
+from fix_existing_pages import fix_html
+from enhance_pages_internal_links import BRANCH_KO, build_related_index, enhance_html, touch_related
+from normalize_pages_meta import normalize_html
+
+
+def fix_plugin(html, rec, ctx):
+    return fix_html(html)[0]
+
+
+def enhance_plugin(html, rec, ctx):
+    return enhance_html(html, rec, ctx['related'])
+
+
+def normalize_plugin(html, rec, ctx):
+    return normalize_html(html, BRANCH_KO[rec['branch']])
+
+
+PLUGINS = [
+    ('fix', fix_plugin),
+    ('enhance', enhance_plugin),
+    ('normalize', normalize_plugin),
+]
+
+
+def run(pages_dir, plugins):
+    """Apply plugins to every page. Returns (written, per-plugin change counts, total)."""
+    pages = load_pages(pages_dir)
+    ctx = {'pages': pages, 'related': build_related_index(pages)}
+    changed_by = {name: 0 for name, _ in plugins}
+    written = 0
+    for rec in pages:
+        path = os.path.join(pages_dir, rec['filename'])
+        with open(path, 'r', encoding='utf-8') as f:
+            original = f.read()
+        html = original
+        for name, plugin in plugins:
+            result = plugin(html, rec, ctx)
+            if result != html:
+                changed_by[name] += 1
+                html = result
+        if html != original:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            refresh_record(rec, path, html)
+            touch_related(ctx['related'], rec)
+            written += 1
+    if written and os.path.exists(MANIFEST):
+        save_manifest(pages)
+    return written, changed_by, len(pages)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--pages', default=PAGES)
+    ap.add_argument('--only', default='', help='Comma-separated plugin names to run (default: all, in order)')
+    args = ap.parse_args()
+
+    names = [n.strip() for n in args.only.split(',') if n.strip()]
+    unknown = set(names) - {name for name, _ in PLUGINS}
+    if unknown:
+        ap.error(f"unknown plugin(s): {', '.join(sorted(unknown))}")
+    plugins = [(name, fn) for name, fn in PLUGINS if not names or name in names]
+
+    started = time.time()
+    written, changed_by, total = run(args.pages, plugins)
+    elapsed = time.time() - started
+    print(f"✅ post-processed {total} page(s), wrote {written} in {elapsed:.2f}s")
+    for name, _ in plugins:
+        print(f"  - {name}: {changed_by[name]} page(s) changed")
+
+
+if __name__ == '__main__':
+    main()
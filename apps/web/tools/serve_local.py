@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Local stand-in for the deployed site: serves apps/web/public and applies its _redirects
+rules the way Cloudflare Pages does, so check_urls.py (and friends) can be exercised
+without deploying.
+
+Rules are matched in file order, first match wins:
+  - '*' in the source captures anything (':splat' in the target)
+  - ':name' captures a run of non-'/' characters
+  - status 200 serves the target file in place; 301/302/303/307/308 send Location
+Without a matching rule, files are served from the public dir ('/dir/' → dir/index.html).
+
+--no-head answers HEAD with 405, to exercise clients' HEAD→GET fallback.
+--delay adds a fixed latency per request, to approximate a remote host.
+
+Usage:
+  python3 apps/web/tools/serve_local.py --port 8000
+  python3 apps/web/tools/list_recent_urls.py --base http://127.0.0.1:8000 --encode \
+    | python3 apps/web/tools/check_urls.py -F
+"""
+
+import os
+import re
+import time
+import argparse
+import mimetypes
+import threading
+from urllib.parse import quote, unquote, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PUBLIC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'public')
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+def _source_regex(source):
+    parts = []
+    for token in re.split(r'(\*|:[A-Za-z_]\w*)', source):
+        if token == '*':
+            parts.append('(?P<splat>.*)')
+        elif token.startswith(':') and len(token) > 1:
+            parts.append(f'(?P<{token[1:]}>[^/]+?)')
+        else:
+            parts.append(re.escape(token))
+    return re.compile('^' + ''.join(parts) + '$')
+
+
+def load_rules(path):
+    """_redirects → (static {source: (order, target, status)}, dynamic [(order, regex, target, status)])"""
+    static, dynamic = {}, []
+    if not os.path.exists(path):
+        return static, dynamic
+    with open(path, 'r', encoding='utf-8') as f:
+        for order, line in enumerate(f):
+            fields = line.split()
+            if not fields or fields[0].startswith('#') or len(fields) < 2:
+                continue
+            source, target = fields[0], fields[1]
+            status = int(fields[2]) if len(fields) > 2 and fields[2].isdigit() else 302
+            if '*' in source or ':' in source:
+                dynamic.append((order, _source_regex(source), target, status))
+            elif source not in static:
+                static[source] = (order, target, status)
+    return static, dynamic
+
+
+def match_rule(static, dynamic, path):
+    """첫 번째로 일치하는 규칙 → (target, status) 또는 None"""
+    best = static.get(path)
+    for order, regex, target, status in dynamic:
+        if best is not None and best[0] < order:
+            break
+        m = regex.match(path)
+        if m:
+            for name, value in m.groupdict().items():
+                target = target.replace(f':{name}', value)
+            return target, status
+    return (best[1], best[2]) if best else None
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # 동시 요청 검사 시 연결 대기열이 넘쳐 SYN 재전송(1s, 3s, ...)으로 지연이 튀지 않도록
+    request_queue_size = 128
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = 'serve_local'
+
+    def log_message(self, fmt, *args):
+        if not self.server.quiet:
+            super().log_message(fmt, *args)
+
+    def _file_for(self, path):
+        rel = path.lstrip('/')
+        full = os.path.normpath(os.path.join(self.server.public, rel))
+        if not full.startswith(os.path.abspath(self.server.public)):
+            return None
+        if os.path.isdir(full):
+            full = os.path.join(full, 'index.html')
+        return full if os.path.isfile(full) else None
+
+    def _respond(self, send_body):
+        with self.server.lock:
+            self.server.requests += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        rule = match_rule(self.server.static, self.server.dynamic, path)
+        if rule and rule[1] in REDIRECT_STATUSES:
+            location = quote(rule[0], safe="/:?=&%#")
+            if parts.query and '?' not in location:
+                location += '?' + parts.query
+            self.send_response(rule[1])
+            self.send_header('Location', location)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if rule:
+            path = rule[0]
+        full = self._file_for(path)
+        if full is None:
+            body = b'Not Found\n'
+            self.send_response(404)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+            return
+        with open(full, 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header('Content-Type', mimetypes.guess_type(full)[0] or 'application/octet-stream')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def do_HEAD(self):
+        if not self.server.allow_head:
+            self.send_response(405)
+            self.send_header('Allow', 'GET')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self._respond(False)
+
+
+def make_server(host='127.0.0.1', port=0, public=PUBLIC, redirects=None, allow_head=True, quiet=True, delay=0.0):
+    """서버 객체 생성 (port=0이면 빈 포트). server.server_address로 실제 주소 확인"""
+    server = Server((host, port), Handler)
+    server.public = public
+    server.static, server.dynamic = load_rules(redirects or os.path.join(public, '_redirects'))
+    server.allow_head = allow_head
+    server.quiet = quiet
+    server.delay = delay
+    server.requests = 0
+    server.lock = threading.Lock()
+    return server
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8000)
+    ap.add_argument('--public', default=PUBLIC, help='Directory to serve (default: apps/web/public)')
+    ap.add_argument('--redirects', default=None, help='Redirect rules file (default: <public>/_redirects)')
+    ap.add_argument('--no-head', action='store_true', help='Answer HEAD with 405')
+    ap.add_argument('--delay', type=float, default=0.0, help='Seconds to wait before each response')
+    ap.add_argument('-v', '--verbose', action='store_true', help='Log each request')
+    args = ap.parse_args()
+
+    server = make_server(args.host, args.port, args.public, args.redirects,
+                         allow_head=not args.no_head, quiet=not args.verbose, delay=args.delay)
+    host, port = server.server_address[:2]
+    print(f"🌐 serving {args.public} at http://{host}:{port} "
+          f"({len(server.static)} static + {len(server.dynamic)} dynamic redirect rules)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()